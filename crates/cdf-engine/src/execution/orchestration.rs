@@ -6661,6 +6661,9 @@ fn prepare_package_artifacts(
     if verdict_summary.quarantine_candidate_count > 0 {
         write_quarantine_summary(builder, verdict_summary, quarantine_part_count)?;
     }
+    if let Some(accuracy) = estimate_accuracy(&plan.scan, &lineage, profile)? {
+        builder.write_json_artifact(cdf_package_contract::ESTIMATE_ACCURACY_FILE, &accuracy)?;
+    }
     let partition_watermark_state = partition_watermarks
         .as_ref()
         .map(cdf_runtime::PartitionWatermarkTracker::snapshot)
@@ -8026,6 +8029,63 @@ fn write_quarantine_summary(
     Ok(())
 }
 
+/// Compares the planning estimates scan partitions recorded with the rows each delivered. Scans
+/// whose partitions carry no estimate keys write nothing, so a scan-level estimate alone never
+/// adds a package artifact.
+fn estimate_accuracy(
+    scan: &cdf_kernel::ScanPlan,
+    lineage: &LineageSummary,
+    profile: &ExecutionProfile,
+) -> Result<Option<cdf_package_contract::EstimateAccuracyArtifact>> {
+    let cdf_kernel::PartitionAuthority::Inline(partitions) = scan.partition_authority() else {
+        return Ok(None);
+    };
+    let estimate = |partition: &PartitionPlan, key: &str| {
+        partition
+            .metadata
+            .get(key)
+            .map(|value| {
+                value.parse::<u64>().map_err(|_| {
+                    CdfError::data("scan partition records a malformed planning estimate")
+                })
+            })
+            .transpose()
+    };
+    let mut estimated = Vec::new();
+    for partition in partitions {
+        let estimated_rows = estimate(partition, cdf_kernel::PLAN_ESTIMATED_ROWS_KEY)?;
+        let estimated_bytes = estimate(partition, cdf_kernel::PLAN_ESTIMATED_BYTES_KEY)?;
+        if estimated_rows.is_none() && estimated_bytes.is_none() {
+            continue;
+        }
+        estimated.push(cdf_package_contract::PartitionEstimateAccuracy {
+            partition_id: partition.partition_id.clone(),
+            estimated_rows,
+            estimated_bytes,
+            observed_rows: lineage
+                .input_observations
+                .iter()
+                .filter(|observation| observation.partition_id == partition.partition_id)
+                .fold(0_u64, |rows, observation| {
+                    rows.saturating_add(observation.observed_rows)
+                }),
+        });
+    }
+    if estimated.is_empty() {
+        return Ok(None);
+    }
+    Ok(Some(cdf_package_contract::EstimateAccuracyArtifact {
+        version: cdf_package_contract::ESTIMATE_ACCURACY_VERSION,
+        estimated_rows: scan.estimated_rows,
+        planned_source_bytes: scan
+            .planned_source_bytes
+            .map(cdf_kernel::PlannedSourceBytes::get),
+        observed_rows: lineage.input_rows,
+        observed_output_bytes: profile.output_bytes,
+        partitions: estimated,
+    }))
+}
+
 fn write_schema_admission_stream(
     builder: &PackageBuilder,
     admission: &SchemaAdmissionArtifact,
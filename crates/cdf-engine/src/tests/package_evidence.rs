@@ -1967,6 +1967,72 @@ fn phase_telemetry_is_additive_and_preserves_manifest_identity() {
     }
 }
 
+#[test]
+fn partition_estimates_write_estimate_accuracy_identity_evidence() {
+    let resource =
+        MockResource::tier_b(sample_batches()).with_partition_estimates(vec![Some((5, 64)), None]);
+    let plan = Planner::new()
+        .plan_tier_b(
+            &resource,
+            plan_input(Vec::new(), None, None, ExecutionExtent::bounded()),
+        )
+        .unwrap();
+    let temp = TempDir::new().unwrap();
+
+    let output = block_on(execute_to_package(&plan, &resource, temp.path())).unwrap();
+    let reader = cdf_package::PackageReader::open(temp.path()).unwrap();
+
+    assert!(
+        package_identity_file_paths(&reader).contains(cdf_package_contract::ESTIMATE_ACCURACY_FILE)
+    );
+    let accuracy: cdf_package_contract::EstimateAccuracyArtifact = serde_json::from_slice(
+        &std::fs::read(
+            temp.path()
+                .join(cdf_package_contract::ESTIMATE_ACCURACY_FILE),
+        )
+        .unwrap(),
+    )
+    .unwrap();
+    assert_eq!(
+        accuracy.version,
+        cdf_package_contract::ESTIMATE_ACCURACY_VERSION
+    );
+    assert_eq!(accuracy.observed_rows, 6);
+    assert_eq!(accuracy.observed_output_bytes, output.profile.output_bytes);
+    // Only the partition that recorded an estimate is compared, against its own rows.
+    assert_eq!(
+        accuracy.partitions,
+        vec![cdf_package_contract::PartitionEstimateAccuracy {
+            partition_id: PartitionId::new("part-0").unwrap(),
+            estimated_rows: Some(5),
+            estimated_bytes: Some(64),
+            observed_rows: 3,
+        }]
+    );
+
+    // Without partition estimates the artifact is not written, so existing identities hold.
+    let unestimated = MockResource::tier_b(sample_batches());
+    let plan = Planner::new()
+        .plan_tier_b(
+            &unestimated,
+            plan_input(Vec::new(), None, None, ExecutionExtent::bounded()),
+        )
+        .unwrap();
+    let temp = TempDir::new().unwrap();
+    block_on(execute_to_package(&plan, &unestimated, temp.path())).unwrap();
+    let reader = cdf_package::PackageReader::open(temp.path()).unwrap();
+    assert!(
+        !package_identity_file_paths(&reader)
+            .contains(cdf_package_contract::ESTIMATE_ACCURACY_FILE)
+    );
+    assert!(
+        !temp
+            .path()
+            .join(cdf_package_contract::ESTIMATE_ACCURACY_FILE)
+            .exists()
+    );
+}
+
 fn collect_dedup_dropped_provenance(reader: &cdf_package::PackageReader) -> Vec<(u64, u64)> {
     let mut rows = Vec::new();
     reader
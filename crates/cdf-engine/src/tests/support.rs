@@ -293,6 +293,8 @@ pub(super) struct MockResource {
     pub(super) tier_a_intent: cdf_kernel::CompiledScanIntent,
     pub(super) compiled_source_plan: Arc<OnceLock<cdf_runtime::CompiledSourcePlan>>,
     pub(super) compiled_source_plan_hash: Arc<OnceLock<cdf_kernel::CompiledSourcePlanHash>>,
+    /// Planning estimates recorded on the partition at the same index, as `(rows, bytes)`.
+    pub(super) partition_estimates: Vec<Option<(u64, u64)>>,
 }
 
 impl MockResource {
@@ -337,6 +339,7 @@ impl MockResource {
             tier_a_intent: cdf_kernel::CompiledScanIntent::full_scan(),
             compiled_source_plan: Arc::new(OnceLock::new()),
             compiled_source_plan_hash: Arc::new(OnceLock::new()),
+            partition_estimates: Vec::new(),
         }
     }
 
@@ -353,6 +356,14 @@ impl MockResource {
         self
     }
 
+    pub(super) fn with_partition_estimates(
+        mut self,
+        partition_estimates: Vec<Option<(u64, u64)>>,
+    ) -> Self {
+        self.partition_estimates = partition_estimates;
+        self
+    }
+
     pub(super) fn with_partition_count(mut self, partition_count: usize) -> Self {
         self.partition_count = partition_count;
         self
@@ -515,6 +526,17 @@ impl ResourceStream for MockResource {
                         .unwrap_or_else(|| format!("unobserved-part-{index}"));
                     metadata.insert(PLAN_SCHEMA_OBSERVATION_ID_KEY.to_owned(), observation_id);
                 }
+                if let Some((rows, bytes)) = self.partition_estimates.get(index).copied().flatten()
+                {
+                    metadata.insert(
+                        cdf_kernel::PLAN_ESTIMATED_ROWS_KEY.to_owned(),
+                        rows.to_string(),
+                    );
+                    metadata.insert(
+                        cdf_kernel::PLAN_ESTIMATED_BYTES_KEY.to_owned(),
+                        bytes.to_string(),
+                    );
+                }
                 if self.effective_schema_runtime.is_some() {
                     metadata.insert(
                         PLAN_SCHEMA_OBSERVATION_BINDING_KEY.to_owned(),
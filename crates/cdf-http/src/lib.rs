@@ -7,6 +7,7 @@ mod pagination;
 mod rate_limit;
 mod redaction;
 mod response;
+mod secret_cache;
 mod support;
 mod trace;
 
@@ -31,4 +32,5 @@ pub use rate_limit::{
 };
 pub use redaction::Redactor;
 pub use response::classify_response;
+pub use secret_cache::{DEFAULT_SECRET_CAPACITY, DEFAULT_SECRET_TTL_MS, SecretCache};
 pub use trace::TraceEvent;
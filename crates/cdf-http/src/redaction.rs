@@ -10,14 +10,14 @@ use crate::{
 
 #[derive(Clone, Debug, PartialEq, Eq)]
 pub struct Redactor {
-    secrets: Vec<String>,
+    secrets: SecretMatcher,
     sensitive_headers: BTreeSet<String>,
 }
 
 impl Default for Redactor {
     fn default() -> Self {
         Self {
-            secrets: Vec::new(),
+            secrets: SecretMatcher::default(),
             sensitive_headers: [
                 "authorization",
                 "proxy-authorization",
@@ -39,19 +39,14 @@ impl Redactor {
     }
 
     pub fn register_secret(&mut self, value: &str) -> Result<()> {
-        if value.is_empty() {
-            return Ok(());
+        if !value.is_empty() {
+            self.secrets.insert(value);
         }
-        self.secrets.push(value.to_owned());
         Ok(())
     }
 
     pub fn redact_text(&self, value: &str) -> String {
-        self.secrets
-            .iter()
-            .fold(value.to_owned(), |redacted, secret| {
-                redacted.replace(secret, "[REDACTED]")
-            })
+        self.secrets.redact(value)
     }
 
     pub fn redact_headers(&self, headers: &HeaderMap) -> HeaderMap {
@@ -102,3 +97,59 @@ impl Redactor {
         redacted
     }
 }
+
+/// Registered secrets, matched in one left-to-right pass over the text.
+///
+/// The matcher is rebuilt only when a new secret is registered, so registering the same token on
+/// every request costs a lookup. At each position the longest secret that matches wins.
+#[derive(Clone, Debug, Default, PartialEq, Eq)]
+struct SecretMatcher {
+    /// Distinct secrets, longest first.
+    secrets: Vec<String>,
+    /// For each first byte, the indexes into `secrets` that start with it; empty until a secret
+    /// is registered.
+    by_first_byte: Vec<Vec<usize>>,
+}
+
+impl SecretMatcher {
+    fn insert(&mut self, secret: &str) {
+        if self.secrets.iter().any(|known| known == secret) {
+            return;
+        }
+        let at = self
+            .secrets
+            .partition_point(|known| known.len() >= secret.len());
+        self.secrets.insert(at, secret.to_owned());
+        self.by_first_byte = vec![Vec::new(); 256];
+        for (index, known) in self.secrets.iter().enumerate() {
+            self.by_first_byte[usize::from(known.as_bytes()[0])].push(index);
+        }
+    }
+
+    fn redact(&self, text: &str) -> String {
+        if self.secrets.is_empty() {
+            return text.to_owned();
+        }
+        let bytes = text.as_bytes();
+        let mut redacted = String::with_capacity(text.len());
+        let (mut copied, mut at) = (0, 0);
+        while at < bytes.len() {
+            let matched = self.by_first_byte[usize::from(bytes[at])]
+                .iter()
+                .map(|&index| self.secrets[index].as_bytes())
+                .find(|secret| bytes[at..].starts_with(secret));
+            match matched {
+                // A secret is valid UTF-8, so a match starts and ends on character boundaries.
+                Some(secret) => {
+                    redacted.push_str(&text[copied..at]);
+                    redacted.push_str("[REDACTED]");
+                    at += secret.len();
+                    copied = at;
+                }
+                None => at += 1,
+            }
+        }
+        redacted.push_str(&text[copied..]);
+        redacted
+    }
+}
@@ -0,0 +1,118 @@
+use std::collections::BTreeMap;
+
+use cdf_kernel::{CdfError, Result};
+
+use crate::auth::{SecretProvider, SecretUri, SecretValue};
+
+pub const DEFAULT_SECRET_TTL_MS: u64 = 15 * 60 * 1_000;
+pub const DEFAULT_SECRET_CAPACITY: usize = 64;
+
+/// Secret values resolved during one run, reused until they expire.
+///
+/// An entry is served for `ttl_ms` after it was resolved and then resolved again, so rotated
+/// credentials are picked up. Once `capacity` secrets are held, expired entries and then the
+/// least recently used one are evicted. Dropped values are zeroed like any [`SecretValue`].
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct SecretCache {
+    ttl_ms: u64,
+    capacity: usize,
+    entries: BTreeMap<SecretUri, CachedSecret>,
+}
+
+#[derive(Clone, Debug, PartialEq, Eq)]
+struct CachedSecret {
+    value: SecretValue,
+    resolved_ms: u64,
+    used_ms: u64,
+}
+
+impl Default for SecretCache {
+    fn default() -> Self {
+        Self {
+            ttl_ms: DEFAULT_SECRET_TTL_MS,
+            capacity: DEFAULT_SECRET_CAPACITY,
+            entries: BTreeMap::new(),
+        }
+    }
+}
+
+impl SecretCache {
+    pub fn new(ttl_ms: u64, capacity: usize) -> Result<Self> {
+        if ttl_ms == 0 || capacity == 0 {
+            return Err(CdfError::contract(
+                "secret cache requires a nonzero ttl and capacity",
+            ));
+        }
+        Ok(Self {
+            ttl_ms,
+            capacity,
+            entries: BTreeMap::new(),
+        })
+    }
+
+    pub fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.entries.is_empty()
+    }
+
+    /// Whether `uri` holds a value that has not expired at `now_ms`.
+    pub fn is_fresh(&self, uri: &SecretUri, now_ms: u64) -> bool {
+        self.entries
+            .get(uri)
+            .is_some_and(|entry| now_ms.saturating_sub(entry.resolved_ms) < self.ttl_ms)
+    }
+
+    /// Returns the value cached for `uri`, resolving it through `provider` when it is missing or
+    /// expired.
+    pub fn resolve(
+        &mut self,
+        uri: &SecretUri,
+        provider: &dyn SecretProvider,
+        now_ms: u64,
+    ) -> Result<&SecretValue> {
+        let entry = match self.entries.remove(uri) {
+            Some(entry) if now_ms.saturating_sub(entry.resolved_ms) < self.ttl_ms => entry,
+            _ => {
+                let value = provider.resolve(uri)?;
+                self.evict(now_ms);
+                CachedSecret {
+                    value,
+                    resolved_ms: now_ms,
+                    used_ms: now_ms,
+                }
+            }
+        };
+        let entry = self.entries.entry(uri.clone()).or_insert(entry);
+        entry.used_ms = now_ms;
+        Ok(&entry.value)
+    }
+
+    /// Drops `uri`, so its next use resolves it again; for credentials the server rejected.
+    pub fn invalidate(&mut self, uri: &SecretUri) {
+        self.entries.remove(uri);
+    }
+
+    /// Makes room for one entry.
+    fn evict(&mut self, now_ms: u64) {
+        if self.entries.len() < self.capacity {
+            return;
+        }
+        let ttl_ms = self.ttl_ms;
+        self.entries
+            .retain(|_, entry| now_ms.saturating_sub(entry.resolved_ms) < ttl_ms);
+        if self.entries.len() < self.capacity {
+            return;
+        }
+        if let Some(oldest) = self
+            .entries
+            .iter()
+            .min_by_key(|(_, entry)| entry.used_ms)
+            .map(|(uri, _)| uri.clone())
+        {
+            self.entries.remove(&oldest);
+        }
+    }
+}
@@ -231,3 +231,71 @@ fn allowlist_denies_before_transport_send() {
     .unwrap();
     assert_eq!(transport.sends.load(Ordering::SeqCst), 1);
 }
+
+#[test]
+fn secret_cache_reuses_values_until_ttl_and_evicts_least_recent() {
+    struct Counting {
+        calls: std::cell::Cell<usize>,
+    }
+
+    impl SecretProvider for Counting {
+        fn resolve(&self, uri: &SecretUri) -> Result<SecretValue> {
+            self.calls.set(self.calls.get() + 1);
+            Ok(SecretValue::new(format!(
+                "{}-{}",
+                uri.as_str().trim_start_matches("secret://env/"),
+                self.calls.get()
+            )))
+        }
+    }
+
+    let provider = Counting {
+        calls: std::cell::Cell::new(0),
+    };
+    let token = SecretUri::new("secret://env/TOKEN").unwrap();
+    let other = SecretUri::new("secret://env/OTHER").unwrap();
+    let third = SecretUri::new("secret://env/THIRD").unwrap();
+    let mut cache = SecretCache::new(1_000, 2).unwrap();
+
+    for now_ms in 0..100 {
+        let value = cache.resolve(&token, &provider, now_ms).unwrap();
+        assert_eq!(value.as_str().unwrap(), "TOKEN-1");
+    }
+    assert_eq!(provider.calls.get(), 1);
+
+    let value = cache.resolve(&token, &provider, 1_000).unwrap();
+    assert_eq!(value.as_str().unwrap(), "TOKEN-2");
+
+    cache.resolve(&other, &provider, 1_100).unwrap();
+    cache.resolve(&token, &provider, 1_200).unwrap();
+    cache.resolve(&third, &provider, 1_300).unwrap();
+    assert_eq!(cache.len(), 2);
+    assert!(cache.is_fresh(&token, 1_300));
+    assert!(!cache.is_fresh(&other, 1_300));
+
+    cache.invalidate(&token);
+    assert!(!cache.is_fresh(&token, 1_300));
+    assert!(SecretCache::new(0, 1).is_err());
+}
+
+#[test]
+fn redactor_matches_registered_secrets_in_one_pass() {
+    let mut redactor = Redactor::default();
+    for _ in 0..1_000 {
+        redactor.register_secret("token").unwrap();
+    }
+    redactor.register_secret("token-extended").unwrap();
+    redactor.register_secret("é-secret").unwrap();
+
+    assert_eq!(
+        redactor.redact_text("a token-extended b token c é-secret d tok"),
+        "a [REDACTED] b [REDACTED] c [REDACTED] d tok"
+    );
+    assert_eq!(redactor, {
+        let mut expected = Redactor::default();
+        expected.register_secret("é-secret").unwrap();
+        expected.register_secret("token").unwrap();
+        expected.register_secret("token-extended").unwrap();
+        expected
+    });
+}
@@ -153,12 +153,12 @@ pub use resource::{
     EFFECTIVE_SCHEMA_EVIDENCE_VERSION, EffectiveSchemaCatalogEntry, EffectiveSchemaEvidence,
     EffectiveSchemaObservationEvidence, EffectiveSchemaRuntime, EstimateSupport,
     ExecutablePartition, FilterCapabilities, FreshnessSpec, IncrementalShape,
-    InvocationTermination, OpenedPartitionStream, OrderBy, PLAN_PHYSICAL_SCHEMA_HASH_KEY,
-    PLAN_SCHEMA_OBSERVATION_BINDING_KEY, PLAN_SCHEMA_OBSERVATION_ID_KEY,
-    PLANNED_TASK_SET_REFERENCE_VERSION, PartitionAttestation, PartitionAttestationAttempt,
-    PartitionAuthority, PartitionCompletion, PartitionOpenAttempt, PartitionPlan,
-    PartitionRetrySafety, PartitionStreamPayload, PartitioningCapabilities, PhysicalSourcePlanHash,
-    PlannedPartitionReader, PlannedSourceBytes, PlannedTaskSetReference,
+    InvocationTermination, OpenedPartitionStream, OrderBy, PLAN_ESTIMATED_BYTES_KEY,
+    PLAN_ESTIMATED_ROWS_KEY, PLAN_PHYSICAL_SCHEMA_HASH_KEY, PLAN_SCHEMA_OBSERVATION_BINDING_KEY,
+    PLAN_SCHEMA_OBSERVATION_ID_KEY, PLANNED_TASK_SET_REFERENCE_VERSION, PartitionAttestation,
+    PartitionAttestationAttempt, PartitionAuthority, PartitionCompletion, PartitionOpenAttempt,
+    PartitionPlan, PartitionRetrySafety, PartitionStreamPayload, PartitioningCapabilities,
+    PhysicalSourcePlanHash, PlannedPartitionReader, PlannedSourceBytes, PlannedTaskSetReference,
     ProcessedObservationOutcome, ProcessedObservationPosition, PushdownFidelity, PushedPredicate,
     QueryableResource, ReplaySupport, ResourceCapabilities, ResourceDescriptor, ResourceStream,
     ScanPlan, ScanPredicate, ScanRequest, SchemaBaselineReference, SchemaObservationBinding,
@@ -1128,6 +1128,10 @@ pub const EFFECTIVE_SCHEMA_EVIDENCE_VERSION: u16 = 2;
 pub const PLAN_SCHEMA_OBSERVATION_ID_KEY: &str = "cdf:schema_observation_id";
 pub const PLAN_SCHEMA_OBSERVATION_BINDING_KEY: &str = "cdf:schema_observation_binding";
 pub const PLAN_PHYSICAL_SCHEMA_HASH_KEY: &str = "cdf:physical_schema_hash";
+/// Per-partition planning estimates a source may record; the engine reports them against the
+/// rows each partition actually delivered in `stats/estimate-accuracy.json`.
+pub const PLAN_ESTIMATED_ROWS_KEY: &str = "cdf:estimated_rows";
+pub const PLAN_ESTIMATED_BYTES_KEY: &str = "cdf:estimated_bytes";
 
 pub fn partition_schema_observation_id(partition: &PartitionPlan) -> &str {
     partition
@@ -1,8 +1,8 @@
 use cdf_kernel::{
     CHECKPOINT_STATE_VERSION, CdfError, Checkpoint, CheckpointId, CheckpointStatus,
-    DestinationCommitRequest, IdempotencyToken, PackageContentAuthority, PackageHash, PipelineId,
-    ProcessedObservationPosition, ResourceId, Result, SchemaAuthorityKey, SchemaHash, SchemaHead,
-    ScopeKey, SourcePosition, StateDelta, StateSegment, TargetName, WriteDisposition,
+    DestinationCommitRequest, IdempotencyToken, PackageContentAuthority, PackageHash, PartitionId,
+    PipelineId, ProcessedObservationPosition, ResourceId, Result, SchemaAuthorityKey, SchemaHash,
+    SchemaHead, ScopeKey, SourcePosition, StateDelta, StateSegment, TargetName, WriteDisposition,
     aggregate_processed_observation_positions,
 };
 use serde::{Deserialize, Serialize};
@@ -636,6 +636,34 @@ impl PartitionWatermarkStateArtifact {
     }
 }
 
+pub const ESTIMATE_ACCURACY_FILE: &str = "stats/estimate-accuracy.json";
+pub const ESTIMATE_ACCURACY_VERSION: u16 = 1;
+
+/// Planning estimates a source recorded per partition, beside the rows the run observed.
+///
+/// Totals compare the scan plan's estimates with the package's observed input rows and output
+/// bytes; planned source bytes are never a transfer measurement, so no observed source-byte
+/// figure is paired with them.
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(deny_unknown_fields)]
+pub struct EstimateAccuracyArtifact {
+    pub version: u16,
+    pub estimated_rows: Option<u64>,
+    pub planned_source_bytes: Option<u64>,
+    pub observed_rows: u64,
+    pub observed_output_bytes: u64,
+    pub partitions: Vec<PartitionEstimateAccuracy>,
+}
+
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(deny_unknown_fields)]
+pub struct PartitionEstimateAccuracy {
+    pub partition_id: PartitionId,
+    pub estimated_rows: Option<u64>,
+    pub estimated_bytes: Option<u64>,
+    pub observed_rows: u64,
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
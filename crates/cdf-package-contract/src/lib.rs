@@ -20,10 +20,11 @@ pub use access::{SharedVerifiedPackageAccess, VerifiedPackageAccess};
 pub use artifacts::{
     DEDUP_PROVENANCE_DIRECTORY, DEDUP_PROVENANCE_VERSION, DEDUP_SUMMARY_FILE,
     DEDUP_SUMMARY_VERSION, DESTINATION_COMMIT_PLAN_FILE, DESTINATION_COMMIT_PLAN_VERSION,
-    DestinationCommitPlanPreimage, EPOCH_FRONTIER_FILE, IdempotencyTokenSource,
+    DestinationCommitPlanPreimage, EPOCH_FRONTIER_FILE, ESTIMATE_ACCURACY_FILE,
+    ESTIMATE_ACCURACY_VERSION, EstimateAccuracyArtifact, IdempotencyTokenSource,
     PARTITION_WATERMARK_STATE_ARTIFACT_VERSION, PARTITION_WATERMARK_STATE_FILE,
     PROCESSED_OBSERVATIONS_FILE, PROCESSED_OBSERVATIONS_VERSION, PackageDedupKeep,
-    PackageDedupSummary, PackageReplayInputs, PackageRunSchemaAuthority,
+    PackageDedupSummary, PackageReplayInputs, PackageRunSchemaAuthority, PartitionEstimateAccuracy,
     PartitionWatermarkStateArtifact, ProcessedObservationEvidenceArtifact, SCAN_PLAN_FILE,
     SCHEMA_ADMISSION_PROGRAM_FILE, STATE_INPUT_CHECKPOINT_FILE, STATE_PROPOSED_DELTA_FILE,
     StateDeltaPreimage, dedup_provenance_shard_path,
@@ -5,10 +5,11 @@ use std::{ffi::CStr, sync::Arc};
 
 use arrow_array::{
     Array, RecordBatch, RecordBatchOptions, StructArray,
-    ffi::{FFI_ArrowArray, FFI_ArrowSchema, from_ffi},
-    ffi_stream::{ArrowArrayStreamReader, FFI_ArrowArrayStream},
+    ffi::{FFI_ArrowArray, FFI_ArrowSchema, from_ffi, from_ffi_and_data_type},
+    ffi_stream::FFI_ArrowArrayStream,
 };
-use arrow_schema::{DataType, Field, Schema};
+use arrow_data::ArrayData;
+use arrow_schema::{ArrowError, DataType, Field, Schema, SchemaRef};
 use pyo3::{
     Bound, PyAny, PyResult,
     exceptions::{PyTypeError, PyValueError},
@@ -79,7 +80,7 @@ fn import_record_batch_capsules(
 
 pub(crate) fn import_record_batch_stream(
     object: &Bound<'_, PyAny>,
-) -> PyResult<ArrowArrayStreamReader> {
+) -> PyResult<ImportedArrowStream> {
     let capsule = object
         .call_method0("__arrow_c_stream__")?
         .cast_into::<PyCapsule>()?;
@@ -88,14 +89,144 @@ pub(crate) fn import_record_batch_stream(
 
 fn import_record_batch_stream_capsule(
     capsule: &Bound<'_, PyCapsule>,
-) -> PyResult<ArrowArrayStreamReader> {
+) -> PyResult<ImportedArrowStream> {
     let stream_ptr = capsule
         .pointer_checked(Some(ARROW_STREAM_CAPSULE_NAME))?
         .cast::<FFI_ArrowArrayStream>();
     // SAFETY: the capsule identity was checked above. Arrow's `from_raw` moves the stream and
-    // empties the capsule, transferring its release callback to the returned reader exactly once.
-    let stream = unsafe { FFI_ArrowArrayStream::from_raw(stream_ptr.as_ptr()) };
-    ArrowArrayStreamReader::try_new(stream).map_err(|error| PyTypeError::new_err(error.to_string()))
+    // empties the capsule, transferring its release callback to the returned stream exactly once.
+    let mut stream = unsafe { FFI_ArrowArrayStream::from_raw(stream_ptr.as_ptr()) };
+    let schema =
+        stream_schema(&mut stream).map_err(|error| PyTypeError::new_err(error.to_string()))?;
+    Ok(ImportedArrowStream { stream, schema })
+}
+
+/// An Arrow C stream read batch by batch, with its one schema imported once up front.
+///
+/// Unlike `ArrowArrayStreamReader`, each batch reports whether every imported buffer still
+/// points into memory the producer exported: Arrow copies a misaligned foreign buffer on import,
+/// and such a batch is not zero-copy.
+pub(crate) struct ImportedArrowStream {
+    stream: FFI_ArrowArrayStream,
+    schema: SchemaRef,
+}
+
+pub(crate) struct ImportedStreamBatch {
+    pub(crate) batch: RecordBatch,
+    pub(crate) zero_copy: bool,
+}
+
+impl ImportedArrowStream {
+    pub(crate) fn schema(&self) -> SchemaRef {
+        Arc::clone(&self.schema)
+    }
+
+    fn next_batch(&mut self) -> Result<Option<ImportedStreamBatch>, ArrowError> {
+        let get_next = self.stream.get_next.ok_or_else(|| {
+            ArrowError::CDataInterface("Arrow C stream was already released".to_owned())
+        })?;
+        let mut array = FFI_ArrowArray::empty();
+        // SAFETY: the stream is owned and unreleased, and `array` is an empty out-parameter that
+        // the producer either fills with one owned struct array or leaves released at the end.
+        let status = unsafe { get_next(&mut self.stream, &mut array) };
+        if status != 0 {
+            return Err(stream_error(&mut self.stream, status));
+        }
+        if array.is_released() {
+            return Ok(None);
+        }
+        let mut exported = Vec::new();
+        exported_buffer_addresses(&array, &mut exported);
+        exported.sort_unstable();
+        // SAFETY: the producer exported `array` for this stream's struct schema and moved its
+        // ownership here; the import takes over its release callback.
+        let data = unsafe {
+            from_ffi_and_data_type(array, DataType::Struct(self.schema.fields().clone()))
+        }?;
+        let zero_copy = imported_buffers_alias(&data, &exported);
+        let array = StructArray::from(data);
+        if array.null_count() != 0 {
+            return Err(ArrowError::CDataInterface(
+                "Arrow C stream record-batch struct must not contain top-level nulls".to_owned(),
+            ));
+        }
+        let batch = RecordBatch::try_new_with_options(
+            Arc::clone(&self.schema),
+            array.columns().to_vec(),
+            &RecordBatchOptions::new().with_row_count(Some(array.len())),
+        )?;
+        Ok(Some(ImportedStreamBatch { batch, zero_copy }))
+    }
+}
+
+impl Iterator for ImportedArrowStream {
+    type Item = Result<ImportedStreamBatch, ArrowError>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        self.next_batch().transpose()
+    }
+}
+
+fn stream_schema(stream: &mut FFI_ArrowArrayStream) -> Result<SchemaRef, ArrowError> {
+    let get_schema = stream.get_schema.ok_or_else(|| {
+        ArrowError::CDataInterface("Arrow C stream was already released".to_owned())
+    })?;
+    let mut schema = FFI_ArrowSchema::empty();
+    // SAFETY: the stream is owned and unreleased, and `schema` is an empty out-parameter the
+    // producer fills with an owned schema that drops with it.
+    let status = unsafe { get_schema(stream, &mut schema) };
+    if status != 0 {
+        return Err(stream_error(stream, status));
+    }
+    Ok(Arc::new(Schema::try_from(&schema)?))
+}
+
+fn stream_error(stream: &mut FFI_ArrowArrayStream, status: i32) -> ArrowError {
+    let message = stream.get_last_error.and_then(|get_last_error| {
+        // SAFETY: the stream is unreleased; a non-null message stays valid until the next call
+        // on the stream, and is copied out before then.
+        let message = unsafe { get_last_error(stream) };
+        (!message.is_null()).then(|| {
+            // SAFETY: `message` is non-null and, per the Arrow C stream interface, a
+            // NUL-terminated string that stays valid until the next call on the stream; it is
+            // copied into an owned `String` here, before any such call.
+            unsafe { CStr::from_ptr(message) }
+                .to_string_lossy()
+                .into_owned()
+        })
+    });
+    ArrowError::CDataInterface(
+        message.unwrap_or_else(|| format!("Arrow C stream failed with status {status}")),
+    )
+}
+
+fn exported_buffer_addresses(array: &FFI_ArrowArray, addresses: &mut Vec<usize>) {
+    addresses.extend(
+        (0..array.num_buffers())
+            .map(|index| array.buffer(index) as usize)
+            .filter(|address| *address != 0),
+    );
+    for index in 0..array.num_children() {
+        exported_buffer_addresses(array.child(index), addresses);
+    }
+    if let Some(dictionary) = array.dictionary() {
+        exported_buffer_addresses(dictionary, addresses);
+    }
+}
+
+/// Whether every nonempty buffer of `data` starts at an address the producer exported. Arrow
+/// imports a foreign buffer at its exported address and only reallocates one it must realign.
+fn imported_buffers_alias(data: &ArrayData, exported: &[usize]) -> bool {
+    data.buffers()
+        .iter()
+        .chain(data.nulls().map(|nulls| nulls.inner().inner()))
+        .all(|buffer| {
+            buffer.is_empty() || exported.binary_search(&(buffer.as_ptr() as usize)).is_ok()
+        })
+        && data
+            .child_data()
+            .iter()
+            .all(|child| imported_buffers_alias(child, exported))
 }
 
 #[cfg(test)]
@@ -200,10 +331,15 @@ mod tests {
             )
             .unwrap();
 
-            let mut reader = import_record_batch_stream_capsule(&capsule).unwrap();
-            assert_eq!(reader.schema(), expected.schema());
+            let mut stream = import_record_batch_stream_capsule(&capsule).unwrap();
+            assert_eq!(stream.schema(), expected.schema());
+            let imported = stream.by_ref().collect::<Result<Vec<_>, _>>().unwrap();
+            assert!(imported.iter().all(|imported| imported.zero_copy));
             assert_eq!(
-                reader.by_ref().collect::<Result<Vec<_>, _>>().unwrap(),
+                imported
+                    .into_iter()
+                    .map(|imported| imported.batch)
+                    .collect::<Vec<_>>(),
                 [expected.clone(), expected]
             );
             let moved = capsule
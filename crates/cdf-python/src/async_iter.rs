@@ -0,0 +1,109 @@
+use cdf_kernel::Result;
+use pyo3::{
+    Bound, PyAny, PyResult,
+    exceptions::PyStopAsyncIteration,
+    types::{PyAnyMethods, PyIterator, PyModule},
+};
+
+use crate::internal::py_error;
+
+/// The values a Python resource produces, pulled one at a time.
+///
+/// Sync iterables are iterated directly. Async iterables (an `async def` generator or any object
+/// with `__aiter__` and no `__iter__`) are stepped on an event loop the host creates for this one
+/// stream: each item runs `__anext__` to completion and the loop is idle between items, so
+/// concurrent work the generator schedules only advances while the host is asking for more.
+pub(crate) enum PythonItems<'py> {
+    Sync(Bound<'py, PyIterator>),
+    Async(AsyncItems<'py>),
+}
+
+impl<'py> PythonItems<'py> {
+    pub(crate) fn new(iterable: &Bound<'py, PyAny>) -> Result<Self> {
+        if is_async_iterable(iterable)? {
+            return AsyncItems::new(iterable).map(Self::Async);
+        }
+        iterable.try_iter().map(Self::Sync).map_err(py_error)
+    }
+}
+
+impl<'py> Iterator for PythonItems<'py> {
+    type Item = PyResult<Bound<'py, PyAny>>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        match self {
+            Self::Sync(iterator) => iterator.next(),
+            Self::Async(items) => items.next(),
+        }
+    }
+}
+
+fn is_async_iterable(iterable: &Bound<'_, PyAny>) -> Result<bool> {
+    Ok(iterable.hasattr("__aiter__").map_err(py_error)?
+        && !iterable.hasattr("__iter__").map_err(py_error)?)
+}
+
+/// An async iterator driven by a host-owned event loop.
+///
+/// Dropping it before exhaustion (a failed batch, cancellation, or backpressure error) closes the
+/// async generator inside the same loop so its `finally` blocks and open clients run, then shuts
+/// the loop down.
+pub(crate) struct AsyncItems<'py> {
+    event_loop: Bound<'py, PyAny>,
+    iterator: Bound<'py, PyAny>,
+    exhausted: bool,
+}
+
+impl<'py> AsyncItems<'py> {
+    fn new(iterable: &Bound<'py, PyAny>) -> Result<Self> {
+        let iterator = iterable.call_method0("__aiter__").map_err(py_error)?;
+        let event_loop = PyModule::import(iterable.py(), "asyncio")
+            .and_then(|asyncio| asyncio.call_method0("new_event_loop"))
+            .map_err(py_error)?;
+        Ok(Self {
+            event_loop,
+            iterator,
+            exhausted: false,
+        })
+    }
+
+    fn run_until_complete(
+        &self,
+        awaitable: PyResult<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyAny>> {
+        self.event_loop
+            .call_method1("run_until_complete", (awaitable?,))
+    }
+}
+
+impl<'py> Iterator for AsyncItems<'py> {
+    type Item = PyResult<Bound<'py, PyAny>>;
+
+    fn next(&mut self) -> Option<Self::Item> {
+        if self.exhausted {
+            return None;
+        }
+        match self.run_until_complete(self.iterator.call_method0("__anext__")) {
+            Ok(item) => Some(Ok(item)),
+            Err(error) if error.is_instance_of::<PyStopAsyncIteration>(self.iterator.py()) => {
+                self.exhausted = true;
+                None
+            }
+            Err(error) => {
+                self.exhausted = true;
+                Some(Err(error))
+            }
+        }
+    }
+}
+
+impl Drop for AsyncItems<'_> {
+    fn drop(&mut self) {
+        if !self.exhausted && self.iterator.hasattr("aclose").unwrap_or(false) {
+            let _ = self.run_until_complete(self.iterator.call_method0("aclose"));
+        }
+        let _ = self.run_until_complete(self.event_loop.call_method0("shutdown_asyncgens"));
+        let _ = self.run_until_complete(self.event_loop.call_method0("shutdown_default_executor"));
+        let _ = self.event_loop.call_method0("close");
+    }
+}
@@ -1,25 +1,62 @@
-use std::{io::Cursor, sync::Arc};
+use std::{
+    num::NonZeroUsize,
+    sync::{
+        Arc, Mutex,
+        atomic::{AtomicBool, AtomicUsize, Ordering},
+    },
+    time::{Duration, Instant},
+};
 
 use crate::{
-    arrow_capsule,
+    arrow_capsule::{self, ImportedStreamBatch},
+    async_iter::PythonItems,
     bridge_types::{
-        ARROW_C_ARRAY_METHOD, ARROW_C_STREAM_METHOD, ArrowCapsuleBoundary, PythonBridgeOptions,
-        PythonFirstObservation, PythonStreamSummary, PythonYieldKind,
+        ARROW_C_ARRAY_METHOD, ARROW_C_STREAM_METHOD, ArrowCapsuleBoundary, CDF_COLUMNS_METHOD,
+        CDF_POSITION_METHOD, PythonBridgeOptions, PythonBridgeProfile, PythonFirstObservation,
+        PythonStreamSummary, PythonYieldKind,
+    },
+    coalesce::{ArrowCoalescer, CoalescedArrow, PendingArrowBatch},
+    column_batch::import_column_batch,
+    dict_schema::{
+        declared_schema_error, declared_schema_mismatch, rows_fit_schema, widen_inferred_schema,
     },
-    dlt::{DltBridgeMetadata, DltBridgeObjectKind, DltBridgeSummary, extract_dlt_metadata},
+    dlt::{
+        DltBridgeMetadata, DltBridgeObjectKind, DltBridgeSummary, expand_dlt_source,
+        extract_dlt_metadata,
+    },
+    dlt_state::{DltStateDelta, DltStateSession},
+    incremental::CursorVerdict,
     internal::{
-        batch_id, descriptor_for, import_arrow_stream, json_error, py_error, python_dict_to_json,
+        batch_id, descriptor_for, import_arrow_stream, py_error, python_dict_to_json_value,
     },
 };
-use arrow_array::RecordBatch;
-use arrow_json::reader::{ReaderBuilder as JsonReaderBuilder, infer_json_schema};
+use arrow_array::{RecordBatch, new_null_array};
+use arrow_json::reader::{ReaderBuilder as JsonReaderBuilder, infer_json_schema_from_iterator};
+use arrow_schema::{DataType, Field, Schema, SchemaRef};
 use cdf_foreign_stream::{ForeignBatchOutcome, ForeignCopyClassification, ForeignTransferMode};
 use cdf_kernel::{Batch, CdfError, ResourceDescriptor, ResourceId, Result, SchemaHash, ScopeKey};
 use pyo3::{
-    Bound, PyAny,
+    Bound, PyAny, Python,
+    marker::Ungil,
     types::{PyAnyMethods, PyDict},
 };
 
+/// A Python stream that failed part-way, with the profile of what it did before failing when
+/// the bridge was profiling.
+pub(crate) struct PythonStreamFailure {
+    pub(crate) error: CdfError,
+    pub(crate) profile: Option<PythonBridgeProfile>,
+}
+
+impl From<CdfError> for PythonStreamFailure {
+    fn from(error: CdfError) -> Self {
+        Self {
+            error,
+            profile: None,
+        }
+    }
+}
+
 impl PythonStreamSummary {
     fn observe(
         &mut self,
@@ -59,10 +96,14 @@ impl PythonStreamSummary {
             PythonYieldKind::DictRows => &mut self.dict_row_outcomes,
             PythonYieldKind::ArrowCArray => &mut self.arrow_c_array_outcomes,
             PythonYieldKind::ArrowCStream => &mut self.arrow_c_stream_outcomes,
+            PythonYieldKind::ColumnBatch => &mut self.column_batch_outcomes,
         };
         *counter = counter
             .checked_add(1)
             .ok_or_else(|| CdfError::data("Python yield-kind count exceeds u64"))?;
+        if let Some(profile) = &mut self.profile {
+            profile.record_window(kind, rows, bytes);
+        }
         Ok(())
     }
 }
@@ -72,9 +113,54 @@ struct PythonBridgeState {
     summary: PythonStreamSummary,
     next_batch_index: usize,
     next_outcome_sequence: u64,
+    /// Last inferred dict-row schema, reused while later windows still fit it.
+    dict_schema: Option<SchemaRef>,
+    /// Arrow yields held back for one concatenated batch when `coalesce_rows` is set.
+    coalescer: ArrowCoalescer,
+    /// An item pulled from Python has not yet joined a batch, so a batch emitted now is not the
+    /// last of what Python ran ahead to produce.
+    holding: bool,
 }
 
 impl PythonBridgeState {
+    /// Returns the schema for one undeclared dict window. A cached schema that admits every row
+    /// is reused without inference; otherwise the window is inferred once and the cache is widened
+    /// to cover it, so a long-running resource stops re-inferring and fragmenting its schema. The
+    /// cache never loses a column, even when the window omits it or changes its type.
+    fn inferred_dict_schema(&mut self, rows: &[serde_json::Value]) -> Result<SchemaRef> {
+        if let Some(cached) = &self.dict_schema
+            && rows_fit_schema(rows, cached)
+        {
+            self.summary.dict_schema_cache_hits = self
+                .summary
+                .dict_schema_cache_hits
+                .checked_add(1)
+                .ok_or_else(|| CdfError::data("Python dict schema cache hits exceed u64"))?;
+            return Ok(Arc::clone(cached));
+        }
+        let window = infer_json_schema_from_iterator(rows.iter().map(Ok)).map_err(|_| {
+            CdfError::data(
+                "infer Python dict-row schema failed; inspect the Python resource locally for the offending value",
+            )
+        })?;
+        let schema = match self.dict_schema.as_deref() {
+            Some(cached) => {
+                let widened = widen_inferred_schema(cached, &window);
+                if widened != *cached {
+                    self.summary.dict_schema_widenings = self
+                        .summary
+                        .dict_schema_widenings
+                        .checked_add(1)
+                        .ok_or_else(|| CdfError::data("Python dict schema widenings exceed u64"))?;
+                }
+                Arc::new(widened)
+            }
+            None => Arc::new(window),
+        };
+        self.dict_schema = Some(Arc::clone(&schema));
+        Ok(schema)
+    }
+
     fn emit_record_batch<F>(
         &mut self,
         record_batch: RecordBatch,
@@ -84,36 +170,240 @@ impl PythonBridgeState {
         emit: &mut F,
     ) -> Result<()>
     where
-        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()>,
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
     {
+        let record_batch = match &options.projection {
+            // An inferred dict window only lacks a column because none of its rows set it.
+            Some(columns)
+                if kind == PythonYieldKind::DictRows && options.declared_schema.is_none() =>
+            {
+                project_inferred_record_batch(&record_batch, columns)?
+            }
+            Some(columns) => project_record_batch(record_batch, columns)?,
+            None => record_batch,
+        };
         let observed_schema_hash =
             cdf_kernel::canonical_arrow_schema_hash(record_batch.schema().as_ref())?;
         let retained_bytes = cdf_memory::record_batch_retained_bytes(&record_batch)?;
-        if retained_bytes == 0 || retained_bytes > options.max_boundary_bytes {
-            return Err(CdfError::data(format!(
-                "Python Arrow batch retains {retained_bytes} bytes outside its compiled 1..={}-byte boundary; emit smaller Arrow batches or raise max_boundary_bytes",
-                options.max_boundary_bytes
-            )));
+        if kind == PythonYieldKind::ArrowCArray {
+            return self.stage_arrow_batch(
+                PendingArrowBatch {
+                    batch: record_batch,
+                    kind,
+                    schema_hash: observed_schema_hash,
+                    retained_bytes,
+                    zero_copy: false,
+                },
+                options,
+                emit,
+            );
         }
-        self.next_batch_index = self
+        self.flush_coalesced_arrow(options, emit)?;
+        self.emit_batch(
+            record_batch,
+            kind,
+            observed_schema_hash,
+            Some(retained_bytes),
+            boundary_peak_bytes,
+            ArrowCopy::Unverified,
+            options,
+            emit,
+        )
+    }
+
+    /// Emits one batch of an Arrow C stream. Its schema hash and projection were resolved once
+    /// for the stream, and its retained size is the batch's own buffer total: every buffer of an
+    /// imported stream batch is a distinct foreign allocation, so there is nothing to deduplicate.
+    fn emit_stream_batch<F>(
+        &mut self,
+        imported: ImportedStreamBatch,
+        layout: &ArrowStreamLayout,
+        options: &PythonBridgeOptions,
+        emit: &mut F,
+    ) -> Result<()>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
+    {
+        let record_batch = match &layout.projection {
+            Some(indices) => imported
+                .batch
+                .project(indices)
+                .map_err(|_| CdfError::internal("project Python batch failed"))?,
+            None => imported.batch,
+        };
+        if options.coalesce_rows.is_some() {
+            let retained_bytes = u64::try_from(record_batch.get_array_memory_size())
+                .map_err(|_| CdfError::data("Python Arrow batch memory exceeds u64"))?;
+            return self.stage_arrow_batch(
+                PendingArrowBatch {
+                    batch: record_batch,
+                    kind: PythonYieldKind::ArrowCStream,
+                    schema_hash: layout.schema_hash.clone(),
+                    retained_bytes,
+                    zero_copy: imported.zero_copy,
+                },
+                options,
+                emit,
+            );
+        }
+        self.holding = false;
+        self.emit_batch(
+            record_batch,
+            PythonYieldKind::ArrowCStream,
+            layout.schema_hash.clone(),
+            None,
+            None,
+            ArrowCopy::verified(imported.zero_copy),
+            options,
+            emit,
+        )
+    }
+
+    /// Holds an Arrow yield back to join its neighbours when the bridge coalesces, and emits it
+    /// as-is otherwise. A yield that already meets a target is never held or merged.
+    fn stage_arrow_batch<F>(
+        &mut self,
+        pending: PendingArrowBatch,
+        options: &PythonBridgeOptions,
+        emit: &mut F,
+    ) -> Result<()>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
+    {
+        let Some(target_rows) = options.coalesce_rows else {
+            self.holding = false;
+            return self.emit_pending_arrow(pending, options, emit);
+        };
+        let target_bytes = ArrowCoalescer::pending_bytes_limit(options.max_boundary_bytes);
+        if pending.batch.num_rows() >= target_rows || pending.retained_bytes > target_bytes {
+            self.flush_coalesced_arrow(options, emit)?;
+            self.holding = false;
+            return self.emit_pending_arrow(pending, options, emit);
+        }
+        if !self.coalescer.admits(&pending, target_rows, target_bytes) {
+            self.flush_coalesced_arrow(options, emit)?;
+        }
+        self.coalescer.push(pending)?;
+        self.holding = false;
+        if self.coalescer.rows() >= target_rows {
+            self.flush_coalesced_arrow(options, emit)?;
+        }
+        Ok(())
+    }
+
+    /// Emits whatever Arrow yields the coalescer holds. Called before any other outcome, at a
+    /// position mark, and at the end of the stream, so coalescing never reorders rows.
+    fn flush_coalesced_arrow<F>(
+        &mut self,
+        options: &PythonBridgeOptions,
+        emit: &mut F,
+    ) -> Result<()>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
+    {
+        if self.coalescer.is_empty() {
+            return Ok(());
+        }
+        match self.coalescer.take()? {
+            None => Ok(()),
+            Some(CoalescedArrow::Single(pending)) => {
+                self.emit_pending_arrow(pending, options, emit)
+            }
+            Some(CoalescedArrow::Merged {
+                batch,
+                kind,
+                schema_hash,
+                input_bytes,
+                yields,
+            }) => {
+                self.summary.coalesced_arrow_yields = self
+                    .summary
+                    .coalesced_arrow_yields
+                    .checked_add(yields)
+                    .ok_or_else(|| CdfError::data("coalesced Python Arrow yields exceed u64"))?;
+                let retained_bytes = cdf_memory::record_batch_retained_bytes(&batch)?;
+                let peak_bytes = input_bytes
+                    .checked_add(retained_bytes)
+                    .ok_or_else(|| CdfError::data("Python coalescing peak exceeds u64"))?;
+                self.emit_batch(
+                    batch,
+                    kind,
+                    schema_hash,
+                    Some(retained_bytes),
+                    Some(peak_bytes),
+                    ArrowCopy::Concatenated,
+                    options,
+                    emit,
+                )
+            }
+        }
+    }
+
+    fn emit_pending_arrow<F>(
+        &mut self,
+        pending: PendingArrowBatch,
+        options: &PythonBridgeOptions,
+        emit: &mut F,
+    ) -> Result<()>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
+    {
+        self.emit_batch(
+            pending.batch,
+            pending.kind,
+            pending.schema_hash,
+            Some(pending.retained_bytes),
+            None,
+            ArrowCopy::verified(pending.zero_copy),
+            options,
+            emit,
+        )
+    }
+
+    /// `retained_bytes` of `None` accounts the batch at its header byte count.
+    #[allow(clippy::too_many_arguments)]
+    fn emit_batch<F>(
+        &mut self,
+        record_batch: RecordBatch,
+        kind: PythonYieldKind,
+        observed_schema_hash: SchemaHash,
+        retained_bytes: Option<u64>,
+        boundary_peak_bytes: Option<u64>,
+        copy: ArrowCopy,
+        options: &PythonBridgeOptions,
+        emit: &mut F,
+    ) -> Result<()>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
+    {
+        let batch_index = self
             .next_batch_index
             .checked_add(1)
             .ok_or_else(|| CdfError::data("Python batch index exceeds usize"))?;
-        self.next_outcome_sequence = self
+        let sequence = self
             .next_outcome_sequence
             .checked_add(1)
             .ok_or_else(|| CdfError::data("Python outcome sequence exceeds u64"))?;
         let batch = Batch::from_record_batch(
-            batch_id(options, self.next_batch_index)?,
+            batch_id(options, batch_index)?,
             options.resource_id.clone(),
             options.partition_id.clone(),
             observed_schema_hash.clone(),
             record_batch,
         )?;
+        let retained_bytes = retained_bytes.unwrap_or(batch.header.byte_count);
+        if retained_bytes == 0 || retained_bytes > options.max_boundary_bytes {
+            return Err(CdfError::data(format!(
+                "Python Arrow batch retains {retained_bytes} bytes outside its compiled 1..={}-byte boundary; emit smaller Arrow batches or raise max_boundary_bytes",
+                options.max_boundary_bytes
+            )));
+        }
+        self.next_batch_index = batch_index;
+        self.next_outcome_sequence = sequence;
         let rows = batch.header.row_count;
         let bytes = batch.header.byte_count;
-        let outcome = python_foreign_outcome(self.next_outcome_sequence, batch, kind)?;
-        emit(outcome, kind)?;
+        let outcome = python_foreign_outcome(sequence, batch, kind, copy)?;
+        emit(outcome, kind, !self.holding)?;
         self.summary.observe(
             observed_schema_hash,
             options,
@@ -129,66 +419,206 @@ impl PythonBridgeState {
     }
 }
 
+fn duration_ns(duration: Duration) -> u64 {
+    u64::try_from(duration.as_nanos()).unwrap_or(u64::MAX)
+}
+
+/// Runs `work` detached from the interpreter and adds how long it took to `detached`.
+fn detach_timed<T, F>(py: Python<'_>, detached: &mut Duration, work: F) -> T
+where
+    F: Ungil + FnOnce() -> T,
+    T: Ungil,
+{
+    let started = Instant::now();
+    let result = py.detach(work);
+    *detached += started.elapsed();
+    result
+}
+
+fn project_record_batch(record_batch: RecordBatch, columns: &[String]) -> Result<RecordBatch> {
+    let indices = projection_indices(&record_batch.schema(), columns)?;
+    record_batch
+        .project(&indices)
+        .map_err(|_| CdfError::internal("project Python batch failed"))
+}
+
+/// Projects an inferred dict window, filling a projected column that no row set with nulls.
+fn project_inferred_record_batch(
+    record_batch: &RecordBatch,
+    columns: &[String],
+) -> Result<RecordBatch> {
+    let schema = record_batch.schema();
+    let (fields, arrays): (Vec<_>, Vec<_>) = columns
+        .iter()
+        .map(|column| match schema.index_of(column) {
+            Ok(index) => (
+                Arc::clone(&schema.fields()[index]),
+                Arc::clone(record_batch.column(index)),
+            ),
+            Err(_) => (
+                Arc::new(Field::new(column, DataType::Null, true)),
+                new_null_array(&DataType::Null, record_batch.num_rows()),
+            ),
+        })
+        .unzip();
+    RecordBatch::try_new(Arc::new(Schema::new(fields)), arrays)
+        .map_err(|_| CdfError::internal("project Python batch failed"))
+}
+
+fn projection_indices(schema: &Schema, columns: &[String]) -> Result<Vec<usize>> {
+    columns
+        .iter()
+        .map(|column| {
+            schema.index_of(column).map_err(|_| {
+                CdfError::data(format!(
+                    "Python resource batch omits projected column `{column}`; yield every column the scan requests"
+                ))
+            })
+        })
+        .collect()
+}
+
+/// What an Arrow C stream fixes once for every batch it produces: the stream has one schema, so
+/// its projection and canonical hash are resolved before the first batch is read.
+struct ArrowStreamLayout {
+    projection: Option<Vec<usize>>,
+    schema_hash: SchemaHash,
+}
+
+impl ArrowStreamLayout {
+    fn new(schema: &Schema, options: &PythonBridgeOptions) -> Result<Self> {
+        let Some(columns) = &options.projection else {
+            return Ok(Self {
+                projection: None,
+                schema_hash: cdf_kernel::canonical_arrow_schema_hash(schema)?,
+            });
+        };
+        let indices = projection_indices(schema, columns)?;
+        let projected = schema
+            .project(&indices)
+            .map_err(|_| CdfError::internal("project Python batch failed"))?;
+        Ok(Self {
+            projection: Some(indices),
+            schema_hash: cdf_kernel::canonical_arrow_schema_hash(&projected)?,
+        })
+    }
+}
+
+/// Bytes one converted row slot occupies in the window before its own heap allocations.
+const JSON_VALUE_SLOT_BYTES: u64 = std::mem::size_of::<serde_json::Value>() as u64;
+
+/// Natively converted dict rows awaiting one columnar Arrow decode.
+///
+/// The window accounts the retained size of its row slots plus every row's heap allocations, so
+/// the `max_boundary_bytes` limit covers the converted input exactly as it covered NDJSON text.
 #[derive(Default)]
 struct DictRowWindow {
-    rows: usize,
-    bytes: Vec<u8>,
+    rows: Vec<serde_json::Value>,
+    heap_bytes: u64,
 }
 
 impl DictRowWindow {
-    fn try_push(&mut self, row: &str, maximum_bytes: u64) -> Result<bool> {
-        let row_bytes = u64::try_from(row.len())
-            .map_err(|_| CdfError::data("Python dict row length exceeds u64"))?;
-        let current = u64::try_from(self.bytes.len())
-            .map_err(|_| CdfError::data("Python dict conversion window exceeds u64"))?;
-        let required = current
-            .checked_add(row_bytes)
-            .and_then(|value| value.checked_add(1))
-            .ok_or_else(|| CdfError::data("Python dict conversion window size overflowed"))?;
-        let current_capacity = u64::try_from(self.bytes.capacity())
-            .map_err(|_| CdfError::data("Python dict conversion capacity exceeds u64"))?;
-        let maximum_buffer_capacity = maximum_bytes.saturating_sub(row_bytes);
-        if required > maximum_buffer_capacity {
-            return Ok(false);
-        }
-        let minimum_peak = current_capacity
-            .max(required)
-            .checked_add(row_bytes)
-            .ok_or_else(|| CdfError::data("Python dict conversion peak size overflowed"))?;
-        if minimum_peak > maximum_bytes {
+    fn len(&self) -> usize {
+        self.rows.len()
+    }
+
+    fn retained_bytes(&self) -> Result<u64> {
+        json_value_slot_bytes(self.rows.capacity())?
+            .checked_add(self.heap_bytes)
+            .ok_or_else(|| CdfError::data("Python dict conversion window size overflowed"))
+    }
+
+    /// Reserves room for one more converted row whose heap allocations total `row_bytes`.
+    /// Returns `false` when the window plus that row would exceed `maximum_bytes`.
+    fn admit(&mut self, row_bytes: u64, maximum_rows: usize, maximum_bytes: u64) -> Result<bool> {
+        let required_rows = self
+            .rows
+            .len()
+            .checked_add(1)
+            .ok_or_else(|| CdfError::data("Python dict row count exceeds usize"))?;
+        let target_capacity = if required_rows <= self.rows.capacity() {
+            self.rows.capacity()
+        } else {
+            let geometric = self
+                .rows
+                .capacity()
+                .checked_mul(2)
+                .unwrap_or(maximum_rows)
+                .min(maximum_rows);
+            required_rows.max(geometric)
+        };
+        let peak_with = |capacity: usize| -> Result<u64> {
+            json_value_slot_bytes(capacity)?
+                .checked_add(self.heap_bytes)
+                .and_then(|bytes| bytes.checked_add(row_bytes))
+                .ok_or_else(|| CdfError::data("Python dict conversion peak size overflowed"))
+        };
+        if peak_with(target_capacity)? > maximum_bytes {
             return Ok(false);
         }
-        if required > current_capacity {
-            let geometric = current_capacity
-                .checked_mul(2)
-                .unwrap_or(maximum_buffer_capacity)
-                .max(1);
-            let target_capacity = required.max(geometric).min(maximum_buffer_capacity);
-            self.bytes
-                .try_reserve_exact(target_capacity.saturating_sub(current).try_into().map_err(
-                    |_| CdfError::data("Python dict conversion reservation exceeds usize"),
-                )?)
+        if target_capacity > self.rows.capacity() {
+            self.rows
+                .try_reserve_exact(target_capacity - self.rows.len())
                 .map_err(|error| {
                     CdfError::data(format!("reserve Python dict conversion window: {error}"))
                 })?;
         }
-        let admitted_peak = u64::try_from(self.bytes.capacity())
-            .map_err(|_| CdfError::data("Python dict conversion capacity exceeds u64"))?
+        Ok(peak_with(self.rows.capacity())? <= maximum_bytes)
+    }
+
+    fn push(&mut self, row: serde_json::Value, row_bytes: u64) -> Result<()> {
+        self.heap_bytes = self
+            .heap_bytes
             .checked_add(row_bytes)
-            .ok_or_else(|| CdfError::data("Python dict conversion peak size overflowed"))?;
-        if admitted_peak > maximum_bytes {
-            return Ok(false);
+            .ok_or_else(|| CdfError::data("Python dict conversion window size overflowed"))?;
+        self.rows.push(row);
+        Ok(())
+    }
+
+    fn take(&mut self) -> Result<(Vec<serde_json::Value>, u64)> {
+        let retained_bytes = self.retained_bytes()?;
+        self.heap_bytes = 0;
+        Ok((std::mem::take(&mut self.rows), retained_bytes))
+    }
+}
+
+fn json_value_slot_bytes(slots: usize) -> Result<u64> {
+    u64::try_from(slots)
+        .ok()
+        .and_then(|slots| slots.checked_mul(JSON_VALUE_SLOT_BYTES))
+        .ok_or_else(|| CdfError::data("Python dict conversion capacity exceeds u64"))
+}
+
+/// Estimated heap bytes one converted row retains: its string, array, and map allocations.
+fn json_row_heap_bytes(row: &serde_json::Value) -> Result<u64> {
+    fn heap_bytes(value: &serde_json::Value) -> Option<u64> {
+        match value {
+            serde_json::Value::Null | serde_json::Value::Bool(_) | serde_json::Value::Number(_) => {
+                Some(0)
+            }
+            serde_json::Value::String(text) => u64::try_from(text.capacity()).ok(),
+            serde_json::Value::Array(values) => values.iter().try_fold(
+                u64::try_from(values.capacity())
+                    .ok()?
+                    .checked_mul(JSON_VALUE_SLOT_BYTES)?,
+                |total, value| total.checked_add(heap_bytes(value)?),
+            ),
+            serde_json::Value::Object(map) => map.iter().try_fold(0_u64, |total, (key, value)| {
+                total
+                    .checked_add(JSON_MAP_ENTRY_BYTES)?
+                    .checked_add(u64::try_from(key.capacity()).ok()?)?
+                    .checked_add(heap_bytes(value)?)
+            }),
         }
-        self.bytes.extend_from_slice(row.as_bytes());
-        self.bytes.push(b'\n');
-        self.rows = self
-            .rows
-            .checked_add(1)
-            .ok_or_else(|| CdfError::data("Python dict row count exceeds usize"))?;
-        Ok(true)
     }
+
+    heap_bytes(row).ok_or_else(|| CdfError::data("Python dict row size exceeds u64"))
 }
 
+/// Per-entry map cost: the key header plus the value slot.
+const JSON_MAP_ENTRY_BYTES: u64 =
+    (std::mem::size_of::<String>() + std::mem::size_of::<serde_json::Value>()) as u64;
+
 impl PythonFirstObservation {
     fn apply_descriptor_metadata(&mut self, metadata: &DltBridgeMetadata) -> Result<()> {
         metadata.apply_to_descriptor(&mut self.descriptor)
@@ -239,6 +669,7 @@ impl PythonResourceBridge {
         I: IntoIterator<Item = serde_json::Value>,
         F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
     {
+        let mut emit = |outcome, kind, _settled: bool| emit(outcome, kind);
         let mut state = PythonBridgeState::default();
         let mut window = DictRowWindow::default();
         for row in rows {
@@ -247,11 +678,10 @@ impl PythonResourceBridge {
                     "Python dict batching accepts JSON objects only",
                 ));
             }
-            let row = serde_json::to_string(&row).map_err(json_error)?;
             self.push_json_row_with(
                 &mut window,
                 &mut state,
-                &row,
+                row,
                 &mut emit,
                 &mut |window, state, transient_bytes, emit| {
                     self.flush_json_rows(window, state, transient_bytes, emit)
@@ -265,88 +695,290 @@ impl PythonResourceBridge {
 
     /// Incrementally imports one Python iterator as neutral foreign-stream outcomes.
     /// Callbacks run without the GIL so host backpressure and memory admission do not stall
-    /// unrelated Python partitions.
+    /// unrelated Python partitions. Async iterables are stepped on a host-owned event loop one
+    /// item at a time, so the same callbacks pace and cancel them.
     pub fn visit_python_foreign_iterable<F>(
         &self,
         iterable: &Bound<'_, PyAny>,
-        mut emit: F,
+        emit: F,
     ) -> Result<PythonStreamSummary>
     where
         F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+    {
+        self.visit_python_foreign_iterable_with_positions(iterable, emit, refuse_position_mark)
+    }
+
+    /// Like [`Self::visit_python_foreign_iterable`], and hands each position mark of a
+    /// `resumable=True` resource to `mark` before flushing the dict rows yielded ahead of it, so
+    /// the batch that closes those rows is the first to carry the mark.
+    pub fn visit_python_foreign_iterable_with_positions<F, M>(
+        &self,
+        iterable: &Bound<'_, PyAny>,
+        emit: F,
+        mark: M,
+    ) -> Result<PythonStreamSummary>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+        M: FnMut(String) -> Result<()>,
+    {
+        self.visit_python_foreign_iterable_profiled(iterable, emit, mark)
+            .map_err(|failure| failure.error)
+    }
+
+    /// Like [`Self::visit_python_foreign_iterable_with_positions`], and a stream that fails
+    /// part-way still hands back the profile of what it did before failing.
+    pub(crate) fn visit_python_foreign_iterable_profiled<F, M>(
+        &self,
+        iterable: &Bound<'_, PyAny>,
+        mut emit: F,
+        mark: M,
+    ) -> std::result::Result<PythonStreamSummary, PythonStreamFailure>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+        M: FnMut(String) -> Result<()>,
+    {
+        self.visit_python_items(
+            iterable,
+            |outcome, kind, _settled| emit(outcome, kind),
+            mark,
+        )
+    }
+
+    /// Reads `iterable` and hands `emit` each batch with whether it is settled: whether every
+    /// item pulled from Python so far is in it or an earlier batch. A batch flushed because a
+    /// newly pulled item could not join it is unsettled, as Python already ran past its rows.
+    fn visit_python_items<F, M>(
+        &self,
+        iterable: &Bound<'_, PyAny>,
+        mut emit: F,
+        mut mark: M,
+    ) -> std::result::Result<PythonStreamSummary, PythonStreamFailure>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()> + Send,
+        M: FnMut(String) -> Result<()>,
     {
         let py = iterable.py();
+        let started = Instant::now();
+        let mut python_time = Duration::ZERO;
+        let mut emit_time = Duration::ZERO;
+        let mut detached = Duration::ZERO;
+        let mut emit = |outcome: ForeignBatchOutcome, kind: PythonYieldKind, settled: bool| {
+            let emitting = Instant::now();
+            let emitted = emit(outcome, kind, settled);
+            emit_time += emitting.elapsed();
+            emitted
+        };
         let mut state = PythonBridgeState::default();
+        state.summary.profile = self.options.profile.then(PythonBridgeProfile::default);
         let mut window = DictRowWindow::default();
-        let iterator = iterable.try_iter().map_err(py_error)?;
-
-        for item in iterator {
-            let item = item.map_err(py_error)?;
-            match arrow_boundary_for(&item)? {
-                Some(boundary) if boundary.kind == PythonYieldKind::ArrowCStream => {
-                    py.detach(|| self.flush_json_rows(&mut window, &mut state, 0, &mut emit))?;
-                    let reader = import_arrow_stream(&item)?;
-                    for batch in reader {
-                        let batch = batch.map_err(|_| {
+        let mut items = PythonItems::new(iterable)?;
+
+        let visited = (|| -> Result<()> {
+            loop {
+                let pulling = Instant::now();
+                let Some(item) = items.next() else {
+                    break;
+                };
+                python_time += pulling.elapsed();
+                let item = item.map_err(py_error)?;
+                state.holding = true;
+                match arrow_boundary_for(&item)? {
+                    Some(boundary) if boundary.kind == PythonYieldKind::ArrowCStream => {
+                        detach_timed(py, &mut detached, || {
+                            self.flush_json_rows(&mut window, &mut state, 0, &mut emit)
+                        })?;
+                        let mut stream = import_arrow_stream(&item)?;
+                        let layout = ArrowStreamLayout::new(&stream.schema(), &self.options)?;
+                        loop {
+                            // The stream's producer is the author's code, so its pulls count as Python.
+                            let pulling = Instant::now();
+                            let Some(imported) = stream.next() else {
+                                break;
+                            };
+                            python_time += pulling.elapsed();
+                            let imported = imported.map_err(|_| {
                             CdfError::data(
                                 "Python Arrow C stream failed while producing a batch; inspect the Python resource locally for exception details",
                             )
                         })?;
-                        py.detach(|| {
+                            state.holding = true;
+                            detach_timed(py, &mut detached, || {
+                                state.emit_stream_batch(imported, &layout, &self.options, &mut emit)
+                            })?;
+                        }
+                    }
+                    Some(boundary) if boundary.kind == PythonYieldKind::ArrowCArray => {
+                        detach_timed(py, &mut detached, || {
+                            self.flush_json_rows(&mut window, &mut state, 0, &mut emit)
+                        })?;
+                        let batch = arrow_capsule::import_record_batch(&item).map_err(py_error)?;
+                        detach_timed(py, &mut detached, || {
                             state.emit_record_batch(
                                 batch,
-                                PythonYieldKind::ArrowCStream,
+                                PythonYieldKind::ArrowCArray,
                                 None,
                                 &self.options,
                                 &mut emit,
                             )
                         })?;
                     }
-                }
-                Some(boundary) if boundary.kind == PythonYieldKind::ArrowCArray => {
-                    py.detach(|| self.flush_json_rows(&mut window, &mut state, 0, &mut emit))?;
-                    let batch = arrow_capsule::import_record_batch(&item).map_err(py_error)?;
-                    py.detach(|| {
-                        state.emit_record_batch(
-                            batch,
-                            PythonYieldKind::ArrowCArray,
-                            None,
-                            &self.options,
+                    Some(_) => unreachable!("arrow boundary kinds are exhausted"),
+                    None if item.hasattr(CDF_COLUMNS_METHOD).map_err(py_error)? => {
+                        detach_timed(py, &mut detached, || {
+                            self.flush_json_rows(&mut window, &mut state, 0, &mut emit)
+                        })?;
+                        let Some(batch) = import_column_batch(
+                            &item,
+                            self.options.declared_schema.as_deref(),
+                            self.options.max_boundary_bytes,
+                        )?
+                        else {
+                            state.holding = false;
+                            continue;
+                        };
+                        detach_timed(py, &mut detached, || {
+                            state.flush_coalesced_arrow(&self.options, &mut emit)?;
+                            state.holding = false;
+                            state.emit_record_batch(
+                                batch,
+                                PythonYieldKind::ColumnBatch,
+                                None,
+                                &self.options,
+                                &mut emit,
+                            )
+                        })?;
+                    }
+                    None if item.cast::<PyDict>().is_ok() => {
+                        if let Some(window) = &self.options.cursor_window {
+                            match window.classify(&item)? {
+                                CursorVerdict::Keep => {}
+                                CursorVerdict::Skip => {
+                                    state.holding = false;
+                                    state.summary.cursor_skipped_rows = state
+                                        .summary
+                                        .cursor_skipped_rows
+                                        .checked_add(1)
+                                        .ok_or_else(|| {
+                                            CdfError::data("Python skipped row count exceeds u64")
+                                        })?;
+                                    continue;
+                                }
+                                CursorVerdict::Stop => {
+                                    state.summary.cursor_bound_reached = true;
+                                    break;
+                                }
+                            }
+                        }
+                        // Held Arrow yields leave before the dict window fills, so the two never
+                        // share the boundary reservation.
+                        if !state.coalescer.is_empty() {
+                            detach_timed(py, &mut detached, || {
+                                state.flush_coalesced_arrow(&self.options, &mut emit)
+                            })?;
+                        }
+                        let converting = Instant::now();
+                        let row = python_dict_to_json_value(&item)?;
+                        if let Some(profile) = &mut state.summary.profile {
+                            profile.dict_to_json_ns = profile
+                                .dict_to_json_ns
+                                .saturating_add(duration_ns(converting.elapsed()));
+                        }
+                        self.push_json_row_with(
+                            &mut window,
+                            &mut state,
+                            row,
                             &mut emit,
-                        )
-                    })?;
-                }
-                Some(_) => unreachable!("arrow boundary kinds are exhausted"),
-                None if item.cast::<PyDict>().is_ok() => {
-                    let row = python_dict_to_json(py, &item)?;
-                    self.push_json_row_with(
-                        &mut window,
-                        &mut state,
-                        &row,
-                        &mut emit,
-                        &mut |window, state, transient_bytes, emit| {
-                            py.detach(|| self.flush_json_rows(window, state, transient_bytes, emit))
-                        },
-                    )?;
-                }
-                None => {
-                    return Err(CdfError::data(
-                        "Python resource yielded unsupported value; expected dict or Arrow PyCapsule-speaking object",
-                    ));
+                            &mut |window, state, transient_bytes, emit| {
+                                detach_timed(py, &mut detached, || {
+                                    self.flush_json_rows(window, state, transient_bytes, emit)
+                                })
+                            },
+                        )?;
+                    }
+                    None if item.hasattr(CDF_POSITION_METHOD).map_err(py_error)? => {
+                        let token = item
+                            .call_method0(CDF_POSITION_METHOD)
+                            .and_then(|token| token.extract::<String>())
+                            .map_err(py_error)?;
+                        mark(token)?;
+                        state.holding = false;
+                        detach_timed(py, &mut detached, || {
+                            state.flush_coalesced_arrow(&self.options, &mut emit)?;
+                            self.flush_json_rows(&mut window, &mut state, 0, &mut emit)
+                        })?;
+                    }
+                    None => {
+                        return Err(CdfError::data(
+                            "Python resource yielded unsupported value; expected dict, cdf_sdk.ColumnBatch, or Arrow PyCapsule-speaking object",
+                        ));
+                    }
                 }
             }
-        }
 
-        py.detach(|| self.flush_json_rows(&mut window, &mut state, 0, &mut emit))?;
-        Ok(state.finish())
+            state.holding = false;
+            detach_timed(py, &mut detached, || {
+                state.flush_coalesced_arrow(&self.options, &mut emit)?;
+                self.flush_json_rows(&mut window, &mut state, 0, &mut emit)
+            })
+        })();
+        let wall = started.elapsed();
+        state.summary.python_ns = duration_ns(python_time);
+        state.summary.emit_ns = duration_ns(emit_time);
+        state.summary.bridge_ns = duration_ns(wall.saturating_sub(python_time + emit_time));
+        if let Some(profile) = &mut state.summary.profile {
+            profile.wall_ns = duration_ns(wall);
+            profile.iterator_ns = state.summary.python_ns;
+            profile.emit_ns = state.summary.emit_ns;
+            profile.gil_hold_ns = duration_ns(wall.saturating_sub(detached));
+        }
+        match visited {
+            Ok(()) => Ok(state.finish()),
+            Err(error) => Err(PythonStreamFailure {
+                error,
+                profile: state.summary.profile.take(),
+            }),
+        }
     }
 
     pub fn visit_dlt_resource<F>(
         &self,
         resource: &Bound<'_, PyAny>,
+        emit: F,
+    ) -> Result<DltBridgeSummary>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+    {
+        self.visit_dlt_resource_after(resource, None, emit)
+    }
+
+    /// Like [`Self::visit_dlt_resource`], resuming an incremental resource after `last_value`,
+    /// its committed cursor (`DltCurrentStateView::resource_state["last_value"]`). Dict rows
+    /// outside `[last_value or initial_value, end_value)` are dropped before conversion, and a
+    /// resource with `row_order` stops being pulled once it passes the far bound.
+    pub fn visit_dlt_resource_after<F>(
+        &self,
+        resource: &Bound<'_, PyAny>,
+        last_value: Option<&serde_json::Value>,
         mut emit: F,
     ) -> Result<DltBridgeSummary>
     where
         F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+    {
+        self.visit_dlt_resource_settled(resource, last_value, |outcome, kind, _settled| {
+            emit(outcome, kind)
+        })
+    }
+
+    /// [`Self::visit_dlt_resource_after`], telling `emit` whether each batch is settled; see
+    /// [`Self::visit_python_items`].
+    fn visit_dlt_resource_settled<F>(
+        &self,
+        resource: &Bound<'_, PyAny>,
+        last_value: Option<&serde_json::Value>,
+        emit: F,
+    ) -> Result<DltBridgeSummary>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()> + Send,
     {
         let metadata = extract_dlt_metadata(resource)?.ok_or_else(|| {
             CdfError::contract(
@@ -358,17 +990,72 @@ impl PythonResourceBridge {
                 "dlt preview expected resource metadata; use visit_dlt_source for sources",
             ));
         }
-        let bridge = self.bridge_for_dlt_metadata(&metadata)?;
+        let bridge = self.bridge_for_dlt_metadata(&metadata, last_value)?;
         let iterable = materialize_dlt_resource(resource)?;
-        let mut stream = bridge.visit_python_foreign_iterable(&iterable, &mut emit)?;
+        let mut stream = bridge
+            .visit_python_items(&iterable, emit, refuse_position_mark)
+            .map_err(|failure| failure.error)?;
         stream.apply_descriptor_metadata(&metadata)?;
         Ok(DltBridgeSummary {
             mapping_table: metadata.mapping_table(),
             metadata,
             stream,
+            state_deltas: Vec::new(),
         })
     }
 
+    /// Reads a dlt resource with `cdf_sdk.dlt.current` bound to its checkpointed state.
+    ///
+    /// The resource resumes after the `last_value` in its state. State it writes is handed to
+    /// `emit` with a batch, ready to commit alongside it, and never carries a write made after
+    /// Python yielded a row that is not in that batch or an earlier one. A batch flushed because
+    /// the next yield could not join it, such as a dict window full by bytes or Arrow following
+    /// dict rows, therefore carries no new state: the writes drained then ride with the next
+    /// batch, and a crash in between re-reads the flushed rows rather than skipping later ones.
+    /// Deltas for a scope are in write order, so a later one supersedes an earlier one. Writes
+    /// not yet handed over after the last batch come back in the summary's `state_deltas`.
+    pub fn visit_dlt_resource_with_state<F>(
+        &self,
+        resource: &Bound<'_, PyAny>,
+        session: &DltStateSession<'_>,
+        mut emit: F,
+    ) -> Result<DltBridgeSummary>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, Vec<DltStateDelta>) -> Result<()> + Send,
+    {
+        let py = resource.py();
+        let metadata = extract_dlt_metadata(resource)?.ok_or_else(|| {
+            CdfError::contract(
+                "dlt preview requires cdf dlt bridge metadata on the resource object",
+            )
+        })?;
+        let resource_id = match metadata.resource_id_hint() {
+            Some(resource_id) => ResourceId::new(resource_id)?,
+            None => self.options.resource_id.clone(),
+        };
+        session.bind(py, &resource_id, &metadata)?;
+        let last_value = session.last_value(&resource_id)?;
+        // Writes drained at an unsettled batch may be for rows still pending in the bridge.
+        let mut held = Vec::new();
+        let mut summary = self.visit_dlt_resource_settled(
+            resource,
+            last_value.as_ref(),
+            |outcome, kind, settled| {
+                let drained = Python::attach(|py| session.drain(py))?;
+                let mut deltas = std::mem::take(&mut held);
+                if settled {
+                    deltas.extend(drained);
+                } else {
+                    held = drained;
+                }
+                emit(outcome, kind, deltas)
+            },
+        )?;
+        held.extend(session.drain(py)?);
+        summary.state_deltas = held;
+        Ok(summary)
+    }
+
     pub fn visit_dlt_source<F>(
         &self,
         source: &Bound<'_, PyAny>,
@@ -377,82 +1064,130 @@ impl PythonResourceBridge {
     where
         F: FnMut(&DltBridgeMetadata, ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
     {
-        let source_metadata = extract_dlt_metadata(source)?;
-        if let Some(metadata) = &source_metadata
-            && metadata.kind == DltBridgeObjectKind::Resource
-        {
-            return self
-                .visit_dlt_resource(source, |outcome, kind| emit(metadata, outcome, kind))
-                .map(|summary| vec![summary]);
-        }
-        let source_name = source_metadata
-            .as_ref()
-            .and_then(|metadata| metadata.resource_id_hint())
-            .map(ToOwned::to_owned);
+        let py = source.py();
+        expand_dlt_source(source)?
+            .iter()
+            .map(|member| {
+                let metadata = &member.metadata;
+                self.visit_dlt_member(member.resource.bind(py), metadata, |outcome, kind| {
+                    emit(metadata, outcome, kind)
+                })
+            })
+            .collect()
+    }
 
-        let source_output = if source.hasattr("__call__").map_err(py_error)? {
-            source.call0().map_err(py_error)?
-        } else {
-            source.clone()
-        };
-        if let Some(mut metadata) = extract_dlt_metadata(&source_output)?
-            && metadata.kind == DltBridgeObjectKind::Resource
-        {
-            if metadata.source_name.is_none() {
-                metadata.source_name.clone_from(&source_name);
+    /// Reads the selected resources of `source` on up to `concurrency` threads of their own.
+    ///
+    /// Each resource gets the emit callback `make_emit` builds for it, so callers can admit
+    /// memory per resource rather than per source. Resources interleave on the GIL, but their
+    /// I/O waits and the bridge's conversion run detached from it, so independent endpoints
+    /// overlap. Summaries come back in source order, identical to [`Self::visit_dlt_source`];
+    /// after a failure no further resources start and the first failure in source order is
+    /// returned.
+    pub fn visit_dlt_source_concurrently<M, E>(
+        &self,
+        source: &Bound<'_, PyAny>,
+        concurrency: NonZeroUsize,
+        make_emit: M,
+    ) -> Result<Vec<DltBridgeSummary>>
+    where
+        M: Fn(&DltBridgeMetadata) -> E + Sync,
+        E: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+    {
+        let members = expand_dlt_source(source)?;
+        let next = AtomicUsize::new(0);
+        let failed = AtomicBool::new(false);
+        let summaries = members
+            .iter()
+            .map(|_| Mutex::new(None))
+            .collect::<Vec<Mutex<Option<Result<DltBridgeSummary>>>>>();
+        source.py().detach(|| {
+            std::thread::scope(|scope| {
+                for _ in 0..concurrency.get().min(members.len()) {
+                    scope.spawn(|| {
+                        while !failed.load(Ordering::Acquire) {
+                            let index = next.fetch_add(1, Ordering::AcqRel);
+                            let Some(member) = members.get(index) else {
+                                break;
+                            };
+                            let summary = Python::attach(|py| {
+                                self.visit_dlt_member(
+                                    member.resource.bind(py),
+                                    &member.metadata,
+                                    make_emit(&member.metadata),
+                                )
+                            });
+                            if summary.is_err() {
+                                failed.store(true, Ordering::Release);
+                            }
+                            if let Ok(mut slot) = summaries[index].lock() {
+                                *slot = Some(summary);
+                            }
+                        }
+                    });
+                }
+            });
+        });
+        // Resources start in source order, so every unread slot follows the first failure.
+        let mut read = Vec::with_capacity(members.len());
+        for slot in summaries {
+            match slot
+                .into_inner()
+                .map_err(|_| CdfError::internal("dlt resource summary was poisoned"))?
+            {
+                Some(summary) => read.push(summary?),
+                None => {
+                    return Err(CdfError::internal(
+                        "dlt source resource was neither read nor failed",
+                    ));
+                }
             }
-            let mut summary = self.visit_dlt_resource(&source_output, |outcome, kind| {
-                emit(&metadata, outcome, kind)
-            })?;
-            summary
-                .metadata
-                .source_name
-                .clone_from(&metadata.source_name);
-            return Ok(vec![summary]);
         }
+        Ok(read)
+    }
 
-        let mut summaries = Vec::new();
-        let iterator = source_output.try_iter().map_err(py_error)?;
-        for item in iterator {
-            let item = item.map_err(py_error)?;
-            let Some(mut metadata) = extract_dlt_metadata(&item)? else {
-                return Err(CdfError::contract(
-                    "dlt source yielded an object without CDF resource metadata",
-                ));
-            };
-            if metadata.kind != DltBridgeObjectKind::Resource {
-                return Err(CdfError::contract(
-                    "dlt source yielded nested source metadata where resource metadata was required",
-                ));
-            }
-            if !metadata.selected_for_source_expansion() {
-                continue;
-            }
-            if metadata.source_name.is_none() {
-                metadata.source_name.clone_from(&source_name);
-            }
-            let mut summary =
-                self.visit_dlt_resource(&item, |outcome, kind| emit(&metadata, outcome, kind))?;
-            summary
-                .metadata
-                .source_name
-                .clone_from(&metadata.source_name);
-            summaries.push(summary);
-        }
-        Ok(summaries)
+    fn visit_dlt_member<F>(
+        &self,
+        resource: &Bound<'_, PyAny>,
+        metadata: &DltBridgeMetadata,
+        emit: F,
+    ) -> Result<DltBridgeSummary>
+    where
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()> + Send,
+    {
+        let mut summary = self.visit_dlt_resource(resource, emit)?;
+        summary
+            .metadata
+            .source_name
+            .clone_from(&metadata.source_name);
+        Ok(summary)
     }
 
-    fn bridge_for_dlt_metadata(&self, metadata: &DltBridgeMetadata) -> Result<Self> {
-        let Some(resource_id) = metadata.resource_id_hint() else {
-            return Ok(self.clone());
-        };
-        Ok(Self::new(
-            self.options
-                .clone()
-                .with_resource_id(ResourceId::new(resource_id)?),
-        ))
+    fn bridge_for_dlt_metadata(
+        &self,
+        metadata: &DltBridgeMetadata,
+        last_value: Option<&serde_json::Value>,
+    ) -> Result<Self> {
+        let mut options = self.options.clone();
+        if let Some(resource_id) = metadata.resource_id_hint() {
+            options = options.with_resource_id(ResourceId::new(resource_id)?);
+        }
+        if let Some(window) = metadata
+            .incremental
+            .as_ref()
+            .map(|incremental| incremental.cursor_window(last_value))
+            .transpose()?
+            .flatten()
+        {
+            options = options.with_cursor_window(window);
+        }
+        Ok(Self::new(options))
     }
 
+    /// Decodes the window straight into Arrow builders. Rows are already JSON values, so no text
+    /// is serialized or re-parsed; `Decoder::serialize` appends them to its tape in one pass.
+    /// A declared schema skips inference entirely and decodes strictly into that schema; an
+    /// undeclared window reuses or widens the stream's cached inferred schema.
     fn flush_json_rows<F>(
         &self,
         window: &mut DictRowWindow,
@@ -461,56 +1196,35 @@ impl PythonResourceBridge {
         emit: &mut F,
     ) -> Result<()>
     where
-        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()>,
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
     {
-        if window.rows == 0 {
+        if window.len() == 0 {
             return Ok(());
         }
-        let rows = std::mem::take(&mut window.rows);
-        let bytes = std::mem::take(&mut window.bytes);
-        let input_capacity = u64::try_from(bytes.capacity())
-            .map_err(|_| CdfError::data("Python dict input capacity exceeds u64"))?;
-        let (schema, _) = infer_json_schema(Cursor::new(bytes.as_slice()), Some(rows)).map_err(
-            |_| {
-                CdfError::data(
-                    "infer Python dict-row schema failed; inspect the Python resource locally for the offending value",
-                )
-            },
-        )?;
-        let mut reader = JsonReaderBuilder::new(Arc::new(schema))
-            .with_batch_size(rows)
-            .build(Cursor::new(bytes.as_slice()))
-            .map_err(|_| {
-                CdfError::data(
-                    "initialize Python dict-row decoder failed; inspect the Python resource locally",
-                )
-            })?;
-        let record_batch = reader
-            .next()
-            .transpose()
-            .map_err(|_| {
-                CdfError::data(
-                    "decode Python dict rows failed; inspect the Python resource locally for the offending value",
-                )
-            })?
-            .ok_or_else(|| CdfError::data("Python dict-row decoder emitted no batch"))?;
-        if reader
-            .next()
-            .transpose()
-            .map_err(|_| {
-                CdfError::data(
-                    "decode Python dict rows failed; inspect the Python resource locally for the offending value",
-                )
-            })?
-            .is_some()
-        {
-            return Err(CdfError::internal(
-                "one Python dict conversion window emitted more than one Arrow batch",
-            ));
+        let (rows, input_bytes) = window.take()?;
+        let inferring = Instant::now();
+        let decoding;
+        let record_batch = match &self.options.declared_schema {
+            Some(schema) => {
+                decoding = Instant::now();
+                decode_declared_json_rows(&rows, schema)?
+            }
+            None => {
+                let schema = state.inferred_dict_schema(&rows)?;
+                decoding = Instant::now();
+                decode_inferred_json_rows(&rows, &schema)?
+            }
+        };
+        if let Some(profile) = &mut state.summary.profile {
+            profile.schema_inference_ns = profile
+                .schema_inference_ns
+                .saturating_add(duration_ns(decoding - inferring));
+            profile.json_decode_ns = profile
+                .json_decode_ns
+                .saturating_add(duration_ns(decoding.elapsed()));
         }
-        drop(reader);
         let output_bytes = cdf_memory::record_batch_retained_bytes(&record_batch)?;
-        let peak_bytes = input_capacity
+        let peak_bytes = input_bytes
             .checked_add(output_bytes)
             .and_then(|bytes| bytes.checked_add(transient_bytes))
             .ok_or_else(|| CdfError::data("Python dict boundary peak exceeds u64"))?;
@@ -520,7 +1234,7 @@ impl PythonResourceBridge {
                 self.options.max_boundary_bytes
             )));
         }
-        drop(bytes);
+        drop(rows);
         state.emit_record_batch(
             record_batch,
             PythonYieldKind::DictRows,
@@ -534,67 +1248,158 @@ impl PythonResourceBridge {
         &self,
         window: &mut DictRowWindow,
         state: &mut PythonBridgeState,
-        row: &str,
+        row: serde_json::Value,
         emit: &mut F,
         flush: &mut G,
     ) -> Result<()>
     where
-        F: FnMut(ForeignBatchOutcome, PythonYieldKind) -> Result<()>,
+        F: FnMut(ForeignBatchOutcome, PythonYieldKind, bool) -> Result<()>,
         G: FnMut(&mut DictRowWindow, &mut PythonBridgeState, u64, &mut F) -> Result<()>,
     {
-        if !window.try_push(row, self.options.max_boundary_bytes)? {
-            if window.rows == 0 {
-                let row_bytes = u64::try_from(row.len())
-                    .map_err(|_| CdfError::data("Python dict row length exceeds u64"))?;
+        let row_bytes = json_row_heap_bytes(&row)?;
+        let maximum_rows = self.options.dict_batch_rows;
+        let maximum_bytes = self.options.max_boundary_bytes;
+        if !window.admit(row_bytes, maximum_rows, maximum_bytes)? {
+            if window.len() == 0 {
                 return Err(CdfError::data(format!(
-                    "one Python dict row and its serialized conversion require more than the {}-byte boundary limit (serialized row: {row_bytes} bytes); raise max_boundary_bytes",
-                    self.options.max_boundary_bytes
+                    "one Python dict row and its converted form require more than the {maximum_bytes}-byte boundary limit (converted row: {} bytes); raise max_boundary_bytes",
+                    row_bytes.saturating_add(JSON_VALUE_SLOT_BYTES)
                 )));
             }
-            let row_bytes = u64::try_from(row.len())
-                .map_err(|_| CdfError::data("Python dict row length exceeds u64"))?;
-            flush(window, state, row_bytes, emit)?;
-            if !window.try_push(row, self.options.max_boundary_bytes)? {
+            let pending_bytes = row_bytes.saturating_add(JSON_VALUE_SLOT_BYTES);
+            flush(window, state, pending_bytes, emit)?;
+            if !window.admit(row_bytes, maximum_rows, maximum_bytes)? {
                 return Err(CdfError::internal(
                     "Python dict row did not fit an empty admitted conversion window",
                 ));
             }
         }
-        if window.rows == self.options.dict_batch_rows {
-            let row_bytes = u64::try_from(row.len())
-                .map_err(|_| CdfError::data("Python dict row length exceeds u64"))?;
-            flush(window, state, row_bytes, emit)?;
+        window.push(row, row_bytes)?;
+        state.holding = false;
+        if window.len() == maximum_rows {
+            flush(window, state, 0, emit)?;
         }
         Ok(())
     }
 }
 
+fn decode_inferred_json_rows(
+    rows: &[serde_json::Value],
+    schema: &SchemaRef,
+) -> Result<RecordBatch> {
+    let mut decoder = JsonReaderBuilder::new(Arc::clone(schema))
+        .with_batch_size(rows.len())
+        .build_decoder()
+        .map_err(|_| {
+            CdfError::data(
+                "initialize Python dict-row decoder failed; inspect the Python resource locally",
+            )
+        })?;
+    let decode_error = |_| {
+        CdfError::data(
+            "decode Python dict rows failed; inspect the Python resource locally for the offending value",
+        )
+    };
+    decoder.serialize(rows).map_err(decode_error)?;
+    decoder
+        .flush()
+        .map_err(decode_error)?
+        .ok_or_else(|| CdfError::data("Python dict-row decoder emitted no batch"))
+}
+
+fn decode_declared_json_rows(
+    rows: &[serde_json::Value],
+    schema: &SchemaRef,
+) -> Result<RecordBatch> {
+    let mut decoder = JsonReaderBuilder::new(Arc::clone(schema))
+        .with_batch_size(rows.len())
+        .with_strict_mode(true)
+        .build_decoder()
+        .map_err(|_| {
+            CdfError::contract(
+                "initialize Python dict-row decoder for the declared schema failed; the declared types are not JSON-decodable",
+            )
+        })?;
+    let decoded = decoder.serialize(rows).and_then(|()| decoder.flush());
+    match decoded {
+        Ok(Some(record_batch)) => Ok(record_batch),
+        Ok(None) => Err(CdfError::data("Python dict-row decoder emitted no batch")),
+        Err(_) => Err(declared_schema_mismatch(rows, schema).unwrap_or_else(|| {
+            declared_schema_error("a value could not be decoded into its declared type".to_owned())
+        })),
+    }
+}
+
+/// Bytes one bridged batch retains, accounted as the bridge accounted it: Arrow C stream batches
+/// at their header byte count, everything else by walking its distinct buffer allocations.
+pub(crate) fn python_batch_retained_bytes(batch: &Batch, kind: PythonYieldKind) -> Result<u64> {
+    match (kind, batch.record_batch()) {
+        (PythonYieldKind::ArrowCStream, Some(_)) => Ok(batch.header.byte_count),
+        (_, Some(record_batch)) => cdf_memory::record_batch_retained_bytes(record_batch),
+        (_, None) => Ok(0),
+    }
+}
+
+/// How an Arrow batch's payload reached the bridge, which decides its copy classification.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+enum ArrowCopy {
+    Unverified,
+    /// The import verified that every buffer aliases producer memory.
+    ZeroCopyVerified,
+    /// Several yields were concatenated into fresh buffers of the batch's full size.
+    Concatenated,
+}
+
+impl ArrowCopy {
+    fn verified(zero_copy: bool) -> Self {
+        if zero_copy {
+            Self::ZeroCopyVerified
+        } else {
+            Self::Unverified
+        }
+    }
+}
+
 fn python_foreign_outcome(
     sequence: u64,
     batch: Batch,
     kind: PythonYieldKind,
+    copy: ArrowCopy,
 ) -> Result<ForeignBatchOutcome> {
     let transfer_mode = match kind {
-        PythonYieldKind::DictRows => ForeignTransferMode::RowCompat,
+        PythonYieldKind::DictRows | PythonYieldKind::ColumnBatch => ForeignTransferMode::RowCompat,
         PythonYieldKind::ArrowCArray | PythonYieldKind::ArrowCStream => {
             ForeignTransferMode::ArrowCData
         }
     };
     let copy = match kind {
-        PythonYieldKind::DictRows => {
+        PythonYieldKind::DictRows | PythonYieldKind::ColumnBatch => {
             if batch.header.byte_count == 0 {
                 ForeignCopyClassification::CopyUnknown
             } else {
                 ForeignCopyClassification::payload_copy_known(batch.header.byte_count)?
             }
         }
-        PythonYieldKind::ArrowCArray | PythonYieldKind::ArrowCStream => {
-            ForeignCopyClassification::CopyUnknown
-        }
+        PythonYieldKind::ArrowCArray | PythonYieldKind::ArrowCStream => match copy {
+            ArrowCopy::ZeroCopyVerified => ForeignCopyClassification::PayloadZeroCopyVerified,
+            ArrowCopy::Concatenated if batch.header.byte_count > 0 => {
+                ForeignCopyClassification::payload_copy_known(batch.header.byte_count)?
+            }
+            ArrowCopy::Concatenated | ArrowCopy::Unverified => {
+                ForeignCopyClassification::CopyUnknown
+            }
+        },
     };
     ForeignBatchOutcome::new(sequence, batch, transfer_mode, copy)
 }
 
+/// The position-mark handler of a resource that is not `resumable=True`.
+fn refuse_position_mark(_token: String) -> Result<()> {
+    Err(CdfError::contract(
+        "Python resource yielded a position mark but is not declared `resumable=True`",
+    ))
+}
+
 fn materialize_dlt_resource<'py>(resource: &Bound<'py, PyAny>) -> Result<Bound<'py, PyAny>> {
     if resource.hasattr("__call__").map_err(py_error)? {
         resource.call0().map_err(py_error)
@@ -1,10 +1,19 @@
+use arrow_schema::SchemaRef;
 use cdf_kernel::{CdfError, PartitionId, ResourceDescriptor, ResourceId, Result, SchemaHash};
 use serde::{Deserialize, Serialize};
 
+use crate::incremental::CursorWindow;
+
 pub const ARROW_C_ARRAY_METHOD: &str = "__arrow_c_array__";
 pub const ARROW_C_STREAM_METHOD: &str = "__arrow_c_stream__";
+/// Export method of `cdf_sdk.ColumnBatch`, the pyarrow-free columnar yield.
+pub const CDF_COLUMNS_METHOD: &str = "__cdf_columns__";
+/// Export method of the position marks `cdf_sdk.Resume` interleaves into a resumable stream.
+pub const CDF_POSITION_METHOD: &str = "__cdf_position__";
 pub const DEFAULT_DICT_BATCH_ROWS: usize = 8 * 1024;
 pub const DEFAULT_MAX_BOUNDARY_BYTES: u64 = 64 * 1024 * 1024;
+/// Emitted batches a profile lists individually; later ones are only counted.
+pub const PROFILE_WINDOW_LIMIT: usize = 4 * 1024;
 
 #[derive(Clone, Debug, PartialEq, Eq)]
 pub struct PythonBridgeOptions {
@@ -13,6 +22,16 @@ pub struct PythonBridgeOptions {
     pub batch_id_prefix: String,
     pub dict_batch_rows: usize,
     pub max_boundary_bytes: u64,
+    /// Declared Arrow schema that dict rows decode into directly, skipping per-window inference.
+    pub declared_schema: Option<SchemaRef>,
+    /// Columns every emitted batch is narrowed to, in order, after conversion.
+    pub projection: Option<Vec<String>>,
+    /// Row target up to which adjacent same-schema Arrow yields are concatenated into one batch.
+    pub coalesce_rows: Option<usize>,
+    /// Records a [`PythonBridgeProfile`] of the stream in its summary.
+    pub profile: bool,
+    /// Cursor range dict rows must fall in; rows outside it are dropped before conversion.
+    pub cursor_window: Option<CursorWindow>,
 }
 
 impl PythonBridgeOptions {
@@ -28,6 +47,11 @@ impl PythonBridgeOptions {
             batch_id_prefix,
             dict_batch_rows: DEFAULT_DICT_BATCH_ROWS,
             max_boundary_bytes: DEFAULT_MAX_BOUNDARY_BYTES,
+            declared_schema: None,
+            projection: None,
+            coalesce_rows: None,
+            profile: false,
+            cursor_window: None,
         }
     }
 
@@ -51,6 +75,56 @@ impl PythonBridgeOptions {
         Ok(self)
     }
 
+    /// Decodes dict rows straight into `schema`; values that do not fit fail with a data error
+    /// naming the declared field instead of widening or drifting between windows.
+    pub fn with_declared_schema(mut self, schema: SchemaRef) -> Result<Self> {
+        if schema.fields().is_empty() {
+            return Err(CdfError::contract(
+                "declared Python dict-row schema must name at least one field",
+            ));
+        }
+        self.declared_schema = Some(schema);
+        Ok(self)
+    }
+
+    /// Narrows every emitted batch to `columns`; a batch missing one fails as a data error.
+    pub fn with_projection(mut self, columns: Vec<String>) -> Result<Self> {
+        if columns.is_empty() {
+            return Err(CdfError::contract(
+                "Python batch projection must name at least one column",
+            ));
+        }
+        self.projection = Some(columns);
+        Ok(self)
+    }
+
+    /// Concatenates adjacent Arrow yields of one schema until a batch reaches `rows` rows or
+    /// half of `max_boundary_bytes`, whichever comes first.
+    pub fn with_coalesce_rows(mut self, rows: usize) -> Result<Self> {
+        if rows < 2 {
+            return Err(CdfError::contract(
+                "Python Arrow coalescing target must be at least 2 rows",
+            ));
+        }
+        self.coalesce_rows = Some(rows);
+        Ok(self)
+    }
+
+    /// Times each stage of the hot path and lists the emitted batches; see
+    /// [`PythonStreamSummary::profile`].
+    pub fn with_profile(mut self, profile: bool) -> Self {
+        self.profile = profile;
+        self
+    }
+
+    /// Drops dict rows whose cursor falls outside `window` before converting them, and stops
+    /// pulling an ordered resource once a row passes the window's far bound. Arrow and
+    /// `ColumnBatch` yields pass through unfiltered.
+    pub fn with_cursor_window(mut self, window: CursorWindow) -> Self {
+        self.cursor_window = Some(window);
+        self
+    }
+
     pub fn with_resource_id(mut self, resource_id: ResourceId) -> Self {
         self.resource_id = resource_id;
         self.batch_id_prefix = format!(
@@ -68,6 +142,7 @@ pub enum PythonYieldKind {
     DictRows,
     ArrowCArray,
     ArrowCStream,
+    ColumnBatch,
 }
 
 #[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
@@ -114,6 +189,68 @@ pub struct PythonStreamSummary {
     pub dict_row_outcomes: u64,
     pub arrow_c_array_outcomes: u64,
     pub arrow_c_stream_outcomes: u64,
+    pub column_batch_outcomes: u64,
+    /// Undeclared dict windows decoded with the cached inferred schema, skipping inference.
+    pub dict_schema_cache_hits: u64,
+    /// Undeclared dict windows that changed the cached schema: a new field, a wider type, or a
+    /// type the window could not reconcile with the cached one.
+    pub dict_schema_widenings: u64,
+    /// Arrow yields concatenated with their neighbours instead of leaving as their own batch.
+    pub coalesced_arrow_yields: u64,
+    /// Wall time spent inside the resource's own Python, pulling items and Arrow stream batches.
+    pub python_ns: u64,
+    /// Wall time the bridge spent converting yields into batches, outside Python and `emit`.
+    pub bridge_ns: u64,
+    /// Wall time spent in the `emit` callback, which includes waiting on downstream admission.
+    pub emit_ns: u64,
+    /// Stage timings and emitted batches, when the bridge was built `with_profile(true)`.
+    pub profile: Option<PythonBridgeProfile>,
+    /// Dict rows dropped, unconverted, for falling outside the cursor window.
+    pub cursor_skipped_rows: u64,
+    /// Whether an ordered resource passed the cursor window's far bound and was left unfinished.
+    pub cursor_bound_reached: bool,
+}
+
+/// Where one profiled stream spent its time, and the batches it emitted.
+///
+/// Stage times are wall time on the producing thread and do not overlap, except that
+/// `gil_hold_ns` spans every stage that ran attached to the interpreter.
+#[derive(Clone, Debug, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub struct PythonBridgeProfile {
+    pub wall_ns: u64,
+    /// Inside the resource's iterator, including Arrow C stream pulls.
+    pub iterator_ns: u64,
+    /// Converting yielded dicts into JSON values, under the GIL.
+    pub dict_to_json_ns: u64,
+    /// Inferring or widening the schema of undeclared dict windows.
+    pub schema_inference_ns: u64,
+    /// Decoding dict windows into Arrow.
+    pub json_decode_ns: u64,
+    /// In the emit callback, which includes memory admission and downstream backpressure.
+    pub emit_ns: u64,
+    /// Attached to the interpreter, holding the GIL on a GIL-enabled build.
+    pub gil_hold_ns: u64,
+    pub windows: Vec<PythonWindowProfile>,
+    /// Emitted batches past [`PROFILE_WINDOW_LIMIT`], counted but not listed.
+    pub windows_omitted: u64,
+}
+
+/// One emitted batch of a profiled stream.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Serialize, Deserialize)]
+pub struct PythonWindowProfile {
+    pub kind: PythonYieldKind,
+    pub rows: u64,
+    pub bytes: u64,
+}
+
+impl PythonBridgeProfile {
+    pub(crate) fn record_window(&mut self, kind: PythonYieldKind, rows: u64, bytes: u64) {
+        if self.windows.len() < PROFILE_WINDOW_LIMIT {
+            self.windows.push(PythonWindowProfile { kind, rows, bytes });
+        } else {
+            self.windows_omitted = self.windows_omitted.saturating_add(1);
+        }
+    }
 }
 
 pub(crate) fn sanitize_id_part(value: &str) -> String {
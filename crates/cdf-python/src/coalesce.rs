@@ -0,0 +1,109 @@
+use arrow_array::RecordBatch;
+use cdf_kernel::{CdfError, Result, SchemaHash};
+
+use crate::bridge_types::PythonYieldKind;
+
+/// One Arrow yield, imported and projected, awaiting emission.
+pub(crate) struct PendingArrowBatch {
+    pub(crate) batch: RecordBatch,
+    pub(crate) kind: PythonYieldKind,
+    pub(crate) schema_hash: SchemaHash,
+    pub(crate) retained_bytes: u64,
+    pub(crate) zero_copy: bool,
+}
+
+/// What leaves the coalescer: a lone yield unchanged, or several concatenated into one batch.
+pub(crate) enum CoalescedArrow {
+    Single(PendingArrowBatch),
+    Merged {
+        batch: RecordBatch,
+        kind: PythonYieldKind,
+        schema_hash: SchemaHash,
+        /// Retained bytes of the yields concatenated, which stay live until the copy completes.
+        input_bytes: u64,
+        yields: u64,
+    },
+}
+
+/// Adjacent Arrow yields of one schema held back so they leave the bridge as one batch.
+///
+/// Pending yields are capped at half the boundary so that they and their concatenated copy
+/// together still fit the batch reservation the producer holds while it converts them.
+#[derive(Default)]
+pub(crate) struct ArrowCoalescer {
+    pending: Vec<PendingArrowBatch>,
+    rows: usize,
+    bytes: u64,
+}
+
+impl ArrowCoalescer {
+    pub(crate) fn pending_bytes_limit(max_boundary_bytes: u64) -> u64 {
+        max_boundary_bytes / 2
+    }
+
+    pub(crate) fn is_empty(&self) -> bool {
+        self.pending.is_empty()
+    }
+
+    pub(crate) fn rows(&self) -> usize {
+        self.rows
+    }
+
+    /// Whether `next` may join the pending yields without crossing either target.
+    pub(crate) fn admits(
+        &self,
+        next: &PendingArrowBatch,
+        target_rows: usize,
+        target_bytes: u64,
+    ) -> bool {
+        let Some(first) = self.pending.first() else {
+            return true;
+        };
+        first.schema_hash == next.schema_hash
+            && self
+                .rows
+                .checked_add(next.batch.num_rows())
+                .is_some_and(|rows| rows <= target_rows)
+            && self
+                .bytes
+                .checked_add(next.retained_bytes)
+                .is_some_and(|bytes| bytes <= target_bytes)
+    }
+
+    pub(crate) fn push(&mut self, next: PendingArrowBatch) -> Result<()> {
+        self.rows = self
+            .rows
+            .checked_add(next.batch.num_rows())
+            .ok_or_else(|| CdfError::data("coalesced Python Arrow rows exceed usize"))?;
+        self.bytes = self
+            .bytes
+            .checked_add(next.retained_bytes)
+            .ok_or_else(|| CdfError::data("coalesced Python Arrow bytes exceed u64"))?;
+        self.pending.push(next);
+        Ok(())
+    }
+
+    pub(crate) fn take(&mut self) -> Result<Option<CoalescedArrow>> {
+        let pending = std::mem::take(&mut self.pending);
+        let input_bytes = std::mem::take(&mut self.bytes);
+        self.rows = 0;
+        if pending.len() <= 1 {
+            return Ok(pending.into_iter().next().map(CoalescedArrow::Single));
+        }
+        let first = &pending[0];
+        let (kind, schema_hash, schema) =
+            (first.kind, first.schema_hash.clone(), first.batch.schema());
+        let yields = u64::try_from(pending.len())
+            .map_err(|_| CdfError::data("coalesced Python Arrow yields exceed u64"))?;
+        let batch =
+            arrow_select::concat::concat_batches(&schema, pending.iter().map(|item| &item.batch))
+                .map_err(|_| CdfError::internal("concatenate Python Arrow batches failed"))?;
+        Ok(Some(CoalescedArrow::Merged {
+            batch,
+            kind,
+            schema_hash,
+            input_bytes,
+            yields,
+        }))
+    }
+}
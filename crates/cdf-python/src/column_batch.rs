@@ -0,0 +1,318 @@
+use std::sync::Arc;
+
+use arrow_array::{
+    Array, ArrayRef, BooleanArray, Float64Array, Int64Array, RecordBatch, RecordBatchOptions,
+    builder::{BooleanBuilder, Float64Builder, Int64Builder, StringBuilder},
+};
+use arrow_schema::{DataType, Field, Schema};
+use cdf_kernel::{CdfError, Result, parse_arrow_field_type};
+use pyo3::{
+    Bound, PyAny,
+    buffer::PyBuffer,
+    types::{PyAnyMethods, PyBool, PyBoolMethods, PyFloat, PyInt, PyString, PyStringMethods},
+};
+
+use crate::{
+    bridge_types::CDF_COLUMNS_METHOD, dict_schema::declared_schema_error, internal::py_error,
+};
+
+/// One `cdf_sdk.ColumnBatch` field as reported by `__cdf_columns__`.
+struct ColumnField {
+    name: String,
+    data_type: Option<DataType>,
+    nullable: bool,
+}
+
+/// Converts one `__cdf_columns__` object into a record batch in a single bridge call.
+///
+/// Columns are equal-length Python sequences; `array.array` buffers of `q`/`l` or `d` type are
+/// copied with one buffer read, other sequences are appended value by value. Returns `None` for an
+/// empty batch. A declared resource schema is authoritative for names, order, and types.
+pub(crate) fn import_column_batch(
+    object: &Bound<'_, PyAny>,
+    declared: Option<&Schema>,
+    maximum_bytes: u64,
+) -> Result<Option<RecordBatch>> {
+    let exported = object.call_method0(CDF_COLUMNS_METHOD).map_err(py_error)?;
+    let (fields, columns) = exported
+        .extract::<(Vec<(String, Option<String>, bool)>, Vec<Bound<'_, PyAny>>)>()
+        .map_err(|_| {
+            CdfError::data(
+                "Python column batch must export (fields, columns) from __cdf_columns__; use cdf_sdk.ColumnBatch",
+            )
+        })?;
+    if fields.is_empty() || fields.len() != columns.len() {
+        return Err(CdfError::data(
+            "Python column batch must name one field per column and at least one column",
+        ));
+    }
+    let fields = fields
+        .into_iter()
+        .map(|(name, data_type, nullable)| {
+            Ok(ColumnField {
+                name,
+                data_type: data_type
+                    .as_deref()
+                    .map(parse_arrow_field_type)
+                    .transpose()?,
+                nullable,
+            })
+        })
+        .collect::<Result<Vec<_>>>()?;
+    let rows = columns[0].len().map_err(py_error)?;
+    for column in &columns[1..] {
+        if column.len().map_err(py_error)? != rows {
+            return Err(CdfError::data(
+                "Python column batch columns must have equal lengths",
+            ));
+        }
+    }
+    if rows == 0 {
+        return Ok(None);
+    }
+
+    let ordered = match declared {
+        Some(schema) => declared_column_order(&fields, schema)?,
+        None => (0..fields.len()).map(|index| (index, None)).collect(),
+    };
+    let mut budget = ColumnBudget::new(maximum_bytes);
+    let mut schema_fields = Vec::with_capacity(ordered.len());
+    let mut arrays = Vec::with_capacity(ordered.len());
+    for (index, declared_field) in ordered {
+        let field = &fields[index];
+        let column = &columns[index];
+        let (data_type, nullable) = match declared_field {
+            Some(declared) => (declared.data_type().clone(), declared.is_nullable()),
+            None => match &field.data_type {
+                Some(data_type) => (data_type.clone(), field.nullable),
+                None => (infer_column_type(column, &field.name)?, field.nullable),
+            },
+        };
+        let array = build_column(column, &field.name, &data_type, rows, &mut budget)?;
+        if !nullable && array.null_count() > 0 {
+            return Err(CdfError::data(format!(
+                "Python column batch non-nullable column `{}` contains null",
+                field.name
+            )));
+        }
+        schema_fields.push(Field::new(field.name.clone(), data_type, nullable));
+        arrays.push(array);
+    }
+    RecordBatch::try_new_with_options(
+        Arc::new(Schema::new(schema_fields)),
+        arrays,
+        &RecordBatchOptions::new().with_row_count(Some(rows)),
+    )
+    .map(Some)
+    .map_err(|_| CdfError::internal("assemble Python column batch failed"))
+}
+
+fn declared_column_order<'a>(
+    fields: &[ColumnField],
+    schema: &'a Schema,
+) -> Result<Vec<(usize, Option<&'a Field>)>> {
+    if fields.len() != schema.fields().len() {
+        return Err(declared_schema_error(
+            "a column batch does not carry exactly the declared columns".to_owned(),
+        ));
+    }
+    schema
+        .fields()
+        .iter()
+        .map(|declared| {
+            let index = fields
+                .iter()
+                .position(|field| field.name == *declared.name())
+                .ok_or_else(|| {
+                    declared_schema_error(format!(
+                        "a column batch omits declared column `{}`",
+                        declared.name()
+                    ))
+                })?;
+            if fields[index]
+                .data_type
+                .as_ref()
+                .is_some_and(|data_type| data_type != declared.data_type())
+            {
+                return Err(declared_schema_error(format!(
+                    "a column batch types column `{}` differently from declared type {}",
+                    declared.name(),
+                    declared.data_type()
+                )));
+            }
+            Ok((index, Some(declared.as_ref())))
+        })
+        .collect()
+}
+
+fn infer_column_type(column: &Bound<'_, PyAny>, name: &str) -> Result<DataType> {
+    if PyBuffer::<i64>::get(column).is_ok() {
+        return Ok(DataType::Int64);
+    }
+    if PyBuffer::<f64>::get(column).is_ok() {
+        return Ok(DataType::Float64);
+    }
+    for value in column.try_iter().map_err(py_error)? {
+        let value = value.map_err(py_error)?;
+        if value.is_none() {
+            continue;
+        }
+        return if value.is_instance_of::<PyBool>() {
+            Ok(DataType::Boolean)
+        } else if value.is_instance_of::<PyInt>() {
+            Ok(DataType::Int64)
+        } else if value.is_instance_of::<PyFloat>() {
+            Ok(DataType::Float64)
+        } else if value.is_instance_of::<PyString>() {
+            Ok(DataType::Utf8)
+        } else {
+            Err(unsupported_value(name))
+        };
+    }
+    Ok(DataType::Null)
+}
+
+fn build_column(
+    column: &Bound<'_, PyAny>,
+    name: &str,
+    data_type: &DataType,
+    rows: usize,
+    budget: &mut ColumnBudget,
+) -> Result<ArrayRef> {
+    let py = column.py();
+    match data_type {
+        DataType::Int64 => {
+            budget.charge_fixed(rows, 8)?;
+            if let Ok(buffer) = PyBuffer::<i64>::get(column) {
+                let values = buffer.to_vec(py).map_err(py_error)?;
+                return Ok(Arc::new(Int64Array::from(values)));
+            }
+            let mut builder = Int64Builder::with_capacity(rows);
+            for value in column.try_iter().map_err(py_error)? {
+                let value = value.map_err(py_error)?;
+                if value.is_none() {
+                    builder.append_null();
+                } else if value.is_instance_of::<PyBool>() {
+                    return Err(mismatched_value(name, data_type));
+                } else {
+                    builder.append_value(
+                        value
+                            .extract::<i64>()
+                            .map_err(|_| mismatched_value(name, data_type))?,
+                    );
+                }
+            }
+            Ok(Arc::new(builder.finish()))
+        }
+        DataType::Float64 => {
+            budget.charge_fixed(rows, 8)?;
+            if let Ok(buffer) = PyBuffer::<f64>::get(column) {
+                let values = buffer.to_vec(py).map_err(py_error)?;
+                return Ok(Arc::new(Float64Array::from(values)));
+            }
+            let mut builder = Float64Builder::with_capacity(rows);
+            for value in column.try_iter().map_err(py_error)? {
+                let value = value.map_err(py_error)?;
+                if value.is_none() {
+                    builder.append_null();
+                } else if value.is_instance_of::<PyBool>() {
+                    return Err(mismatched_value(name, data_type));
+                } else {
+                    builder.append_value(
+                        value
+                            .extract::<f64>()
+                            .map_err(|_| mismatched_value(name, data_type))?,
+                    );
+                }
+            }
+            Ok(Arc::new(builder.finish()))
+        }
+        DataType::Boolean => {
+            budget.charge_fixed(rows.div_ceil(8), 1)?;
+            let mut builder = BooleanBuilder::with_capacity(rows);
+            for value in column.try_iter().map_err(py_error)? {
+                let value = value.map_err(py_error)?;
+                if value.is_none() {
+                    builder.append_null();
+                } else {
+                    let value = value
+                        .cast::<PyBool>()
+                        .map_err(|_| mismatched_value(name, data_type))?;
+                    builder.append_value(value.is_true());
+                }
+            }
+            let array: BooleanArray = builder.finish();
+            Ok(Arc::new(array))
+        }
+        DataType::Utf8 => {
+            budget.charge_fixed(rows.saturating_add(1), 4)?;
+            let mut builder = StringBuilder::with_capacity(rows, 0);
+            for value in column.try_iter().map_err(py_error)? {
+                let value = value.map_err(py_error)?;
+                if value.is_none() {
+                    builder.append_null();
+                } else {
+                    let text = value
+                        .cast::<PyString>()
+                        .map_err(|_| mismatched_value(name, data_type))?;
+                    let text = text
+                        .to_str()
+                        .map_err(|_| mismatched_value(name, data_type))?;
+                    budget.charge_fixed(text.len(), 1)?;
+                    builder.append_value(text);
+                }
+            }
+            Ok(Arc::new(builder.finish()))
+        }
+        DataType::Null => {
+            for value in column.try_iter().map_err(py_error)? {
+                if !value.map_err(py_error)?.is_none() {
+                    return Err(mismatched_value(name, data_type));
+                }
+            }
+            Ok(arrow_array::new_null_array(&DataType::Null, rows))
+        }
+        other => Err(CdfError::contract(format!(
+            "Python column batch column `{name}` declares type {other}; column batches carry int64, float64, boolean, and utf8 columns, so yield dict rows or Arrow for other types"
+        ))),
+    }
+}
+
+/// Running conversion-size check so an oversized column batch fails before it is fully built.
+struct ColumnBudget {
+    used: u64,
+    maximum: u64,
+}
+
+impl ColumnBudget {
+    fn new(maximum: u64) -> Self {
+        Self { used: 0, maximum }
+    }
+
+    fn charge_fixed(&mut self, count: usize, width: u64) -> Result<()> {
+        self.used = u64::try_from(count)
+            .ok()
+            .and_then(|count| count.checked_mul(width))
+            .and_then(|bytes| self.used.checked_add(bytes))
+            .ok_or_else(|| CdfError::data("Python column batch size exceeds u64"))?;
+        if self.used > self.maximum {
+            return Err(CdfError::data(format!(
+                "Python column batch requires more than the {}-byte boundary limit; yield smaller column batches or raise max_boundary_bytes",
+                self.maximum
+            )));
+        }
+        Ok(())
+    }
+}
+
+fn mismatched_value(name: &str, data_type: &DataType) -> CdfError {
+    CdfError::data(format!(
+        "Python column batch column `{name}` holds a value that does not fit type {data_type}"
+    ))
+}
+
+fn unsupported_value(name: &str) -> CdfError {
+    CdfError::data(format!(
+        "Python column batch column `{name}` holds a value that is not bool, int, float, str, or None; yield Arrow for other values"
+    ))
+}
@@ -1,22 +1,59 @@
-use cdf_http::{HttpRequest, Redactor, SecretProvider, SecretUri, TraceEvent};
-use cdf_kernel::{Result, SourcePosition};
+use std::{collections::VecDeque, sync::Arc, time::Instant};
 
-#[derive(Clone, Debug, PartialEq, Eq)]
+use cdf_http::{
+    EgressAllowlist, HttpRequest, HttpResponse, HttpResponseBudget, HttpTransport, RateLimitPolicy,
+    RateLimiter, Redactor, SecretCache, SecretProvider, SecretUri, SecretValue, TraceEvent,
+    classify_response, send_with_policy,
+};
+use cdf_kernel::{CdfError, ErrorKind, Result, SourcePosition};
+use cdf_memory::{ConsumerKey, MemoryClass, MemoryCoordinator, MemoryLease, ReservationRequest};
+use futures_util::StreamExt;
+use serde::{Deserialize, Serialize};
+
+/// Log ring capacity a run reserves per context unless configured otherwise.
+pub const DEFAULT_CONTEXT_LOG_BYTES: u64 = 1024 * 1024;
+pub const DEFAULT_CONTEXT_LOG_MESSAGES_PER_MINUTE: u32 = 600;
+
+/// Host state behind a Python resource's `ctx`.
+///
+/// No run hands Python a context yet: resources are called without one, so nothing builds
+/// the SDK's private `_HostLogger` from [`Self::log_policy`] or attaches
+/// [`Self::log_evidence`] to run evidence. Those are the seams the Python `ctx.logger` and the
+/// run's evidence writer plug into once a run hosts a context.
+///
+/// The context is not `Clone`: its log ring may hold a memory lease, and a copy would report
+/// bytes it does not own.
+#[derive(Debug)]
 pub struct PythonContext {
     redactor: Redactor,
+    secrets: SecretCache,
+    /// Run clock the secret cache's TTL and the log rate are measured against.
+    started: Instant,
     cursor: Option<SourcePosition>,
-    logs: Vec<ContextLogEvent>,
+    logs: ContextLogRing,
+    traces: Vec<TraceEvent>,
 }
 
 impl PythonContext {
-    pub fn new(cursor: Option<SourcePosition>) -> Self {
+    /// A context streaming its log into `logs`. Build the ring with [`ContextLogRing::reserve`]
+    /// so its capacity is accounted to the run's memory coordinator.
+    pub fn new(cursor: Option<SourcePosition>, logs: ContextLogRing) -> Self {
         Self {
             redactor: Redactor::default(),
+            secrets: SecretCache::default(),
+            started: Instant::now(),
             cursor,
-            logs: Vec::new(),
+            logs,
+            traces: Vec::new(),
         }
     }
 
+    /// Replaces the run's secret cache, to change its TTL or capacity.
+    pub fn with_secret_cache(mut self, secrets: SecretCache) -> Self {
+        self.secrets = secrets;
+        self
+    }
+
     pub fn cursor(&self) -> Option<&SourcePosition> {
         self.cursor.as_ref()
     }
@@ -25,35 +62,368 @@ impl PythonContext {
         &self.redactor
     }
 
+    /// Resolves the secret URIs a resource declares before its first request, so each one is
+    /// fetched from the provider once and registered with the redactor up front.
+    pub fn prefetch_secrets<'a>(
+        &mut self,
+        uris: impl IntoIterator<Item = &'a SecretUri>,
+        provider: &dyn SecretProvider,
+    ) -> Result<()> {
+        for uri in uris {
+            self.resolve_secret(uri, provider)?;
+        }
+        Ok(())
+    }
+
+    /// Authorizes `request` with the bearer token at `uri`. The token is served from the run's
+    /// secret cache, so paged calls with one token reach the provider once per TTL.
     pub fn resolve_bearer_request(
         &mut self,
         request: HttpRequest,
         uri: &SecretUri,
         provider: &dyn SecretProvider,
     ) -> Result<HttpRequest> {
-        let secret = provider.resolve(uri)?;
-        self.redactor.register_secret_value(&secret)?;
+        let secret = self.resolve_secret(uri, provider)?;
         Ok(request.with_header("authorization", format!("Bearer {}", secret.as_str()?)))
     }
 
+    /// Sends `request` authorized with the bearer token at `uri` and records its trace.
+    ///
+    /// A 401 or 403 means the cached token may have been rotated upstream, so it is dropped from
+    /// the cache, resolved again, and the request sent once more. The second response is returned
+    /// whatever its status; [`classify_response`] maps it into the error taxonomy.
+    pub async fn send_bearer(
+        &mut self,
+        transport: &dyn HttpTransport,
+        allowlist: &EgressAllowlist,
+        request: HttpRequest,
+        uri: &SecretUri,
+        provider: &dyn SecretProvider,
+        budget: &HttpResponseBudget,
+    ) -> Result<HttpResponse> {
+        let authorized = self.resolve_bearer_request(request.clone(), uri, provider)?;
+        let sent = send_with_policy(transport, allowlist, authorized.clone(), budget.clone()).await;
+        let response = self.record_exchange(&authorized, sent)?;
+        if !classify_response(&response).is_some_and(|error| error.kind == ErrorKind::Auth) {
+            return Ok(response);
+        }
+        drop(response);
+        self.secrets.invalidate(uri);
+        let authorized = self.resolve_bearer_request(request, uri, provider)?;
+        let sent = send_with_policy(transport, allowlist, authorized.clone(), budget.clone()).await;
+        self.record_exchange(&authorized, sent)
+    }
+
+    /// The secret at `uri`, resolved through the cache. Only a fresh resolution is registered
+    /// with the redactor; a cached value already is.
+    fn resolve_secret(
+        &mut self,
+        uri: &SecretUri,
+        provider: &dyn SecretProvider,
+    ) -> Result<&SecretValue> {
+        let now_ms = self.now_ms();
+        let resolved = !self.secrets.is_fresh(uri, now_ms);
+        let secret = self.secrets.resolve(uri, provider, now_ms)?;
+        if resolved {
+            self.redactor.register_secret_value(secret)?;
+        }
+        Ok(secret)
+    }
+
     pub fn trace_request(&self, request: &HttpRequest) -> TraceEvent {
         TraceEvent::from_request(request, &self.redactor)
     }
 
+    /// Sends independent read requests with at most `max_in_flight` outstanding and returns the
+    /// responses in request order.
+    ///
+    /// Every exchange passes the egress allowlist and records a redacted trace event, in request
+    /// order. The first failure is returned after its trace is recorded; requests still in flight
+    /// are dropped with it.
+    pub async fn get_many(
+        &mut self,
+        transport: &dyn HttpTransport,
+        allowlist: &EgressAllowlist,
+        requests: Vec<HttpRequest>,
+        budget: &HttpResponseBudget,
+        max_in_flight: usize,
+    ) -> Result<Vec<HttpResponse>> {
+        if max_in_flight == 0 {
+            return Err(CdfError::contract(
+                "Python HTTP get_many requires max_in_flight of at least 1",
+            ));
+        }
+        if requests
+            .iter()
+            .any(|request| !request.method.is_safe_read())
+        {
+            return Err(CdfError::contract(
+                "Python HTTP get_many sends safe read requests only; send writes one at a time with request()",
+            ));
+        }
+        let mut responses = Vec::with_capacity(requests.len());
+        let mut exchanges = futures_util::stream::iter(requests)
+            .map(move |request| async move {
+                let sent =
+                    send_with_policy(transport, allowlist, request.clone(), budget.clone()).await;
+                (request, sent)
+            })
+            .buffered(max_in_flight);
+        while let Some((request, sent)) = exchanges.next().await {
+            responses.push(self.record_exchange(&request, sent)?);
+            budget.check_cancellation()?;
+        }
+        Ok(responses)
+    }
+
+    /// Records the redacted trace of one exchange and passes its outcome through.
+    fn record_exchange(
+        &mut self,
+        request: &HttpRequest,
+        sent: Result<HttpResponse>,
+    ) -> Result<HttpResponse> {
+        match sent {
+            Ok(response) => {
+                self.traces.push(TraceEvent::from_exchange(
+                    request,
+                    &response,
+                    &self.redactor,
+                    None,
+                ));
+                Ok(response)
+            }
+            Err(error) => {
+                let mut trace = TraceEvent::from_request(request, &self.redactor);
+                trace.error_kind = Some(error.kind.clone());
+                self.traces.push(trace);
+                Err(error)
+            }
+        }
+    }
+
+    pub fn traces(&self) -> &[TraceEvent] {
+        &self.traces
+    }
+
+    /// Level and rate a Python `_HostLogger` sinking into [`Self::log`] should apply before
+    /// formatting a message.
+    pub fn log_policy(&self) -> &ContextLogPolicy {
+        self.logs.policy()
+    }
+
+    /// Streams `message` into the bounded log ring. Messages below the policy level or over its
+    /// rate are counted and dropped; the oldest messages make room once the ring is full.
     pub fn log(&mut self, level: impl Into<String>, message: impl AsRef<str>) {
-        self.logs.push(ContextLogEvent {
-            level: level.into(),
-            message: self.redactor.redact_text(message.as_ref()),
-        });
+        let now_ms = self.now_ms();
+        self.logs.push(level.into(), message.as_ref(), now_ms);
     }
 
-    pub fn logs(&self) -> &[ContextLogEvent] {
-        &self.logs
+    /// The messages still held, redacted as they are read so dropped messages are never scanned.
+    pub fn logs(&self) -> Vec<ContextLogEvent> {
+        self.logs.events(&self.redactor)
+    }
+
+    /// The held messages and drop counts, for the run's evidence once a run hosts a context.
+    pub fn log_evidence(&self) -> ContextLogEvidence {
+        ContextLogEvidence {
+            events: self.logs(),
+            counts: self.logs.counts(),
+        }
+    }
+
+    fn now_ms(&self) -> u64 {
+        u64::try_from(self.started.elapsed().as_millis()).unwrap_or(u64::MAX)
     }
 }
 
-#[derive(Clone, Debug, PartialEq, Eq)]
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
 pub struct ContextLogEvent {
     pub level: String,
     pub message: String,
 }
+
+/// Severity of a context log message. Messages at an unrecognized level are always kept.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq, PartialOrd, Ord, Serialize, Deserialize)]
+#[serde(rename_all = "snake_case")]
+pub enum ContextLogLevel {
+    Debug,
+    #[default]
+    Info,
+    Warning,
+    Error,
+}
+
+impl ContextLogLevel {
+    pub fn parse(level: &str) -> Option<Self> {
+        match level.to_ascii_lowercase().as_str() {
+            "debug" => Some(Self::Debug),
+            "info" => Some(Self::Info),
+            "warn" | "warning" => Some(Self::Warning),
+            "error" => Some(Self::Error),
+            _ => None,
+        }
+    }
+}
+
+/// Which context log messages are kept.
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+pub struct ContextLogPolicy {
+    pub min_level: ContextLogLevel,
+    pub messages_per_minute: Option<u32>,
+}
+
+impl Default for ContextLogPolicy {
+    fn default() -> Self {
+        Self {
+            min_level: ContextLogLevel::Info,
+            messages_per_minute: Some(DEFAULT_CONTEXT_LOG_MESSAGES_PER_MINUTE),
+        }
+    }
+}
+
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub struct ContextLogCounts {
+    pub kept: u64,
+    pub below_level: u64,
+    pub rate_limited: u64,
+    /// Messages pushed out of the full ring, or too large to fit it at all.
+    pub evicted: u64,
+}
+
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+pub struct ContextLogEvidence {
+    pub events: Vec<ContextLogEvent>,
+    pub counts: ContextLogCounts,
+}
+
+/// Bounded buffer the context logger streams into.
+///
+/// The ring holds at most `capacity_bytes` of level and message text and evicts its oldest
+/// messages to admit new ones. A ring built with [`ContextLogRing::reserve`] holds a memory
+/// lease for that capacity for as long as it lives, so rings are not `Clone`.
+#[derive(Debug)]
+pub struct ContextLogRing {
+    policy: ContextLogPolicy,
+    limiter: RateLimiter,
+    capacity_bytes: u64,
+    used_bytes: u64,
+    events: VecDeque<ContextLogEvent>,
+    counts: ContextLogCounts,
+    lease: Option<MemoryLease>,
+}
+
+impl ContextLogRing {
+    /// A ring whose capacity is not accounted to any memory coordinator.
+    pub fn new(capacity_bytes: u64, policy: ContextLogPolicy) -> Result<Self> {
+        Self::validate(capacity_bytes, &policy)?;
+        Ok(Self::with_capacity(capacity_bytes, policy, None))
+    }
+
+    /// A ring whose capacity is reserved from `memory` as source memory.
+    pub async fn reserve(
+        memory: Arc<dyn MemoryCoordinator>,
+        capacity_bytes: u64,
+        policy: ContextLogPolicy,
+    ) -> Result<Self> {
+        Self::validate(capacity_bytes, &policy)?;
+        let lease = cdf_memory::reserve(
+            memory,
+            ReservationRequest::new(
+                ConsumerKey::new("python-context-log", MemoryClass::Source)?,
+                capacity_bytes,
+            )?,
+        )
+        .await?;
+        Ok(Self::with_capacity(capacity_bytes, policy, Some(lease)))
+    }
+
+    pub fn policy(&self) -> &ContextLogPolicy {
+        &self.policy
+    }
+
+    pub fn counts(&self) -> ContextLogCounts {
+        self.counts
+    }
+
+    /// Bytes held from the memory coordinator for the ring; zero for an unaccounted ring.
+    pub fn reserved_bytes(&self) -> u64 {
+        self.lease.as_ref().map_or(0, MemoryLease::bytes)
+    }
+
+    fn validate(capacity_bytes: u64, policy: &ContextLogPolicy) -> Result<()> {
+        if capacity_bytes == 0 || policy.messages_per_minute == Some(0) {
+            return Err(CdfError::contract(
+                "Python context log ring requires a nonzero capacity and message rate",
+            ));
+        }
+        Ok(())
+    }
+
+    fn with_capacity(
+        capacity_bytes: u64,
+        policy: ContextLogPolicy,
+        lease: Option<MemoryLease>,
+    ) -> Self {
+        let limiter = RateLimiter::new(
+            RateLimitPolicy {
+                requests_per_minute: policy.messages_per_minute,
+                quota_headers: Vec::new(),
+            },
+            0,
+        );
+        Self {
+            policy,
+            limiter,
+            capacity_bytes,
+            used_bytes: 0,
+            events: VecDeque::new(),
+            counts: ContextLogCounts::default(),
+            lease,
+        }
+    }
+
+    fn push(&mut self, level: String, message: &str, now_ms: u64) {
+        if ContextLogLevel::parse(&level).is_some_and(|parsed| parsed < self.policy.min_level) {
+            self.counts.below_level = self.counts.below_level.saturating_add(1);
+            return;
+        }
+        if !self.limiter.before_request(now_ms).allowed {
+            self.counts.rate_limited = self.counts.rate_limited.saturating_add(1);
+            return;
+        }
+        let bytes = event_bytes(&level, message);
+        if bytes > self.capacity_bytes {
+            self.counts.evicted = self.counts.evicted.saturating_add(1);
+            return;
+        }
+        while self.used_bytes.saturating_add(bytes) > self.capacity_bytes {
+            let Some(oldest) = self.events.pop_front() else {
+                break;
+            };
+            self.used_bytes = self
+                .used_bytes
+                .saturating_sub(event_bytes(&oldest.level, &oldest.message));
+            self.counts.evicted = self.counts.evicted.saturating_add(1);
+        }
+        self.used_bytes = self.used_bytes.saturating_add(bytes);
+        self.counts.kept = self.counts.kept.saturating_add(1);
+        self.events.push_back(ContextLogEvent {
+            level,
+            message: message.to_owned(),
+        });
+    }
+
+    fn events(&self, redactor: &Redactor) -> Vec<ContextLogEvent> {
+        self.events
+            .iter()
+            .map(|event| ContextLogEvent {
+                level: event.level.clone(),
+                message: redactor.redact_text(&event.message),
+            })
+            .collect()
+    }
+}
+
+fn event_bytes(level: &str, message: &str) -> u64 {
+    u64::try_from(level.len().saturating_add(message.len())).unwrap_or(u64::MAX)
+}
@@ -0,0 +1,202 @@
+use std::sync::Arc;
+
+use arrow_schema::{DataType, Field, Fields, Schema};
+use cdf_kernel::CdfError;
+
+/// Returns whether one converted JSON value decodes into `data_type` without coercion.
+///
+/// Strings are accepted by every temporal, decimal, and binary type because arrow-json parses
+/// them there; the decoder remains the authority for their text. Non-integral numbers never fit
+/// an integer column, so a fractional value is a mismatch rather than a silent truncation.
+pub(crate) fn json_value_fits(value: &serde_json::Value, data_type: &DataType) -> bool {
+    use serde_json::Value;
+
+    match (value, data_type) {
+        (Value::Null, _) => true,
+        (Value::Bool(_), DataType::Boolean) => true,
+        (Value::Number(number), data_type) if data_type.is_integer() => {
+            if number.is_f64() {
+                return false;
+            }
+            match data_type {
+                DataType::Int8 => number.as_i64().is_some_and(|n| i8::try_from(n).is_ok()),
+                DataType::Int16 => number.as_i64().is_some_and(|n| i16::try_from(n).is_ok()),
+                DataType::Int32 => number.as_i64().is_some_and(|n| i32::try_from(n).is_ok()),
+                DataType::Int64 => number.is_i64(),
+                DataType::UInt8 => number.as_u64().is_some_and(|n| u8::try_from(n).is_ok()),
+                DataType::UInt16 => number.as_u64().is_some_and(|n| u16::try_from(n).is_ok()),
+                DataType::UInt32 => number.as_u64().is_some_and(|n| u32::try_from(n).is_ok()),
+                _ => number.is_u64(),
+            }
+        }
+        (Value::Number(_), data_type) if data_type.is_floating() => true,
+        (
+            Value::Number(number),
+            DataType::Timestamp(..)
+            | DataType::Date32
+            | DataType::Date64
+            | DataType::Time32(_)
+            | DataType::Time64(_)
+            | DataType::Duration(_),
+        ) => !number.is_f64(),
+        (Value::Number(_), DataType::Decimal128(..) | DataType::Decimal256(..)) => true,
+        (
+            Value::String(_),
+            DataType::Utf8
+            | DataType::LargeUtf8
+            | DataType::Utf8View
+            | DataType::Binary
+            | DataType::LargeBinary
+            | DataType::BinaryView
+            | DataType::Timestamp(..)
+            | DataType::Date32
+            | DataType::Date64
+            | DataType::Time32(_)
+            | DataType::Time64(_)
+            | DataType::Duration(_)
+            | DataType::Decimal128(..)
+            | DataType::Decimal256(..),
+        ) => true,
+        (
+            Value::Array(values),
+            DataType::List(item) | DataType::LargeList(item) | DataType::ListView(item),
+        ) => values.iter().all(|value| field_accepts(item, value)),
+        (Value::Object(map), DataType::Struct(fields)) => {
+            map.keys()
+                .all(|key| fields.iter().any(|field| field.name() == key))
+                && fields.iter().all(|field| {
+                    field_accepts(field, map.get(field.name()).unwrap_or(&Value::Null))
+                })
+        }
+        (Value::Object(map), DataType::Map(entries, _)) => match entries.data_type() {
+            DataType::Struct(parts) if parts.len() == 2 => {
+                map.values().all(|value| field_accepts(&parts[1], value))
+            }
+            _ => false,
+        },
+        _ => false,
+    }
+}
+
+fn field_accepts(field: &Field, value: &serde_json::Value) -> bool {
+    if value.is_null() {
+        field.is_nullable()
+    } else {
+        json_value_fits(value, field.data_type())
+    }
+}
+
+/// Names the first declared-schema violation in a dict-row window without publishing values.
+///
+/// Only schema vocabulary (declared field names and types) appears in the message; an
+/// undeclared key is reported by position class, never by its text.
+pub(crate) fn declared_schema_mismatch(
+    rows: &[serde_json::Value],
+    schema: &Schema,
+) -> Option<CdfError> {
+    for row in rows {
+        let serde_json::Value::Object(map) = row else {
+            return Some(declared_schema_error(
+                "a yielded row is not a JSON object".to_owned(),
+            ));
+        };
+        if map
+            .keys()
+            .any(|key| schema.fields().iter().all(|field| field.name() != key))
+        {
+            return Some(declared_schema_error(
+                "a row carries a field that the declared schema does not name".to_owned(),
+            ));
+        }
+        for field in schema.fields() {
+            let value = map.get(field.name()).unwrap_or(&serde_json::Value::Null);
+            if value.is_null() && !field.is_nullable() {
+                return Some(declared_schema_error(format!(
+                    "non-nullable field `{}` is missing or null",
+                    field.name()
+                )));
+            }
+            if !field_accepts(field, value) {
+                return Some(declared_schema_error(format!(
+                    "field `{}` holds a value that does not fit declared type {}",
+                    field.name(),
+                    field.data_type()
+                )));
+            }
+        }
+    }
+    None
+}
+
+pub(crate) fn declared_schema_error(detail: String) -> CdfError {
+    CdfError::data(format!(
+        "Python dict rows do not match the declared resource schema: {detail}; yield values of the declared types or correct `schema=`"
+    ))
+}
+
+/// Returns whether every row of an inferred dict window decodes into `schema` unchanged.
+pub(crate) fn rows_fit_schema(rows: &[serde_json::Value], schema: &Schema) -> bool {
+    rows.iter().all(|row| {
+        let serde_json::Value::Object(map) = row else {
+            return false;
+        };
+        map.keys()
+            .all(|key| schema.fields().iter().any(|field| field.name() == key))
+            && schema.fields().iter().all(|field| {
+                field_accepts(
+                    field,
+                    map.get(field.name()).unwrap_or(&serde_json::Value::Null),
+                )
+            })
+    })
+}
+
+/// Widens a cached inferred schema so it also admits a newly inferred window schema.
+///
+/// Cached fields keep their order and new fields append, so the result never reorders or drops
+/// columns that earlier batches already published; a field the window omits stays, filled with
+/// nulls. A field whose types cannot be reconciled (for example a string where a number was
+/// inferred) takes the window's type, so that change crosses as its own physical observation
+/// while every other column stays put.
+pub(crate) fn widen_inferred_schema(cached: &Schema, window: &Schema) -> Schema {
+    Schema::new(widen_fields(cached.fields(), window.fields()))
+}
+
+fn widen_fields(cached: &Fields, window: &Fields) -> Fields {
+    let mut fields = Vec::with_capacity(cached.len().max(window.len()));
+    for field in cached {
+        match window.find(field.name()) {
+            Some((_, incoming)) => fields.push(Arc::new(Field::new(
+                field.name(),
+                widen_data_type(field.data_type(), incoming.data_type())
+                    .unwrap_or_else(|| incoming.data_type().clone()),
+                true,
+            ))),
+            None => fields.push(Arc::clone(field)),
+        }
+    }
+    for field in window {
+        if cached.find(field.name()).is_none() {
+            fields.push(Arc::clone(field));
+        }
+    }
+    Fields::from(fields)
+}
+
+fn widen_data_type(cached: &DataType, incoming: &DataType) -> Option<DataType> {
+    match (cached, incoming) {
+        (cached, incoming) if cached == incoming => Some(cached.clone()),
+        (DataType::Null, other) | (other, DataType::Null) => Some(other.clone()),
+        (DataType::Int64, DataType::Float64) | (DataType::Float64, DataType::Int64) => {
+            Some(DataType::Float64)
+        }
+        (DataType::List(cached), DataType::List(incoming)) => Some(DataType::new_list(
+            widen_data_type(cached.data_type(), incoming.data_type())?,
+            true,
+        )),
+        (DataType::Struct(cached), DataType::Struct(incoming)) => {
+            Some(DataType::Struct(widen_fields(cached, incoming)))
+        }
+        _ => None,
+    }
+}
@@ -5,13 +5,15 @@ use cdf_kernel::{
     CursorSpec, CursorValue, ForeignState, PipelineId, ResourceDescriptor, ResourceId, Result,
     ScopeKey, SourcePosition, TrustLevel, WriteDisposition,
 };
-use pyo3::{Bound, PyAny, types::PyAnyMethods};
+use pyo3::{Bound, Py, PyAny, types::PyAnyMethods};
 use serde::{Deserialize, Serialize};
 use serde_json::{Value, json};
 use sha2::{Digest, Sha256};
 
 use crate::{
     bridge_types::{PythonStreamSummary, sanitize_id_part},
+    dlt_state::DltStateDelta,
+    incremental::{CursorRowOrder, CursorWindow},
     internal::{json_error, py_error, python_dict_to_json},
 };
 
@@ -134,6 +136,31 @@ pub struct DltIncrementalHint {
     pub row_order: Option<String>,
 }
 
+impl DltIncrementalHint {
+    /// The cursor window a read resuming after `last_value` applies, or `None` when the hint
+    /// bounds nothing. The committed `last_value` supersedes `initial_value` as the start,
+    /// unless the hint tolerates lag: rows may then arrive behind `last_value`, and the lag is
+    /// in milliseconds while the cursor's unit is unknown here, so only `initial_value` bounds
+    /// the start and the checkpoint's own lag handling decides what is late.
+    pub fn cursor_window(&self, last_value: Option<&Value>) -> Result<Option<CursorWindow>> {
+        let order = match self.row_order.as_deref() {
+            None => None,
+            Some("asc") => Some(CursorRowOrder::Ascending),
+            Some("desc") => Some(CursorRowOrder::Descending),
+            Some(other) => {
+                return Err(CdfError::contract(format!(
+                    "unknown dlt incremental row_order `{other}`"
+                )));
+            }
+        };
+        let start = last_value
+            .filter(|value| !value.is_null() && self.lag_tolerance_ms == 0)
+            .or(self.initial_value.as_ref())
+            .cloned();
+        CursorWindow::new(&self.cursor_path, start, self.end_value.clone(), order)
+    }
+}
+
 #[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
 pub struct DltSchemaContractHint {
     pub mode: String,
@@ -228,10 +255,17 @@ impl DltBridgeMetadata {
                 ),
             );
             if incremental.initial_value.is_some() || incremental.end_value.is_some() {
-                table.preview_only(
+                table.mapped(
                     "incremental initial/end value",
-                    "checkpoint input/output positions",
-                    "Initial and end bounds are recorded as preview metadata; CDF checkpoint commits still own durable cursor advancement.",
+                    "bridge cursor window",
+                    "Dict rows outside [last or initial value, end value) are dropped before conversion; with a lag tolerance only the initial value bounds the start. CDF checkpoint commits still own durable cursor advancement.",
+                );
+            }
+            if incremental.row_order.is_some() {
+                table.mapped(
+                    "incremental row_order",
+                    "bridge cursor window",
+                    "The bridge stops pulling the resource once a row passes the far bound of its cursor window.",
                 );
             }
         }
@@ -327,6 +361,8 @@ pub struct DltBridgeSummary {
     pub metadata: DltBridgeMetadata,
     pub mapping_table: DltBridgeMappingTable,
     pub stream: PythonStreamSummary,
+    /// State written after the last batch, when read with a [`crate::DltStateSession`].
+    pub state_deltas: Vec<DltStateDelta>,
 }
 
 #[derive(Clone, Debug, PartialEq, Serialize, Deserialize)]
@@ -341,6 +377,77 @@ pub struct DltCurrentStateView {
     pub note: String,
 }
 
+/// One selected resource of a dlt source, read independently of its siblings.
+#[derive(Debug)]
+pub struct DltSourceMember {
+    /// The resource's metadata, with `source_name` inherited from its source when unset.
+    pub metadata: DltBridgeMetadata,
+    pub resource: Py<PyAny>,
+}
+
+/// Expands `source` into its selected resources, in the order the source yields them.
+///
+/// A source is called once if callable; it may return a single resource or an iterable of them.
+/// A resource passed as `source` expands to itself. Unselected resources and resources with
+/// `write_disposition="skip"` are dropped without being called.
+pub fn expand_dlt_source(source: &Bound<'_, PyAny>) -> Result<Vec<DltSourceMember>> {
+    let source_metadata = extract_dlt_metadata(source)?;
+    if let Some(metadata) = &source_metadata
+        && metadata.kind == DltBridgeObjectKind::Resource
+    {
+        return Ok(vec![DltSourceMember {
+            metadata: metadata.clone(),
+            resource: source.clone().unbind(),
+        }]);
+    }
+    let source_name = source_metadata
+        .as_ref()
+        .and_then(|metadata| metadata.resource_id_hint())
+        .map(ToOwned::to_owned);
+    let source_output = if source.hasattr("__call__").map_err(py_error)? {
+        source.call0().map_err(py_error)?
+    } else {
+        source.clone()
+    };
+    if let Some(mut metadata) = extract_dlt_metadata(&source_output)?
+        && metadata.kind == DltBridgeObjectKind::Resource
+    {
+        if metadata.source_name.is_none() {
+            metadata.source_name.clone_from(&source_name);
+        }
+        return Ok(vec![DltSourceMember {
+            metadata,
+            resource: source_output.unbind(),
+        }]);
+    }
+
+    let mut members = Vec::new();
+    for item in source_output.try_iter().map_err(py_error)? {
+        let item = item.map_err(py_error)?;
+        let Some(mut metadata) = extract_dlt_metadata(&item)? else {
+            return Err(CdfError::contract(
+                "dlt source yielded an object without CDF resource metadata",
+            ));
+        };
+        if metadata.kind != DltBridgeObjectKind::Resource {
+            return Err(CdfError::contract(
+                "dlt source yielded nested source metadata where resource metadata was required",
+            ));
+        }
+        if !metadata.selected_for_source_expansion() {
+            continue;
+        }
+        if metadata.source_name.is_none() {
+            metadata.source_name.clone_from(&source_name);
+        }
+        members.push(DltSourceMember {
+            metadata,
+            resource: item.unbind(),
+        });
+    }
+    Ok(members)
+}
+
 pub fn extract_dlt_metadata(object: &Bound<'_, PyAny>) -> Result<Option<DltBridgeMetadata>> {
     if object.hasattr(DLT_METADATA_ATTR).map_err(py_error)? {
         let metadata = object.getattr(DLT_METADATA_ATTR).map_err(py_error)?;
@@ -426,7 +533,7 @@ fn extract_cdf_resource_metadata(object: &Bound<'_, PyAny>) -> Result<DltBridgeM
     })
 }
 
-fn position_to_dlt_state(position: &SourcePosition) -> Result<Value> {
+pub(crate) fn position_to_dlt_state(position: &SourcePosition) -> Result<Value> {
     match position {
         SourcePosition::Cursor(cursor) => Ok(json!({
             "last_value": cursor_value_to_json(&cursor.value),
@@ -696,6 +803,11 @@ pub fn fixture_state_delta_position(field: &str, value: CursorValue) -> SourcePo
 }
 
 pub fn fixture_dlt_foreign_state(state: &Value) -> Result<SourcePosition> {
+    dlt_foreign_state(state)
+}
+
+/// Encodes `state` as an opaque `dlt-state-v1` position.
+pub(crate) fn dlt_foreign_state(state: &Value) -> Result<SourcePosition> {
     let opaque_blob =
         serde_json::to_vec(state).map_err(|error| CdfError::data(error.to_string()))?;
     let mut hasher = Sha256::new();
@@ -0,0 +1,281 @@
+use std::{
+    collections::{BTreeMap, BTreeSet},
+    sync::{Mutex, MutexGuard},
+};
+
+use cdf_kernel::{
+    CdfError, CheckpointStore, PipelineId, ResourceId, Result, ScopeKey, SourcePosition,
+};
+use pyo3::{
+    Bound, Py, PyAny, Python,
+    types::{PyAnyMethods, PyModule},
+};
+use serde::{Deserialize, Serialize};
+use serde_json::Value;
+
+use crate::{
+    dlt::{DltBridgeMetadata, composite_dlt_state, dlt_foreign_state, position_to_dlt_state},
+    internal::{json_error, py_error, python_dict_to_json_value},
+};
+
+/// Top-level keys of one dlt state scope changed since the previous flush, and the checkpoint
+/// position they fold into.
+#[derive(Clone, Debug, PartialEq, Serialize, Deserialize)]
+pub struct DltStateDelta {
+    pub resource_id: ResourceId,
+    pub scope: ScopeKey,
+    /// Keys written since the previous flush, with their new values.
+    pub written: BTreeMap<String, Value>,
+    pub removed: BTreeSet<String>,
+    /// The scope's whole state after this delta: a composite position with one `dlt-state-v1`
+    /// part per top-level key. Parts of keys left unchanged are copied over already encoded
+    /// rather than serialized again.
+    pub output_position: SourcePosition,
+}
+
+/// One scope bound in `cdf_sdk.dlt.current`, held as its keyed checkpoint parts.
+struct DltStateScope {
+    resource_id: ResourceId,
+    /// Resource or source name the scope is bound under on the Python side.
+    key: String,
+    source: bool,
+    scope: ScopeKey,
+    parts: BTreeMap<String, SourcePosition>,
+}
+
+/// `cdf_sdk.dlt.current` backed by one pipeline's checkpoint heads.
+///
+/// A resource or source scope is read from its head the first time a resource using it is
+/// bound, and Python parses it only when the resource first touches that state. Each session
+/// owns its own Python state maps, so writes an earlier session never committed are not seen
+/// by the next one.
+///
+/// Changes leave as [`DltStateDelta`]s keyed by top-level state key: a changed key is
+/// re-encoded whole, however deep the change, while unchanged keys keep their encoded parts.
+/// The delta's `output_position` still copies every part of the scope, since it is the state
+/// the checkpoint commits.
+pub struct DltStateSession<'a> {
+    store: &'a dyn CheckpointStore,
+    pipeline_id: PipelineId,
+    current: Py<PyAny>,
+    /// This session's `cdf_sdk.dlt._Session`, holding the maps its binds hydrate.
+    maps: Py<PyAny>,
+    scopes: Mutex<Vec<DltStateScope>>,
+}
+
+impl<'a> DltStateSession<'a> {
+    pub fn new(
+        py: Python<'_>,
+        store: &'a dyn CheckpointStore,
+        pipeline_id: PipelineId,
+    ) -> Result<Self> {
+        let current = PyModule::import(py, "cdf_sdk.dlt")
+            .and_then(|module| module.getattr("current"))
+            .map_err(py_error)?;
+        let maps = current.call_method0("_session").map_err(py_error)?;
+        Ok(Self {
+            store,
+            pipeline_id,
+            current: current.unbind(),
+            maps: maps.unbind(),
+            scopes: Mutex::new(Vec::new()),
+        })
+    }
+
+    /// Points `current.state` on this thread at `resource_id` and its source, reading each scope
+    /// from its checkpoint head the first time it is bound.
+    pub fn bind(
+        &self,
+        py: Python<'_>,
+        resource_id: &ResourceId,
+        metadata: &DltBridgeMetadata,
+    ) -> Result<()> {
+        let resource_key = metadata
+            .name
+            .clone()
+            .unwrap_or_else(|| resource_id.as_str().to_owned());
+        let source_key = metadata
+            .source_name
+            .clone()
+            .filter(|source| !source.trim().is_empty());
+        let mut scopes = self.lock()?;
+        let resource_loader = self.hydrate(
+            py,
+            &mut scopes,
+            resource_id,
+            &resource_key,
+            ScopeKey::Resource,
+        )?;
+        let source_loader = match (&source_key, metadata.source_scope()) {
+            (Some(key), Some(scope)) => self.hydrate(py, &mut scopes, resource_id, key, scope)?,
+            _ => None,
+        };
+        drop(scopes);
+        self.current
+            .bind(py)
+            .call_method1(
+                "_bind",
+                (
+                    self.maps.bind(py),
+                    resource_key,
+                    source_key,
+                    resource_loader,
+                    source_loader,
+                ),
+            )
+            .map_err(py_error)?;
+        Ok(())
+    }
+
+    /// The incremental cursor a bound resource resumes after, read from its `last_value` part.
+    pub fn last_value(&self, resource_id: &ResourceId) -> Result<Option<Value>> {
+        self.lock()?
+            .iter()
+            .find(|scope| !scope.source && scope.resource_id == *resource_id)
+            .and_then(|scope| scope.parts.get("last_value"))
+            .map(position_to_dlt_state)
+            .transpose()
+    }
+
+    /// Collects the state written since the previous drain as one delta per bound scope.
+    ///
+    /// A source scope shared by several bound resources yields a delta for each of them, since
+    /// every resource's checkpoints carry its source's state.
+    pub fn drain(&self, py: Python<'_>) -> Result<Vec<DltStateDelta>> {
+        let changes = self
+            .current
+            .bind(py)
+            .call_method1("_drain", (self.maps.bind(py),))
+            .map_err(py_error)?;
+        let mut scopes = self.lock()?;
+        let mut deltas = Vec::new();
+        for change in changes.try_iter().map_err(py_error)? {
+            let (kind, key, written, removed) = change
+                .and_then(|change| {
+                    change.extract::<(String, String, Bound<'_, PyAny>, Vec<String>)>()
+                })
+                .map_err(py_error)?;
+            let written = match python_dict_to_json_value(&written)? {
+                Value::Object(written) => written.into_iter().collect::<BTreeMap<_, _>>(),
+                _ => {
+                    return Err(CdfError::internal(
+                        "dlt state drain returned non-object written keys",
+                    ));
+                }
+            };
+            let encoded = written
+                .iter()
+                .map(|(key, value)| Ok((key.clone(), dlt_foreign_state(value)?)))
+                .collect::<Result<Vec<_>>>()?;
+            let removed = removed.into_iter().collect::<BTreeSet<_>>();
+            let source = kind == "source";
+            for scope in scopes
+                .iter_mut()
+                .filter(|scope| scope.source == source && scope.key == key)
+            {
+                for (key, part) in &encoded {
+                    scope.parts.insert(key.clone(), part.clone());
+                }
+                for key in &removed {
+                    scope.parts.remove(key);
+                }
+                deltas.push(DltStateDelta {
+                    resource_id: scope.resource_id.clone(),
+                    scope: scope.scope.clone(),
+                    written: written.clone(),
+                    removed: removed.clone(),
+                    output_position: composite_dlt_state(scope.parts.clone()),
+                });
+            }
+        }
+        Ok(deltas)
+    }
+
+    /// Registers `scope` for `resource_id` and returns the loader Python hydrates it with, if
+    /// this is the first bind of a nonempty state.
+    fn hydrate<'py>(
+        &self,
+        py: Python<'py>,
+        scopes: &mut Vec<DltStateScope>,
+        resource_id: &ResourceId,
+        key: &str,
+        scope: ScopeKey,
+    ) -> Result<Option<Bound<'py, PyAny>>> {
+        if scopes
+            .iter()
+            .any(|bound| bound.resource_id == *resource_id && bound.scope == scope)
+        {
+            return Ok(None);
+        }
+        let source = scope != ScopeKey::Resource;
+        // A source already bound through a sibling resource is live in Python; share its parts
+        // so every resource's deltas fold into the same state.
+        let shared = scopes
+            .iter()
+            .find(|bound| source && bound.source && bound.key == key)
+            .map(|bound| bound.parts.clone());
+        let (parts, loader) = match shared {
+            Some(parts) => (parts, None),
+            None => {
+                let parts = match self.store.head(&self.pipeline_id, resource_id, &scope)? {
+                    Some(head) => keyed_dlt_state(&head.delta.output_position)?,
+                    None => BTreeMap::new(),
+                };
+                let loader = if parts.is_empty() {
+                    None
+                } else {
+                    Some(state_loader(py, &parts)?)
+                };
+                (parts, loader)
+            }
+        };
+        scopes.push(DltStateScope {
+            resource_id: resource_id.clone(),
+            key: key.to_owned(),
+            source,
+            scope,
+            parts,
+        });
+        Ok(loader)
+    }
+
+    fn lock(&self) -> Result<MutexGuard<'_, Vec<DltStateScope>>> {
+        self.scopes
+            .lock()
+            .map_err(|_| CdfError::internal("dlt state session was poisoned"))
+    }
+}
+
+/// Splits a dlt state head into one part per top-level key. Heads written before state was
+/// keyed, as a single object, are split the first time they are read.
+fn keyed_dlt_state(position: &SourcePosition) -> Result<BTreeMap<String, SourcePosition>> {
+    if let SourcePosition::Composite(composite) = position {
+        return Ok(composite.positions.clone());
+    }
+    match position_to_dlt_state(position)? {
+        Value::Object(state) => state
+            .iter()
+            .map(|(key, value)| Ok((key.clone(), dlt_foreign_state(value)?)))
+            .collect(),
+        _ => Err(CdfError::data("dlt state head is not a JSON object")),
+    }
+}
+
+/// `functools.partial(json.loads, text)` over the scope's state, so Python decodes it only when
+/// the resource first reads it.
+fn state_loader<'py>(
+    py: Python<'py>,
+    parts: &BTreeMap<String, SourcePosition>,
+) -> Result<Bound<'py, PyAny>> {
+    let state = parts
+        .iter()
+        .map(|(key, part)| Ok((key.clone(), position_to_dlt_state(part)?)))
+        .collect::<Result<serde_json::Map<_, _>>>()?;
+    let text = serde_json::to_string(&Value::Object(state)).map_err(json_error)?;
+    let loads = PyModule::import(py, "json")
+        .and_then(|json| json.getattr("loads"))
+        .map_err(py_error)?;
+    PyModule::import(py, "functools")
+        .and_then(|functools| functools.getattr("partial")?.call1((loads, text)))
+        .map_err(py_error)
+}
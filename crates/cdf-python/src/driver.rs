@@ -26,6 +26,8 @@ use futures_util::StreamExt;
 use serde::Deserialize;
 
 use crate::{
+    process::PythonIsolation,
+    profile::PythonProfileMode,
     resource::{PreparedPythonInvocation, PythonPhysicalPlan, PythonResource},
     validate_attached_interpreter,
 };
@@ -76,7 +78,10 @@ impl PythonSourceDriver {
                 "properties": {
                     "uri": {"type": "string", "pattern": "^python://"},
                     "dict_batch_rows": {"type": "integer", "minimum": 1},
-                    "max_boundary_bytes": {"type": "integer", "minimum": 2}
+                    "max_boundary_bytes": {"type": "integer", "minimum": 2},
+                    "coalesce_rows": {"type": "integer", "minimum": 2},
+                    "prefetch_batches": {"type": "integer", "minimum": 2},
+                    "isolation": {"type": "string", "enum": ["embedded", "process"]}
                 }
             },
             "resource": {
@@ -146,11 +151,26 @@ impl SourceDriver for PythonSourceDriver {
             request.descriptor.trust_level.clone(),
             options.dict_batch_rows,
             options.max_boundary_bytes,
-        )?;
+        )?
+        .with_coalesce_rows(options.coalesce_rows)?
+        .with_prefetch_batches(options.prefetch_batches)?
+        .with_isolation(options.isolation)?;
         validate_declarative_metadata(&request, &resource)?;
         let physical_plan = serde_json::to_value(resource.physical_plan()).map_err(|error| {
             CdfError::internal(format!("serialize Python source plan: {error}"))
         })?;
+        let mut redacted_options = serde_json::json!({
+            "scheme": "python",
+            "dict_batch_rows": options.dict_batch_rows,
+            "max_boundary_bytes": options.max_boundary_bytes,
+            "isolation": options.isolation,
+        });
+        if let Some(rows) = options.coalesce_rows {
+            redacted_options["coalesce_rows"] = rows.into();
+        }
+        if let Some(batches) = options.prefetch_batches {
+            redacted_options["prefetch_batches"] = batches.into();
+        }
         compile_resource_plan(
             self.descriptor.clone(),
             resource,
@@ -161,11 +181,7 @@ impl SourceDriver for PythonSourceDriver {
                 source_materializations: Vec::new(),
                 effective_schema_runtime: request.effective_schema_runtime,
                 baseline_observation_schema_catalog: request.baseline_observation_schema_catalog,
-                redacted_options: serde_json::json!({
-                    "scheme": "python",
-                    "dict_batch_rows": options.dict_batch_rows,
-                    "max_boundary_bytes": options.max_boundary_bytes,
-                }),
+                redacted_options,
                 physical_plan,
             },
         )
@@ -181,7 +197,12 @@ impl SourceDriver for PythonSourceDriver {
         context: &SourceResolutionContext<'_>,
         output: &mut dyn cdf_runtime::SourceHealthSink,
     ) -> Result<()> {
-        output.emit(self.doctor_health(request, context)?)
+        let startup = self.startup_health(&request, context)?;
+        output.emit(self.doctor_health(request, context)?)?;
+        match startup {
+            Some(startup) => output.emit(startup),
+            None => Ok(()),
+        }
     }
 
     fn discovery_session(
@@ -229,9 +250,12 @@ impl SourceDriver for PythonSourceDriver {
 
     fn resolve_blocking_lane(
         &self,
-        _plan: &CompiledSourcePlan,
+        plan: &CompiledSourcePlan,
         context: &SourceResolutionContext<'_>,
     ) -> Result<Option<BlockingLaneSpec>> {
+        if physical_plan(plan)?.isolation == PythonIsolation::Process {
+            return Ok(None);
+        }
         let options = validate_project_options(
             context.project_root(),
             context.driver_options(&self.descriptor.driver_id),
@@ -247,6 +271,37 @@ impl SourceDriver for PythonSourceDriver {
         plan: &CompiledSourcePlan,
         context: &SourceResolutionContext<'_>,
     ) -> Result<Arc<dyn QueryableResource>> {
+        let physical = physical_plan(plan)?;
+        if physical.isolation == PythonIsolation::Process {
+            let options = decode_project_options(
+                context
+                    .driver_options(&self.descriptor.driver_id)
+                    .ok_or_else(|| {
+                        CdfError::contract(
+                            "python.interpreter is required for Python plan, preview, and run",
+                        )
+                    })?,
+            )?;
+            if !options.profile.is_off() {
+                // The profiler runs inside the host interpreter, which a worker never touches.
+                tracing::warn!(
+                    resource = %self.descriptor.resource_id,
+                    "python.profile covers embedded resources only; this process-isolated resource is not profiled"
+                );
+            }
+            let interpreter =
+                configured_interpreter_path(context.project_root(), &options.interpreter)
+                    .canonicalize()
+                    .map_err(|error| {
+                        CdfError::contract(format!(
+                            "configured Python interpreter is missing or inaccessible: {error}"
+                        ))
+                    })?;
+            return Ok(Arc::new(
+                PythonResource::from_compiled(context.project_root(), plan, physical)?
+                    .with_execution_services_and_worker(context.execution().clone(), interpreter)?,
+            ));
+        }
         let lane = plan
             .execution_capabilities
             .blocking_lane
@@ -254,7 +309,6 @@ impl SourceDriver for PythonSourceDriver {
             .ok_or_else(|| {
                 CdfError::contract("compiled Python source omitted its blocking lane")
             })?;
-        let physical = physical_plan(plan)?;
         let prepared = context
             .prepared_payloads()
             .take(&prepared_python_invocation_key(plan, &physical)?)?
@@ -265,11 +319,16 @@ impl SourceDriver for PythonSourceDriver {
                 Result::Ok(prepared)
             })
             .transpose()?;
+        let project = context
+            .driver_options(&self.descriptor.driver_id)
+            .map(decode_project_options)
+            .transpose()?;
+        let resident = project.as_ref().is_some_and(|options| options.resident);
+        let profile = project.map_or(PythonProfileMode::Off, |options| options.profile);
         let mut resource = PythonResource::from_compiled(context.project_root(), plan, physical)?
-            .with_execution_services_and_lane(
-            context.execution().clone(),
-            lane.lane_id.clone(),
-        )?;
+            .with_resident(resident)
+            .with_profile(profile, context.artifact_root())
+            .with_execution_services_and_lane(context.execution().clone(), lane.lane_id.clone())?;
         if let Some(prepared) = prepared {
             resource = resource.with_prepared_invocation(prepared)?;
         }
@@ -410,6 +469,81 @@ impl PythonSourceDriver {
     }
 }
 
+impl PythonSourceDriver {
+    /// Reports cold-versus-warm start latency for each compiled embedded resource: the import a
+    /// run pays on its first open, and what a later open pays. That is the resident lookup under
+    /// `python.resident` and a second import of the cached code otherwise.
+    fn startup_health(
+        &self,
+        request: &SourceHealthRequest,
+        context: &SourceResolutionContext<'_>,
+    ) -> Result<Option<SourceHealthResult>> {
+        let Some(options) = context.driver_options(&self.descriptor.driver_id) else {
+            return Ok(None);
+        };
+        let resident = decode_project_options(options)?.resident;
+        let mut resources = Vec::new();
+        for plan in &request.compiled_plans {
+            if plan.driver.driver_id != self.descriptor.driver_id {
+                continue;
+            }
+            let physical = physical_plan(plan)?;
+            if physical.isolation != PythonIsolation::Embedded {
+                continue;
+            }
+            request.budget.consume_work(1)?;
+            let latency =
+                match PythonResource::from_compiled(context.project_root(), plan, physical)
+                    .and_then(|resource| resource.with_resident(resident).startup_latency())
+                {
+                    Ok(latency) => latency,
+                    Err(error) => {
+                        return Ok(Some(SourceHealthResult::failed(
+                            "startup",
+                            "Python resource module could not be imported for the startup probe",
+                            &plan.descriptor.resource_id,
+                            &error,
+                        )));
+                    }
+                };
+            resources.push((plan.descriptor.resource_id.to_string(), latency));
+        }
+        let Some((slowest_id, slowest)) = resources
+            .iter()
+            .max_by_key(|(_, latency)| latency.cold)
+            .cloned()
+        else {
+            return Ok(None);
+        };
+        Ok(Some(SourceHealthResult {
+            probe_id: "startup".to_owned(),
+            status: SourceHealthStatus::Passed,
+            message: format!(
+                "slowest Python resource `{slowest_id}` starts in {:.1} ms cold and {:.3} ms warm{}",
+                slowest.cold.as_secs_f64() * 1000.0,
+                slowest.warm.as_secs_f64() * 1000.0,
+                if resident {
+                    ""
+                } else {
+                    "; set python.resident = true to keep modules warm between runs"
+                }
+            ),
+            details: serde_json::json!({
+                "resident": resident,
+                "warm_start": if resident { "resident_module" } else { "cached_import" },
+                "resources": resources
+                    .iter()
+                    .map(|(resource_id, latency)| serde_json::json!({
+                        "resource_id": resource_id,
+                        "cold_start_ms": latency.cold.as_secs_f64() * 1000.0,
+                        "warm_start_ms": latency.warm.as_secs_f64() * 1000.0,
+                    }))
+                    .collect::<Vec<_>>(),
+            }),
+        }))
+    }
+}
+
 fn compile_resource_plan(
     driver: SourceDriverDescriptor,
     resource: PythonResource,
@@ -420,7 +554,13 @@ fn compile_resource_plan(
     CompiledSourcePlan::new(
         driver,
         capabilities.clone(),
-        execution_capabilities(physical.bounded, physical.max_boundary_bytes),
+        execution_capabilities(
+            physical.bounded,
+            physical.max_boundary_bytes,
+            resource.partition_count(),
+            resource.isolation(),
+            physical.resumable,
+        ),
         input,
     )
 }
@@ -474,6 +614,14 @@ struct PythonSourceOptions {
     dict_batch_rows: usize,
     #[serde(default = "default_max_boundary_bytes")]
     max_boundary_bytes: u64,
+    /// Row target for concatenating adjacent Arrow yields into one batch; off when absent.
+    #[serde(default)]
+    coalesce_rows: Option<usize>,
+    /// Batches the producer may queue ahead of the consumer; one when absent.
+    #[serde(default)]
+    prefetch_batches: Option<usize>,
+    #[serde(default)]
+    isolation: PythonIsolation,
 }
 
 const fn default_dict_batch_rows() -> usize {
@@ -498,6 +646,13 @@ struct PythonProjectOptions {
     dict_batch_rows: usize,
     #[serde(default = "default_max_boundary_bytes")]
     max_boundary_bytes: u64,
+    /// Keeps embedded resource modules imported between runs hosted by the same process.
+    #[serde(default)]
+    resident: bool,
+    /// Profiles embedded resources into `.cdf/profiles/python/` under the artifact root.
+    /// Process-isolated resources are not profiled; resolving one with profiling on warns.
+    #[serde(default)]
+    profile: PythonProfileMode,
 }
 
 struct ValidatedPythonProjectOptions {
@@ -748,7 +903,13 @@ mod health_tests {
 fn execution_capabilities(
     bounded: bool,
     maximum_boundary_bytes: u64,
+    partitions: usize,
+    isolation: PythonIsolation,
+    resumable: bool,
 ) -> SourceExecutionCapabilities {
+    // Keyed partitions are independent producer calls; the resolved Python lane still caps how
+    // many of them actually run at once (one under the GIL).
+    let partition_concurrency = u16::try_from(partitions.max(1)).unwrap_or(u16::MAX);
     let poll_bytes = 1;
     let decode_bytes = maximum_boundary_bytes.saturating_sub(poll_bytes).max(1);
     let minimum_decode_bytes = decode_bytes.min(8 * 1024);
@@ -758,10 +919,14 @@ fn execution_capabilities(
         minimum_decode_bytes,
         maximum_decode_bytes: decode_bytes,
         maximum_emitted_batch_bytes: decode_bytes,
-        maximum_concurrency: 1,
-        useful_concurrency: 1,
-        executor_class: SourceExecutorClass::BlockingLane,
-        blocking_lane: Some(BlockingLaneSpec {
+        maximum_concurrency: partition_concurrency,
+        useful_concurrency: partition_concurrency,
+        // A worker process holds its own GIL, so process isolation needs no shared Python lane.
+        executor_class: match isolation {
+            PythonIsolation::Embedded => SourceExecutorClass::BlockingLane,
+            PythonIsolation::Process => SourceExecutorClass::Io,
+        },
+        blocking_lane: isolation.is_embedded().then(|| BlockingLaneSpec {
             lane_id: "python.source".to_owned(),
             binding: cdf_runtime::BlockingLaneBinding::RuntimeResolvedRequired,
             maximum_concurrency: u16::MAX,
@@ -773,8 +938,10 @@ fn execution_capabilities(
         pausable: true,
         spillable: false,
         idempotent_reads: false,
-        reopenable: false,
-        resumable: false,
+        // A `resumable=True` resource reopens a partition after the page token it last marked;
+        // without one a reopen would re-fetch rows a committed frontier already covers.
+        reopenable: resumable,
+        resumable,
         speculative_safe: false,
         retry_granularity: SourceRetryGranularity::None,
         retryable_errors: Vec::new(),
@@ -0,0 +1,101 @@
+use std::collections::BTreeMap;
+
+use cdf_kernel::{
+    CdfError, EstimateSupport, PLAN_ESTIMATED_BYTES_KEY, PLAN_ESTIMATED_ROWS_KEY, PartitionPlan,
+    Result,
+};
+use pyo3::{Bound, PyAny, types::PyAnyMethods};
+
+use crate::internal::py_error;
+
+/// Decorator attribute holding the `@cdf_sdk.resource(estimate=...)` hook, or `None`.
+pub(crate) const ESTIMATE_ATTRIBUTE: &str = "__cdf_estimate__";
+
+/// Partition metadata recording why a failed `estimate=` hook left the partition unestimated.
+pub(crate) const ESTIMATE_WARNING_METADATA: &str = "estimate_warning";
+
+/// Capability advertised by a resource that declares an `estimate=` hook. The hook may still
+/// leave either figure unknown for a given partition.
+pub(crate) fn estimate_support(declared: bool) -> EstimateSupport {
+    if declared {
+        EstimateSupport::RowsAndBytes
+    } else {
+        EstimateSupport::None
+    }
+}
+
+/// Expected rows and bytes one partition will yield, as the author's hook reported them.
+#[derive(Clone, Debug, Default, PartialEq, Eq)]
+pub(crate) struct PythonEstimate {
+    pub(crate) rows: Option<u64>,
+    pub(crate) bytes: Option<u64>,
+    /// Why the hook produced no estimate, when it raised or returned something else.
+    pub(crate) warning: Option<String>,
+}
+
+impl PythonEstimate {
+    /// Calls the hook with the partition key, or with no argument for an unkeyed resource.
+    /// Returning `None` leaves the partition unestimated.
+    ///
+    /// An estimate is only a planning hint, so a hook that raises (a timed-out count query,
+    /// say) or returns something other than `cdf_sdk.Estimate` leaves the partition unknown
+    /// and records a warning instead of failing the plan.
+    pub(crate) fn call(hook: &Bound<'_, PyAny>, partition_key: Option<&str>) -> Self {
+        Self::try_call(hook, partition_key).unwrap_or_else(|error| Self {
+            warning: Some(format!(
+                "`estimate=` hook left this partition unestimated: {}",
+                error.message
+            )),
+            ..Self::default()
+        })
+    }
+
+    fn try_call(hook: &Bound<'_, PyAny>, partition_key: Option<&str>) -> Result<Self> {
+        let estimate = match partition_key {
+            Some(key) => hook.call1((key,)),
+            None => hook.call0(),
+        }
+        .map_err(py_error)?;
+        if estimate.is_none() {
+            return Ok(Self::default());
+        }
+        let figure = |name: &str| {
+            estimate
+                .getattr(name)
+                .and_then(|value| value.extract::<Option<u64>>())
+                .map_err(|_| {
+                    CdfError::contract(
+                        "Python resource `estimate=` hook did not return `cdf_sdk.Estimate`",
+                    )
+                })
+        };
+        Ok(Self {
+            rows: figure("rows")?,
+            bytes: figure("bytes")?,
+            warning: None,
+        })
+    }
+
+    /// Records the estimate in partition metadata, where the engine reads it back to report
+    /// estimate accuracy after the run.
+    pub(crate) fn record(self, metadata: &mut BTreeMap<String, String>) {
+        if let Some(warning) = self.warning {
+            metadata.insert(ESTIMATE_WARNING_METADATA.to_owned(), warning);
+        }
+        if let Some(rows) = self.rows {
+            metadata.insert(PLAN_ESTIMATED_ROWS_KEY.to_owned(), rows.to_string());
+        }
+        if let Some(bytes) = self.bytes {
+            metadata.insert(PLAN_ESTIMATED_BYTES_KEY.to_owned(), bytes.to_string());
+        }
+    }
+}
+
+/// Sum of one recorded estimate across `partitions`, or `None` unless every partition has it:
+/// a partial total would understate the scan to planning and admission.
+pub(crate) fn planned_total(partitions: &[PartitionPlan], key: &str) -> Option<u64> {
+    partitions.iter().try_fold(0_u64, |total, partition| {
+        let figure = partition.metadata.get(key)?.parse::<u64>().ok()?;
+        Some(total.saturating_add(figure))
+    })
+}
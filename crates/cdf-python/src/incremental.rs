@@ -0,0 +1,177 @@
+use std::cmp::Ordering;
+
+use cdf_kernel::{CdfError, Result};
+use pyo3::{Bound, PyAny, types::PyAnyMethods};
+use serde_json::Value;
+
+use crate::internal::python_cursor_to_json;
+
+/// Order in which a resource promises to yield its cursor, letting the bridge stop pulling once
+/// a row passes the window's far bound.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum CursorRowOrder {
+    Ascending,
+    Descending,
+}
+
+/// Half-open cursor range `[start, end)` that a dict row must fall in to be converted.
+///
+/// Bounds are JSON strings or numbers and compare like-typed with the row's cursor: strings
+/// lexically, so ISO-8601 timestamps in one format order correctly, and numbers numerically.
+/// A string bound that spells a number, such as `initial_value="100"`, also bounds a numeric
+/// cursor.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct CursorWindow {
+    cursor_path: String,
+    path: Vec<String>,
+    start: Option<WindowBound>,
+    end: Option<WindowBound>,
+    order: Option<CursorRowOrder>,
+}
+
+/// One window bound, with the number it spells when it is a numeric string, parsed once rather
+/// than per row.
+#[derive(Clone, Debug, PartialEq, Eq)]
+struct WindowBound {
+    value: Value,
+    numeric: Option<Value>,
+}
+
+impl WindowBound {
+    fn new(value: Value) -> Self {
+        let numeric = value
+            .as_str()
+            .and_then(|text| serde_json::from_str::<Value>(text.trim()).ok())
+            .filter(Value::is_number);
+        Self { value, numeric }
+    }
+}
+
+/// What the bridge does with one dict row under a [`CursorWindow`].
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(crate) enum CursorVerdict {
+    Keep,
+    Skip,
+    /// The row is past the far bound of an ordered resource, so every later row is too.
+    Stop,
+}
+
+impl CursorWindow {
+    /// A window over `cursor_path`, a field name or dotted path into nested dicts; `None` when
+    /// neither bound is set and every row would be kept.
+    pub fn new(
+        cursor_path: &str,
+        start: Option<Value>,
+        end: Option<Value>,
+        order: Option<CursorRowOrder>,
+    ) -> Result<Option<Self>> {
+        let path = cursor_path
+            .split('.')
+            .map(ToOwned::to_owned)
+            .collect::<Vec<_>>();
+        if path.iter().any(String::is_empty) {
+            return Err(CdfError::contract(format!(
+                "cursor window path `{cursor_path}` has an empty segment"
+            )));
+        }
+        let start = start.filter(|bound| !bound.is_null());
+        let end = end.filter(|bound| !bound.is_null());
+        if [&start, &end]
+            .into_iter()
+            .flatten()
+            .any(|bound| !(bound.is_string() || bound.is_number()))
+        {
+            return Err(CdfError::contract(format!(
+                "cursor window bounds for `{cursor_path}` must be strings or numbers"
+            )));
+        }
+        if start.is_none() && end.is_none() {
+            return Ok(None);
+        }
+        Ok(Some(Self {
+            cursor_path: cursor_path.to_owned(),
+            path,
+            start: start.map(WindowBound::new),
+            end: end.map(WindowBound::new),
+            order,
+        }))
+    }
+
+    /// Reads only the cursor of `row`, so rows outside the window are never converted whole.
+    pub(crate) fn classify(&self, row: &Bound<'_, PyAny>) -> Result<CursorVerdict> {
+        let missing = || {
+            CdfError::data(format!(
+                "Python dict row has no value at cursor `{}`",
+                self.cursor_path
+            ))
+        };
+        let mut value = row.clone();
+        for part in &self.path {
+            value = value.get_item(part.as_str()).map_err(|_| missing())?;
+        }
+        if value.is_none() {
+            return Err(missing());
+        }
+        let cursor = python_cursor_to_json(&value)?;
+        let before_start = match &self.start {
+            Some(start) => self.compare(&cursor, start)? == Ordering::Less,
+            None => false,
+        };
+        let past_end = match &self.end {
+            Some(end) => self.compare(&cursor, end)? != Ordering::Less,
+            None => false,
+        };
+        Ok(match (before_start, past_end, self.order) {
+            (false, false, _) => CursorVerdict::Keep,
+            (_, true, Some(CursorRowOrder::Ascending))
+            | (true, _, Some(CursorRowOrder::Descending)) => CursorVerdict::Stop,
+            _ => CursorVerdict::Skip,
+        })
+    }
+
+    fn compare(&self, cursor: &Value, bound: &WindowBound) -> Result<Ordering> {
+        let bound_value = match (cursor, &bound.numeric) {
+            (Value::Number(_), Some(numeric)) => numeric,
+            _ => &bound.value,
+        };
+        let ordering = match (cursor, bound_value) {
+            (Value::String(cursor), Value::String(bound)) => Some(cursor.cmp(bound)),
+            (Value::Number(cursor), Value::Number(bound)) => {
+                match (
+                    cursor.as_i64(),
+                    bound.as_i64(),
+                    cursor.as_u64(),
+                    bound.as_u64(),
+                ) {
+                    (Some(cursor), Some(bound), _, _) => Some(cursor.cmp(&bound)),
+                    (_, _, Some(cursor), Some(bound)) => Some(cursor.cmp(&bound)),
+                    _ => cursor
+                        .as_f64()
+                        .zip(bound.as_f64())
+                        .and_then(|(cursor, bound)| cursor.partial_cmp(&bound)),
+                }
+            }
+            _ => None,
+        };
+        // Only the JSON kinds are named; the row's cursor value is data and stays out of errors.
+        ordering.ok_or_else(|| {
+            CdfError::data(format!(
+                "Python dict row cursor `{}` is a {} and is not comparable with its {} window bound; cursor values and incremental bounds must both be numbers or both be strings",
+                self.cursor_path,
+                json_kind(cursor),
+                json_kind(&bound.value)
+            ))
+        })
+    }
+}
+
+fn json_kind(value: &Value) -> &'static str {
+    match value {
+        Value::Null => "null",
+        Value::Bool(_) => "boolean",
+        Value::Number(_) => "number",
+        Value::String(_) => "string",
+        Value::Array(_) => "list",
+        Value::Object(_) => "dict",
+    }
+}
@@ -6,16 +6,19 @@ use cdf_kernel::{
 };
 use pyo3::{
     Bound, PyAny, PyErr, Python,
-    types::{PyAnyMethods, PyDict, PyDictMethods, PyModule, PyStringMethods, PyTypeMethods},
+    types::{
+        PyAnyMethods, PyBool, PyBoolMethods, PyDict, PyDictMethods, PyFloat, PyFloatMethods, PyInt,
+        PyList, PyListMethods, PyModule, PyString, PyStringMethods, PyTuple, PyTupleMethods,
+        PyTypeMethods,
+    },
 };
 
 use crate::{arrow_capsule, bridge_types::PythonBridgeOptions};
 
 pub(crate) fn import_arrow_stream(
     object: &Bound<'_, PyAny>,
-) -> Result<Box<dyn arrow_array::RecordBatchReader + Send>> {
-    let reader = arrow_capsule::import_record_batch_stream(object).map_err(py_error)?;
-    Ok(Box::new(reader))
+) -> Result<arrow_capsule::ImportedArrowStream> {
+    arrow_capsule::import_record_batch_stream(object).map_err(py_error)
 }
 
 pub(crate) fn python_dict_to_json(py: Python<'_>, object: &Bound<'_, PyAny>) -> Result<String> {
@@ -34,6 +37,136 @@ pub(crate) fn python_dict_to_json(py: Python<'_>, object: &Bound<'_, PyAny>) ->
     Ok(json_text)
 }
 
+/// Nesting bound for native dict-row conversion. Matches serde_json's own recursion limit so a
+/// self-referencing container fails as a data error instead of exhausting the stack.
+const PYTHON_ROW_MAX_DEPTH: usize = 128;
+
+/// Converts one Python dict row into a JSON object without a `json.dumps` text round trip.
+///
+/// Accepts the JSON-native Python values `json.dumps` accepts (dict, list, tuple, `str`, `int`,
+/// `float`, `bool`, `None`), except that an `int` must fit 64 bits and a `float` must be finite,
+/// since neither survives as a JSON number. Dict keys of type `int`, `float`, `bool`, or `None`
+/// are stringified as `json.dumps` does. Keys are sorted so the inferred field order stays
+/// identical to the former `sort_keys=True` encoding.
+pub(crate) fn python_dict_to_json_value(object: &Bound<'_, PyAny>) -> Result<serde_json::Value> {
+    let value = python_value_to_json(object, 0)?;
+    if !value.is_object() {
+        return Err(CdfError::data(
+            "Python dict batching accepts JSON objects only",
+        ));
+    }
+    Ok(value)
+}
+
+/// Converts one cursor value, such as a string or number, without converting the rest of its row.
+pub(crate) fn python_cursor_to_json(object: &Bound<'_, PyAny>) -> Result<serde_json::Value> {
+    python_value_to_json(object, 0)
+}
+
+fn python_value_to_json(object: &Bound<'_, PyAny>, depth: usize) -> Result<serde_json::Value> {
+    if object.is_none() {
+        return Ok(serde_json::Value::Null);
+    }
+    if let Ok(value) = object.cast::<PyString>() {
+        return value
+            .to_str()
+            .map(|text| serde_json::Value::String(text.to_owned()))
+            .map_err(|_| non_json_row_value());
+    }
+    if let Ok(value) = object.cast::<PyBool>() {
+        return Ok(serde_json::Value::Bool(value.is_true()));
+    }
+    if object.is_instance_of::<PyInt>() {
+        if let Ok(value) = object.extract::<i64>() {
+            return Ok(serde_json::Value::from(value));
+        }
+        return object
+            .extract::<u64>()
+            .map(serde_json::Value::from)
+            .map_err(|_| non_json_row_value());
+    }
+    if let Ok(value) = object.cast::<PyFloat>() {
+        return serde_json::Number::from_f64(value.value())
+            .map(serde_json::Value::Number)
+            .ok_or_else(non_json_row_value);
+    }
+    let depth = depth
+        .checked_add(1)
+        .filter(|depth| *depth <= PYTHON_ROW_MAX_DEPTH)
+        .ok_or_else(|| {
+            CdfError::data(format!(
+                "Python dict row nests deeper than {PYTHON_ROW_MAX_DEPTH} JSON levels; emit Arrow for deeply nested values"
+            ))
+        })?;
+    if let Ok(dict) = object.cast::<PyDict>() {
+        let mut map = serde_json::Map::new();
+        for (key, value) in dict.iter() {
+            map.insert(python_json_key(&key)?, python_value_to_json(&value, depth)?);
+        }
+        map.sort_keys();
+        return Ok(serde_json::Value::Object(map));
+    }
+    if let Ok(list) = object.cast::<PyList>() {
+        return list
+            .iter()
+            .map(|value| python_value_to_json(&value, depth))
+            .collect::<Result<Vec<_>>>()
+            .map(serde_json::Value::Array);
+    }
+    if let Ok(tuple) = object.cast::<PyTuple>() {
+        return tuple
+            .iter()
+            .map(|value| python_value_to_json(&value, depth))
+            .collect::<Result<Vec<_>>>()
+            .map(serde_json::Value::Array);
+    }
+    Err(non_json_row_value())
+}
+
+/// Stringifies a dict key as `json.dumps` does: `str` as-is, `int` and `float` by their base
+/// type's `repr`, non-finite floats as `NaN`/`Infinity`/`-Infinity`, and `bool` and `None` as
+/// their JSON literals. Any other key is not JSON-encodable.
+fn python_json_key(key: &Bound<'_, PyAny>) -> Result<String> {
+    if let Ok(key) = key.cast::<PyString>() {
+        return key
+            .to_str()
+            .map(str::to_owned)
+            .map_err(|_| non_json_row_value());
+    }
+    if let Ok(key) = key.cast::<PyBool>() {
+        return Ok(if key.is_true() { "true" } else { "false" }.to_owned());
+    }
+    if key.is_none() {
+        return Ok("null".to_owned());
+    }
+    let py = key.py();
+    let base_type = if let Ok(float) = key.cast::<PyFloat>() {
+        let value = float.value();
+        if value.is_nan() {
+            return Ok("NaN".to_owned());
+        }
+        if value.is_infinite() {
+            return Ok(if value > 0.0 { "Infinity" } else { "-Infinity" }.to_owned());
+        }
+        py.get_type::<PyFloat>()
+    } else if key.is_instance_of::<PyInt>() {
+        py.get_type::<PyInt>()
+    } else {
+        return Err(non_json_row_value());
+    };
+    // The base type's `repr`, so an `IntEnum` or float subclass key encodes as its number.
+    base_type
+        .call_method1("__repr__", (key,))
+        .and_then(|text| text.extract::<String>())
+        .map_err(|_| non_json_row_value())
+}
+
+fn non_json_row_value() -> CdfError {
+    CdfError::data(
+        "Python dict row contains a value that cannot be encoded as JSON; emit Arrow for non-JSON-native values",
+    )
+}
+
 pub(crate) fn descriptor_for(
     resource_id: ResourceId,
     state_scope: ScopeKey,
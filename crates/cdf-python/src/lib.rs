@@ -17,35 +17,56 @@ use sha2::{Digest, Sha256};
     reason = "Arrow/Python FFI exception governed by .10x/decisions/compiler-enforced-rust-safety-walls.md"
 )]
 mod arrow_capsule;
+mod async_iter;
 mod bridge;
 mod bridge_types;
+mod coalesce;
+mod column_batch;
 mod context;
+mod dict_schema;
 mod dlt;
+mod dlt_state;
 mod driver;
+mod estimate;
+mod incremental;
 mod internal;
 mod interpreter;
+mod module_cache;
+mod process;
+mod profile;
+mod pushdown;
+mod resident;
 mod resource;
 #[cfg(test)]
 mod tests;
 
 pub use bridge::{PythonResourceBridge, arrow_boundary_for};
 pub use bridge_types::{
-    ARROW_C_ARRAY_METHOD, ARROW_C_STREAM_METHOD, ArrowCapsuleBoundary, DEFAULT_DICT_BATCH_ROWS,
-    DEFAULT_MAX_BOUNDARY_BYTES, PythonBridgeOptions, PythonFirstObservation, PythonStreamSummary,
-    PythonYieldKind,
+    ARROW_C_ARRAY_METHOD, ARROW_C_STREAM_METHOD, ArrowCapsuleBoundary, CDF_COLUMNS_METHOD,
+    CDF_POSITION_METHOD, DEFAULT_DICT_BATCH_ROWS, DEFAULT_MAX_BOUNDARY_BYTES, PROFILE_WINDOW_LIMIT,
+    PythonBridgeOptions, PythonBridgeProfile, PythonFirstObservation, PythonStreamSummary,
+    PythonWindowProfile, PythonYieldKind,
+};
+pub use context::{
+    ContextLogCounts, ContextLogEvent, ContextLogEvidence, ContextLogLevel, ContextLogPolicy,
+    ContextLogRing, DEFAULT_CONTEXT_LOG_BYTES, DEFAULT_CONTEXT_LOG_MESSAGES_PER_MINUTE,
+    PythonContext,
 };
-pub use context::{ContextLogEvent, PythonContext};
 pub use dlt::{
     DLT_METADATA_ATTR, DltBridgeMappingEntry, DltBridgeMappingStatus, DltBridgeMappingTable,
     DltBridgeMetadata, DltBridgeObjectKind, DltBridgeSummary, DltCurrentStateView,
-    DltIncrementalHint, DltSchemaContractHint, DltWriteDisposition, DltWriteDispositionHint,
-    composite_dlt_state, dlt_current_state_view, extract_dlt_metadata, fixture_dlt_foreign_state,
-    fixture_state_delta_position,
+    DltIncrementalHint, DltSchemaContractHint, DltSourceMember, DltWriteDisposition,
+    DltWriteDispositionHint, composite_dlt_state, dlt_current_state_view, expand_dlt_source,
+    extract_dlt_metadata, fixture_dlt_foreign_state, fixture_state_delta_position,
 };
+pub use dlt_state::{DltStateDelta, DltStateSession};
 pub use driver::PythonSourceDriver;
+pub use incremental::{CursorRowOrder, CursorWindow};
 pub use interpreter::{
     InterpreterReport, InterpreterRequirement, PythonConcurrencyMode, PythonExecutionSemantics,
     attached_interpreter_report, execution_semantics, inspect_interpreter,
     python_execution_lane_spec, validate_attached_interpreter,
 };
+pub use process::PythonIsolation;
+pub use profile::PythonProfileMode;
 pub use resource::PythonResource;
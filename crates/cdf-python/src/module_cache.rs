@@ -0,0 +1,354 @@
+use std::{
+    collections::BTreeMap,
+    ffi::OsStr,
+    fs,
+    io::Write,
+    path::{Component, Path, PathBuf},
+    sync::atomic::{AtomicU64, Ordering},
+    time::SystemTime,
+};
+
+use cdf_kernel::{CdfError, Result};
+use pyo3::{
+    Bound, PyAny, PyResult, Python,
+    types::{
+        PyAnyMethods, PyBytes, PyBytesMethods, PyDict, PyDictMethods, PyModule, PyModuleMethods,
+    },
+};
+use serde::{Deserialize, Serialize, de::DeserializeOwned};
+use sha2::{Digest, Sha256};
+
+const CACHE_DIRECTORY: &str = ".cdf/python-cache";
+const MODULE_NAME: &str = "cdf_project_resource";
+/// Prefix of the synthetic package a resource module is imported into, one per directory.
+const PACKAGE_PREFIX: &str = "cdf_project_";
+/// Files the cache directory keeps; the least recently used beyond this are evicted.
+pub(crate) const MAX_CACHE_FILES: usize = 256;
+/// Directories under the project root whose modules are installed packages, not project code.
+const INSTALLED_DIRECTORIES: [&str; 4] = ["site-packages", "dist-packages", ".venv", ".cdf"];
+
+static TEMPORARY_COUNTER: AtomicU64 = AtomicU64::new(0);
+
+/// Bytecode and decorator metadata for one resource module, under `.cdf/python-cache/`.
+///
+/// Entries are keyed by the module's `content_hash` and by the interpreter's bytecode identity
+/// (`sys.implementation.cache_tag` plus the import magic number), so an edited module or a
+/// different interpreter never reads another entry. Decorator metadata also depends on what the
+/// module imports, so each record lists the cdf version that inspected it and the hash of every
+/// `cdf_sdk` and project module loaded at the time; a record whose files changed is a miss.
+///
+/// The directory keeps at most [`MAX_CACHE_FILES`] files, evicting the least recently used. The
+/// cache is an accelerator only: an entry that is missing, unreadable, stale, or fails to
+/// unmarshal falls back to compiling the source, and a write that fails leaves the run
+/// unaffected.
+pub(crate) struct PythonModuleCache {
+    project_root: PathBuf,
+    stem: Option<PathBuf>,
+}
+
+/// A recorded inspection and the files it was made against.
+#[derive(Serialize, Deserialize)]
+struct RecordedMetadata<T> {
+    cdf_version: String,
+    /// SHA-256 of each imported `cdf_sdk` or project source file, by absolute path.
+    dependencies: BTreeMap<PathBuf, String>,
+    metadata: T,
+}
+
+impl PythonModuleCache {
+    pub(crate) fn new(py: Python<'_>, project_root: &Path, content_hash: &str) -> Self {
+        let stem = interpreter_tag(py).ok().flatten().map(|tag| {
+            let digest = content_hash.strip_prefix("sha256:").unwrap_or(content_hash);
+            project_root
+                .join(CACHE_DIRECTORY)
+                .join(format!("{digest}-{tag}"))
+        });
+        Self {
+            project_root: project_root.to_path_buf(),
+            stem,
+        }
+    }
+
+    /// Imports the module from cached bytecode, compiling and caching it on a miss.
+    pub(crate) fn load_module<'py>(
+        &self,
+        py: Python<'py>,
+        source: &str,
+        file_name: &str,
+    ) -> Result<Bound<'py, PyModule>> {
+        let code = match self.cached_code(py) {
+            Some(code) => code,
+            None => {
+                let code = compile(py, source, file_name).map_err(|_| {
+                    CdfError::contract(
+                        "Python resource module could not be imported; run `cdf doctor` and inspect the module syntax",
+                    )
+                })?;
+                self.store_code(&code);
+                code
+            }
+        };
+        exec_module(py, &code, &self.project_root.join(file_name)).map_err(|_| {
+            CdfError::contract(
+                "Python resource module could not be imported; run `cdf doctor` and inspect the module syntax",
+            )
+        })
+    }
+
+    /// Metadata a previous inspection of `callable` recorded for this module and interpreter,
+    /// unless cdf or any file the module imported has changed since.
+    pub(crate) fn metadata<T: DeserializeOwned>(&self, callable: &str) -> Option<T> {
+        let path = self.path(&format!("{callable}.metadata.json"))?;
+        let recorded =
+            serde_json::from_slice::<RecordedMetadata<T>>(&fs::read(&path).ok()?).ok()?;
+        let current = recorded.cdf_version == env!("CARGO_PKG_VERSION")
+            && recorded
+                .dependencies
+                .iter()
+                .all(|(file, digest)| file_digest(file).is_some_and(|current| current == *digest));
+        current.then(|| {
+            touch(&path);
+            recorded.metadata
+        })
+    }
+
+    /// Records the inspection of `callable` in the just-imported module, together with the
+    /// `cdf_sdk` and project modules loaded alongside it.
+    pub(crate) fn store_metadata<T: Serialize>(
+        &self,
+        py: Python<'_>,
+        callable: &str,
+        metadata: &T,
+    ) {
+        let Some(path) = self.path(&format!("{callable}.metadata.json")) else {
+            return;
+        };
+        let Ok(dependencies) = self.imported_dependencies(py) else {
+            return;
+        };
+        if let Ok(bytes) = serde_json::to_vec(&RecordedMetadata {
+            cdf_version: env!("CARGO_PKG_VERSION").to_owned(),
+            dependencies,
+            metadata,
+        }) {
+            let _ = write_atomic_replace(&path, &bytes);
+            self.evict_least_recently_used();
+        }
+    }
+
+    /// Hashes the source of every loaded `cdf_sdk` module and every project module outside an
+    /// installed-package directory. The resource module itself is already the cache key.
+    fn imported_dependencies(&self, py: Python<'_>) -> PyResult<BTreeMap<PathBuf, String>> {
+        let project_root = self
+            .project_root
+            .canonicalize()
+            .unwrap_or_else(|_| self.project_root.clone());
+        let modules = PyModule::import(py, "sys")?
+            .getattr("modules")?
+            .cast_into::<PyDict>()?
+            .copy()?;
+        let mut dependencies = BTreeMap::new();
+        for (name, module) in modules.iter() {
+            let name = name.extract::<String>()?;
+            if name.ends_with(MODULE_NAME) {
+                continue;
+            }
+            let Some(file) = module
+                .getattr("__file__")
+                .ok()
+                .and_then(|file| file.extract::<Option<PathBuf>>().ok().flatten())
+                .filter(|file| file.extension() == Some(OsStr::new("py")))
+                .and_then(|file| file.canonicalize().ok())
+            else {
+                continue;
+            };
+            let sdk = name == "cdf_sdk" || name.starts_with("cdf_sdk.");
+            let project = file.strip_prefix(&project_root).is_ok_and(|relative| {
+                !relative.components().any(|component| {
+                    matches!(component, Component::Normal(part)
+                        if INSTALLED_DIRECTORIES.iter().any(|installed| *part == **installed))
+                })
+            });
+            if (sdk || project)
+                && let Some(digest) = file_digest(&file)
+            {
+                dependencies.insert(file, digest);
+            }
+        }
+        Ok(dependencies)
+    }
+
+    fn cached_code<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyAny>> {
+        let path = self.path("pyc")?;
+        let bytes = fs::read(&path).ok()?;
+        let code = PyModule::import(py, "marshal")
+            .and_then(|marshal| marshal.call_method1("loads", (PyBytes::new(py, &bytes),)))
+            .ok()?;
+        touch(&path);
+        Some(code)
+    }
+
+    fn store_code(&self, code: &Bound<'_, PyAny>) {
+        let Some(path) = self.path("pyc") else {
+            return;
+        };
+        if let Ok(bytes) = PyModule::import(code.py(), "marshal")
+            .and_then(|marshal| marshal.call_method1("dumps", (code,)))
+            .and_then(|bytes| Ok(bytes.cast::<PyBytes>()?.as_bytes().to_vec()))
+        {
+            let _ = write_atomic_replace(&path, &bytes);
+            self.evict_least_recently_used();
+        }
+    }
+
+    fn path(&self, suffix: &str) -> Option<PathBuf> {
+        self.stem.as_ref().map(|stem| stem.with_extension(suffix))
+    }
+
+    /// Removes the least recently used files once the directory holds more than
+    /// [`MAX_CACHE_FILES`]. A hit refreshes its file's modification time, so that is the use
+    /// order.
+    fn evict_least_recently_used(&self) {
+        let Some(directory) = self.stem.as_deref().and_then(Path::parent) else {
+            return;
+        };
+        let Ok(entries) = fs::read_dir(directory) else {
+            return;
+        };
+        let mut files = entries
+            .filter_map(|entry| {
+                let entry = entry.ok()?;
+                let metadata = entry.metadata().ok().filter(fs::Metadata::is_file)?;
+                Some((metadata.modified().ok()?, entry.path()))
+            })
+            .collect::<Vec<_>>();
+        if files.len() <= MAX_CACHE_FILES {
+            return;
+        }
+        files.sort();
+        for (_, path) in &files[..files.len() - MAX_CACHE_FILES] {
+            let _ = fs::remove_file(path);
+        }
+    }
+}
+
+fn file_digest(path: &Path) -> Option<String> {
+    fs::read(path)
+        .ok()
+        .map(|bytes| hex::encode(Sha256::digest(bytes)))
+}
+
+/// Marks a cache file as just used, for eviction order.
+fn touch(path: &Path) {
+    let _ = fs::File::options()
+        .append(true)
+        .open(path)
+        .and_then(|file| file.set_modified(SystemTime::now()));
+}
+
+/// `None` when the interpreter disables bytecode caching (`cache_tag is None`).
+fn interpreter_tag(py: Python<'_>) -> PyResult<Option<String>> {
+    let cache_tag = PyModule::import(py, "sys")?
+        .getattr("implementation")?
+        .getattr("cache_tag")?
+        .extract::<Option<String>>()?;
+    let magic = PyModule::import(py, "importlib.util")?.getattr("MAGIC_NUMBER")?;
+    let magic = hex::encode(magic.cast::<PyBytes>()?.as_bytes());
+    Ok(cache_tag
+        .filter(|tag| {
+            tag.chars().all(|character| {
+                character.is_ascii_alphanumeric() || matches!(character, '-' | '_')
+            })
+        })
+        .map(|tag| format!("{tag}-{magic}")))
+}
+
+fn compile<'py>(py: Python<'py>, source: &str, file_name: &str) -> PyResult<Bound<'py, PyAny>> {
+    PyModule::import(py, "builtins")?
+        .getattr("compile")?
+        .call1((source, file_name, "exec", 0, true))
+}
+
+/// Runs `code` as a fresh module for the file at `path`, registered in `sys.modules` the way
+/// `importlib` would import it: the module carries `__spec__`, `__loader__`, and an absolute
+/// `__file__`, so `importlib.resources` finds files beside it. It is imported into a synthetic
+/// package whose path is its own directory, so `from . import helpers` imports its siblings;
+/// siblings imported by an earlier load are dropped first and imported afresh with it. The
+/// module is unregistered again if execution fails.
+fn exec_module<'py>(
+    py: Python<'py>,
+    code: &Bound<'py, PyAny>,
+    path: &Path,
+) -> PyResult<Bound<'py, PyModule>> {
+    let builtins = PyModule::import(py, "builtins")?;
+    let util = PyModule::import(py, "importlib.util")?;
+    let modules = PyModule::import(py, "sys")?
+        .getattr("modules")?
+        .cast_into::<PyDict>()?;
+    let directory = path.parent().unwrap_or(path);
+    let package = format!(
+        "{PACKAGE_PREFIX}{}",
+        &hex::encode(Sha256::digest(directory.as_os_str().as_encoded_bytes()))[..16]
+    );
+    let siblings = format!("{package}.");
+    for (name, _) in modules.copy()?.iter() {
+        if name.extract::<String>()?.starts_with(&siblings) {
+            modules.del_item(name)?;
+        }
+    }
+    // A namespace package, as `importlib` builds for a directory without `__init__.py`, so
+    // `importlib.resources.files(__package__)` reads the resource module's directory.
+    let machinery = PyModule::import(py, "importlib.machinery")?;
+    let locations = vec![directory.to_string_lossy().into_owned()];
+    let loader = machinery.getattr("NamespaceLoader")?.call1((
+        &package,
+        &locations,
+        machinery.getattr("PathFinder")?.getattr("find_spec")?,
+    ))?;
+    let package_kwargs = PyDict::new(py);
+    package_kwargs.set_item("is_package", true)?;
+    let package_spec = machinery
+        .getattr("ModuleSpec")?
+        .call((&package, loader), Some(&package_kwargs))?;
+    package_spec.setattr("submodule_search_locations", locations)?;
+    modules.set_item(
+        &package,
+        util.getattr("module_from_spec")?.call1((package_spec,))?,
+    )?;
+    let name = format!("{package}.{MODULE_NAME}");
+    let spec = util
+        .getattr("spec_from_file_location")?
+        .call1((&name, path.to_string_lossy().into_owned()))?;
+    let module = util
+        .getattr("module_from_spec")?
+        .call1((spec,))?
+        .cast_into::<PyModule>()?;
+    module.setattr("__builtins__", &builtins)?;
+    modules.set_item(&name, &module)?;
+    if let Err(error) = builtins.getattr("exec")?.call1((code, module.dict())) {
+        let _ = modules.del_item(&name);
+        return Err(error);
+    }
+    Ok(module)
+}
+
+fn write_atomic_replace(path: &Path, bytes: &[u8]) -> std::io::Result<()> {
+    if let Some(parent) = path.parent() {
+        fs::create_dir_all(parent)?;
+    }
+    let temp = path.with_extension(format!(
+        "tmp-{}-{}",
+        std::process::id(),
+        TEMPORARY_COUNTER.fetch_add(1, Ordering::Relaxed)
+    ));
+    let result = fs::OpenOptions::new()
+        .write(true)
+        .create_new(true)
+        .open(&temp)
+        .and_then(|mut file| file.write_all(bytes))
+        .and_then(|()| fs::rename(&temp, path));
+    if result.is_err() {
+        let _ = fs::remove_file(&temp);
+    }
+    result
+}
@@ -0,0 +1,245 @@
+use std::{path::Path, sync::Arc};
+
+use arrow_schema::Schema;
+use cdf_foreign_stream::{
+    ForeignBackpressure, ForeignCancellationContract, ForeignExecutionLane,
+    ForeignLaneCapabilities, ForeignMemoryContract, ForeignProducerDescriptor, ForeignProducerId,
+    ForeignProtocolVersion, ForeignSchemaAcquisition, ForeignSecurityContract, ForeignStartupModel,
+    ForeignStateContract, ForeignTransferMode,
+};
+use cdf_kernel::{CdfError, PartitionId, ResourceId, Result};
+use cdf_subprocess::{CommandSpec, SubprocessProducer, SubprocessProtocol, SupervisionOptions};
+use serde::{Deserialize, Serialize};
+
+/// Where a Python resource's generator runs.
+///
+/// `Embedded` attaches to the interpreter linked into this process and shares its GIL with every
+/// other embedded resource. `Process` runs each partition in a supervised worker process of the
+/// configured interpreter, so GIL-bound resources scale across cores; batches return as an Arrow
+/// IPC stream and the worker needs `pyarrow` plus a declared `schema=`.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(rename_all = "snake_case")]
+pub enum PythonIsolation {
+    #[default]
+    Embedded,
+    Process,
+}
+
+impl PythonIsolation {
+    pub fn is_embedded(&self) -> bool {
+        matches!(self, Self::Embedded)
+    }
+}
+
+const WORKER_STDERR_BYTES: u64 = 4 * 1024;
+
+/// Worker entry point run with `python -c`. User code never sees the IPC pipe or the diagnostic
+/// stream: both of its standard streams are redirected to the null device, and a failure reports
+/// only the exception type, matching the embedded boundary's redaction.
+const PYTHON_WORKER: &str = r#"
+import array
+import binascii
+import importlib.util
+import os
+import sys
+from collections.abc import Mapping
+
+ipc = os.fdopen(os.dup(1), "wb")
+diagnostics = os.fdopen(os.dup(2), "w")
+null = os.open(os.devnull, os.O_WRONLY)
+os.dup2(null, 1)
+os.dup2(null, 2)
+
+
+def run():
+    import pyarrow as pa
+
+    schema_hex, batch_rows, module_path, callable_name, scan_json, *key = sys.argv[1:]
+    schema = pa.ipc.open_stream(binascii.unhexlify(schema_hex)).schema
+    batch_rows = int(batch_rows)
+    spec = importlib.util.spec_from_file_location("cdf_project_resource", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    kwargs = {}
+    if scan_json:
+        from cdf_sdk.scan import _scan_from_host
+
+        kwargs["scan"] = _scan_from_host(scan_json)
+    produced = getattr(module, callable_name)(*key, **kwargs)
+
+    def items():
+        if hasattr(produced, "__aiter__") and not hasattr(produced, "__iter__"):
+            import asyncio
+
+            loop = asyncio.new_event_loop()
+            iterator = produced.__aiter__()
+            try:
+                while True:
+                    try:
+                        yield loop.run_until_complete(iterator.__anext__())
+                    except StopAsyncIteration:
+                        return
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+        else:
+            yield from produced
+
+    def conform(table):
+        return table.select(schema.names).cast(schema).to_batches()
+
+    with pa.ipc.new_stream(ipc, schema) as writer:
+        rows = []
+
+        def flush():
+            if rows:
+                writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+                rows.clear()
+
+        for item in items():
+            if isinstance(item, Mapping):
+                rows.append(item)
+                if len(rows) == batch_rows:
+                    flush()
+                continue
+            flush()
+            if hasattr(item, "__cdf_columns__"):
+                fields, columns = item.__cdf_columns__()
+                table = pa.table(
+                    {
+                        field[0]: column.tolist() if isinstance(column, array.array) else list(column)
+                        for field, column in zip(fields, columns)
+                    }
+                )
+                batches = conform(table)
+            elif hasattr(item, "__arrow_c_stream__"):
+                batches = conform(pa.RecordBatchReader.from_stream(item).read_all())
+            elif hasattr(item, "__arrow_c_array__"):
+                batches = conform(pa.Table.from_batches([pa.record_batch(item)]))
+            else:
+                raise TypeError("expected dict, cdf_sdk.ColumnBatch, or Arrow PyCapsule-speaking object")
+            for batch in batches:
+                if batch.num_rows:
+                    writer.write_batch(batch)
+        flush()
+
+
+try:
+    run()
+    ipc.flush()
+except BaseException as error:
+    name = type(error).__name__
+    if not (name.isidentifier() and len(name) <= 128):
+        name = "Exception"
+    diagnostics.write(
+        "Python execution failed at the foreign boundary (" + name + "); inspect the Python resource locally for exception details\n"
+    )
+    diagnostics.flush()
+    os._exit(1)
+"#;
+
+pub(crate) fn python_process_descriptor(
+    max_boundary_bytes: u64,
+) -> Result<ForeignProducerDescriptor> {
+    let descriptor = ForeignProducerDescriptor {
+        producer_id: ForeignProducerId::new("cdf.python.process")?,
+        protocol_version: ForeignProtocolVersion::new("1")?,
+        transfer_modes: vec![ForeignTransferMode::ArrowIpcStream],
+        schema_acquisition: ForeignSchemaAcquisition::DeclaredHandshake,
+        startup: ForeignStartupModel::ChildProcess,
+        lanes: ForeignLaneCapabilities {
+            execution_lane: ForeignExecutionLane::IsolatedProcess,
+            maximum_internal_parallelism: 1,
+            backpressure: ForeignBackpressure::Pipe,
+        },
+        memory: ForeignMemoryContract {
+            payload_window_bytes: Some(max_boundary_bytes),
+            control_queue_bytes: None,
+            diagnostic_queue_bytes: Some(WORKER_STDERR_BYTES),
+            native_scratch_bytes: None,
+            child_process_bytes: None,
+        },
+        cancellation: ForeignCancellationContract {
+            cooperative_stop: true,
+            interrupt_safe: true,
+            force_termination_authorized: true,
+            drains_on_cancel: true,
+        },
+        state: ForeignStateContract {
+            emits_positions: true,
+            emits_watermarks: false,
+            emits_foreign_state: true,
+            terminal_state_required: true,
+        },
+        security: ForeignSecurityContract {
+            ambient_network: true,
+            ambient_filesystem: true,
+            secret_names: Vec::new(),
+        },
+    };
+    descriptor.validate()?;
+    Ok(descriptor)
+}
+
+/// One partition's worker invocation.
+pub(crate) struct PythonWorkerRequest<'a> {
+    pub(crate) interpreter: &'a Path,
+    pub(crate) project_root: &'a Path,
+    pub(crate) module_path: &'a Path,
+    pub(crate) callable: &'a str,
+    pub(crate) partition_key: Option<&'a str>,
+    /// Negotiated scan for a `pushdown=` resource, as `cdf_sdk.scan._scan_from_host` reads it.
+    pub(crate) scan_json: Option<String>,
+    pub(crate) resource_id: ResourceId,
+    pub(crate) partition_id: PartitionId,
+    pub(crate) schema: Arc<Schema>,
+    pub(crate) dict_batch_rows: usize,
+    pub(crate) max_boundary_bytes: u64,
+}
+
+/// Builds the supervised producer for one partition's worker process.
+pub(crate) fn python_worker_producer(
+    request: PythonWorkerRequest<'_>,
+    memory: Arc<dyn cdf_memory::MemoryCoordinator>,
+) -> Result<SubprocessProducer> {
+    let schema_hex = hex::encode(ipc_schema_bytes(&request.schema)?);
+    let mut args = vec![
+        "-c".to_owned(),
+        PYTHON_WORKER.to_owned(),
+        schema_hex,
+        request.dict_batch_rows.to_string(),
+        request.module_path.to_string_lossy().into_owned(),
+        request.callable.to_owned(),
+        request.scan_json.unwrap_or_default(),
+    ];
+    args.extend(request.partition_key.map(str::to_owned));
+    let command = CommandSpec::new(request.interpreter.to_string_lossy())
+        .with_args(args)
+        .with_current_dir(request.project_root);
+    let read_options = cdf_runtime::ReadOptions::new(request.resource_id, request.partition_id)
+        .with_batch_size(request.dict_batch_rows)?;
+    SubprocessProducer::new(
+        command,
+        SubprocessProtocol::ArrowIpc,
+        read_options,
+        cdf_runtime::DecodeSchemaPlan::fixed_admission(request.schema),
+        SupervisionOptions {
+            stderr_line_limit: 1,
+            maximum_stream_chunk_bytes: request.max_boundary_bytes,
+            maximum_stderr_bytes: WORKER_STDERR_BYTES,
+            ..SupervisionOptions::default()
+        },
+        memory,
+    )
+}
+
+fn ipc_schema_bytes(schema: &Schema) -> Result<Vec<u8>> {
+    let mut writer = arrow_ipc::writer::StreamWriter::try_new(Vec::new(), schema)
+        .map_err(|_| CdfError::internal("encode Python worker schema failed"))?;
+    writer
+        .finish()
+        .map_err(|_| CdfError::internal("encode Python worker schema failed"))?;
+    writer
+        .into_inner()
+        .map_err(|_| CdfError::internal("encode Python worker schema failed"))
+}
@@ -0,0 +1,211 @@
+use std::{
+    path::{Path, PathBuf},
+    sync::atomic::{AtomicU64, Ordering},
+    time::{SystemTime, UNIX_EPOCH},
+};
+
+use cdf_kernel::{CdfError, PartitionId, ResourceId, Result};
+use pyo3::{
+    Bound, PyAny, Python,
+    types::{PyAnyMethods, PyModule},
+};
+use serde::{Deserialize, Serialize};
+
+use crate::{
+    bridge_types::{PythonBridgeProfile, sanitize_id_part},
+    internal::py_error,
+};
+
+/// How much an embedded Python partition records about where its time went.
+///
+/// `Timings` has the bridge time each stage of the hot path and writes one JSON profile per
+/// partition. `Cprofile` additionally runs the resource under `cProfile` and dumps its stats
+/// next to that profile, for `python -m pstats` or snakeviz. Process-isolated resources run in
+/// a worker interpreter the host does not instrument, so they are not profiled in either mode.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(rename_all = "snake_case")]
+pub enum PythonProfileMode {
+    #[default]
+    Off,
+    Timings,
+    Cprofile,
+}
+
+impl PythonProfileMode {
+    pub fn is_off(&self) -> bool {
+        matches!(self, Self::Off)
+    }
+}
+
+/// Where one resource's partition profiles are written:
+/// `.cdf/profiles/python/<resource>/<run>/` under the invocation's artifact root.
+///
+/// `<run>` is stamped when the resource is resolved, so every run keeps its own profiles and
+/// concurrent runs never write the same file.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub(crate) struct PythonProfileSink {
+    mode: PythonProfileMode,
+    directory: PathBuf,
+}
+
+/// Distinguishes resources resolved in the same millisecond by one process.
+static PROFILE_RUN_SEQUENCE: AtomicU64 = AtomicU64::new(0);
+
+/// The JSON document written for one profiled partition.
+#[derive(Debug, Serialize)]
+struct PythonPartitionProfile<'a> {
+    resource_id: &'a str,
+    partition_id: &'a str,
+    mode: PythonProfileMode,
+    bridge: &'a PythonBridgeProfile,
+    /// File name of the `cProfile` stats dumped beside this profile, if any.
+    #[serde(skip_serializing_if = "Option::is_none")]
+    cprofile_stats: Option<String>,
+    /// Why the partition stopped early; absent when it completed.
+    #[serde(skip_serializing_if = "Option::is_none")]
+    error: Option<&'a str>,
+}
+
+impl PythonProfileSink {
+    pub(crate) fn new(
+        mode: PythonProfileMode,
+        artifact_root: &Path,
+        resource_id: &ResourceId,
+    ) -> Option<Self> {
+        (!mode.is_off()).then(|| {
+            let started_ms = SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .map_or(0, |elapsed| elapsed.as_millis());
+            let run = format!(
+                "{started_ms:013}-{}-{}",
+                std::process::id(),
+                PROFILE_RUN_SEQUENCE.fetch_add(1, Ordering::Relaxed)
+            );
+            Self {
+                mode,
+                directory: artifact_root
+                    .join(".cdf")
+                    .join("profiles")
+                    .join("python")
+                    .join(sanitize_id_part(resource_id.as_str()))
+                    .join(run),
+            }
+        })
+    }
+
+    /// Starts a `cProfile.Profile` on this thread when the mode asks for one. It must be
+    /// enabled before the callable is first called so generator setup is captured too.
+    ///
+    /// From Python 3.12 `cProfile` claims the interpreter-wide `sys.monitoring` profiler tool,
+    /// so while one partition is profiled every other partition of the interpreter, such as
+    /// concurrent keyed partitions or another profiler the resource started, fails to enable
+    /// its own. Such a partition logs a warning and runs with timings only, without a `.pstats`
+    /// file, instead of failing.
+    pub(crate) fn start<'py>(
+        &self,
+        py: Python<'py>,
+        partition_id: &PartitionId,
+        resource_id: &ResourceId,
+    ) -> Option<CprofileRun<'py>> {
+        if self.mode != PythonProfileMode::Cprofile {
+            return None;
+        }
+        let profiler = PyModule::import(py, "cProfile")
+            .and_then(|module| module.getattr("Profile")?.call0())
+            .and_then(|profiler| profiler.call_method0("enable").map(|_| profiler));
+        match profiler {
+            Ok(profiler) => Some(CprofileRun(profiler)),
+            Err(error) => {
+                tracing::warn!(
+                    resource_id = resource_id.as_str(),
+                    partition_id = partition_id.as_str(),
+                    "Python partition runs without cProfile: {}",
+                    py_error(error).message
+                );
+                None
+            }
+        }
+    }
+
+    /// Writes the partition's bridge profile and, under `Cprofile`, its stats. A partition
+    /// that failed or was cancelled is profiled too, with `error` recording why it stopped.
+    ///
+    /// Profiling is diagnostic, so a profile that cannot be written is a warning rather than a
+    /// failure of the partition it describes.
+    pub(crate) fn finish(
+        &self,
+        profiler: Option<&CprofileRun<'_>>,
+        partition_id: &PartitionId,
+        resource_id: &ResourceId,
+        bridge: &PythonBridgeProfile,
+        error: Option<&CdfError>,
+    ) {
+        if let Err(failure) = self.write(profiler, partition_id, resource_id, bridge, error) {
+            tracing::warn!(
+                resource_id = resource_id.as_str(),
+                partition_id = partition_id.as_str(),
+                "Python partition profile was not written: {}",
+                failure.message
+            );
+        }
+    }
+
+    fn write(
+        &self,
+        profiler: Option<&CprofileRun<'_>>,
+        partition_id: &PartitionId,
+        resource_id: &ResourceId,
+        bridge: &PythonBridgeProfile,
+        error: Option<&CdfError>,
+    ) -> Result<()> {
+        std::fs::create_dir_all(&self.directory).map_err(|error| {
+            CdfError::internal(format!("create Python profile directory failed: {error}"))
+        })?;
+        let stem = sanitize_id_part(partition_id.as_str());
+        let cprofile_stats = match profiler {
+            Some(CprofileRun(profiler)) => {
+                profiler.call_method0("disable").map_err(py_error)?;
+                let name = format!("{stem}.pstats");
+                let staged = self.directory.join(format!("{name}.tmp"));
+                profiler
+                    .call_method1("dump_stats", (staged.clone(),))
+                    .map_err(py_error)?;
+                self.publish(&staged, &name)?;
+                Some(name)
+            }
+            None => None,
+        };
+        let document = serde_json::to_vec_pretty(&PythonPartitionProfile {
+            resource_id: resource_id.as_str(),
+            partition_id: partition_id.as_str(),
+            mode: self.mode,
+            bridge,
+            cprofile_stats,
+            error: error.map(|error| error.message.as_str()),
+        })
+        .map_err(|error| CdfError::internal(format!("serialize Python profile: {error}")))?;
+        let name = format!("{stem}.json");
+        let staged = self.directory.join(format!("{name}.tmp"));
+        std::fs::write(&staged, document)
+            .map_err(|error| CdfError::internal(format!("write Python profile failed: {error}")))?;
+        self.publish(&staged, &name)
+    }
+
+    /// Renames a fully written file into place, so readers never see a partial profile.
+    fn publish(&self, staged: &Path, name: &str) -> Result<()> {
+        std::fs::rename(staged, self.directory.join(name)).map_err(|error| {
+            let _ = std::fs::remove_file(staged);
+            CdfError::internal(format!("publish Python profile failed: {error}"))
+        })
+    }
+}
+
+/// An enabled `cProfile.Profile`; dropping it disables the profiler, so a partition that fails
+/// leaves no profiling hook behind on its thread.
+pub(crate) struct CprofileRun<'py>(Bound<'py, PyAny>);
+
+impl Drop for CprofileRun<'_> {
+    fn drop(&mut self) {
+        let _ = self.0.call_method0("disable");
+    }
+}
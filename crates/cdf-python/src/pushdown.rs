@@ -0,0 +1,215 @@
+use std::sync::Arc;
+
+use arrow_schema::{Field, Schema, SchemaRef};
+use cdf_kernel::{
+    CapabilitySupport, CdfError, CompiledScanIntent, DeclarativeExpressionLiteral,
+    FilterCapabilities, PushdownFidelity, PushedPredicate, ResourceCapabilities, Result,
+    ScanPredicate, ScanRequest,
+};
+use serde::{Deserialize, Serialize};
+
+/// Python callable hook that receives the negotiated scan as `scan=cdf_sdk.ScanRequest`.
+pub(crate) const SCAN_KEYWORD: &str = "scan";
+/// Host-side constructor for `cdf_sdk.ScanRequest`, fed the JSON from [`scan_request_json`].
+pub(crate) const SCAN_FROM_HOST: &str = "_scan_from_host";
+
+/// What a `@cdf_sdk.resource(pushdown=...)` author applies upstream.
+///
+/// `exact` predicates are trusted to remove every non-matching row, so the engine drops its own
+/// filter for them; inexact predicates only narrow the fetch and the engine filters again.
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(deny_unknown_fields)]
+pub(crate) struct PythonPushdown {
+    pub(crate) projection: bool,
+    pub(crate) operators: Vec<String>,
+    pub(crate) exact: bool,
+    pub(crate) limit: bool,
+}
+
+impl PythonPushdown {
+    pub(crate) fn validate(&self) -> Result<()> {
+        if self
+            .operators
+            .iter()
+            .any(|operator| !matches!(operator.as_str(), "=" | "!=" | ">" | ">=" | "<" | "<="))
+        {
+            return Err(CdfError::contract(
+                "Python resource `pushdown=` operators must be comparisons (=, !=, >, >=, <, <=)",
+            ));
+        }
+        Ok(())
+    }
+
+    /// Resource capabilities advertised for this declaration. Limits are never pushed into a
+    /// cursor resource, whose incremental window the engine must see in full.
+    pub(crate) fn apply(&self, capabilities: &mut ResourceCapabilities, has_cursor: bool) {
+        if self.projection {
+            capabilities.projection = CapabilitySupport::Supported;
+        }
+        if !self.operators.is_empty() {
+            capabilities.filters = FilterCapabilities {
+                default_fidelity: self.fidelity(),
+                supported_operators: self.operators.clone(),
+            };
+        }
+        if self.limit && !has_cursor {
+            capabilities.limits = CapabilitySupport::Supported;
+        }
+    }
+
+    fn fidelity(&self) -> PushdownFidelity {
+        if self.exact {
+            PushdownFidelity::Exact
+        } else {
+            PushdownFidelity::Inexact
+        }
+    }
+
+    /// Splits canonical predicates into the column-literal comparisons this resource applies and
+    /// the rest, which stay with the engine.
+    pub(crate) fn classify(
+        &self,
+        schema: &Schema,
+        predicates: &[ScanPredicate],
+    ) -> (Vec<PushedPredicate>, Vec<ScanPredicate>) {
+        let mut pushed = Vec::new();
+        let mut unsupported = Vec::new();
+        for predicate in predicates {
+            let expression = &predicate.canonical_expression;
+            let pushable = expression
+                .comparison()
+                .zip(expression.comparison_operator())
+                .is_some_and(|((column, _, literal), operator)| {
+                    schema.field_with_name(column).is_ok()
+                        && self.operators.iter().any(|supported| supported == operator)
+                        && literal_json(literal).is_some()
+                });
+            if pushable {
+                pushed.push(PushedPredicate {
+                    predicate: predicate.clone(),
+                    fidelity: self.fidelity(),
+                });
+            } else {
+                unsupported.push(predicate.clone());
+            }
+        }
+        (pushed, unsupported)
+    }
+}
+
+/// The compiled intent each partition carries for `request` under `capabilities`.
+pub(crate) fn scan_intent(
+    capabilities: &ResourceCapabilities,
+    schema: &Schema,
+    request: &ScanRequest,
+    pushed: Vec<PushedPredicate>,
+) -> Result<CompiledScanIntent> {
+    let projection = (capabilities.projection == CapabilitySupport::Supported)
+        .then(|| request.projection.clone())
+        .flatten();
+    if let Some(column) = projection
+        .iter()
+        .flatten()
+        .find(|column| schema.field_with_name(column).is_err())
+    {
+        return Err(CdfError::contract(format!(
+            "Python scan projects column `{column}` that the resource schema does not name"
+        )));
+    }
+    let intent = CompiledScanIntent {
+        version: cdf_kernel::COMPILED_SCAN_INTENT_VERSION,
+        projection,
+        predicates: pushed,
+        limit: (capabilities.limits == CapabilitySupport::Supported)
+            .then_some(request.limit)
+            .flatten(),
+        order_by: Vec::new(),
+    };
+    intent.validate()?;
+    Ok(intent)
+}
+
+/// Columns the opened partition must emit, or `None` when it emits the whole schema.
+pub(crate) fn projected_columns(intent: &CompiledScanIntent) -> Option<&[String]> {
+    intent
+        .projection
+        .as_deref()
+        .filter(|columns| !columns.is_empty())
+}
+
+/// Relaxes a declared schema for a projected scan: unprojected fields become nullable, so rows
+/// may omit what the author no longer fetches, and projected fields keep their declaration.
+pub(crate) fn relaxed_declared_schema(schema: &Schema, projection: &[String]) -> SchemaRef {
+    Arc::new(Schema::new_with_metadata(
+        schema
+            .fields()
+            .iter()
+            .map(|field| {
+                if projection.contains(field.name()) {
+                    Arc::clone(field)
+                } else {
+                    Arc::new(Field::clone(field).with_nullable(true))
+                }
+            })
+            .collect::<Vec<_>>(),
+        schema.metadata().clone(),
+    ))
+}
+
+/// The schema a projected partition emits, in projection order.
+pub(crate) fn projected_schema(schema: &Schema, projection: &[String]) -> Result<SchemaRef> {
+    schema
+        .project(
+            &projection
+                .iter()
+                .map(|column| schema.index_of(column))
+                .collect::<std::result::Result<Vec<_>, _>>()
+                .map_err(|_| {
+                    CdfError::contract("Python scan projects a column the resource schema lacks")
+                })?,
+        )
+        .map(Arc::new)
+        .map_err(|_| CdfError::internal("project Python resource schema failed"))
+}
+
+/// Serializes the negotiated scan for `cdf_sdk.scan._scan_from_host`.
+pub(crate) fn scan_request_json(intent: &CompiledScanIntent) -> Result<String> {
+    let predicates = intent
+        .predicates
+        .iter()
+        .map(|pushed| {
+            let expression = &pushed.predicate.canonical_expression;
+            let ((column, _, literal), operator) = expression
+                .comparison()
+                .zip(expression.comparison_operator())
+                .ok_or_else(|| {
+                    CdfError::contract("Python scan received a predicate it did not negotiate")
+                })?;
+            let value = literal_json(literal).ok_or_else(|| {
+                CdfError::contract("Python scan received a predicate it did not negotiate")
+            })?;
+            Ok(serde_json::json!([column, operator, value]))
+        })
+        .collect::<Result<Vec<_>>>()?;
+    serde_json::to_string(&serde_json::json!({
+        "columns": intent.projection,
+        "predicates": predicates,
+        "limit": intent.limit,
+    }))
+    .map_err(|error| CdfError::internal(format!("serialize Python scan request: {error}")))
+}
+
+fn literal_json(literal: &DeclarativeExpressionLiteral) -> Option<serde_json::Value> {
+    match literal {
+        DeclarativeExpressionLiteral::Null => Some(serde_json::Value::Null),
+        DeclarativeExpressionLiteral::Boolean(value) => Some((*value).into()),
+        DeclarativeExpressionLiteral::Signed(value) => Some((*value).into()),
+        DeclarativeExpressionLiteral::Unsigned(value) => Some((*value).into()),
+        DeclarativeExpressionLiteral::Float64Bits(_) => literal
+            .as_float64()
+            .and_then(serde_json::Number::from_f64)
+            .map(serde_json::Value::Number),
+        DeclarativeExpressionLiteral::String(value) => Some(value.clone().into()),
+        _ => None,
+    }
+}
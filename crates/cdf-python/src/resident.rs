@@ -0,0 +1,52 @@
+use std::{
+    collections::BTreeMap,
+    path::{Path, PathBuf},
+    sync::Mutex,
+    time::Duration,
+};
+
+use pyo3::{Bound, Py, Python, types::PyModule};
+
+/// Resource modules kept imported for the life of this process, by absolute module path.
+///
+/// The lock is never held across Python execution: a miss imports outside it, so two partitions
+/// racing on a cold module may both import it and the later one is retained.
+static RESIDENT_MODULES: Mutex<BTreeMap<PathBuf, ResidentModule>> = Mutex::new(BTreeMap::new());
+
+struct ResidentModule {
+    content_hash: String,
+    module: Py<PyModule>,
+}
+
+/// How long one embedded invocation took to reach a callable it can call.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(crate) struct PythonStartupLatency {
+    pub(crate) cold: Duration,
+    pub(crate) warm: Duration,
+}
+
+/// The resident module for `module_path`, unless the retained import hashed different source.
+pub(crate) fn warm_module<'py>(
+    py: Python<'py>,
+    module_path: &Path,
+    content_hash: &str,
+) -> Option<Bound<'py, PyModule>> {
+    let modules = RESIDENT_MODULES.lock().ok()?;
+    modules
+        .get(module_path)
+        .filter(|resident| resident.content_hash == content_hash)
+        .map(|resident| resident.module.bind(py).clone())
+}
+
+/// Retains `module` as the resident import of `module_path`, replacing one of older content.
+pub(crate) fn retain_module(module_path: &Path, content_hash: &str, module: &Bound<'_, PyModule>) {
+    if let Ok(mut modules) = RESIDENT_MODULES.lock() {
+        modules.insert(
+            module_path.to_path_buf(),
+            ResidentModule {
+                content_hash: content_hash.to_owned(),
+                module: module.clone().unbind(),
+            },
+        );
+    }
+}
@@ -1,32 +1,53 @@
 use std::{
-    collections::{BTreeMap, VecDeque},
-    ffi::CString,
+    collections::{BTreeMap, BTreeSet, VecDeque},
     fs,
     path::{Path, PathBuf},
     sync::{Arc, Mutex},
+    time::Instant,
 };
 
-use arrow_array::{Array, Int64Array, TimestampMicrosecondArray, UInt64Array};
+use arrow_arith::aggregate::{max, max_string};
+use arrow_array::{
+    Array, ArrayRef, ArrowNumericType, Date32Array, Date64Array, Int64Array, LargeStringArray,
+    PrimitiveArray, StringArray, TimestampMicrosecondArray, TimestampMillisecondArray,
+    TimestampNanosecondArray, TimestampSecondArray, UInt64Array,
+};
 use arrow_schema::{DataType, Field, Schema, SchemaRef, TimeUnit};
 use cdf_kernel::{
-    BackpressureSupport, CapabilitySupport, CompiledSourcePlanHash, CursorOrderingClaim,
-    CursorPosition, CursorSpec, CursorValue, DeliveryGuarantee, EffectiveSchemaCatalogEntry,
-    EffectiveSchemaRuntime, ErrorKind, EstimateSupport, FilterCapabilities, ForeignState,
-    IncrementalShape, PartitionAuthority, PartitionId, PartitionPlan, PartitioningCapabilities,
-    PlanId, QueryableResource, ReplaySupport, ResourceCapabilities, ResourceDescriptor, ResourceId,
+    BackpressureSupport, CapabilitySupport, CompiledScanIntent, CompiledSourcePlanHash,
+    CursorOrderingClaim, CursorPosition, CursorSpec, CursorValue, DeliveryGuarantee,
+    EffectiveSchemaCatalogEntry, EffectiveSchemaRuntime, ErrorKind, FilterCapabilities,
+    ForeignState, IncrementalShape, PLAN_ESTIMATED_BYTES_KEY, PLAN_ESTIMATED_ROWS_KEY,
+    PartitionAuthority, PartitionId, PartitionPlan, PartitioningCapabilities, PlanId,
+    QueryableResource, ReplaySupport, ResourceCapabilities, ResourceDescriptor, ResourceId,
     ResourceStream, Result, ScanPlan, ScanRequest, SchemaSource, ScopeKey,
-    SourceBoundaryCapabilities, SourcePosition, TrustLevel, TypePolicyAllowances, WriteDisposition,
-    parse_arrow_field_type,
+    SourceBoundaryCapabilities, SourceIoMetrics, SourcePosition, TrustLevel, TypePolicyAllowances,
+    WriteDisposition, parse_arrow_field_type,
 };
 use cdf_runtime::CompiledSourcePlan;
 use pyo3::{
     Python,
-    types::{PyAnyMethods, PyModule},
+    types::{PyAnyMethods, PyDict, PyDictMethods, PyModule, PyString},
 };
 use serde::{Deserialize, Serialize};
 use sha2::{Digest, Sha256};
 
-use crate::{bridge::PythonResourceBridge, bridge_types::PythonBridgeOptions, internal::py_error};
+use crate::{
+    bridge::{PythonResourceBridge, PythonStreamFailure, python_batch_retained_bytes},
+    bridge_types::{PythonBridgeOptions, PythonBridgeProfile, PythonStreamSummary},
+    estimate::{ESTIMATE_ATTRIBUTE, PythonEstimate, estimate_support, planned_total},
+    internal::py_error,
+    module_cache::PythonModuleCache,
+    process::{
+        PythonIsolation, PythonWorkerRequest, python_process_descriptor, python_worker_producer,
+    },
+    profile::{PythonProfileMode, PythonProfileSink},
+    pushdown::{
+        PythonPushdown, SCAN_FROM_HOST, SCAN_KEYWORD, projected_columns, projected_schema,
+        relaxed_declared_schema, scan_intent, scan_request_json,
+    },
+    resident::{PythonStartupLatency, retain_module, warm_module},
+};
 use cdf_foreign_stream::{
     ForeignBackpressure, ForeignCancellation, ForeignCancellationContract, ForeignExecutionLane,
     ForeignLaneCapabilities, ForeignMemoryContract, ForeignProducer, ForeignProducerDescriptor,
@@ -36,19 +57,41 @@ use cdf_foreign_stream::{
 };
 
 const PARTITION_ID: &str = "python-000001";
+const PARTITION_KEY_METADATA: &str = "partition_key";
 
 #[derive(Clone, Debug)]
 pub struct PythonResource {
     descriptor: ResourceDescriptor,
     schema: SchemaRef,
     capabilities: ResourceCapabilities,
+    project_root: PathBuf,
     module_path: PathBuf,
     module_relative: String,
     callable: String,
     content_hash: String,
     bounded: bool,
+    partition_keys: Vec<String>,
+    pushdown: Option<PythonPushdown>,
+    /// Whether the callable declares an `estimate=` hook that planning calls per partition.
+    estimate: bool,
+    /// Whether the callable takes `resume=` and marks page tokens as its batch positions.
+    resumable: bool,
+    /// Scan intent of the partition being opened; a full scan outside `ResourceStream::open`.
+    scan_intent: CompiledScanIntent,
+    /// Page token the partition being opened resumes after; see [`PythonResource::planned_resume_token`].
+    resume_token: Option<String>,
     dict_batch_rows: usize,
     max_boundary_bytes: u64,
+    /// Row target for concatenating adjacent Arrow yields; `None` emits each yield as-is.
+    coalesce_rows: Option<usize>,
+    /// Batches the producer may queue ahead of the consumer; `None` queues one.
+    prefetch_batches: Option<usize>,
+    isolation: PythonIsolation,
+    /// Keeps the imported module resident in this process between runs; see [`warm_module`].
+    resident: bool,
+    /// Where partition profiles go when `python.profile` is on; `None` records nothing.
+    profile: Option<PythonProfileSink>,
+    worker_interpreter: Option<PathBuf>,
     execution: Option<cdf_runtime::ExecutionServices>,
     blocking_lane: Option<String>,
     compiled_source_plan_hash: Option<CompiledSourcePlanHash>,
@@ -57,6 +100,8 @@ pub struct PythonResource {
     type_policy_allowances: TypePolicyAllowances,
     foreign_descriptor: ForeignProducerDescriptor,
     prepared_invocation: Arc<Mutex<PreparedInvocationState>>,
+    /// Python time of the partition being produced, handed to its completion; see `open`.
+    source_io: Arc<Mutex<Option<SourceIoMetrics>>>,
 }
 
 #[derive(Clone, Debug, Serialize, Deserialize)]
@@ -66,9 +111,23 @@ pub(crate) struct PythonPhysicalPlan {
     pub(crate) callable: String,
     pub(crate) content_hash: String,
     pub(crate) bounded: bool,
+    #[serde(default, skip_serializing_if = "Vec::is_empty")]
+    pub(crate) partition_keys: Vec<String>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(crate) pushdown: Option<PythonPushdown>,
+    #[serde(default, skip_serializing_if = "std::ops::Not::not")]
+    pub(crate) estimate: bool,
+    #[serde(default, skip_serializing_if = "std::ops::Not::not")]
+    pub(crate) resumable: bool,
     pub(crate) dict_batch_rows: usize,
     pub(crate) max_boundary_bytes: u64,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(crate) coalesce_rows: Option<usize>,
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub(crate) prefetch_batches: Option<usize>,
     pub(crate) schema_acquisition: ForeignSchemaAcquisition,
+    #[serde(default, skip_serializing_if = "PythonIsolation::is_embedded")]
+    pub(crate) isolation: PythonIsolation,
 }
 
 #[derive(Debug)]
@@ -147,7 +206,14 @@ impl PythonResource {
                 module_path.display()
             ))
         })?;
-        let metadata = inspect_metadata(&source, &module_relative, &callable)?;
+        let content_hash = format!("sha256:{}", hex::encode(Sha256::digest(source.as_bytes())));
+        let metadata = inspect_metadata(
+            project_root,
+            &content_hash,
+            &source,
+            &module_relative,
+            &callable,
+        )?;
         let schema_acquisition = if metadata.schema.is_empty() {
             ForeignSchemaAcquisition::StreamBootstrap
         } else {
@@ -188,14 +254,53 @@ impl PythonResource {
                 "Python resource `{resource_id}` uses merge without a merge key"
             )));
         }
+        let partitioning = if metadata.partition_keys.is_empty() {
+            PartitioningCapabilities {
+                parallel_partitions: false,
+                supported_scopes: vec![cdf_kernel::ScopeKind::Resource],
+            }
+        } else {
+            PartitioningCapabilities {
+                parallel_partitions: true,
+                supported_scopes: vec![cdf_kernel::ScopeKind::Partition],
+            }
+        };
         let has_cursor = metadata.cursor.is_some();
+        if has_cursor && metadata.resumable {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `{resource_id}` declares both `cursor=` and `resumable=True`; batch positions come from one of them"
+            )));
+        }
         let cursor = metadata.cursor.map(|field| CursorSpec {
             field,
-            ordering: CursorOrderingClaim::Exact,
-            lag_tolerance_ms: 0,
+            ordering: metadata.cursor_ordering,
+            lag_tolerance_ms: metadata.cursor_lag_ms,
         });
-        let content_hash = format!("sha256:{}", hex::encode(Sha256::digest(source.as_bytes())));
-        let foreign_descriptor = python_foreign_descriptor(max_boundary_bytes, schema_acquisition)?;
+        let foreign_descriptor =
+            python_foreign_descriptor(max_boundary_bytes, 1, schema_acquisition)?;
+        let mut capabilities = ResourceCapabilities {
+            projection: CapabilitySupport::Unsupported,
+            filters: FilterCapabilities::default(),
+            limits: CapabilitySupport::Unsupported,
+            ordering: CapabilitySupport::Unsupported,
+            partitioning,
+            incremental: if has_cursor {
+                IncrementalShape::Cursor
+            } else {
+                IncrementalShape::Full
+            },
+            replay: if metadata.resumable {
+                ReplaySupport::FromPosition
+            } else {
+                ReplaySupport::None
+            },
+            idempotent_reads: false,
+            backpressure: BackpressureSupport::Pausable,
+            estimates: estimate_support(metadata.estimate),
+        };
+        if let Some(pushdown) = &metadata.pushdown {
+            pushdown.apply(&mut capabilities, has_cursor);
+        }
         Ok(Self {
             descriptor: ResourceDescriptor {
                 resource_id,
@@ -211,32 +316,27 @@ impl PythonResource {
                 trust_level,
             },
             schema,
-            capabilities: ResourceCapabilities {
-                projection: CapabilitySupport::Unsupported,
-                filters: FilterCapabilities::default(),
-                limits: CapabilitySupport::Unsupported,
-                ordering: CapabilitySupport::Unsupported,
-                partitioning: PartitioningCapabilities {
-                    parallel_partitions: false,
-                    supported_scopes: vec![cdf_kernel::ScopeKind::Resource],
-                },
-                incremental: if has_cursor {
-                    IncrementalShape::Cursor
-                } else {
-                    IncrementalShape::Full
-                },
-                replay: ReplaySupport::None,
-                idempotent_reads: false,
-                backpressure: BackpressureSupport::Pausable,
-                estimates: EstimateSupport::None,
-            },
+            project_root: project_root.to_path_buf(),
+            capabilities,
             module_path,
             module_relative,
             callable,
             content_hash,
             bounded: metadata.bounded,
+            partition_keys: metadata.partition_keys,
+            pushdown: metadata.pushdown,
+            estimate: metadata.estimate,
+            resumable: metadata.resumable,
+            scan_intent: CompiledScanIntent::full_scan(),
+            resume_token: None,
             dict_batch_rows,
             max_boundary_bytes,
+            coalesce_rows: None,
+            prefetch_batches: None,
+            isolation: PythonIsolation::Embedded,
+            resident: false,
+            profile: None,
+            worker_interpreter: None,
             execution: None,
             blocking_lane: None,
             compiled_source_plan_hash: None,
@@ -245,6 +345,7 @@ impl PythonResource {
             type_policy_allowances: TypePolicyAllowances::default(),
             foreign_descriptor,
             prepared_invocation: Arc::new(Mutex::new(PreparedInvocationState::Fresh)),
+            source_io: Arc::default(),
         })
     }
 
@@ -254,9 +355,16 @@ impl PythonResource {
             callable: self.callable.clone(),
             content_hash: self.content_hash.clone(),
             bounded: self.bounded,
+            partition_keys: self.partition_keys.clone(),
+            pushdown: self.pushdown.clone(),
+            estimate: self.estimate,
+            resumable: self.resumable,
             dict_batch_rows: self.dict_batch_rows,
             max_boundary_bytes: self.max_boundary_bytes,
+            coalesce_rows: self.coalesce_rows,
+            prefetch_batches: self.prefetch_batches,
             schema_acquisition: self.foreign_descriptor.schema_acquisition,
+            isolation: self.isolation,
         }
     }
 
@@ -274,20 +382,63 @@ impl PythonResource {
                 "compiled Python source requires positive dict_batch_rows and max_boundary_bytes of at least 2",
             ));
         }
+        validate_partition_keys(&physical.partition_keys)?;
+        if let Some(pushdown) = &physical.pushdown {
+            pushdown.validate()?;
+        }
+        if physical.resumable && physical.isolation == PythonIsolation::Process {
+            return Err(cdf_kernel::CdfError::contract(
+                "compiled Python source is resumable under process isolation, which cannot carry page tokens",
+            ));
+        }
+        if physical.coalesce_rows.is_some_and(|rows| rows < 2)
+            || (physical.coalesce_rows.is_some() && physical.isolation == PythonIsolation::Process)
+        {
+            return Err(cdf_kernel::CdfError::contract(
+                "compiled Python source coalesces Arrow yields outside an embedded source or below 2 rows",
+            ));
+        }
+        if physical.prefetch_batches.is_some_and(|batches| batches < 2)
+            || (physical.prefetch_batches.is_some()
+                && physical.isolation == PythonIsolation::Process)
+        {
+            return Err(cdf_kernel::CdfError::contract(
+                "compiled Python source prefetches batches outside an embedded source or below 2 batches",
+            ));
+        }
         let module_path = resolve_module_path(project_root, &physical.module_relative)?;
-        let foreign_descriptor =
-            python_foreign_descriptor(physical.max_boundary_bytes, physical.schema_acquisition)?;
+        let foreign_descriptor = match physical.isolation {
+            PythonIsolation::Embedded => python_foreign_descriptor(
+                physical.max_boundary_bytes,
+                physical.prefetch_batches.unwrap_or(1),
+                physical.schema_acquisition,
+            )?,
+            PythonIsolation::Process => python_process_descriptor(physical.max_boundary_bytes)?,
+        };
         Ok(Self {
             descriptor: plan.descriptor.clone(),
             schema: Arc::new(plan.schema.clone()),
             capabilities: plan.resource_capabilities.clone(),
+            project_root: project_root.to_path_buf(),
             module_path,
             module_relative: physical.module_relative,
             callable: physical.callable,
             content_hash: physical.content_hash,
             bounded: physical.bounded,
+            partition_keys: physical.partition_keys,
+            pushdown: physical.pushdown,
+            estimate: physical.estimate,
+            resumable: physical.resumable,
+            scan_intent: CompiledScanIntent::full_scan(),
+            resume_token: None,
             dict_batch_rows: physical.dict_batch_rows,
             max_boundary_bytes: physical.max_boundary_bytes,
+            coalesce_rows: physical.coalesce_rows,
+            prefetch_batches: physical.prefetch_batches,
+            isolation: physical.isolation,
+            resident: false,
+            profile: None,
+            worker_interpreter: None,
             execution: None,
             blocking_lane: None,
             compiled_source_plan_hash: Some(plan.compiled_source_plan_hash()?),
@@ -296,9 +447,120 @@ impl PythonResource {
             type_policy_allowances: plan.type_policy_allowances,
             foreign_descriptor,
             prepared_invocation: Arc::new(Mutex::new(PreparedInvocationState::Fresh)),
+            source_io: Arc::default(),
         })
     }
 
+    /// Selects where the resource's generator runs; process isolation needs a declared schema
+    /// because the worker encodes every batch against it before the first row crosses the pipe.
+    pub fn with_isolation(mut self, isolation: PythonIsolation) -> Result<Self> {
+        if isolation == PythonIsolation::Process && self.coalesce_rows.is_some() {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `{}` sets `coalesce_rows`, which applies only to embedded sources",
+                self.descriptor.resource_id
+            )));
+        }
+        if isolation == PythonIsolation::Process && self.prefetch_batches.is_some() {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `{}` sets `prefetch_batches`, which applies only to embedded sources",
+                self.descriptor.resource_id
+            )));
+        }
+        if isolation == PythonIsolation::Process && self.resumable {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `{}` is `resumable=True`, which process isolation does not support; run it embedded",
+                self.descriptor.resource_id
+            )));
+        }
+        if isolation == PythonIsolation::Process {
+            if self.schema_acquisition() != ForeignSchemaAcquisition::DeclaredHandshake {
+                return Err(cdf_kernel::CdfError::contract(format!(
+                    "Python resource `{}` uses process isolation without a declared schema; add `schema={{...}}` to `@cdf_sdk.resource`",
+                    self.descriptor.resource_id
+                )));
+            }
+            self.foreign_descriptor = python_process_descriptor(self.max_boundary_bytes)?;
+        }
+        self.isolation = isolation;
+        Ok(self)
+    }
+
+    /// Concatenates adjacent same-schema Arrow yields up to `rows` rows per batch, so a resource
+    /// that yields one small Arrow batch per API page emits fewer, larger batches.
+    pub fn with_coalesce_rows(mut self, rows: Option<usize>) -> Result<Self> {
+        if rows.is_some_and(|rows| rows < 2) {
+            return Err(cdf_kernel::CdfError::contract(
+                "Python source coalesce_rows must be at least 2",
+            ));
+        }
+        if rows.is_some() && self.isolation == PythonIsolation::Process {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `{}` sets `coalesce_rows`, which applies only to embedded sources",
+                self.descriptor.resource_id
+            )));
+        }
+        self.coalesce_rows = rows;
+        Ok(self)
+    }
+
+    /// Lets the producer queue up to `batches` batches ahead of the consumer, so the generator
+    /// keeps running while earlier batches are admitted and written. Each queued batch holds its
+    /// own memory lease, and a full queue pauses the generator until the consumer catches up.
+    pub fn with_prefetch_batches(mut self, batches: Option<usize>) -> Result<Self> {
+        if batches.is_some_and(|batches| batches < 2) {
+            return Err(cdf_kernel::CdfError::contract(
+                "Python source prefetch_batches must be at least 2",
+            ));
+        }
+        if batches.is_some() && self.isolation == PythonIsolation::Process {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `{}` sets `prefetch_batches`, which applies only to embedded sources",
+                self.descriptor.resource_id
+            )));
+        }
+        self.foreign_descriptor = python_foreign_descriptor(
+            self.max_boundary_bytes,
+            batches.unwrap_or(1),
+            self.schema_acquisition(),
+        )?;
+        self.prefetch_batches = batches;
+        Ok(self)
+    }
+
+    pub(crate) fn isolation(&self) -> PythonIsolation {
+        self.isolation
+    }
+
+    /// Keeps the embedded module imported between runs in this process. Module-level state then
+    /// persists across runs and partitions; an edited module is re-imported on its next open.
+    pub(crate) fn with_resident(mut self, resident: bool) -> Self {
+        self.resident = resident;
+        self
+    }
+
+    /// Profiles each partition as `mode` asks, writing under `artifact_root`; see
+    /// [`PythonProfileSink`].
+    pub fn with_profile(mut self, mode: PythonProfileMode, artifact_root: &Path) -> Self {
+        self.profile = PythonProfileSink::new(mode, artifact_root, &self.descriptor.resource_id);
+        self
+    }
+
+    /// Injects the execution services and the interpreter that process-isolated partitions spawn.
+    pub(crate) fn with_execution_services_and_worker(
+        mut self,
+        execution: cdf_runtime::ExecutionServices,
+        interpreter: PathBuf,
+    ) -> Result<Self> {
+        if self.isolation != PythonIsolation::Process {
+            return Err(cdf_kernel::CdfError::contract(
+                "embedded Python source requires a blocking lane instead of a worker interpreter",
+            ));
+        }
+        self.execution = Some(execution);
+        self.worker_interpreter = Some(interpreter);
+        Ok(self)
+    }
+
     pub(crate) fn with_prepared_invocation(
         mut self,
         prepared: PreparedPythonInvocation,
@@ -324,20 +586,49 @@ impl PythonResource {
         Ok(self)
     }
 
-    fn partition(&self) -> Result<PartitionPlan> {
+    /// Number of partitions this resource plans; one unless `partitions=` declared keys.
+    pub(crate) fn partition_count(&self) -> usize {
+        self.partition_keys.len().max(1)
+    }
+
+    fn partitions(&self) -> Result<Vec<PartitionPlan>> {
+        let estimates = self.partition_estimates()?;
+        (0..self.partition_count())
+            .map(|index| self.partition(index, estimates.get(index).cloned().unwrap_or_default()))
+            .collect()
+    }
+
+    /// Plans the partition at `index`. A keyed resource gives every key its own partition
+    /// scope, so cursor state and retries are tracked per key rather than per callable.
+    fn partition(&self, index: usize, estimate: PythonEstimate) -> Result<PartitionPlan> {
+        let partition_id = match self.partition_keys.get(index) {
+            Some(key) => keyed_partition_id(key)?,
+            None => PartitionId::new(PARTITION_ID)?,
+        };
+        let mut metadata = BTreeMap::from([
+            ("source_kind".to_owned(), "python".to_owned()),
+            ("module".to_owned(), self.module_relative.clone()),
+            ("callable".to_owned(), self.callable.clone()),
+            ("content_identity".to_owned(), self.content_hash.clone()),
+        ]);
+        let scope = match self.partition_keys.get(index) {
+            Some(key) => {
+                metadata.insert(PARTITION_KEY_METADATA.to_owned(), key.clone());
+                ScopeKey::Partition {
+                    partition_id: partition_id.clone(),
+                }
+            }
+            None => self.descriptor.state_scope.clone(),
+        };
+        estimate.record(&mut metadata);
         let mut partition = PartitionPlan {
-            partition_id: PartitionId::new(PARTITION_ID)?,
-            scope: self.descriptor.state_scope.clone(),
+            partition_id,
+            scope,
             planned_position: None,
             start_position: None,
-            scan_intent: cdf_kernel::CompiledScanIntent::full_scan(),
+            scan_intent: self.scan_intent.clone(),
             retry_safety: cdf_kernel::PartitionRetrySafety::Forbidden,
-            metadata: BTreeMap::from([
-                ("source_kind".to_owned(), "python".to_owned()),
-                ("module".to_owned(), self.module_relative.clone()),
-                ("callable".to_owned(), self.callable.clone()),
-                ("content_identity".to_owned(), self.content_hash.clone()),
-            ]),
+            metadata,
         };
         if let Some(runtime) = &self.effective_schema_runtime {
             cdf_kernel::bind_partition_schema_observation(
@@ -349,20 +640,41 @@ impl PythonResource {
         Ok(partition)
     }
 
-    fn produce_foreign_stream(
-        &self,
-        partition: PartitionPlan,
-        sender: &mut cdf_runtime::BlockingTaskStreamSender<ForeignStreamEvent>,
-        cancellation: &cdf_runtime::RunCancellation,
-        foreign_cancellation: &ForeignCancellation,
-        memory: Arc<dyn cdf_memory::MemoryCoordinator>,
-    ) -> Result<Option<SourcePosition>> {
-        if partition.partition_id.as_str() != PARTITION_ID {
-            return Err(cdf_kernel::CdfError::contract(format!(
-                "Python resource planned partition `{PARTITION_ID}` but received `{}`",
-                partition.partition_id
-            )));
+    /// Runs the `estimate=` hook once per planned partition; empty when none is declared.
+    fn partition_estimates(&self) -> Result<Vec<PythonEstimate>> {
+        if !self.estimate {
+            return Ok(Vec::new());
+        }
+        Python::attach(|py| {
+            let source = self.read_planned_module()?;
+            let module = self.import_planned_module(py, &source)?;
+            let hook = self
+                .resolve_callable(&module)?
+                .getattr(ESTIMATE_ATTRIBUTE)
+                .map_err(py_error)?;
+            if self.partition_keys.is_empty() {
+                return Ok(vec![PythonEstimate::call(&hook, None)]);
+            }
+            Ok(self
+                .partition_keys
+                .iter()
+                .map(|key| PythonEstimate::call(&hook, Some(key)))
+                .collect())
+        })
+    }
+
+    /// Resolves a requested partition id back to its planned index.
+    fn partition_index(&self, partition_id: &PartitionId) -> Option<usize> {
+        if self.partition_keys.is_empty() {
+            return (partition_id.as_str() == PARTITION_ID).then_some(0);
         }
+        self.partition_keys
+            .iter()
+            .position(|key| keyed_partition_id(key).is_ok_and(|keyed| keyed == *partition_id))
+    }
+
+    /// Reads the module and refuses to run it if it changed since the plan hashed it.
+    fn read_planned_module(&self) -> Result<String> {
         let source = fs::read_to_string(&self.module_path).map_err(|error| {
             cdf_kernel::CdfError::data(format!(
                 "read Python resource module {}: {error}",
@@ -377,9 +689,240 @@ impl PythonResource {
                 self.module_relative
             )));
         }
-        let opaque_blob = format!("{}#{}", self.content_hash, self.callable).into_bytes();
-        let blob_sha256 = format!("sha256:{}", hex::encode(Sha256::digest(&opaque_blob)));
-        let cursor = self.descriptor.cursor.clone();
+        Ok(source)
+    }
+
+    fn foreign_state(&self, partition_id: &PartitionId) -> ForeignState {
+        let opaque_blob = if self.partition_keys.is_empty() {
+            format!("{}#{}", self.content_hash, self.callable)
+        } else {
+            format!("{}#{}@{partition_id}", self.content_hash, self.callable)
+        }
+        .into_bytes();
+        python_foreign_state(PYTHON_RESOURCE_PROTOCOL, opaque_blob)
+    }
+
+    /// The position of a resumable partition's batches once the resource marked `token`.
+    ///
+    /// Unlike [`Self::foreign_state`] this omits the module's content hash: a page token names
+    /// an upstream position, so an edited module still resumes where the last run committed.
+    fn page_token_state(
+        &self,
+        partition_id: &PartitionId,
+        token: Option<&str>,
+    ) -> Result<ForeignState> {
+        let opaque_blob = serde_json::to_vec(&PageTokenState {
+            callable: self.callable.clone(),
+            partition_id: partition_id.clone(),
+            token: token.map(str::to_owned),
+        })
+        .map_err(|error| {
+            cdf_kernel::CdfError::internal(format!("serialize Python page token: {error}"))
+        })?;
+        Ok(python_foreign_state(PAGE_TOKEN_PROTOCOL, opaque_blob))
+    }
+
+    /// The page token `start_position` resumes a resumable partition after. Positions recorded
+    /// before the resource became resumable start it fresh.
+    fn planned_resume_token(&self, partition: &PartitionPlan) -> Result<Option<String>> {
+        let Some(position) = partition.start_position.as_ref().filter(|_| self.resumable) else {
+            return Ok(None);
+        };
+        let mismatched = || {
+            cdf_kernel::CdfError::contract(format!(
+                "Python resource `{}` cannot resume partition `{}` from a position it did not record",
+                self.descriptor.resource_id, partition.partition_id
+            ))
+        };
+        let SourcePosition::ForeignState(state) = position else {
+            return Err(mismatched());
+        };
+        if state.protocol == PYTHON_RESOURCE_PROTOCOL {
+            return Ok(None);
+        }
+        if state.protocol != PAGE_TOKEN_PROTOCOL {
+            return Err(mismatched());
+        }
+        let recorded = serde_json::from_slice::<PageTokenState>(&state.opaque_blob)
+            .map_err(|_| mismatched())?;
+        if recorded.callable != self.callable || recorded.partition_id != partition.partition_id {
+            return Err(mismatched());
+        }
+        Ok(recorded.token)
+    }
+
+    fn batch_position(
+        &self,
+        batch: &cdf_kernel::Batch,
+        foreign_state: &ForeignState,
+    ) -> Result<Option<SourcePosition>> {
+        match &self.descriptor.cursor {
+            Some(cursor) => batch
+                .record_batch()
+                .map(|record_batch| cursor_position(record_batch, cursor))
+                .transpose(),
+            None => Ok(Some(SourcePosition::ForeignState(foreign_state.clone()))),
+        }
+    }
+
+    /// Opens one partition in a supervised worker process and stamps the same source positions
+    /// the embedded producer would have attached to each batch.
+    fn open_worker(
+        &self,
+        request: ForeignStreamOpenRequest,
+    ) -> cdf_kernel::BoxFuture<'_, Result<ForeignStreamOpen>> {
+        use futures_util::StreamExt;
+
+        Box::pin(async move {
+            let index = self
+                .partition_index(&request.partition_id)
+                .filter(|_| request.resource_id == self.descriptor.resource_id)
+                .ok_or_else(|| {
+                    cdf_kernel::CdfError::contract(
+                        "Python foreign stream request does not match the resolved resource partition",
+                    )
+                })?;
+            let (Some(execution), Some(interpreter)) = (&self.execution, &self.worker_interpreter)
+            else {
+                return Err(cdf_kernel::CdfError::contract(
+                    "process-isolated Python source requires injected execution services and a worker interpreter",
+                ));
+            };
+            self.read_planned_module()?;
+            let schema = match projected_columns(&self.scan_intent) {
+                Some(columns) => projected_schema(&self.schema, columns)?,
+                None => Arc::clone(&self.schema),
+            };
+            let scan_json = self
+                .pushdown
+                .as_ref()
+                .map(|_| scan_request_json(&self.scan_intent))
+                .transpose()?;
+            let producer = python_worker_producer(
+                PythonWorkerRequest {
+                    interpreter,
+                    project_root: &self.project_root,
+                    module_path: &self.module_path,
+                    callable: &self.callable,
+                    partition_key: self.partition_keys.get(index).map(String::as_str),
+                    scan_json,
+                    resource_id: self.descriptor.resource_id.clone(),
+                    partition_id: request.partition_id.clone(),
+                    schema,
+                    dict_batch_rows: self.dict_batch_rows,
+                    max_boundary_bytes: self.max_boundary_bytes,
+                },
+                execution.memory(),
+            )?;
+            let foreign_state = self.foreign_state(&request.partition_id);
+            let mut opened = ForeignProducer::open(&producer, request).await?;
+            if opened.descriptor.transfer_modes != self.foreign_descriptor.transfer_modes {
+                opened.termination.cancel();
+                return Err(cdf_kernel::CdfError::internal(
+                    "Python worker process opened an unexpected transfer mode",
+                ));
+            }
+            let resource = self.clone();
+            let mut last_position = None;
+            opened.events = Box::pin(opened.events.map(move |event| match event? {
+                ForeignStreamEvent::Outcome(mut outcome) => {
+                    outcome.batch.header.source_position =
+                        resource.batch_position(&outcome.batch, &foreign_state)?;
+                    last_position.clone_from(&outcome.batch.header.source_position);
+                    Ok(ForeignStreamEvent::Outcome(outcome))
+                }
+                ForeignStreamEvent::Terminal(ForeignTerminalStatus::Succeeded { .. }) => Ok(
+                    ForeignStreamEvent::Terminal(ForeignTerminalStatus::Succeeded {
+                        final_position: last_position.clone(),
+                    }),
+                ),
+                event => Ok(event),
+            }));
+            opened.descriptor = self.foreign_descriptor.clone();
+            Ok(opened)
+        })
+    }
+
+    /// Imports the planned module, reusing this process's resident import when the resource runs
+    /// resident and the module's content hash still matches it.
+    fn import_planned_module<'py>(
+        &self,
+        py: Python<'py>,
+        source: &str,
+    ) -> Result<pyo3::Bound<'py, PyModule>> {
+        if self.resident
+            && let Some(module) = warm_module(py, &self.module_path, &self.content_hash)
+        {
+            return Ok(module);
+        }
+        let module = PythonModuleCache::new(py, &self.project_root, &self.content_hash)
+            .load_module(py, source, &self.module_relative)?;
+        if self.resident {
+            retain_module(&self.module_path, &self.content_hash, &module);
+        }
+        Ok(module)
+    }
+
+    fn resolve_callable<'py>(
+        &self,
+        module: &pyo3::Bound<'py, PyModule>,
+    ) -> Result<pyo3::Bound<'py, pyo3::PyAny>> {
+        module.getattr(self.callable.as_str()).map_err(|_| {
+            cdf_kernel::CdfError::contract(format!(
+                "Python resource callable `{}` is missing; run `cdf doctor` after repairing the resource target",
+                self.callable
+            ))
+        })
+    }
+
+    /// Measures a cold start (hash check, import, callable lookup) against the warm start the
+    /// next run would get, for `cdf doctor`. A resident resource retains the import, as its run
+    /// would, and finds it resident; any other resource imports the cached code a second time
+    /// and leaves the resident modules untouched.
+    pub(crate) fn startup_latency(&self) -> Result<PythonStartupLatency> {
+        Python::attach(|py| {
+            let started = Instant::now();
+            let source = self.read_planned_module()?;
+            let module = PythonModuleCache::new(py, &self.project_root, &self.content_hash)
+                .load_module(py, &source, &self.module_relative)?;
+            self.resolve_callable(&module)?;
+            let cold = started.elapsed();
+            if self.resident {
+                retain_module(&self.module_path, &self.content_hash, &module);
+            }
+            let started = Instant::now();
+            let source = self.read_planned_module()?;
+            let module = self.import_planned_module(py, &source)?;
+            self.resolve_callable(&module)?;
+            Ok(PythonStartupLatency {
+                cold,
+                warm: started.elapsed(),
+            })
+        })
+    }
+
+    fn produce_foreign_stream(
+        &self,
+        partition: PartitionPlan,
+        sender: &mut cdf_runtime::BlockingTaskStreamSender<ForeignStreamEvent>,
+        cancellation: &cdf_runtime::RunCancellation,
+        foreign_cancellation: &ForeignCancellation,
+        memory: Arc<dyn cdf_memory::MemoryCoordinator>,
+    ) -> Result<Option<SourcePosition>> {
+        let Some(index) = self.partition_index(&partition.partition_id) else {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource planned {} partition(s) but received `{}`",
+                self.partition_count(),
+                partition.partition_id
+            )));
+        };
+        let partition_key = self.partition_keys.get(index);
+        let source = self.read_planned_module()?;
+        let foreign_state = Mutex::new(if self.resumable {
+            self.page_token_state(&partition.partition_id, self.resume_token.as_deref())?
+        } else {
+            self.foreign_state(&partition.partition_id)
+        });
         let execution = self.execution.as_ref().ok_or_else(|| {
             cdf_kernel::CdfError::contract(
                 "Python foreign producer requires injected execution services",
@@ -394,26 +937,75 @@ impl PythonResource {
         )?);
         let mut final_position = None;
         let produced = Python::attach(|py| -> Result<_> {
-            let module = load_module(py, &source, &self.module_relative)?;
-            let callable = module.getattr(self.callable.as_str()).map_err(|_| {
-                cdf_kernel::CdfError::contract(format!(
-                    "Python resource callable `{}` is missing; run `cdf doctor` after repairing the resource target",
-                    self.callable
-                ))
-            })?;
-            let iterable = callable.call0().map_err(|_| {
-                cdf_kernel::CdfError::data(format!(
-                    "Python resource callable `{}` failed without emitting a batch",
-                    self.callable
-                ))
-            })?;
-            PythonResourceBridge::new(PythonBridgeOptions::new(
-                self.descriptor.resource_id.clone(),
-                partition.partition_id.clone(),
-            )
-            .with_dict_batch_rows(self.dict_batch_rows)?
-            .with_max_boundary_bytes(self.max_boundary_bytes)?)
-            .visit_python_foreign_iterable(&iterable, |outcome, _kind| {
+            let callable = self.resolve_callable(&self.import_planned_module(py, &source)?)?;
+            let profiler = self.profile.as_ref().and_then(|sink| {
+                sink.start(py, &partition.partition_id, &self.descriptor.resource_id)
+            });
+            // Everything the profiler observes runs in here, so a partition that fails or is
+            // cancelled is still profiled below.
+            let streamed = (|| -> std::result::Result<PythonStreamSummary, PythonStreamFailure> {
+                let kwargs = PyDict::new(py);
+                if self.pushdown.is_some() {
+                    let payload = scan_request_json(&self.scan_intent)?;
+                    let scan = PyModule::import(py, "cdf_sdk.scan")
+                        .and_then(|scan| scan.getattr(SCAN_FROM_HOST)?.call1((payload,)))
+                        .map_err(py_error)?;
+                    kwargs.set_item(SCAN_KEYWORD, scan).map_err(py_error)?;
+                }
+                let resume = if self.resumable {
+                    let resume = PyModule::import(py, "cdf_sdk.resume")
+                        .and_then(|resume| {
+                            resume
+                                .getattr(RESUME_FROM_HOST)?
+                                .call1((self.resume_token.as_deref(),))
+                        })
+                        .map_err(py_error)?;
+                    kwargs.set_item(RESUME_KEYWORD, &resume).map_err(py_error)?;
+                    Some(resume)
+                } else {
+                    None
+                };
+                let kwargs = (!kwargs.is_empty()).then_some(kwargs);
+                let iterable = match partition_key {
+                    Some(key) => callable.call((key.as_str(),), kwargs.as_ref()),
+                    None => callable.call((), kwargs.as_ref()),
+                }
+                .map_err(|_| {
+                    cdf_kernel::CdfError::data(format!(
+                        "Python resource callable `{}` failed without emitting a batch",
+                        self.callable
+                    ))
+                })?;
+                let iterable = match resume {
+                    Some(resume) => PyModule::import(py, "cdf_sdk.resume")
+                        .and_then(|module| module.getattr("_marked")?.call1((iterable, resume)))
+                        .map_err(py_error)?,
+                    None => iterable,
+                };
+                let mut options = PythonBridgeOptions::new(
+                    self.descriptor.resource_id.clone(),
+                    partition.partition_id.clone(),
+                )
+                .with_dict_batch_rows(self.dict_batch_rows)?
+                .with_max_boundary_bytes(self.max_boundary_bytes)?
+                .with_profile(self.profile.is_some());
+                if let Some(rows) = self.coalesce_rows {
+                    options = options.with_coalesce_rows(rows)?;
+                }
+                let projection = projected_columns(&self.scan_intent);
+                if self.schema_acquisition() == ForeignSchemaAcquisition::DeclaredHandshake {
+                    options = options.with_declared_schema(match projection {
+                        Some(columns) => relaxed_declared_schema(&self.schema, columns),
+                        None => Arc::clone(&self.schema),
+                    })?;
+                }
+                if let Some(columns) = projection {
+                    options = options.with_projection(columns.to_vec())?;
+                }
+                PythonResourceBridge::new(options)
+                .visit_python_foreign_iterable_profiled(
+                &iterable,
+                |outcome, kind| {
                 foreign_cancellation.check()?;
                 let cdf_foreign_stream::ForeignBatchOutcome {
                     sequence,
@@ -422,24 +1014,13 @@ impl PythonResource {
                     copy,
                 } = outcome;
                 cancellation.check()?;
-                batch.header.source_position = match &cursor {
-                    Some(cursor) => batch
-                        .record_batch()
-                        .map(|record_batch| cursor_position(record_batch, cursor))
-                        .transpose()?,
-                    None => Some(SourcePosition::ForeignState(ForeignState {
-                        version: cdf_kernel::SOURCE_POSITION_VERSION,
-                        protocol: "python-resource-v1".to_owned(),
-                        opaque_blob: opaque_blob.clone(),
-                        blob_sha256: blob_sha256.clone(),
-                    })),
-                };
+                let position = foreign_state.lock().map_err(|_| {
+                    cdf_kernel::CdfError::internal("Python page token state was poisoned")
+                })?;
+                batch.header.source_position = self.batch_position(&batch, &position)?;
+                drop(position);
                 final_position.clone_from(&batch.header.source_position);
-                let retained_bytes = batch
-                    .record_batch()
-                    .map(cdf_memory::record_batch_retained_bytes)
-                    .transpose()?
-                    .unwrap_or(0)
+                let retained_bytes = python_batch_retained_bytes(&batch, kind)?
                     .checked_add(batch.header.pre_contract_evidence_retained_bytes()?)
                     .ok_or_else(|| {
                         cdf_kernel::CdfError::data("Python batch retained memory exceeds u64")
@@ -478,7 +1059,49 @@ impl PythonResource {
                     self.max_boundary_bytes,
                 )?);
                 Ok(())
-            })?;
+            },
+                |token| {
+                    let marked = self.page_token_state(&partition.partition_id, Some(&token))?;
+                    *foreign_state.lock().map_err(|_| {
+                        cdf_kernel::CdfError::internal("Python page token state was poisoned")
+                    })? = marked;
+                    Ok(())
+                },
+            )
+            })();
+            if let Some(sink) = &self.profile {
+                let unobserved = PythonBridgeProfile::default();
+                let (profile, error) = match &streamed {
+                    Ok(summary) => (summary.profile.as_ref(), None),
+                    Err(failure) => (failure.profile.as_ref(), Some(&failure.error)),
+                };
+                sink.finish(
+                    profiler.as_ref(),
+                    &partition.partition_id,
+                    &self.descriptor.resource_id,
+                    profile.unwrap_or(&unobserved),
+                    error,
+                );
+            }
+            let summary = streamed.map_err(|failure| failure.error)?;
+            // Time in the author's Python is the source read. The bridge cannot see the bytes or
+            // requests behind it, so those stay zero; rows and batch bytes are already in the
+            // source transfer report. Bridge and emit time are ours, not the source's.
+            *self.source_io.lock().map_err(|_| {
+                cdf_kernel::CdfError::internal("Python source timing state was poisoned")
+            })? = Some(SourceIoMetrics {
+                duration_ns: summary.python_ns,
+                ..SourceIoMetrics::default()
+            });
+            tracing::debug!(
+                resource_id = self.descriptor.resource_id.as_str(),
+                partition_id = partition.partition_id.as_str(),
+                python_ns = summary.python_ns,
+                bridge_ns = summary.bridge_ns,
+                emit_ns = summary.emit_ns,
+                batches = summary.outcome_count,
+                "Python partition stream finished"
+            );
             Ok(())
         });
         produced?;
@@ -486,6 +1109,32 @@ impl PythonResource {
     }
 }
 
+/// Position protocol of a batch from a resource that does not mark page tokens.
+const PYTHON_RESOURCE_PROTOCOL: &str = "python-resource-v1";
+/// Position protocol of a batch from a `resumable=True` resource; see [`PageTokenState`].
+const PAGE_TOKEN_PROTOCOL: &str = "python-page-token-v1";
+/// `cdf_sdk.resume` constructor the host calls to build the `resume=` argument.
+const RESUME_FROM_HOST: &str = "_resume_from_host";
+const RESUME_KEYWORD: &str = "resume";
+
+/// The last page token a resumable partition marked before a batch; `None` until it marks one.
+#[derive(Debug, Serialize, Deserialize)]
+#[serde(deny_unknown_fields)]
+struct PageTokenState {
+    callable: String,
+    partition_id: PartitionId,
+    token: Option<String>,
+}
+
+fn python_foreign_state(protocol: &str, opaque_blob: Vec<u8>) -> ForeignState {
+    ForeignState {
+        version: cdf_kernel::SOURCE_POSITION_VERSION,
+        protocol: protocol.to_owned(),
+        blob_sha256: format!("sha256:{}", hex::encode(Sha256::digest(&opaque_blob))),
+        opaque_blob,
+    }
+}
+
 fn reserve_python_batch(
     execution: &cdf_runtime::ExecutionServices,
     cancellation: &cdf_runtime::RunCancellation,
@@ -505,7 +1154,7 @@ fn reserve_python_batch(
     })
 }
 
-fn cursor_position(
+pub(crate) fn cursor_position(
     batch: &arrow_array::RecordBatch,
     cursor: &CursorSpec,
 ) -> Result<SourcePosition> {
@@ -516,29 +1165,68 @@ fn cursor_position(
         ))
     })?;
     let array = batch.column(index);
+    let field = cursor.field.as_str();
     let value = match array.data_type() {
-        DataType::Int64 => CursorValue::I64(max_int64(
-            array.as_any().downcast_ref::<Int64Array>().unwrap(),
-            &cursor.field,
-        )?),
-        DataType::UInt64 => CursorValue::U64(max_u64(
-            array.as_any().downcast_ref::<UInt64Array>().unwrap(),
-            &cursor.field,
+        DataType::Int64 => {
+            CursorValue::I64(max_value(typed_cursor::<Int64Array>(array, field)?, field)?)
+        }
+        DataType::UInt64 => CursorValue::U64(max_value(
+            typed_cursor::<UInt64Array>(array, field)?,
+            field,
         )?),
-        DataType::Timestamp(TimeUnit::Microsecond, timezone) => CursorValue::TimestampMicros {
-            micros: max_timestamp_micros(
-                array
-                    .as_any()
-                    .downcast_ref::<TimestampMicrosecondArray>()
-                    .unwrap(),
-                &cursor.field,
-            )?,
+        DataType::Date32 => CursorValue::I64(i64::from(max_value(
+            typed_cursor::<Date32Array>(array, field)?,
+            field,
+        )?)),
+        // Date64 counts milliseconds, so it resumes as a timestamp, as the SQL sources bind it.
+        DataType::Date64 => CursorValue::TimestampMicros {
+            micros: max_value(typed_cursor::<Date64Array>(array, field)?, field)?
+                .checked_mul(1_000)
+                .ok_or_else(|| timestamp_overflow(field))?,
+            timezone: None,
+        },
+        DataType::Timestamp(unit, timezone) => CursorValue::TimestampMicros {
+            micros: match unit {
+                TimeUnit::Second => {
+                    max_value(typed_cursor::<TimestampSecondArray>(array, field)?, field)?
+                        .checked_mul(1_000_000)
+                        .ok_or_else(|| timestamp_overflow(field))?
+                }
+                TimeUnit::Millisecond => max_value(
+                    typed_cursor::<TimestampMillisecondArray>(array, field)?,
+                    field,
+                )?
+                .checked_mul(1_000)
+                .ok_or_else(|| timestamp_overflow(field))?,
+                TimeUnit::Microsecond => max_value(
+                    typed_cursor::<TimestampMicrosecondArray>(array, field)?,
+                    field,
+                )?,
+                // Flooring keeps the resume point at or before the newest row, so the next run
+                // re-reads at most the sub-microsecond tail instead of skipping it.
+                TimeUnit::Nanosecond => max_value(
+                    typed_cursor::<TimestampNanosecondArray>(array, field)?,
+                    field,
+                )?
+                .div_euclid(1_000),
+            },
             timezone: timezone.as_ref().map(ToString::to_string),
         },
+        // ISO-8601 text in one fixed format and offset orders lexically, like the SQL sources'
+        // string cursors.
+        DataType::Utf8 => CursorValue::String(
+            max_string(typed_cursor::<StringArray>(array, field)?)
+                .ok_or_else(|| empty_cursor(field))?
+                .to_owned(),
+        ),
+        DataType::LargeUtf8 => CursorValue::String(
+            max_string(typed_cursor::<LargeStringArray>(array, field)?)
+                .ok_or_else(|| empty_cursor(field))?
+                .to_owned(),
+        ),
         other => {
             return Err(cdf_kernel::CdfError::data(format!(
-                "Python cursor field `{}` has unsupported Arrow type {other}; use int64, uint64, or timestamp(us)",
-                cursor.field
+                "Python cursor field `{field}` has unsupported Arrow type {other}; use an integer, date, timestamp, or ISO-8601 string"
             )));
         }
     };
@@ -549,46 +1237,44 @@ fn cursor_position(
     }))
 }
 
-fn max_int64(array: &Int64Array, field: &str) -> Result<i64> {
-    (0..array.len())
-        .filter(|index| !array.is_null(*index))
-        .map(|index| array.value(index))
-        .max()
-        .ok_or_else(|| {
-            cdf_kernel::CdfError::data(format!(
-                "Python cursor field `{field}` contains no non-null values"
-            ))
-        })
+fn typed_cursor<'a, T: 'static>(array: &'a ArrayRef, field: &str) -> Result<&'a T> {
+    array.as_any().downcast_ref::<T>().ok_or_else(|| {
+        cdf_kernel::CdfError::internal(format!(
+            "Python cursor field `{field}` Arrow array does not match its data type"
+        ))
+    })
 }
 
-fn max_timestamp_micros(array: &TimestampMicrosecondArray, field: &str) -> Result<i64> {
-    (0..array.len())
-        .filter(|index| !array.is_null(*index))
-        .map(|index| array.value(index))
-        .max()
-        .ok_or_else(|| {
-            cdf_kernel::CdfError::data(format!(
-                "Python cursor field `{field}` contains no non-null values"
-            ))
-        })
+fn max_value<T: ArrowNumericType>(array: &PrimitiveArray<T>, field: &str) -> Result<T::Native> {
+    max(array).ok_or_else(|| empty_cursor(field))
 }
 
-fn max_u64(array: &UInt64Array, field: &str) -> Result<u64> {
-    (0..array.len())
-        .filter(|index| !array.is_null(*index))
-        .map(|index| array.value(index))
-        .max()
-        .ok_or_else(|| {
-            cdf_kernel::CdfError::data(format!(
-                "Python cursor field `{field}` contains no non-null values"
-            ))
-        })
+fn empty_cursor(field: &str) -> cdf_kernel::CdfError {
+    cdf_kernel::CdfError::data(format!(
+        "Python cursor field `{field}` contains no non-null values"
+    ))
+}
+
+fn timestamp_overflow(field: &str) -> cdf_kernel::CdfError {
+    cdf_kernel::CdfError::data(format!(
+        "Python cursor field `{field}` overflows timestamp microseconds"
+    ))
 }
 
 fn python_foreign_descriptor(
     max_boundary_bytes: u64,
+    prefetch_batches: usize,
     schema_acquisition: ForeignSchemaAcquisition,
 ) -> Result<ForeignProducerDescriptor> {
+    // Every queued batch keeps its boundary-sized lease until the consumer takes it.
+    let payload_window_bytes = u64::try_from(prefetch_batches)
+        .ok()
+        .and_then(|batches| max_boundary_bytes.checked_mul(batches))
+        .ok_or_else(|| {
+            cdf_kernel::CdfError::contract(
+                "Python source prefetch window exceeds u64 bytes; lower prefetch_batches",
+            )
+        })?;
     let descriptor = ForeignProducerDescriptor {
         producer_id: ForeignProducerId::new("cdf.python")?,
         protocol_version: ForeignProtocolVersion::new("1")?,
@@ -604,7 +1290,7 @@ fn python_foreign_descriptor(
             backpressure: ForeignBackpressure::HostWindow,
         },
         memory: ForeignMemoryContract {
-            payload_window_bytes: Some(max_boundary_bytes),
+            payload_window_bytes: Some(payload_window_bytes),
             control_queue_bytes: None,
             diagnostic_queue_bytes: None,
             native_scratch_bytes: None,
@@ -641,8 +1327,11 @@ impl ForeignProducer for PythonResource {
         &self,
         request: ForeignStreamOpenRequest,
     ) -> cdf_kernel::BoxFuture<'_, Result<ForeignStreamOpen>> {
+        if self.isolation == PythonIsolation::Process {
+            return self.open_worker(request);
+        }
         if request.resource_id != self.descriptor.resource_id
-            || request.partition_id.as_str() != PARTITION_ID
+            || self.partition_index(&request.partition_id).is_none()
         {
             return Box::pin(async {
                 Err(cdf_kernel::CdfError::contract(
@@ -650,6 +1339,12 @@ impl ForeignProducer for PythonResource {
                 ))
             });
         }
+        // Stream-bootstrap discovery only ever prepares the first partition, and only as a full
+        // scan from the start; a pushed-down or resumed scan drops that invocation, which
+        // cancels it, and calls again.
+        if request.partition_id.as_str() != PARTITION_ID || self.resume_token.is_some() {
+            return self.open_fresh(request);
+        }
         let prepared = {
             let mut state = match self.prepared_invocation.lock() {
                 Ok(state) => state,
@@ -676,7 +1371,9 @@ impl ForeignProducer for PythonResource {
                 }
             }
         };
-        if let Some(prepared) = prepared {
+        if let Some(prepared) = prepared
+            && self.scan_intent == CompiledScanIntent::full_scan()
+        {
             return Box::pin(async move {
                 request.cancellation.check()?;
                 prepared.into_open()
@@ -693,13 +1390,14 @@ impl PythonResource {
     ) -> cdf_kernel::BoxFuture<'_, Result<ForeignStreamOpen>> {
         let resource = Arc::new(self.clone());
         Box::pin(async move {
-            if request.resource_id != resource.descriptor.resource_id
-                || request.partition_id.as_str() != PARTITION_ID
-            {
-                return Err(cdf_kernel::CdfError::contract(
-                    "Python foreign stream request does not match the resolved resource partition",
-                ));
-            }
+            let index = resource
+                .partition_index(&request.partition_id)
+                .filter(|_| request.resource_id == resource.descriptor.resource_id)
+                .ok_or_else(|| {
+                    cdf_kernel::CdfError::contract(
+                        "Python foreign stream request does not match the resolved resource partition",
+                    )
+                })?;
             request.cancellation.check()?;
             let execution = resource.execution.clone().ok_or_else(|| {
                 cdf_kernel::CdfError::contract(
@@ -713,11 +1411,11 @@ impl PythonResource {
             })?;
             let descriptor = resource.foreign_descriptor.clone();
             let memory = execution.memory();
-            let partition = resource.partition()?;
+            let partition = resource.partition(index, PythonEstimate::default())?;
             let events = execution.spawn_blocking_stream(
                 "python-foreign-producer",
                 &lane,
-                1,
+                resource.prefetch_batches.unwrap_or(1),
                 move |mut sender, cancellation| {
                     let foreign_cancellation = request.cancellation;
                     let produced = resource.produce_foreign_stream(
@@ -801,7 +1499,7 @@ impl ResourceStream for PythonResource {
                 "Python scan request resource does not match the resolved resource",
             ));
         }
-        Ok(vec![self.partition()?])
+        self.partitions()
     }
 
     fn open(&self, partition: PartitionPlan) -> cdf_kernel::PartitionOpenAttempt<'_> {
@@ -812,7 +1510,26 @@ impl ResourceStream for PythonResource {
                 ))
             }));
         };
-        let resource = Arc::new(self.clone());
+        if self.pushdown.is_none() && partition.scan_intent != CompiledScanIntent::full_scan() {
+            return cdf_kernel::PartitionOpenAttempt::materialized(Box::pin(async {
+                Err(cdf_kernel::CdfError::contract(
+                    "Python resource without `pushdown=` received a narrowed scan intent",
+                ))
+            }));
+        }
+        let mut resource = self.clone();
+        resource.resume_token = match self.planned_resume_token(&partition) {
+            Ok(token) => token,
+            Err(error) => {
+                return cdf_kernel::PartitionOpenAttempt::materialized(Box::pin(async move {
+                    Err(error)
+                }));
+            }
+        };
+        resource.scan_intent = partition.scan_intent;
+        resource.source_io = Arc::default();
+        let source_io = Arc::clone(&resource.source_io);
+        let resource = Arc::new(resource);
         let request = ForeignStreamOpenRequest {
             resource_id: self.descriptor.resource_id.clone(),
             partition_id: partition.partition_id.clone(),
@@ -843,7 +1560,8 @@ impl ResourceStream for PythonResource {
                 projection.batches,
                 Box::pin(async move {
                     let source_transfer = completion.await?;
-                    Ok(cdf_kernel::PartitionCompletion::default()
+                    let source_io = source_io.lock().ok().and_then(|mut timing| timing.take());
+                    Ok(cdf_kernel::PartitionCompletion::new(None, source_io)
                         .with_source_transfer(source_transfer))
                 }),
             ))
@@ -858,100 +1576,265 @@ impl QueryableResource for PythonResource {
     }
 
     fn negotiate(&self, request: &ScanRequest) -> Result<ScanPlan> {
-        let partitions = self.plan_partitions(request)?;
+        let mut partitions = self.plan_partitions(request)?;
+        let (pushed, unsupported) = match &self.pushdown {
+            Some(pushdown) => {
+                let (pushed, unsupported) = pushdown.classify(&self.schema, &request.filters);
+                let intent =
+                    scan_intent(&self.capabilities, &self.schema, request, pushed.clone())?;
+                for partition in &mut partitions {
+                    partition.scan_intent = intent.clone();
+                }
+                (pushed, unsupported)
+            }
+            None => (Vec::new(), request.filters.clone()),
+        };
+        let estimated_rows = planned_total(&partitions, PLAN_ESTIMATED_ROWS_KEY);
+        let estimated_bytes = planned_total(&partitions, PLAN_ESTIMATED_BYTES_KEY);
         Ok(ScanPlan::from_partition_authority(
             PlanId::new(format!("python-plan-{}", self.descriptor.resource_id))?,
             request.clone(),
             PartitionAuthority::Inline(partitions),
-            Vec::new(),
-            request.filters.clone(),
-            None,
-            None,
+            pushed,
+            unsupported,
+            estimated_rows,
+            estimated_bytes,
             DeliveryGuarantee::AtLeastOnceDuplicateRisk,
         ))
     }
 }
 
+#[derive(Serialize, Deserialize)]
 struct PythonMetadata {
     schema: Vec<(String, String, bool)>,
     primary_key: Vec<String>,
     merge_key: Vec<String>,
     cursor: Option<String>,
+    cursor_ordering: CursorOrderingClaim,
+    cursor_lag_ms: u64,
     bounded: bool,
     write_disposition: String,
+    partition_keys: Vec<String>,
+    pushdown: Option<PythonPushdown>,
+    #[serde(default)]
+    estimate: bool,
+    #[serde(default)]
+    resumable: bool,
 }
 
-fn inspect_metadata(source: &str, file_name: &str, callable_name: &str) -> Result<PythonMetadata> {
+/// Reads the decorator metadata of `callable_name`, reusing the module cache's record of an earlier
+/// inspection. Resources with a `partitions=` enumerator are never recorded there: the enumerator
+/// runs again on every compile because its keys usually come from outside the module.
+fn inspect_metadata(
+    project_root: &Path,
+    content_hash: &str,
+    source: &str,
+    file_name: &str,
+    callable_name: &str,
+) -> Result<PythonMetadata> {
     Python::attach(|py| {
-        let module = load_module(py, source, file_name)?;
-        let callable = module.getattr(callable_name).map_err(|_| {
+        let cache = PythonModuleCache::new(py, project_root, content_hash);
+        if let Some(metadata) = cache.metadata(callable_name) {
+            return Ok(metadata);
+        }
+        let metadata = inspect_module_metadata(
+            &cache.load_module(py, source, file_name)?,
+            file_name,
+            callable_name,
+        )?;
+        if metadata.partition_keys.is_empty() {
+            cache.store_metadata(py, callable_name, &metadata);
+        }
+        Ok(metadata)
+    })
+}
+
+fn inspect_module_metadata(
+    module: &pyo3::Bound<'_, PyModule>,
+    file_name: &str,
+    callable_name: &str,
+) -> Result<PythonMetadata> {
+    let callable = module.getattr(callable_name).map_err(|_| {
+        cdf_kernel::CdfError::contract(format!(
+            "Python resource target `{file_name}#{callable_name}` is missing"
+        ))
+    })?;
+    if !callable.is_callable() {
+        return Err(cdf_kernel::CdfError::contract(format!(
+            "Python resource target `{file_name}#{callable_name}` is not callable"
+        )));
+    }
+    if !callable
+        .getattr("__cdf_resource__")
+        .and_then(|value| value.extract::<bool>())
+        .unwrap_or(false)
+    {
+        return Err(cdf_kernel::CdfError::contract(format!(
+            "Python resource target `{file_name}#{callable_name}` must use `@cdf_sdk.resource`"
+        )));
+    }
+    let schema = callable
+        .getattr("__cdf_schema__")
+        .and_then(|value| value.extract::<Vec<(String, String, bool)>>())
+        .map_err(|_| {
             cdf_kernel::CdfError::contract(format!(
-                "Python resource target `{file_name}#{callable_name}` is missing"
+                "Python resource target `{file_name}#{callable_name}` has invalid `schema={{...}}` metadata"
             ))
         })?;
-        if !callable.is_callable() {
-            return Err(cdf_kernel::CdfError::contract(format!(
-                "Python resource target `{file_name}#{callable_name}` is not callable"
-            )));
-        }
-        if !callable
-            .getattr("__cdf_resource__")
-            .and_then(|value| value.extract::<bool>())
-            .unwrap_or(false)
-        {
-            return Err(cdf_kernel::CdfError::contract(format!(
-                "Python resource target `{file_name}#{callable_name}` must use `@cdf_sdk.resource`"
-            )));
-        }
-        let schema = callable
-            .getattr("__cdf_schema__")
-            .and_then(|value| value.extract::<Vec<(String, String, bool)>>())
-            .map_err(|_| {
+    let partition_keys = match callable.getattr("__cdf_partitions__") {
+        Ok(enumerator) if !enumerator.is_none() => {
+            let keys = enumerate_partition_keys(&enumerator).ok_or_else(|| {
                 cdf_kernel::CdfError::contract(format!(
-                    "Python resource target `{file_name}#{callable_name}` has invalid `schema={{...}}` metadata"
+                    "Python resource target `{file_name}#{callable_name}` has a `partitions=` enumerator that failed or did not return string keys"
                 ))
             })?;
-        Ok(PythonMetadata {
-            schema,
-            primary_key: callable
-                .getattr("__cdf_primary_key__")
-                .and_then(|value| value.extract())
-                .map_err(py_error)?,
-            merge_key: callable
-                .getattr("__cdf_merge_key__")
-                .and_then(|value| value.extract())
-                .map_err(py_error)?,
-            cursor: callable
-                .getattr("__cdf_cursor__")
-                .and_then(|value| value.extract())
-                .map_err(py_error)?,
-            bounded: callable
-                .getattr("__cdf_bounded__")
-                .and_then(|value| value.extract())
-                .map_err(py_error)?,
-            write_disposition: callable
-                .getattr("__cdf_write_disposition__")
-                .and_then(|value| value.extract())
-                .map_err(py_error)?,
-        })
+            validate_partition_keys(&keys)?;
+            if keys.is_empty() {
+                return Err(cdf_kernel::CdfError::contract(format!(
+                    "Python resource target `{file_name}#{callable_name}` has a `partitions=` enumerator that returned no keys"
+                )));
+            }
+            keys
+        }
+        _ => Vec::new(),
+    };
+    // Modules written against an SDK without cursor claims keep the exact, lag-free cursor.
+    let cursor_ordering = match callable.getattr("__cdf_cursor_ordering__") {
+        Ok(ordering) if !ordering.is_none() => match ordering.extract::<String>().as_deref() {
+            Ok("exact") => CursorOrderingClaim::Exact,
+            Ok("inexact") => CursorOrderingClaim::Inexact,
+            Ok("unordered") => CursorOrderingClaim::Unordered,
+            _ => {
+                return Err(cdf_kernel::CdfError::contract(format!(
+                    "Python resource target `{file_name}#{callable_name}` has `cursor_ordering=` outside exact, inexact, or unordered"
+                )));
+            }
+        },
+        _ => CursorOrderingClaim::Exact,
+    };
+    let cursor_lag_ms = match callable.getattr("__cdf_cursor_lag_ms__") {
+        Ok(lag) if !lag.is_none() => lag.extract::<u64>().map_err(|_| {
+            cdf_kernel::CdfError::contract(format!(
+                "Python resource target `{file_name}#{callable_name}` has `cursor_lag_ms=` that is not a nonnegative integer"
+            ))
+        })?,
+        _ => 0,
+    };
+    let pushdown = match callable.getattr("__cdf_pushdown__") {
+        Ok(pushdown) if !pushdown.is_none() => {
+            let (projection, operators, exact, limit) = pushdown
+                .extract::<(bool, Vec<String>, bool, bool)>()
+                .map_err(|_| {
+                    cdf_kernel::CdfError::contract(format!(
+                        "Python resource target `{file_name}#{callable_name}` has invalid `pushdown=` metadata"
+                    ))
+                })?;
+            let pushdown = PythonPushdown {
+                projection,
+                operators,
+                exact,
+                limit,
+            };
+            pushdown.validate()?;
+            Some(pushdown)
+        }
+        _ => None,
+    };
+    let estimate = match callable.getattr(ESTIMATE_ATTRIBUTE) {
+        Ok(hook) if !hook.is_none() => {
+            if !hook.is_callable() {
+                return Err(cdf_kernel::CdfError::contract(format!(
+                    "Python resource target `{file_name}#{callable_name}` has an `estimate=` hook that is not callable"
+                )));
+            }
+            true
+        }
+        _ => false,
+    };
+    // Hand-decorated targets that predate `resumable=` stay unresumable; a malformed flag fails.
+    let resumable = match callable.getattr("__cdf_resumable__") {
+        Ok(resumable) if !resumable.is_none() => resumable.extract::<bool>().map_err(|_| {
+            cdf_kernel::CdfError::contract(format!(
+                "Python resource target `{file_name}#{callable_name}` has `resumable=` that is not a boolean"
+            ))
+        })?,
+        _ => false,
+    };
+    Ok(PythonMetadata {
+        schema,
+        primary_key: callable
+            .getattr("__cdf_primary_key__")
+            .and_then(|value| value.extract())
+            .map_err(py_error)?,
+        merge_key: callable
+            .getattr("__cdf_merge_key__")
+            .and_then(|value| value.extract())
+            .map_err(py_error)?,
+        cursor: callable
+            .getattr("__cdf_cursor__")
+            .and_then(|value| value.extract())
+            .map_err(py_error)?,
+        cursor_ordering,
+        cursor_lag_ms,
+        bounded: callable
+            .getattr("__cdf_bounded__")
+            .and_then(|value| value.extract())
+            .map_err(py_error)?,
+        write_disposition: callable
+            .getattr("__cdf_write_disposition__")
+            .and_then(|value| value.extract())
+            .map_err(py_error)?,
+        partition_keys,
+        pushdown,
+        estimate,
+        resumable,
     })
 }
 
-fn load_module<'py>(
-    py: Python<'py>,
-    source: &str,
-    file_name: &str,
-) -> Result<pyo3::Bound<'py, PyModule>> {
-    let code = CString::new(source)
-        .map_err(|_| cdf_kernel::CdfError::contract("Python module contains a NUL byte"))?;
-    let file_name = CString::new(file_name)
-        .map_err(|_| cdf_kernel::CdfError::contract("Python module path contains a NUL byte"))?;
-    let module_name = CString::new("cdf_project_resource").unwrap();
-    PyModule::from_code(py, &code, &file_name, &module_name).map_err(|_| {
-        cdf_kernel::CdfError::contract(
-            "Python resource module could not be imported; run `cdf doctor` and inspect the module syntax",
-        )
-    })
+/// Collects the keys a `partitions=` enumerator returns from any iterable of strings; `None` when
+/// it fails or returns anything else. A bare string is refused rather than split into characters.
+fn enumerate_partition_keys(enumerator: &pyo3::Bound<'_, pyo3::PyAny>) -> Option<Vec<String>> {
+    let keys = enumerator.call0().ok()?;
+    if keys.is_instance_of::<PyString>() {
+        return None;
+    }
+    keys.try_iter()
+        .ok()?
+        .map(|key| key.ok()?.extract::<String>().ok())
+        .collect()
+}
+
+/// The partition id of a keyed partition. It is derived from the key rather than its position in
+/// the enumeration, so committed cursors and page tokens stay bound to their key when a dynamic
+/// enumerator reorders, inserts, or drops keys between runs.
+fn keyed_partition_id(key: &str) -> Result<PartitionId> {
+    let digest = Sha256::digest(key.as_bytes());
+    PartitionId::new(format!("python-key-{}", hex::encode(&digest[..8])))
+}
+
+/// Partition keys become plan metadata and scope identity, so they must be unique and nonempty,
+/// and no two may share a derived partition id.
+fn validate_partition_keys(keys: &[String]) -> Result<()> {
+    if keys.len() > 999_999 {
+        return Err(cdf_kernel::CdfError::contract(
+            "Python resource `partitions=` enumerator returned more than 999999 keys",
+        ));
+    }
+    let mut seen = BTreeSet::new();
+    let mut partition_ids = BTreeSet::new();
+    for key in keys {
+        if key.is_empty() || !seen.insert(key.as_str()) {
+            return Err(cdf_kernel::CdfError::contract(
+                "Python resource `partitions=` keys must be nonempty and unique",
+            ));
+        }
+        if !partition_ids.insert(keyed_partition_id(key)?) {
+            return Err(cdf_kernel::CdfError::contract(format!(
+                "Python resource `partitions=` key `{key}` collides with another key's partition id"
+            )));
+        }
+    }
+    Ok(())
 }
 
 fn parse_python_uri(uri: &str) -> Result<(String, String)> {
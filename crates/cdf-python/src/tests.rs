@@ -22,9 +22,12 @@ use cdf_foreign_stream::{
 };
 use cdf_http::{EgressAllowlist, HttpMethod, SecretValue};
 use cdf_kernel::{
-    CHECKPOINT_STATE_VERSION, Checkpoint, CheckpointId, CheckpointStatus, CheckpointStore,
-    CursorOrderingClaim, CursorValue, ErrorKind, PackageHash, PageToken, PipelineId, Receipt,
-    RewindReport, RewindRequest, ScanRequest, SchemaHash, SegmentId, StateDelta, StateSegment,
+    CHECKPOINT_STATE_VERSION, CapabilitySupport, Checkpoint, CheckpointId, CheckpointStatus,
+    CheckpointStore, CursorOrderingClaim, CursorSpec, CursorValue, ErrorKind, EstimateSupport,
+    PLAN_ESTIMATED_BYTES_KEY, PLAN_ESTIMATED_ROWS_KEY, PackageHash, PageToken, PartitionPlan,
+    PipelineId, PlannedSourceBytes, PredicateId, QueryableResource, Receipt, ResourceStream,
+    RewindReport, RewindRequest, ScanPredicate, ScanRequest, SchemaHash, SegmentId, StateDelta,
+    StateSegment,
 };
 use futures_util::StreamExt;
 use pyo3::types::PyList;
@@ -83,6 +86,36 @@ raw_events.__cdf_write_disposition__ = "append"
     }
 }
 
+impl TestPythonProject {
+    /// Writes `src/tenants.py#tenants`, keyed by `keys`, yielding `rows` rows per key after
+    /// `work` pure-Python loop steps per row.
+    fn write_partitioned_module(&self, keys: &[&str], rows: usize, work: usize) {
+        fs::write(
+            self.root.join("src/tenants.py"),
+            format!(
+                r#"
+def tenants(tenant):
+    for value in range({rows}):
+        score = 0
+        for step in range({work}):
+            score = (score + step * value) % 1000003
+        yield {{"id": value, "tenant": tenant, "score": score}}
+
+tenants.__cdf_resource__ = True
+tenants.__cdf_primary_key__ = ()
+tenants.__cdf_merge_key__ = ()
+tenants.__cdf_cursor__ = None
+tenants.__cdf_bounded__ = True
+tenants.__cdf_schema__ = (("id", "int64", False), ("tenant", "utf8", False), ("score", "int64", False))
+tenants.__cdf_write_disposition__ = "append"
+tenants.__cdf_partitions__ = lambda: {keys:?}
+"#,
+            ),
+        )
+        .unwrap();
+    }
+}
+
 impl Drop for TestPythonProject {
     fn drop(&mut self) {
         let _ = fs::remove_dir_all(&self.root);
@@ -114,11 +147,27 @@ fn compile_reference_plan(
     registry: &cdf_runtime::SourceRegistry,
     project: &TestPythonProject,
     project_options: serde_json::Value,
+) -> cdf_runtime::CompiledSourcePlan {
+    compile_reference_plan_for(
+        registry,
+        project,
+        "python://src/events.py#raw_events",
+        "events.raw",
+        project_options,
+    )
+}
+
+fn compile_reference_plan_for(
+    registry: &cdf_runtime::SourceRegistry,
+    project: &TestPythonProject,
+    uri: &str,
+    resource_id: &str,
+    project_options: serde_json::Value,
 ) -> cdf_runtime::CompiledSourcePlan {
     registry
         .compile_reference(cdf_runtime::SourceReferenceCompileRequest {
-            uri: "python://src/events.py#raw_events".to_owned(),
-            resource_id: ResourceId::new("events.raw").unwrap(),
+            uri: uri.to_owned(),
+            resource_id: ResourceId::new(resource_id).unwrap(),
             project_root: project.root.clone(),
             trust_level: TrustLevel::Governed,
             freshness: None,
@@ -476,6 +525,181 @@ fn python_generator_dicts_convert_to_batches() {
     });
 }
 
+#[test]
+fn coalescing_merges_adjacent_arrow_yields_and_flushes_at_marks_and_schema_changes() {
+    fn exported<'py>(py: Python<'py>, batch: RecordBatch) -> Bound<'py, PyAny> {
+        let field = Field::new_struct("", batch.schema().fields().clone(), false);
+        let array = arrow_array::StructArray::from(batch);
+        let schema = pyo3::types::PyCapsule::new_with_value(
+            py,
+            arrow_array::ffi::FFI_ArrowSchema::try_from(&field).unwrap(),
+            c"arrow_schema",
+        )
+        .unwrap();
+        let array = pyo3::types::PyCapsule::new_with_value(
+            py,
+            arrow_array::ffi::FFI_ArrowArray::new(&array.to_data()),
+            c"arrow_array",
+        )
+        .unwrap();
+        PyModule::from_code(
+            py,
+            c"class Exported:\n    def __init__(self, capsules):\n        self.capsules = capsules\n    def __arrow_c_array__(self, requested_schema=None):\n        return self.capsules\n",
+            c"coalesce_exported.py",
+            c"coalesce_exported",
+        )
+        .unwrap()
+        .getattr("Exported")
+        .unwrap()
+        .call1(((schema, array),))
+        .unwrap()
+    }
+    fn ids(values: std::ops::Range<i64>) -> RecordBatch {
+        RecordBatch::try_from_iter([(
+            "id",
+            Arc::new(Int64Array::from_iter_values(values)) as ArrayRef,
+        )])
+        .unwrap()
+    }
+
+    Python::attach(|py| {
+        let names = RecordBatch::try_from_iter([(
+            "name",
+            Arc::new(StringArray::from(vec!["ada"])) as ArrayRef,
+        )])
+        .unwrap();
+        let mark = PyModule::from_code(
+            py,
+            c"class Mark:\n    def __cdf_position__(self):\n        return 'page-2'\n",
+            c"coalesce_mark.py",
+            c"coalesce_mark",
+        )
+        .unwrap()
+        .getattr("Mark")
+        .unwrap()
+        .call0()
+        .unwrap();
+        let items = PyList::new(
+            py,
+            [
+                exported(py, ids(0..2)),
+                exported(py, ids(2..4)),
+                exported(py, ids(4..6)),
+                mark,
+                exported(py, ids(6..8)),
+                exported(py, names),
+                exported(py, ids(8..18)),
+            ],
+        )
+        .unwrap();
+        let bridge = PythonResourceBridge::new(
+            PythonBridgeOptions::new(
+                ResourceId::new("python.coalesced").unwrap(),
+                PartitionId::new("python-000001").unwrap(),
+            )
+            .with_coalesce_rows(5)
+            .unwrap(),
+        );
+        let events = std::sync::Mutex::new(Vec::new());
+        let summary = bridge
+            .visit_python_foreign_iterable_with_positions(
+                items.as_any(),
+                |outcome, _kind| {
+                    events.lock().unwrap().push(format!(
+                        "{}:{}:{}",
+                        outcome.sequence,
+                        outcome.batch.header.row_count,
+                        matches!(
+                            outcome.copy,
+                            ForeignCopyClassification::PayloadCopyKnown { .. }
+                        )
+                    ));
+                    Ok(())
+                },
+                |token| {
+                    events.lock().unwrap().push(token);
+                    Ok(())
+                },
+            )
+            .unwrap();
+
+        // The first two yields merge; the third would cross the row target and waits for the
+        // mark, which flushes it so the rows it covers leave before the next page begins.
+        assert_eq!(
+            events.into_inner().unwrap(),
+            vec![
+                "1:4:true",
+                "page-2",
+                "2:2:false",
+                "3:2:false",
+                "4:1:false",
+                "5:10:false"
+            ]
+        );
+        assert_eq!(summary.coalesced_arrow_yields, 2);
+        assert_eq!(summary.arrow_c_array_outcomes, 5);
+        assert_eq!(summary.row_count, 19);
+    });
+}
+
+#[test]
+fn position_marks_with_nothing_pending_ride_the_next_batch() {
+    Python::attach(|py| {
+        let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+            .parent()
+            .unwrap()
+            .parent()
+            .unwrap()
+            .join("python");
+        let source = CString::new(format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+from cdf_sdk.resume import Resume, _marked
+
+def pages(resume):
+    for token, ids in (("page-1", [0, 1]), ("page-2", [2]), ("page-3", [3, 4])):
+        for id in ids:
+            yield {{"id": id}}
+        resume.mark_position(token)
+
+def marked():
+    resume = Resume(None)
+    return _marked(pages(resume), resume)
+"#
+        ))
+        .unwrap();
+        let module = PyModule::from_code(py, &source, c"idle_marks.py", c"idle_marks").unwrap();
+        let iterable = module.getattr("marked").unwrap().call0().unwrap();
+        let events = std::sync::Mutex::new(Vec::new());
+        bridge()
+            .visit_python_foreign_iterable_with_positions(
+                &iterable,
+                |outcome, _kind| {
+                    events
+                        .lock()
+                        .unwrap()
+                        .push(format!("rows:{}", outcome.batch.header.row_count));
+                    Ok(())
+                },
+                |token| {
+                    events.lock().unwrap().push(token);
+                    Ok(())
+                },
+            )
+            .unwrap();
+
+        // A full window leaves before Python marks its page, so `page-1` first rides the batch
+        // of `page-2`'s rows and `page-3`, marked after its rows already left, rides no batch.
+        // Resuming then re-reads pages since the last token that rode a batch: marks are
+        // at-least-once and never skip rows.
+        assert_eq!(
+            events.into_inner().unwrap(),
+            vec!["rows:2", "page-1", "page-2", "rows:1", "rows:2", "page-3"]
+        );
+    });
+}
+
 #[test]
 fn incremental_python_bridge_stops_before_exhausting_the_generator() {
     Python::attach(|py| {
@@ -504,6 +728,42 @@ fn incremental_python_bridge_stops_before_exhausting_the_generator() {
     });
 }
 
+#[test]
+fn async_python_generators_stream_on_a_host_event_loop_and_close_on_stop() {
+    Python::attach(|py| {
+        let module = PyModule::from_code(
+            py,
+            c"import asyncio\nclosed = []\nasync def page(n):\n    await asyncio.sleep(0)\n    return {'id': n}\nasync def rows():\n    try:\n        for n in range(0, 6, 2):\n            for row in await asyncio.gather(page(n), page(n + 1)):\n                yield row\n    finally:\n        closed.append(True)\n",
+            c"async_rows.py",
+            c"async_rows",
+        )
+        .unwrap();
+        let bridge = PythonResourceBridge::new(
+            PythonBridgeOptions::new(
+                ResourceId::new("python.async").unwrap(),
+                PartitionId::new("python-000001").unwrap(),
+            )
+            .with_dict_batch_rows(2)
+            .unwrap(),
+        );
+
+        let iterable = module.getattr("rows").unwrap().call0().unwrap();
+        let read = collect_python_iterable(&bridge, &iterable).unwrap();
+        assert_eq!(read.summary.row_count, 6);
+        assert_eq!(read.batches.len(), 3);
+        assert_eq!(read.yield_kinds, vec![PythonYieldKind::DictRows; 3]);
+
+        let iterable = module.getattr("rows").unwrap().call0().unwrap();
+        let error = bridge
+            .visit_python_foreign_iterable(&iterable, |_outcome, _kind| {
+                Err(CdfError::data("intentional downstream stop"))
+            })
+            .unwrap_err();
+        assert_eq!(error.message, "intentional downstream stop");
+        assert_eq!(module.getattr("closed").unwrap().len().unwrap(), 2);
+    });
+}
+
 #[test]
 fn python_exception_details_are_redacted_at_the_foreign_boundary() {
     Python::attach(|py| {
@@ -1091,128 +1351,1967 @@ fn python_resource_opens_the_neutral_foreign_event_protocol() {
 }
 
 #[test]
-#[ignore = "slow H2 release-mode batch-size curve"]
-fn dict_row_batch_curve_reports_throughput_without_changing_defaults() {
-    use std::time::Instant;
+fn resource_modules_cache_bytecode_and_metadata_by_content_and_interpreter() {
+    let project = TestPythonProject::new(2);
+    let load = || {
+        PythonResource::load(
+            &project.root,
+            "python://src/events.py#raw_events",
+            ResourceId::new("events.raw").unwrap(),
+            TrustLevel::Governed,
+            8,
+            1024 * 1024,
+        )
+        .unwrap()
+    };
+    let first = load().physical_plan();
+    let module_path = project.root.join("src/events.py");
+    let cache = project.root.join(".cdf/python-cache");
+    let mut entries = fs::read_dir(&cache)
+        .unwrap()
+        .map(|entry| entry.unwrap().file_name().into_string().unwrap())
+        .collect::<Vec<_>>();
+    entries.sort();
+    let digest = first.content_hash.strip_prefix("sha256:").unwrap();
+    assert_eq!(entries.len(), 2);
+    assert!(entries.iter().all(|entry| entry.starts_with(digest)));
+    assert!(entries[0].ends_with(".pyc"));
+    assert!(entries[1].ends_with(".raw_events.metadata.json"));
 
-    const ROWS: u64 = 1_000_000;
-    for batch_rows in [1_024, 8_192, 65_536] {
-        let bridge = PythonResourceBridge::new(
-            PythonBridgeOptions::new(
-                ResourceId::new("python.batch-curve").unwrap(),
-                PartitionId::new("python-000001").unwrap(),
-            )
-            .with_dict_batch_rows(batch_rows)
-            .unwrap(),
-        );
-        let started = Instant::now();
-        let summary = bridge
-            .visit_json_dict_rows(
-                (0..ROWS).map(|id| serde_json::json!({"id": id, "name": "cdf"})),
-                |_outcome, _kind| Ok(()),
+    // A recorded inspection answers without importing the module again.
+    let metadata = cache.join(&entries[1]);
+    let recorded = fs::read_to_string(&metadata).unwrap();
+    fs::write(&metadata, recorded.replace("\"append\"", "\"replace\"")).unwrap();
+    assert_eq!(
+        ResourceStream::descriptor(&load()).write_disposition,
+        WriteDisposition::Replace
+    );
+
+    // Corrupt bytecode falls back to compiling the source.
+    fs::write(cache.join(&entries[0]), b"not bytecode").unwrap();
+    let module = Python::attach(|py| {
+        module_cache::PythonModuleCache::new(py, &project.root, &first.content_hash)
+            .load_module(
+                py,
+                &fs::read_to_string(&module_path).unwrap(),
+                "src/events.py",
             )
-            .unwrap();
-        let elapsed = started.elapsed();
-        let rows_per_second = ROWS as f64 / elapsed.as_secs_f64();
-        eprintln!(
-            "h2_dict_curve batch_rows={batch_rows} elapsed_ms={} rows_per_second={rows_per_second:.0} outcomes={} peak_boundary_bytes={}",
-            elapsed.as_millis(),
-            summary.outcome_count,
-            summary.peak_boundary_bytes
-        );
-        assert_eq!(summary.row_count, ROWS);
-        assert!(summary.peak_boundary_bytes <= DEFAULT_MAX_BOUNDARY_BYTES);
-    }
+            .unwrap()
+            .getattr("raw_events")
+            .is_ok()
+    });
+    assert!(module);
+
+    // An edited module hashes to a new key and is inspected afresh.
+    fs::write(
+        &module_path,
+        fs::read_to_string(&module_path).unwrap() + "\n# edited\n",
+    )
+    .unwrap();
+    let edited = load();
+    assert_ne!(edited.physical_plan().content_hash, first.content_hash);
+    assert_eq!(
+        ResourceStream::descriptor(&edited).write_disposition,
+        WriteDisposition::Append
+    );
+    assert_eq!(fs::read_dir(&cache).unwrap().count(), 4);
 }
 
 #[test]
-fn interpreter_report_checks_version_path_and_gil_state() {
-    Python::attach(|py| {
-        let report = inspect_interpreter(py).unwrap();
-        InterpreterRequirement::default().check(&report).unwrap();
-        InterpreterRequirement {
-            executable: Some(report.executable.clone()),
-            ..InterpreterRequirement::default()
-        }
-        .check(&report)
-        .unwrap();
+fn resource_modules_import_as_package_members_and_recache_when_helpers_change() {
+    let project = TestPythonProject::new(0);
+    let package = project.root.join("src/shop");
+    fs::create_dir_all(&package).unwrap();
+    let helpers = package.join("helpers.py");
+    fs::write(&helpers, "DISPOSITION = \"append\"\n").unwrap();
+    fs::write(
+        package.join("orders.py"),
+        r#"
+from importlib.resources import files
 
-        let error = InterpreterRequirement {
-            min_major: 99,
-            ..InterpreterRequirement::default()
-        }
-        .check(&report)
-        .unwrap_err();
-        assert_eq!(error.kind, ErrorKind::Contract);
-    });
-}
+from . import helpers
 
-#[test]
-fn admitted_python_work_is_mode_correct_and_fixture_hash_stable() {
-    let read = collect_json_rows(
-        &bridge(),
-        vec![
-            serde_json::json!({"id": 1, "name": "ada"}),
-            serde_json::json!({"id": 2, "name": "grace"}),
-        ],
+assert __spec__.origin == __file__
+assert files(__package__).joinpath("helpers.py").is_file()
+
+def orders():
+    yield {"id": 1}
+
+orders.__cdf_resource__ = True
+orders.__cdf_primary_key__ = ()
+orders.__cdf_merge_key__ = ()
+orders.__cdf_cursor__ = None
+orders.__cdf_bounded__ = True
+orders.__cdf_schema__ = (("id", "int64", False),)
+orders.__cdf_write_disposition__ = helpers.DISPOSITION
+"#,
     )
     .unwrap();
-    let report = attached_interpreter_report().unwrap();
-    let project = TestPythonProject::new(2);
-    let mut registry = cdf_runtime::SourceRegistry::new();
-    registry
-        .register(PythonSourceDriver::new().unwrap())
+    let load = || {
+        let resource = PythonResource::load(
+            &project.root,
+            "python://src/shop/orders.py#orders",
+            ResourceId::new("orders").unwrap(),
+            TrustLevel::Governed,
+            8,
+            1024 * 1024,
+        )
         .unwrap();
-    let project_options = python_project_options(&report, 4_096, 1024 * 1024);
-    let plan = compile_reference_plan(&registry, &project, project_options.clone());
-    assert_eq!(plan.physical_plan["dict_batch_rows"], 4_096);
-    assert_eq!(plan.physical_plan["max_boundary_bytes"], 1024 * 1024);
-    let (host, execution) =
-        cdf_engine::StandaloneExecutionHost::default_services(64 * 1024 * 1024).unwrap();
-    let unbound_error = cdf_runtime::resolve_runtime_scheduler(
-        1,
-        &plan.execution_capabilities,
-        &cdf_runtime::DestinationRuntimeCapabilities::default(),
-        &execution,
-        None,
-    )
-    .unwrap_err();
+        ResourceStream::descriptor(&resource).write_disposition
+    };
+    assert_eq!(load(), WriteDisposition::Append);
+
+    // The recorded inspection names the helper it read, so editing only the helper is a miss,
+    // and the helper is imported afresh rather than served from `sys.modules`.
+    let cache = project.root.join(".cdf/python-cache");
+    let metadata = fs::read_dir(&cache)
+        .unwrap()
+        .map(|entry| entry.unwrap().path())
+        .find(|path| path.to_string_lossy().ends_with(".orders.metadata.json"))
+        .unwrap();
+    let recorded: serde_json::Value =
+        serde_json::from_slice(&fs::read(&metadata).unwrap()).unwrap();
     assert!(
-        unbound_error
-            .message
-            .contains("requires source resolution against the execution host")
+        recorded["dependencies"]
+            .as_object()
+            .unwrap()
+            .contains_key(helpers.canonicalize().unwrap().to_str().unwrap())
     );
-    let context = cdf_runtime::SourceResolutionContext::new(
-        &project.root,
-        Arc::new(NoopSecretProvider),
-        &execution,
-        Arc::new(EgressAllowlist::allow_any()),
-    )
-    .with_driver_options(BTreeMap::from([("python".to_owned(), project_options)]));
-    let resource = registry.resolve(&plan, &context).unwrap();
-    let lane = execution
-        .capabilities()
-        .blocking_lanes
-        .into_iter()
-        .find(|lane| lane.lane_id == "python.source")
-        .expect("registry resolution installs the runtime-resolved Python lane");
-    let requested_parallelism = usize::from(execution.capabilities().logical_cpu_slots);
-    let semantics = execution_semantics(&report, requested_parallelism);
+    fs::write(&helpers, "DISPOSITION = \"replace\"\n").unwrap();
+    assert_eq!(load(), WriteDisposition::Replace);
+
+    // The directory is bounded: stale files are evicted, least recently used first.
+    let stale = std::time::UNIX_EPOCH + std::time::Duration::from_secs(86_400);
+    for index in 0..module_cache::MAX_CACHE_FILES {
+        let path = cache.join(format!("stale-{index}.pyc"));
+        fs::write(&path, b"stale").unwrap();
+        fs::File::options()
+            .append(true)
+            .open(&path)
+            .unwrap()
+            .set_modified(stale)
+            .unwrap();
+    }
+    fs::write(&helpers, "DISPOSITION = \"append\"\n").unwrap();
+    assert_eq!(load(), WriteDisposition::Append);
     assert_eq!(
-        lane.maximum_concurrency,
-        u16::try_from(semantics.effective_parallelism).unwrap()
+        fs::read_dir(&cache).unwrap().count(),
+        module_cache::MAX_CACHE_FILES
     );
-    let scheduler = cdf_runtime::resolve_runtime_scheduler(
-        1,
-        &plan.execution_capabilities,
-        &cdf_runtime::DestinationRuntimeCapabilities::default(),
-        &execution,
-        None,
-    )
-    .unwrap();
-    assert_eq!(
-        scheduler.source_lane_concurrency,
-        Some(lane.maximum_concurrency)
+    assert!(metadata.exists());
+}
+
+#[test]
+fn resident_python_modules_stay_imported_until_their_content_changes() {
+    const BOUNDARY_BYTES: u64 = 256 * 1024;
+    let project = TestPythonProject::new(0);
+    let module_path = project.root.join("src/resident.py");
+    let write_module = |rows: usize| {
+        fs::write(
+            &module_path,
+            format!(
+                r#"
+IMPORTS = [0]
+IMPORTS[0] += 1
+
+def resident():
+    for value in range({rows}):
+        yield {{"id": value, "imports": IMPORTS[0]}}
+    IMPORTS[0] += 1
+
+resident.__cdf_resource__ = True
+resident.__cdf_primary_key__ = ()
+resident.__cdf_merge_key__ = ()
+resident.__cdf_cursor__ = None
+resident.__cdf_bounded__ = True
+resident.__cdf_schema__ = (("id", "int64", False), ("imports", "int64", False))
+resident.__cdf_write_disposition__ = "append"
+"#,
+            ),
+        )
+        .unwrap();
+    };
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(4 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let run = |resident: bool| {
+        let resource = PythonResource::load(
+            &project.root,
+            "python://src/resident.py#resident",
+            ResourceId::new("resident").unwrap(),
+            TrustLevel::Governed,
+            8,
+            BOUNDARY_BYTES,
+        )
+        .unwrap()
+        .with_resident(resident)
+        .with_execution_services_and_lane(execution.clone(), lane.lane_id.clone())
+        .unwrap();
+        let partition = resource
+            .plan_partitions(&ScanRequest {
+                resource_id: ResourceId::new("resident").unwrap(),
+                projection: None,
+                filters: Vec::new(),
+                limit: None,
+                order_by: Vec::new(),
+                scope: ScopeKey::Resource,
+            })
+            .unwrap()
+            .remove(0);
+        host.block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, partition).await?;
+            let mut imports = Vec::new();
+            while let Some(batch) = stream.next().await {
+                let batch = batch?;
+                let column = batch
+                    .record_batch()
+                    .unwrap()
+                    .column(1)
+                    .as_any()
+                    .downcast_ref::<Int64Array>()
+                    .unwrap()
+                    .clone();
+                imports.extend(column.values().iter().copied());
+            }
+            stream.completion().await?;
+            Result::Ok(imports)
+        })
+        .unwrap()
+    };
+
+    write_module(1);
+    assert_eq!(run(false), vec![1]);
+    assert_eq!(run(false), vec![1]);
+    // The resident module keeps its globals: each run sees the previous run's increment.
+    assert_eq!(run(true), vec![1]);
+    assert_eq!(run(true), vec![2]);
+    assert_eq!(run(true), vec![3]);
+
+    // Editing the module changes its content hash, so the next open imports it afresh.
+    write_module(2);
+    assert_eq!(run(true), vec![1, 1]);
+    assert_eq!(run(true), vec![2, 2]);
+
+    let latency = |resident: bool| {
+        PythonResource::load(
+            &project.root,
+            "python://src/resident.py#resident",
+            ResourceId::new("resident").unwrap(),
+            TrustLevel::Governed,
+            8,
+            BOUNDARY_BYTES,
+        )
+        .unwrap()
+        .with_resident(resident)
+        .startup_latency()
+        .unwrap()
+    };
+    // Without `resident`, the probe's warm start is a second import of the cached code and the
+    // resident module is left alone: the next resident run still sees its own globals.
+    let cached = latency(false);
+    assert!(cached.cold > std::time::Duration::ZERO);
+    assert!(cached.warm > std::time::Duration::ZERO);
+    assert_eq!(run(true), vec![3, 3]);
+    // With it, the probe retains its import as a run would and looks it up warm.
+    let resident = latency(true);
+    assert!(resident.warm > std::time::Duration::ZERO);
+    assert_eq!(run(true), vec![1, 1]);
+}
+
+#[test]
+fn python_cursor_positions_take_the_vectorized_max_of_common_cursor_types() {
+    use arrow_array::{
+        Date32Array, Date64Array, LargeStringArray, TimestampMillisecondArray,
+        TimestampNanosecondArray, UInt64Array,
+    };
+
+    let position = |array: ArrayRef| {
+        let batch = RecordBatch::try_new(
+            Arc::new(Schema::new(vec![Field::new(
+                "updated_at",
+                array.data_type().clone(),
+                true,
+            )])),
+            vec![array],
+        )
+        .unwrap();
+        resource::cursor_position(
+            &batch,
+            &CursorSpec {
+                field: "updated_at".to_owned(),
+                ordering: CursorOrderingClaim::Inexact,
+                lag_tolerance_ms: 0,
+            },
+        )
+        .map(|position| match position {
+            SourcePosition::Cursor(cursor) => cursor.value,
+            other => panic!("expected a cursor position, got {other:?}"),
+        })
+    };
+
+    assert_eq!(
+        position(Arc::new(Int64Array::from(vec![
+            Some(3),
+            None,
+            Some(9),
+            Some(-1)
+        ])))
+        .unwrap(),
+        CursorValue::I64(9)
+    );
+    assert_eq!(
+        position(Arc::new(UInt64Array::from(vec![4, 11, 2]))).unwrap(),
+        CursorValue::U64(11)
+    );
+    assert_eq!(
+        position(Arc::new(Date32Array::from(vec![
+            Some(20_000),
+            None,
+            Some(20_100)
+        ])))
+        .unwrap(),
+        CursorValue::I64(20_100)
+    );
+    assert_eq!(
+        position(Arc::new(Date64Array::from(vec![
+            Some(1_700_000_000_000),
+            None,
+            Some(1_700_086_400_000)
+        ])))
+        .unwrap(),
+        CursorValue::TimestampMicros {
+            micros: 1_700_086_400_000_000,
+            timezone: None,
+        }
+    );
+    assert_eq!(
+        position(Arc::new(
+            TimestampMillisecondArray::from(vec![1_700_000_000_123, 1_700_000_000_456])
+                .with_timezone("UTC")
+        ))
+        .unwrap(),
+        CursorValue::TimestampMicros {
+            micros: 1_700_000_000_456_000,
+            timezone: Some("UTC".to_owned()),
+        }
+    );
+    assert_eq!(
+        position(Arc::new(TimestampNanosecondArray::from(vec![
+            1_700_000_000_000_001_999,
+            -1_001,
+        ])))
+        .unwrap(),
+        CursorValue::TimestampMicros {
+            micros: 1_700_000_000_000_001,
+            timezone: None,
+        }
+    );
+    assert_eq!(
+        position(Arc::new(StringArray::from(vec![
+            Some("2026-07-01T00:00:00Z"),
+            None,
+            Some("2026-07-02T08:30:00Z"),
+        ])))
+        .unwrap(),
+        CursorValue::String("2026-07-02T08:30:00Z".to_owned())
+    );
+    assert_eq!(
+        position(Arc::new(LargeStringArray::from(vec![
+            "2026-01-01",
+            "2025-12-31"
+        ])))
+        .unwrap(),
+        CursorValue::String("2026-01-01".to_owned())
+    );
+
+    let empty = position(Arc::new(Int64Array::from(vec![None, None]))).unwrap_err();
+    assert_eq!(empty.kind, ErrorKind::Data);
+    let overflow = position(Arc::new(Date64Array::from(vec![i64::MAX]))).unwrap_err();
+    assert!(
+        overflow
+            .message
+            .contains("overflows timestamp microseconds")
+    );
+    let overflow = position(Arc::new(TimestampMillisecondArray::from(vec![i64::MAX]))).unwrap_err();
+    assert!(
+        overflow
+            .message
+            .contains("overflows timestamp microseconds")
+    );
+    let unsupported = position(Arc::new(arrow_array::Float64Array::from(vec![1.5]))).unwrap_err();
+    assert!(unsupported.message.contains("unsupported Arrow type"));
+}
+
+#[test]
+fn python_cursor_ordering_and_lag_claims_flow_into_the_cursor_spec() {
+    let project = TestPythonProject::new(0);
+    fs::write(
+        project.root.join("src/events.py"),
+        r#"
+def raw_events():
+    yield {"id": 1, "updated_at": "2026-07-01T00:00:00Z"}
+
+raw_events.__cdf_resource__ = True
+raw_events.__cdf_primary_key__ = ()
+raw_events.__cdf_merge_key__ = ()
+raw_events.__cdf_cursor__ = "updated_at"
+raw_events.__cdf_cursor_ordering__ = "unordered"
+raw_events.__cdf_cursor_lag_ms__ = 30000
+raw_events.__cdf_bounded__ = True
+raw_events.__cdf_schema__ = (("id", "int64", False), ("updated_at", "utf8", False))
+raw_events.__cdf_write_disposition__ = "append"
+"#,
+    )
+    .unwrap();
+    let load = || {
+        PythonResource::load(
+            &project.root,
+            "python://src/events.py#raw_events",
+            ResourceId::new("events.raw").unwrap(),
+            TrustLevel::Governed,
+            8,
+            1024 * 1024,
+        )
+    };
+    let cursor = ResourceStream::descriptor(&load().unwrap())
+        .cursor
+        .clone()
+        .unwrap();
+    assert_eq!(cursor.ordering, CursorOrderingClaim::Unordered);
+    assert_eq!(cursor.lag_tolerance_ms, 30_000);
+
+    let source = fs::read_to_string(project.root.join("src/events.py")).unwrap();
+    fs::write(
+        project.root.join("src/events.py"),
+        source.replace("\"unordered\"", "\"sorted\""),
+    )
+    .unwrap();
+    assert_eq!(load().unwrap_err().kind, ErrorKind::Contract);
+}
+
+#[test]
+fn partitioned_python_resource_plans_one_scoped_partition_per_key() {
+    const BOUNDARY_BYTES: u64 = 256 * 1024;
+    let project = TestPythonProject::new(0);
+    project.write_partitioned_module(&["acme", "globex", "initech"], 2, 0);
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(4 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/tenants.py#tenants",
+        ResourceId::new("tenants").unwrap(),
+        TrustLevel::Governed,
+        8,
+        BOUNDARY_BYTES,
+    )
+    .unwrap()
+    .with_execution_services_and_lane(execution, lane.lane_id)
+    .unwrap();
+    assert!(resource.capabilities().partitioning.parallel_partitions);
+    assert_eq!(resource.physical_plan().partition_keys.len(), 3);
+
+    let request = ScanRequest {
+        resource_id: ResourceId::new("tenants").unwrap(),
+        projection: None,
+        filters: Vec::new(),
+        limit: None,
+        order_by: Vec::new(),
+        scope: ScopeKey::Resource,
+    };
+    let partitions = resource.plan_partitions(&request).unwrap();
+    assert_eq!(partitions.len(), 3);
+    for (partition, key) in partitions.iter().zip(["acme", "globex", "initech"]) {
+        assert_eq!(
+            partition.scope,
+            ScopeKey::Partition {
+                partition_id: partition.partition_id.clone()
+            }
+        );
+        assert_eq!(partition.metadata["partition_key"], key);
+    }
+
+    let tenants = host
+        .block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, partitions[1].clone()).await?;
+            let mut tenants = Vec::new();
+            while let Some(batch) = stream.next().await {
+                let batch = batch?;
+                let column = batch
+                    .record_batch()
+                    .unwrap()
+                    .column(1)
+                    .as_any()
+                    .downcast_ref::<StringArray>()
+                    .unwrap()
+                    .clone();
+                tenants.extend(column.iter().map(|value| value.unwrap().to_owned()));
+            }
+            stream.completion().await?;
+            Result::Ok(tenants)
+        })
+        .unwrap();
+    assert_eq!(tenants, vec!["globex", "globex"]);
+
+    let unplanned = host
+        .block_on_root(ForeignProducer::open(
+            &resource,
+            ForeignStreamOpenRequest {
+                resource_id: ResourceId::new("tenants").unwrap(),
+                partition_id: PartitionId::new("python-000004").unwrap(),
+                cancellation: ForeignCancellation::default(),
+            },
+        ))
+        .err()
+        .unwrap();
+    assert_eq!(unplanned.kind, ErrorKind::Contract);
+}
+
+#[test]
+fn keyed_partition_ids_follow_their_key_when_the_enumeration_changes() {
+    const BOUNDARY_BYTES: u64 = 256 * 1024;
+    let project = TestPythonProject::new(0);
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(4 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let request = ScanRequest {
+        resource_id: ResourceId::new("tenants").unwrap(),
+        projection: None,
+        filters: Vec::new(),
+        limit: None,
+        order_by: Vec::new(),
+        scope: ScopeKey::Resource,
+    };
+    let planned = |resource: &PythonResource| {
+        resource
+            .plan_partitions(&request)
+            .unwrap()
+            .into_iter()
+            .map(|partition| (partition.metadata["partition_key"].clone(), partition))
+            .collect::<BTreeMap<_, _>>()
+    };
+    let load = || {
+        PythonResource::load(
+            &project.root,
+            "python://src/tenants.py#tenants",
+            ResourceId::new("tenants").unwrap(),
+            TrustLevel::Governed,
+            8,
+            BOUNDARY_BYTES,
+        )
+        .unwrap()
+        .with_execution_services_and_lane(execution.clone(), lane.lane_id.clone())
+        .unwrap()
+    };
+
+    project.write_partitioned_module(&["acme", "globex", "initech"], 1, 0);
+    let first = planned(&load());
+    // The second run's enumerator is a generator that reorders the keys, drops one, and
+    // inserts another ahead of the survivors.
+    let module = fs::read_to_string(project.root.join("src/tenants.py")).unwrap();
+    fs::write(
+        project.root.join("src/tenants.py"),
+        module.replace(
+            r#"lambda: ["acme", "globex", "initech"]"#,
+            r#"lambda: (key for key in ("hooli", "initech", "acme"))"#,
+        ),
+    )
+    .unwrap();
+    let resource = load();
+    let second = planned(&resource);
+    assert_eq!(second.len(), 3);
+    for key in ["acme", "initech"] {
+        assert_eq!(second[key].partition_id, first[key].partition_id);
+        assert_eq!(second[key].scope, first[key].scope);
+    }
+    assert!(
+        first
+            .values()
+            .all(|partition| partition.partition_id != second["hooli"].partition_id)
+    );
+
+    let tenants = host
+        .block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, first["acme"].clone()).await?;
+            let mut tenants = Vec::new();
+            while let Some(batch) = stream.next().await {
+                let batch = batch?;
+                let column = batch
+                    .record_batch()
+                    .unwrap()
+                    .column(1)
+                    .as_any()
+                    .downcast_ref::<StringArray>()
+                    .unwrap()
+                    .clone();
+                tenants.extend(column.iter().map(|value| value.unwrap().to_owned()));
+            }
+            stream.completion().await?;
+            Result::Ok(tenants)
+        })
+        .unwrap();
+    assert_eq!(tenants, vec!["acme"]);
+
+    let dropped = host
+        .block_on_root(ForeignProducer::open(
+            &resource,
+            ForeignStreamOpenRequest {
+                resource_id: ResourceId::new("tenants").unwrap(),
+                partition_id: first["globex"].partition_id.clone(),
+                cancellation: ForeignCancellation::default(),
+            },
+        ))
+        .err()
+        .unwrap();
+    assert_eq!(dropped.kind, ErrorKind::Contract);
+}
+
+#[test]
+fn pushdown_resources_negotiate_projection_filters_and_limits_into_the_call() {
+    const BOUNDARY_BYTES: u64 = 256 * 1024;
+    let project = TestPythonProject::new(0);
+    let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .parent()
+        .unwrap()
+        .parent()
+        .unwrap()
+        .join("python");
+    fs::write(
+        project.root.join("src/scores.py"),
+        format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+import cdf_sdk
+
+@cdf_sdk.resource(
+    schema={{"id": "int64", "name": "utf8", "score": "int64"}},
+    pushdown=cdf_sdk.Pushdown(projection=True, operators=(">=",), limit=True),
+)
+def scores(scan):
+    assert scan.columns == ("id", "score")
+    assert scan.predicates == (cdf_sdk.Predicate("score", ">=", 2),)
+    emitted = 0
+    for value in range(5):
+        if value >= scan.predicates[0].value and emitted < scan.limit:
+            emitted += 1
+            yield {{"id": value, "score": value}}
+"#,
+        ),
+    )
+    .unwrap();
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(4 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/scores.py#scores",
+        ResourceId::new("scores").unwrap(),
+        TrustLevel::Governed,
+        8,
+        BOUNDARY_BYTES,
+    )
+    .unwrap()
+    .with_execution_services_and_lane(execution, lane.lane_id)
+    .unwrap();
+    let capabilities = resource.capabilities();
+    assert_eq!(capabilities.projection, CapabilitySupport::Supported);
+    assert_eq!(capabilities.limits, CapabilitySupport::Supported);
+    assert_eq!(capabilities.filters.supported_operators, vec![">="]);
+    assert!(resource.physical_plan().pushdown.is_some());
+
+    let request = ScanRequest {
+        resource_id: ResourceId::new("scores").unwrap(),
+        projection: Some(vec!["id".to_owned(), "score".to_owned()]),
+        filters: vec![
+            ScanPredicate::new(PredicateId::new("pushed").unwrap(), "score >= 2").unwrap(),
+            ScanPredicate::new(PredicateId::new("residual").unwrap(), "score < 4").unwrap(),
+        ],
+        limit: Some(2),
+        order_by: Vec::new(),
+        scope: ScopeKey::Resource,
+    };
+    let plan = resource.negotiate(&request).unwrap();
+    assert_eq!(plan.pushed_predicates.len(), 1);
+    assert_eq!(plan.unsupported_predicates.len(), 1);
+    let partition = plan.inline_partitions().unwrap()[0].clone();
+    assert_eq!(partition.scan_intent.limit, Some(2));
+    assert_eq!(partition.scan_intent.projection, request.projection);
+
+    let batches = host
+        .block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, partition).await?;
+            let mut batches = Vec::new();
+            while let Some(batch) = stream.next().await {
+                batches.push(batch?.record_batch().unwrap().clone());
+            }
+            stream.completion().await?;
+            Result::Ok(batches)
+        })
+        .unwrap();
+    let ids = batches
+        .iter()
+        .flat_map(|batch| {
+            assert_eq!(
+                batch
+                    .schema()
+                    .fields()
+                    .iter()
+                    .map(|field| field.name().as_str())
+                    .collect::<Vec<_>>(),
+                vec!["id", "score"]
+            );
+            batch
+                .column(0)
+                .as_any()
+                .downcast_ref::<Int64Array>()
+                .unwrap()
+                .values()
+                .to_vec()
+        })
+        .collect::<Vec<_>>();
+    assert_eq!(ids, vec![2, 3]);
+}
+
+#[test]
+fn estimate_hooks_record_partition_estimates_and_total_them_for_admission() {
+    let project = TestPythonProject::new(0);
+    let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .parent()
+        .unwrap()
+        .parent()
+        .unwrap()
+        .join("python");
+    fs::write(
+        project.root.join("src/regions.py"),
+        format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+import cdf_sdk
+
+COUNTS = {{"east": 40, "west": 2}}
+
+@cdf_sdk.resource(
+    schema={{"id": "int64"}},
+    partitions=lambda: ["east", "west"],
+    estimate=lambda region: cdf_sdk.Estimate(rows=COUNTS[region], bytes=8 * COUNTS[region]),
+)
+def regions(partition):
+    yield {{"id": COUNTS[partition]}}
+
+@cdf_sdk.resource(
+    schema={{"id": "int64"}},
+    partitions=lambda: ["east", "west"],
+    estimate=lambda region: cdf_sdk.Estimate(rows=COUNTS[region]) if region == "east" else None,
+)
+def partial(partition):
+    yield {{"id": COUNTS[partition]}}
+
+def timed_out_count(region):
+    if region == "west":
+        raise TimeoutError("count query timed out")
+    return cdf_sdk.Estimate(rows=COUNTS[region])
+
+@cdf_sdk.resource(
+    schema={{"id": "int64"}},
+    partitions=lambda: ["east", "west"],
+    estimate=timed_out_count,
+)
+def flaky(partition):
+    yield {{"id": COUNTS[partition]}}
+"#,
+        ),
+    )
+    .unwrap();
+    let load = |callable: &str| {
+        PythonResource::load(
+            &project.root,
+            &format!("python://src/regions.py#{callable}"),
+            ResourceId::new(callable).unwrap(),
+            TrustLevel::Governed,
+            8,
+            1024,
+        )
+        .unwrap()
+    };
+    let request = |callable: &str| ScanRequest {
+        resource_id: ResourceId::new(callable).unwrap(),
+        projection: None,
+        filters: Vec::new(),
+        limit: None,
+        order_by: Vec::new(),
+        scope: ScopeKey::Resource,
+    };
+
+    let regions = load("regions");
+    assert_eq!(
+        regions.capabilities().estimates,
+        EstimateSupport::RowsAndBytes
+    );
+    assert!(regions.physical_plan().estimate);
+    let plan = regions.negotiate(&request("regions")).unwrap();
+    assert_eq!(plan.estimated_rows, Some(42));
+    assert_eq!(
+        plan.planned_source_bytes.map(PlannedSourceBytes::get),
+        Some(336)
+    );
+    let partitions = plan.inline_partitions().unwrap();
+    assert_eq!(
+        partitions
+            .iter()
+            .map(|partition| partition.metadata[PLAN_ESTIMATED_ROWS_KEY].as_str())
+            .collect::<Vec<_>>(),
+        vec!["40", "2"]
+    );
+
+    // A partition the hook cannot size leaves the scan total unknown rather than understated.
+    let partial = load("partial");
+    let plan = partial.negotiate(&request("partial")).unwrap();
+    assert_eq!(plan.estimated_rows, None);
+    assert_eq!(plan.planned_source_bytes, None);
+    let partitions = plan.inline_partitions().unwrap();
+    assert_eq!(partitions[0].metadata[PLAN_ESTIMATED_ROWS_KEY], "40");
+    assert!(!partitions[1].metadata.contains_key(PLAN_ESTIMATED_ROWS_KEY));
+    assert!(
+        !partitions[0]
+            .metadata
+            .contains_key(PLAN_ESTIMATED_BYTES_KEY)
+    );
+
+    // A hook that raises is only a missing hint: planning goes on and records why.
+    let flaky = load("flaky");
+    let plan = flaky.negotiate(&request("flaky")).unwrap();
+    assert_eq!(plan.estimated_rows, None);
+    let partitions = plan.inline_partitions().unwrap();
+    assert_eq!(partitions[0].metadata[PLAN_ESTIMATED_ROWS_KEY], "40");
+    assert!(!partitions[0].metadata.contains_key("estimate_warning"));
+    assert!(!partitions[1].metadata.contains_key(PLAN_ESTIMATED_ROWS_KEY));
+    assert!(partitions[1].metadata["estimate_warning"].contains("TimeoutError"));
+}
+
+#[test]
+fn resumable_resources_stamp_marked_page_tokens_and_resume_after_them() {
+    let project = TestPythonProject::new(0);
+    let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .parent()
+        .unwrap()
+        .parent()
+        .unwrap()
+        .join("python");
+    fs::write(
+        project.root.join("src/pages.py"),
+        format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+import cdf_sdk
+
+PAGES = {{None: ([1, 2], "p2"), "p2": ([3, 4], "p3"), "p3": ([5, 6], None)}}
+
+@cdf_sdk.resource(schema={{"id": "int64"}}, resumable=True)
+def pages(resume):
+    token = resume.token
+    while True:
+        ids, next_token = PAGES[token]
+        for id in ids:
+            yield {{"id": id}}
+        if next_token is None:
+            return
+        resume.mark_position(next_token)
+        token = next_token
+
+@cdf_sdk.resource(schema={{"id": "int64"}}, cursor="id", resumable=True)
+def both(resume):
+    yield {{"id": 1}}
+
+REGIONS = {{"east": 100, "west": 200}}
+
+@cdf_sdk.resource(schema={{"id": "int64"}}, partitions=lambda: ["east", "west"], resumable=True)
+def regions(region, resume):
+    page = int(resume.token or "0")
+    while page < 2:
+        yield {{"id": REGIONS[region] + page}}
+        page += 1
+        resume.mark_position(str(page))
+
+@cdf_sdk.resource(schema={{"id": "int64"}}, resumable="yes")
+def malformed(resume):
+    yield {{"id": 1}}
+"#,
+        ),
+    )
+    .unwrap();
+    let load = |callable: &str| {
+        PythonResource::load(
+            &project.root,
+            &format!("python://src/pages.py#{callable}"),
+            ResourceId::new(callable).unwrap(),
+            TrustLevel::Governed,
+            8,
+            BOUNDARY_BYTES,
+        )
+    };
+    let error = load("both").unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Contract);
+    let error = load("malformed").unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Contract);
+    assert!(error.message.contains("`resumable=` that is not a boolean"));
+
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(4 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let resource = load("pages")
+        .unwrap()
+        .with_execution_services_and_lane(execution.clone(), lane.lane_id.clone())
+        .unwrap();
+    assert_eq!(
+        resource.capabilities().replay,
+        cdf_kernel::ReplaySupport::FromPosition
+    );
+    assert!(resource.physical_plan().resumable);
+    assert!(
+        resource
+            .clone()
+            .with_isolation(PythonIsolation::Process)
+            .is_err()
+    );
+    let partitions = |resource: &PythonResource, callable: &str| {
+        resource
+            .negotiate(&ScanRequest {
+                resource_id: ResourceId::new(callable).unwrap(),
+                projection: None,
+                filters: Vec::new(),
+                limit: None,
+                order_by: Vec::new(),
+                scope: ScopeKey::Resource,
+            })
+            .unwrap()
+            .inline_partitions()
+            .unwrap()
+            .to_vec()
+    };
+    let partition = partitions(&resource, "pages")[0].clone();
+    let scan = |resource: &PythonResource, partition: PartitionPlan| {
+        host.block_on_root(async {
+            let mut stream = ResourceStream::open(resource, partition).await?;
+            let mut scanned = Vec::new();
+            while let Some(batch) = stream.next().await {
+                let batch = batch?;
+                let ids = batch
+                    .record_batch()
+                    .unwrap()
+                    .column(0)
+                    .as_any()
+                    .downcast_ref::<Int64Array>()
+                    .unwrap()
+                    .values()
+                    .to_vec();
+                scanned.push((ids, batch.header.source_position.clone().unwrap()));
+            }
+            stream.completion().await?;
+            Result::Ok(scanned)
+        })
+    };
+    let recorded = |position: &SourcePosition| match position {
+        SourcePosition::ForeignState(state) => {
+            serde_json::from_slice::<serde_json::Value>(&state.opaque_blob).unwrap()
+        }
+        other => panic!("expected a page token position, got {other:?}"),
+    };
+    let token = |position: &SourcePosition| recorded(position)["token"].clone();
+
+    // Each mark flushes the rows it covers, so a batch never carries a token past its own rows.
+    let scanned = scan(&resource, partition.clone()).unwrap();
+    assert_eq!(
+        scanned
+            .iter()
+            .map(|(ids, _)| ids.clone())
+            .collect::<Vec<_>>(),
+        vec![vec![1, 2], vec![3, 4], vec![5, 6]]
+    );
+    assert_eq!(
+        scanned
+            .iter()
+            .map(|(_, position)| token(position))
+            .collect::<Vec<_>>(),
+        vec!["p2", "p3", "p3"]
+    );
+
+    let mut resumed = partition.clone();
+    resumed.start_position = Some(scanned[0].1.clone());
+    assert_eq!(
+        scan(&resource, resumed)
+            .unwrap()
+            .into_iter()
+            .flat_map(|(ids, _)| ids)
+            .collect::<Vec<_>>(),
+        vec![3, 4, 5, 6]
+    );
+
+    // Keyed partitions bind their page tokens to the key's partition id, so a token resumes
+    // only the key that marked it.
+    let regions = load("regions")
+        .unwrap()
+        .with_execution_services_and_lane(execution, lane.lane_id)
+        .unwrap();
+    let [east, west]: [PartitionPlan; 2] = partitions(&regions, "regions").try_into().unwrap();
+    assert!(east.partition_id.as_str().starts_with("python-key-"));
+    let scanned = scan(&regions, west.clone()).unwrap();
+    assert_eq!(
+        scanned
+            .iter()
+            .map(|(ids, _)| ids.clone())
+            .collect::<Vec<_>>(),
+        vec![vec![200], vec![201]]
+    );
+    assert_eq!(
+        recorded(&scanned[0].1)["partition_id"],
+        west.partition_id.as_str()
+    );
+    let mut resumed = west.clone();
+    resumed.start_position = Some(scanned[0].1.clone());
+    assert_eq!(
+        scan(&regions, resumed)
+            .unwrap()
+            .into_iter()
+            .flat_map(|(ids, _)| ids)
+            .collect::<Vec<_>>(),
+        vec![201]
+    );
+    let mut crossed = east;
+    crossed.start_position = Some(scanned[0].1.clone());
+    let error = scan(&regions, crossed).unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Contract);
+    assert!(error.message.contains("from a position it did not record"));
+}
+
+#[test]
+fn prefetching_resources_queue_batches_ahead_and_report_python_time() {
+    let project = TestPythonProject::new(0);
+    let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .parent()
+        .unwrap()
+        .parent()
+        .unwrap()
+        .join("python");
+    fs::write(
+        project.root.join("src/slow.py"),
+        format!(
+            r#"
+import sys, time
+sys.path.insert(0, {sdk_root:?})
+import cdf_sdk
+
+@cdf_sdk.resource(schema={{"id": "int64"}})
+def slow():
+    for id in range(16):
+        time.sleep(0.005)
+        with open({progress:?}, "a") as progress:
+            progress.write(f"{{id}}\n")
+        yield {{"id": id}}
+"#,
+            progress = project.root.join("progress.log"),
+        ),
+    )
+    .unwrap();
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(8 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/slow.py#slow",
+        ResourceId::new("slow").unwrap(),
+        TrustLevel::Governed,
+        2,
+        BOUNDARY_BYTES,
+    )
+    .unwrap();
+    assert!(resource.clone().with_prefetch_batches(Some(1)).is_err());
+    let resource = resource
+        .with_prefetch_batches(Some(3))
+        .unwrap()
+        .with_execution_services_and_lane(execution, lane.lane_id)
+        .unwrap();
+    assert_eq!(resource.physical_plan().prefetch_batches, Some(3));
+    assert!(
+        resource
+            .clone()
+            .with_isolation(PythonIsolation::Process)
+            .is_err()
+    );
+    let partition = resource
+        .negotiate(&ScanRequest {
+            resource_id: ResourceId::new("slow").unwrap(),
+            projection: None,
+            filters: Vec::new(),
+            limit: None,
+            order_by: Vec::new(),
+            scope: ScopeKey::Resource,
+        })
+        .unwrap()
+        .inline_partitions()
+        .unwrap()[0]
+        .clone();
+
+    let (produced_while_blocked, rows, completion) = host
+        .block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, partition).await?;
+            let mut rows = stream.next().await.unwrap()?.header.row_count;
+            // Hold the consumer still: the producer keeps reading into the queue meanwhile.
+            std::thread::sleep(std::time::Duration::from_millis(500));
+            let produced_while_blocked = fs::read_to_string(project.root.join("progress.log"))
+                .unwrap()
+                .lines()
+                .count();
+            while let Some(batch) = stream.next().await {
+                rows += batch?.header.row_count;
+            }
+            Result::Ok((produced_while_blocked, rows, stream.completion().await?))
+        })
+        .unwrap();
+
+    // Two rows per window: the first window was taken, and at least two more were queued
+    // behind it, but the bounded queue stopped the generator well short of its end.
+    assert!(
+        (6..16).contains(&produced_while_blocked),
+        "{produced_while_blocked}"
+    );
+    assert_eq!(rows, 16);
+    // The generator's own sleeps are Python time. The bridge cannot see what I/O they stand
+    // for, so bytes and requests are left to the transfer report.
+    let source_io = completion.source_io().unwrap();
+    assert!(source_io.duration_ns >= 80_000_000);
+    assert_eq!(source_io.requests, 0);
+    assert_eq!(source_io.physical_bytes, 0);
+    assert_eq!(completion.source_transfer().unwrap().modes[0].rows, 16);
+}
+
+#[test]
+fn profiled_resources_write_stage_timings_and_cprofile_stats() {
+    let project = TestPythonProject::new(0);
+    let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+        .parent()
+        .unwrap()
+        .parent()
+        .unwrap()
+        .join("python");
+    fs::write(
+        project.root.join("src/profiled.py"),
+        format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+import cdf_sdk
+
+def page(id):
+    return {{"id": id, "name": f"row-{{id}}"}}
+
+@cdf_sdk.resource()
+def profiled():
+    for id in range(5):
+        yield page(id)
+
+@cdf_sdk.resource()
+def interrupted():
+    yield page(0)
+    raise ConnectionResetError("upstream went away")
+"#,
+        ),
+    )
+    .unwrap();
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(4 * BOUNDARY_BYTES).unwrap();
+    let semantics = execution_semantics(
+        &attached_interpreter_report().unwrap(),
+        usize::from(execution.capabilities().logical_cpu_slots),
+    );
+    let lane = python_execution_lane_spec(&semantics);
+    execution
+        .ensure_blocking_lanes(std::slice::from_ref(&lane))
+        .unwrap();
+    let artifacts = project.root.join("artifacts");
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/profiled.py#profiled",
+        ResourceId::new("profiled").unwrap(),
+        TrustLevel::Governed,
+        2,
+        BOUNDARY_BYTES,
+    )
+    .unwrap()
+    .with_profile(PythonProfileMode::Cprofile, &artifacts)
+    .with_execution_services_and_lane(execution.clone(), lane.lane_id.clone())
+    .unwrap();
+    let partition = resource
+        .negotiate(&ScanRequest {
+            resource_id: ResourceId::new("profiled").unwrap(),
+            projection: None,
+            filters: Vec::new(),
+            limit: None,
+            order_by: Vec::new(),
+            scope: ScopeKey::Resource,
+        })
+        .unwrap()
+        .inline_partitions()
+        .unwrap()[0]
+        .clone();
+    host.block_on_root(async {
+        let mut stream = ResourceStream::open(&resource, partition.clone()).await?;
+        while let Some(batch) = stream.next().await {
+            batch?;
+        }
+        stream.completion().await.map(drop)
+    })
+    .unwrap();
+
+    // Each resolved resource profiles into its own run directory.
+    let runs = fs::read_dir(artifacts.join(".cdf/profiles/python/profiled"))
+        .unwrap()
+        .map(|entry| entry.unwrap().path())
+        .collect::<Vec<_>>();
+    assert_eq!(runs.len(), 1);
+    let directory = &runs[0];
+    assert!(
+        fs::read_dir(directory)
+            .unwrap()
+            .all(|entry| entry.unwrap().path().extension().unwrap() != "tmp")
+    );
+    let profile: serde_json::Value = serde_json::from_slice(
+        &fs::read(directory.join(format!("{}.json", partition.partition_id.as_str()))).unwrap(),
+    )
+    .unwrap();
+    assert_eq!(profile["mode"], "cprofile");
+    let bridge = &profile["bridge"];
+    assert_eq!(
+        bridge["windows"]
+            .as_array()
+            .unwrap()
+            .iter()
+            .map(|window| (
+                window["kind"].as_str().unwrap(),
+                window["rows"].as_u64().unwrap()
+            ))
+            .collect::<Vec<_>>(),
+        vec![("dict_rows", 2), ("dict_rows", 2), ("dict_rows", 1)]
+    );
+    assert!(bridge["dict_to_json_ns"].as_u64().unwrap() > 0);
+    assert!(bridge["schema_inference_ns"].as_u64().unwrap() > 0);
+    assert!(bridge["gil_hold_ns"].as_u64().unwrap() <= bridge["wall_ns"].as_u64().unwrap());
+
+    // The stats name the author's own helper, so `pstats` can rank it.
+    let stats = directory.join(profile["cprofile_stats"].as_str().unwrap());
+    Python::attach(|py| {
+        let functions = PyModule::import(py, "pstats")
+            .unwrap()
+            .getattr("Stats")
+            .unwrap()
+            .call1((stats,))
+            .unwrap()
+            .getattr("stats")
+            .unwrap()
+            .str()
+            .unwrap()
+            .to_string();
+        assert!(functions.contains("'page'"));
+    });
+
+    // A partition whose profiler cannot be enabled, as under Python 3.12+ when another
+    // partition of the interpreter holds the `sys.monitoring` profiler tool, still completes
+    // and writes its timings.
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/profiled.py#profiled",
+        ResourceId::new("contended").unwrap(),
+        TrustLevel::Governed,
+        2,
+        BOUNDARY_BYTES,
+    )
+    .unwrap()
+    .with_profile(PythonProfileMode::Cprofile, &artifacts)
+    .with_execution_services_and_lane(execution.clone(), lane.lane_id.clone())
+    .unwrap();
+    let partition = resource
+        .negotiate(&ScanRequest {
+            resource_id: ResourceId::new("contended").unwrap(),
+            projection: None,
+            filters: Vec::new(),
+            limit: None,
+            order_by: Vec::new(),
+            scope: ScopeKey::Resource,
+        })
+        .unwrap()
+        .inline_partitions()
+        .unwrap()[0]
+        .clone();
+    let held = Python::attach(|py| {
+        let profiler = PyModule::import(py, "cProfile")
+            .unwrap()
+            .getattr("Profile")
+            .unwrap()
+            .call0()
+            .unwrap();
+        profiler.call_method0("enable").unwrap();
+        profiler.unbind()
+    });
+    let contended = host.block_on_root(async {
+        let mut stream = ResourceStream::open(&resource, partition.clone()).await?;
+        let mut rows = 0;
+        while let Some(batch) = stream.next().await {
+            rows += batch?.header.row_count;
+        }
+        stream.completion().await.map(|_| rows)
+    });
+    Python::attach(|py| held.bind(py).call_method0("disable").unwrap());
+    assert_eq!(contended.unwrap(), 5);
+    let run = fs::read_dir(artifacts.join(".cdf/profiles/python/contended"))
+        .unwrap()
+        .next()
+        .unwrap()
+        .unwrap()
+        .path();
+    let profile: serde_json::Value = serde_json::from_slice(
+        &fs::read(run.join(format!("{}.json", partition.partition_id.as_str()))).unwrap(),
+    )
+    .unwrap();
+    assert_eq!(profile["mode"], "cprofile");
+    assert!(profile.get("error").is_none());
+
+    // A partition that fails part-way still leaves the profile of what it did.
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/profiled.py#interrupted",
+        ResourceId::new("interrupted").unwrap(),
+        TrustLevel::Governed,
+        2,
+        BOUNDARY_BYTES,
+    )
+    .unwrap()
+    .with_profile(PythonProfileMode::Timings, &artifacts)
+    .with_execution_services_and_lane(execution, lane.lane_id)
+    .unwrap();
+    let partition = resource
+        .negotiate(&ScanRequest {
+            resource_id: ResourceId::new("interrupted").unwrap(),
+            projection: None,
+            filters: Vec::new(),
+            limit: None,
+            order_by: Vec::new(),
+            scope: ScopeKey::Resource,
+        })
+        .unwrap()
+        .inline_partitions()
+        .unwrap()[0]
+        .clone();
+    let failure = host
+        .block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, partition.clone()).await?;
+            while let Some(batch) = stream.next().await {
+                batch?;
+            }
+            stream.completion().await.map(drop)
+        })
+        .unwrap_err();
+    let run = fs::read_dir(artifacts.join(".cdf/profiles/python/interrupted"))
+        .unwrap()
+        .next()
+        .unwrap()
+        .unwrap()
+        .path();
+    let profile: serde_json::Value = serde_json::from_slice(
+        &fs::read(run.join(format!("{}.json", partition.partition_id.as_str()))).unwrap(),
+    )
+    .unwrap();
+    assert_eq!(profile["mode"], "timings");
+    assert!(failure.message.contains("ConnectionResetError"));
+    assert!(
+        profile["error"]
+            .as_str()
+            .unwrap()
+            .contains("ConnectionResetError")
+    );
+    assert!(profile["bridge"]["wall_ns"].as_u64().unwrap() > 0);
+}
+
+#[test]
+fn process_isolation_requires_a_declared_schema_and_plans_an_ipc_worker() {
+    let project = TestPythonProject::new(1);
+    fs::write(
+        project.root.join("src/undeclared.py"),
+        r#"
+def rows():
+    yield {"id": 1}
+
+rows.__cdf_resource__ = True
+rows.__cdf_primary_key__ = ()
+rows.__cdf_merge_key__ = ()
+rows.__cdf_cursor__ = None
+rows.__cdf_bounded__ = True
+rows.__cdf_schema__ = ()
+rows.__cdf_write_disposition__ = "append"
+"#,
+    )
+    .unwrap();
+    let load = |uri: &str| {
+        PythonResource::load(
+            &project.root,
+            uri,
+            ResourceId::new("events.raw").unwrap(),
+            TrustLevel::Governed,
+            2,
+            256 * 1024,
+        )
+        .unwrap()
+    };
+    let error = load("python://src/undeclared.py#rows")
+        .with_isolation(PythonIsolation::Process)
+        .unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Contract);
+    assert!(error.message.contains("declared schema"));
+
+    let embedded = load("python://src/events.py#raw_events");
+    assert!(
+        serde_json::to_value(embedded.physical_plan())
+            .unwrap()
+            .get("isolation")
+            .is_none()
+    );
+    let isolated = embedded.with_isolation(PythonIsolation::Process).unwrap();
+    assert_eq!(
+        serde_json::to_value(isolated.physical_plan()).unwrap()["isolation"],
+        "process"
+    );
+    let boundary = isolated.source_boundary_capabilities().unwrap();
+    assert_eq!(
+        boundary.transfer_modes,
+        vec![ForeignTransferMode::ArrowIpcStream]
+    );
+    assert_eq!(
+        boundary.execution_lane,
+        cdf_foreign_stream::ForeignExecutionLane::IsolatedProcess
+    );
+}
+
+#[test]
+#[ignore = "requires PyArrow in the configured interpreter"]
+fn process_isolated_partitions_stream_ipc_batches_with_source_positions() {
+    let report = attached_interpreter_report().unwrap();
+    let project = TestPythonProject::new(0);
+    project.write_partitioned_module(&["acme", "globex"], 3, 0);
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(64 * 1024 * 1024).unwrap();
+    let resource = PythonResource::load(
+        &project.root,
+        "python://src/tenants.py#tenants",
+        ResourceId::new("tenants").unwrap(),
+        TrustLevel::Governed,
+        2,
+        1024 * 1024,
+    )
+    .unwrap()
+    .with_isolation(PythonIsolation::Process)
+    .unwrap()
+    .with_execution_services_and_worker(execution, report.executable.clone())
+    .unwrap();
+    let partitions = resource
+        .plan_partitions(&ScanRequest {
+            resource_id: ResourceId::new("tenants").unwrap(),
+            projection: None,
+            filters: Vec::new(),
+            limit: None,
+            order_by: Vec::new(),
+            scope: ScopeKey::Resource,
+        })
+        .unwrap();
+    let tenants = host
+        .block_on_root(async {
+            let mut stream = ResourceStream::open(&resource, partitions[1].clone()).await?;
+            let mut tenants = Vec::new();
+            while let Some(batch) = stream.next().await {
+                let batch = batch?;
+                assert!(matches!(
+                    batch.header.source_position,
+                    Some(SourcePosition::ForeignState(_))
+                ));
+                let column = batch
+                    .record_batch()
+                    .unwrap()
+                    .column(1)
+                    .as_any()
+                    .downcast_ref::<StringArray>()
+                    .unwrap()
+                    .clone();
+                tenants.extend(column.iter().map(|value| value.unwrap().to_owned()));
+            }
+            let completion = stream.completion().await?;
+            Result::Ok((tenants, completion))
+        })
+        .unwrap();
+    assert_eq!(tenants.0, vec!["globex", "globex", "globex"]);
+    let transfer = tenants.1.source_transfer().unwrap();
+    assert_eq!(transfer.modes[0].mode, ForeignTransferMode::ArrowIpcStream);
+    assert_eq!(transfer.modes[0].rows, 3);
+}
+
+#[test]
+fn keyed_python_partitions_admit_parallel_jobs_only_without_the_gil() {
+    let report = attached_interpreter_report().unwrap();
+    let project = TestPythonProject::new(0);
+    project.write_partitioned_module(&["a", "b", "c", "d"], 1, 0);
+    let mut registry = cdf_runtime::SourceRegistry::new();
+    registry
+        .register(PythonSourceDriver::new().unwrap())
+        .unwrap();
+    let project_options = python_project_options(&report, 1_024, 1024 * 1024);
+    let plan = compile_reference_plan_for(
+        &registry,
+        &project,
+        "python://src/tenants.py#tenants",
+        "tenants",
+        project_options.clone(),
+    );
+    assert_eq!(plan.execution_capabilities.maximum_concurrency, 4);
+    assert_eq!(plan.execution_capabilities.useful_concurrency, 4);
+    let (_host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(64 * 1024 * 1024).unwrap();
+    let context = cdf_runtime::SourceResolutionContext::new(
+        &project.root,
+        Arc::new(NoopSecretProvider),
+        &execution,
+        Arc::new(EgressAllowlist::allow_any()),
+    )
+    .with_driver_options(BTreeMap::from([("python".to_owned(), project_options)]));
+    registry.resolve(&plan, &context).unwrap();
+    let scheduler = cdf_runtime::resolve_runtime_scheduler(
+        4,
+        &plan.execution_capabilities,
+        &cdf_runtime::DestinationRuntimeCapabilities::default(),
+        &execution,
+        None,
+    )
+    .unwrap();
+    let jobs = scheduler.effective_jobs.jobs;
+    if report.can_parallelize_python() {
+        let host_slots = execution.capabilities().logical_cpu_slots;
+        assert_eq!(
+            jobs,
+            4.min(host_slots).min(scheduler.effective_jobs.memory_jobs)
+        );
+    } else {
+        assert_eq!(jobs, 1);
+        assert_eq!(scheduler.source_lane_concurrency, Some(1));
+    }
+}
+
+#[test]
+#[ignore = "slow H2 free-threaded partition scaling curve"]
+fn keyed_python_partitions_scale_rows_per_second_with_threads() {
+    use std::time::Instant;
+
+    const BOUNDARY_BYTES: u64 = 1024 * 1024;
+    const PARTITIONS: usize = 8;
+    const ROWS: usize = 20_000;
+    let report = attached_interpreter_report().unwrap();
+    let project = TestPythonProject::new(0);
+    let keys = (0..PARTITIONS)
+        .map(|index| format!("tenant-{index}"))
+        .collect::<Vec<_>>();
+    project.write_partitioned_module(
+        &keys.iter().map(String::as_str).collect::<Vec<_>>(),
+        ROWS,
+        64,
+    );
+    let mut baseline = None;
+    for threads in [1, 2, 4, 8] {
+        let (host, execution) = cdf_engine::StandaloneExecutionHost::default_services(
+            4 * PARTITIONS as u64 * BOUNDARY_BYTES,
+        )
+        .unwrap();
+        let semantics = execution_semantics(&report, threads);
+        let lane = python_execution_lane_spec(&semantics);
+        execution
+            .ensure_blocking_lanes(std::slice::from_ref(&lane))
+            .unwrap();
+        let resource = PythonResource::load(
+            &project.root,
+            "python://src/tenants.py#tenants",
+            ResourceId::new("tenants").unwrap(),
+            TrustLevel::Governed,
+            8_192,
+            BOUNDARY_BYTES,
+        )
+        .unwrap()
+        .with_execution_services_and_lane(execution, lane.lane_id)
+        .unwrap();
+        let partitions = resource
+            .plan_partitions(&ScanRequest {
+                resource_id: ResourceId::new("tenants").unwrap(),
+                projection: None,
+                filters: Vec::new(),
+                limit: None,
+                order_by: Vec::new(),
+                scope: ScopeKey::Resource,
+            })
+            .unwrap();
+        let started = Instant::now();
+        let rows = host
+            .block_on_root(async {
+                let drains = partitions.into_iter().map(|partition| async {
+                    let mut stream = ResourceStream::open(&resource, partition).await?;
+                    let mut rows = 0;
+                    while let Some(batch) = stream.next().await {
+                        rows += batch?.header.row_count;
+                    }
+                    stream.completion().await?;
+                    Result::Ok(rows)
+                });
+                futures_util::future::try_join_all(drains).await
+            })
+            .unwrap()
+            .into_iter()
+            .sum::<u64>();
+        let elapsed = started.elapsed().as_secs_f64();
+        assert_eq!(rows, (PARTITIONS * ROWS) as u64);
+        let rows_per_second = rows as f64 / elapsed;
+        let baseline = *baseline.get_or_insert(rows_per_second);
+        eprintln!(
+            "h2_python_partition_scaling mode={:?} threads={threads} effective={} rows={rows} rows_per_second={rows_per_second:.0} speedup={:.2}",
+            semantics.mode,
+            semantics.effective_parallelism,
+            rows_per_second / baseline
+        );
+    }
+}
+
+#[test]
+#[ignore = "slow H2 release-mode batch-size curve"]
+fn dict_row_batch_curve_reports_throughput_without_changing_defaults() {
+    use std::time::Instant;
+
+    const ROWS: u64 = 1_000_000;
+    for batch_rows in [1_024, 8_192, 65_536] {
+        let bridge = PythonResourceBridge::new(
+            PythonBridgeOptions::new(
+                ResourceId::new("python.batch-curve").unwrap(),
+                PartitionId::new("python-000001").unwrap(),
+            )
+            .with_dict_batch_rows(batch_rows)
+            .unwrap(),
+        );
+        let started = Instant::now();
+        let summary = bridge
+            .visit_json_dict_rows(
+                (0..ROWS).map(|id| serde_json::json!({"id": id, "name": "cdf"})),
+                |_outcome, _kind| Ok(()),
+            )
+            .unwrap();
+        let elapsed = started.elapsed();
+        let rows_per_second = ROWS as f64 / elapsed.as_secs_f64();
+        eprintln!(
+            "h2_dict_curve batch_rows={batch_rows} elapsed_ms={} rows_per_second={rows_per_second:.0} outcomes={} peak_boundary_bytes={}",
+            elapsed.as_millis(),
+            summary.outcome_count,
+            summary.peak_boundary_bytes
+        );
+        assert_eq!(summary.row_count, ROWS);
+        assert!(summary.peak_boundary_bytes <= DEFAULT_MAX_BOUNDARY_BYTES);
+    }
+}
+
+#[test]
+fn native_dict_rows_stringify_keys_like_json_dumps_and_reject_non_json_values() {
+    Python::attach(|py| {
+        let module = PyModule::from_code(
+            py,
+            cr#"
+import enum, functools, json
+
+class Status(enum.IntEnum):
+    OK = 200
+
+keyed = {"b": 1, 200: 5, Status.OK: 6, 1.5: 2, 1e16: 3, False: 4, None: 7, float("nan"): 8}
+keyed_text = json.dumps(keyed)
+u64_max = {"id": 2**64 - 1}
+i64_min = {"id": -2**63}
+past_u64 = {"id": 2**64}
+past_i64 = {"id": -2**63 - 1}
+infinite = {"score": float("inf")}
+nan = {"score": float("nan")}
+deepest = functools.reduce(lambda row, _: {"v": row}, range(127), {"v": 0})
+too_deep = {"v": deepest}
+cycle = []
+cycle.append(cycle)
+cyclic = {"v": cycle}
+tuple_key = {(1, 2): 1}
+set_value = {"v": {1, 2}}
+"#,
+            c"native_dict_conversion.py",
+            c"native_dict_conversion",
+        )
+        .unwrap();
+        let convert =
+            |name: &str| crate::internal::python_dict_to_json_value(&module.getattr(name).unwrap());
+
+        // Non-string keys become the same strings json.dumps wrote for them.
+        let dumped = module
+            .getattr("keyed_text")
+            .unwrap()
+            .extract::<String>()
+            .unwrap();
+        let keyed = convert("keyed").unwrap();
+        assert_eq!(
+            keyed,
+            serde_json::from_str::<serde_json::Value>(&dumped).unwrap()
+        );
+        assert_eq!(
+            keyed.as_object().unwrap().keys().collect::<Vec<_>>(),
+            ["1.5", "1e+16", "200", "NaN", "b", "false", "null"]
+        );
+
+        assert_eq!(
+            convert("u64_max").unwrap()["id"],
+            serde_json::json!(u64::MAX)
+        );
+        assert_eq!(
+            convert("i64_min").unwrap()["id"],
+            serde_json::json!(i64::MIN)
+        );
+        assert!(convert("deepest").is_ok());
+        for name in [
+            "past_u64",
+            "past_i64",
+            "infinite",
+            "nan",
+            "tuple_key",
+            "set_value",
+        ] {
+            let error = convert(name).unwrap_err();
+            assert_eq!(error.kind, ErrorKind::Data, "{name}");
+            assert!(
+                error.message.contains("cannot be encoded as JSON"),
+                "{name}"
+            );
+        }
+        for name in ["too_deep", "cyclic"] {
+            let error = convert(name).unwrap_err();
+            assert_eq!(error.kind, ErrorKind::Data, "{name}");
+            assert!(
+                error.message.contains("deeper than 128 JSON levels"),
+                "{name}"
+            );
+        }
+    });
+}
+
+#[test]
+#[ignore = "slow H2 release-mode dict conversion comparison"]
+fn native_dict_rows_outpace_the_json_text_round_trip() {
+    use std::time::Instant;
+
+    const ROWS: usize = 200_000;
+    Python::attach(|py| {
+        let module = PyModule::from_code(
+            py,
+            c"def rows(count):\n    for value in range(count):\n        yield {'id': value, 'name': 'cdf', 'score': value * 0.5, 'active': value % 2 == 0, 'tags': ['a', 'b']}\n",
+            c"dict_conversion_curve.py",
+            c"dict_conversion_curve",
+        )
+        .unwrap();
+        for batch_rows in [1_024, 8_192, 65_536] {
+            let bridge = PythonResourceBridge::new(
+                PythonBridgeOptions::new(
+                    ResourceId::new("python.dict-conversion").unwrap(),
+                    PartitionId::new("python-000001").unwrap(),
+                )
+                .with_dict_batch_rows(batch_rows)
+                .unwrap(),
+            );
+            let iterable = module.getattr("rows").unwrap().call1((ROWS,)).unwrap();
+            let started = Instant::now();
+            let summary = bridge
+                .visit_python_foreign_iterable(&iterable, |_outcome, _kind| Ok(()))
+                .unwrap();
+            let native = started.elapsed();
+            assert_eq!(summary.row_count, ROWS as u64);
+
+            let iterable = module.getattr("rows").unwrap().call1((ROWS,)).unwrap();
+            let started = Instant::now();
+            let mut json_rows = 0;
+            let mut window = Vec::new();
+            let mut rows_in_window = 0;
+            let mut decode_window = |window: &mut Vec<u8>, rows: usize| {
+                let (schema, _) = arrow_json::reader::infer_json_schema(
+                    Cursor::new(window.as_slice()),
+                    Some(rows),
+                )
+                .unwrap();
+                let reader = arrow_json::ReaderBuilder::new(Arc::new(schema))
+                    .with_batch_size(rows)
+                    .build(Cursor::new(window.as_slice()))
+                    .unwrap();
+                for batch in reader {
+                    json_rows += batch.unwrap().num_rows();
+                }
+                window.clear();
+            };
+            for item in iterable.try_iter().unwrap() {
+                let row = crate::internal::python_dict_to_json(py, &item.unwrap()).unwrap();
+                window.extend_from_slice(row.as_bytes());
+                window.push(b'\n');
+                rows_in_window += 1;
+                if rows_in_window == batch_rows {
+                    decode_window(&mut window, rows_in_window);
+                    rows_in_window = 0;
+                }
+            }
+            if rows_in_window > 0 {
+                decode_window(&mut window, rows_in_window);
+            }
+            let json_text = started.elapsed();
+            assert_eq!(json_rows, ROWS);
+
+            eprintln!(
+                "h2_dict_conversion batch_rows={batch_rows} native_ms={} json_text_ms={} speedup={:.2} peak_boundary_bytes={}",
+                native.as_millis(),
+                json_text.as_millis(),
+                json_text.as_secs_f64() / native.as_secs_f64(),
+                summary.peak_boundary_bytes
+            );
+            assert!(summary.peak_boundary_bytes <= DEFAULT_MAX_BOUNDARY_BYTES);
+        }
+    });
+}
+
+#[test]
+fn interpreter_report_checks_version_path_and_gil_state() {
+    Python::attach(|py| {
+        let report = inspect_interpreter(py).unwrap();
+        InterpreterRequirement::default().check(&report).unwrap();
+        InterpreterRequirement {
+            executable: Some(report.executable.clone()),
+            ..InterpreterRequirement::default()
+        }
+        .check(&report)
+        .unwrap();
+
+        let error = InterpreterRequirement {
+            min_major: 99,
+            ..InterpreterRequirement::default()
+        }
+        .check(&report)
+        .unwrap_err();
+        assert_eq!(error.kind, ErrorKind::Contract);
+    });
+}
+
+#[test]
+fn admitted_python_work_is_mode_correct_and_fixture_hash_stable() {
+    let read = collect_json_rows(
+        &bridge(),
+        vec![
+            serde_json::json!({"id": 1, "name": "ada"}),
+            serde_json::json!({"id": 2, "name": "grace"}),
+        ],
+    )
+    .unwrap();
+    let report = attached_interpreter_report().unwrap();
+    let project = TestPythonProject::new(2);
+    let mut registry = cdf_runtime::SourceRegistry::new();
+    registry
+        .register(PythonSourceDriver::new().unwrap())
+        .unwrap();
+    let project_options = python_project_options(&report, 4_096, 1024 * 1024);
+    let plan = compile_reference_plan(&registry, &project, project_options.clone());
+    assert_eq!(plan.physical_plan["dict_batch_rows"], 4_096);
+    assert_eq!(plan.physical_plan["max_boundary_bytes"], 1024 * 1024);
+    let (host, execution) =
+        cdf_engine::StandaloneExecutionHost::default_services(64 * 1024 * 1024).unwrap();
+    let unbound_error = cdf_runtime::resolve_runtime_scheduler(
+        1,
+        &plan.execution_capabilities,
+        &cdf_runtime::DestinationRuntimeCapabilities::default(),
+        &execution,
+        None,
+    )
+    .unwrap_err();
+    assert!(
+        unbound_error
+            .message
+            .contains("requires source resolution against the execution host")
+    );
+    let context = cdf_runtime::SourceResolutionContext::new(
+        &project.root,
+        Arc::new(NoopSecretProvider),
+        &execution,
+        Arc::new(EgressAllowlist::allow_any()),
+    )
+    .with_driver_options(BTreeMap::from([("python".to_owned(), project_options)]));
+    let resource = registry.resolve(&plan, &context).unwrap();
+    let lane = execution
+        .capabilities()
+        .blocking_lanes
+        .into_iter()
+        .find(|lane| lane.lane_id == "python.source")
+        .expect("registry resolution installs the runtime-resolved Python lane");
+    let requested_parallelism = usize::from(execution.capabilities().logical_cpu_slots);
+    let semantics = execution_semantics(&report, requested_parallelism);
+    assert_eq!(
+        lane.maximum_concurrency,
+        u16::try_from(semantics.effective_parallelism).unwrap()
+    );
+    let scheduler = cdf_runtime::resolve_runtime_scheduler(
+        1,
+        &plan.execution_capabilities,
+        &cdf_runtime::DestinationRuntimeCapabilities::default(),
+        &execution,
+        None,
+    )
+    .unwrap();
+    assert_eq!(
+        scheduler.source_lane_concurrency,
+        Some(lane.maximum_concurrency)
     );
     assert_eq!(scheduler.effective_jobs.jobs, 1);
 
@@ -1315,10 +3414,13 @@ fn context_uses_http_secret_redaction_for_logs_and_traces() {
         }
     }
 
-    let mut ctx = PythonContext::new(Some(SourcePosition::PageToken(PageToken {
-        version: cdf_kernel::SOURCE_POSITION_VERSION,
-        token: "cursor-1".to_owned(),
-    })));
+    let mut ctx = PythonContext::new(
+        Some(SourcePosition::PageToken(PageToken {
+            version: cdf_kernel::SOURCE_POSITION_VERSION,
+            token: "cursor-1".to_owned(),
+        })),
+        unaccounted_log_ring(),
+    );
     let uri = SecretUri::new("secret://env/GITHUB_TOKEN").unwrap();
     let request = ctx
         .resolve_bearer_request(
@@ -1338,6 +3440,293 @@ fn context_uses_http_secret_redaction_for_logs_and_traces() {
         .unwrap();
 }
 
+fn unaccounted_log_ring() -> ContextLogRing {
+    ContextLogRing::new(DEFAULT_CONTEXT_LOG_BYTES, ContextLogPolicy::default()).unwrap()
+}
+
+#[test]
+fn context_caches_prefetched_secrets_across_paged_requests() {
+    struct Counting(AtomicUsize);
+
+    impl SecretProvider for Counting {
+        fn resolve(&self, _uri: &SecretUri) -> Result<SecretValue> {
+            self.0.fetch_add(1, Ordering::SeqCst);
+            Ok(SecretValue::new("paged-secret-token"))
+        }
+    }
+
+    let provider = Counting(AtomicUsize::new(0));
+    let uri = SecretUri::new("secret://env/PAGED_TOKEN").unwrap();
+    let mut ctx = PythonContext::new(None, unaccounted_log_ring())
+        .with_secret_cache(cdf_http::SecretCache::new(60_000, 4).unwrap());
+    ctx.prefetch_secrets([&uri], &provider).unwrap();
+    assert_eq!(provider.0.load(Ordering::SeqCst), 1);
+
+    for page in 0..1_000 {
+        let request = ctx
+            .resolve_bearer_request(
+                HttpRequest::new(
+                    HttpMethod::Get,
+                    format!("https://api.example.test/issues?page={page}"),
+                ),
+                &uri,
+                &provider,
+            )
+            .unwrap();
+        assert_eq!(
+            request.headers.get("authorization").unwrap(),
+            "Bearer paged-secret-token"
+        );
+    }
+    assert_eq!(provider.0.load(Ordering::SeqCst), 1);
+    ctx.log("info", "page fetched with paged-secret-token");
+    assert_eq!(ctx.logs()[0].message, "page fetched with [REDACTED]");
+}
+
+#[test]
+fn context_reresolves_a_rejected_bearer_token_once() {
+    struct Rotating(AtomicUsize);
+
+    impl SecretProvider for Rotating {
+        fn resolve(&self, _uri: &SecretUri) -> Result<SecretValue> {
+            let resolved = self.0.fetch_add(1, Ordering::SeqCst);
+            Ok(SecretValue::new(if resolved == 0 {
+                "stale-secret-token"
+            } else {
+                "rotated-secret-token"
+            }))
+        }
+    }
+
+    struct Stale(AtomicUsize);
+
+    impl SecretProvider for Stale {
+        fn resolve(&self, _uri: &SecretUri) -> Result<SecretValue> {
+            self.0.fetch_add(1, Ordering::SeqCst);
+            Ok(SecretValue::new("stale-secret-token"))
+        }
+    }
+
+    #[derive(Default)]
+    struct RotatedOnly(AtomicUsize);
+
+    impl cdf_http::HttpTransport for RotatedOnly {
+        fn send(
+            &self,
+            request: HttpRequest,
+            _budget: cdf_http::HttpResponseBudget,
+        ) -> cdf_kernel::BoxFuture<'_, Result<cdf_http::HttpResponse>> {
+            self.0.fetch_add(1, Ordering::SeqCst);
+            let status = match request.headers.get("authorization").map(String::as_str) {
+                Some("Bearer rotated-secret-token") => 200,
+                _ => 401,
+            };
+            Box::pin(async move { Ok(cdf_http::HttpResponse::new(status)) })
+        }
+    }
+
+    let (host, execution) = cdf_engine::StandaloneExecutionHost::default_services(1 << 20).unwrap();
+    let budget =
+        cdf_http::HttpResponseBudget::new(1 << 16, execution.memory(), Arc::new(|| Ok(())))
+            .unwrap();
+    let allowlist = EgressAllowlist::from_hosts(["api.example.test"]);
+    let uri = SecretUri::new("secret://env/ROTATED_TOKEN").unwrap();
+    let request = || HttpRequest::new(HttpMethod::Get, "https://api.example.test/issues");
+
+    let transport = RotatedOnly::default();
+    let provider = Rotating(AtomicUsize::new(0));
+    let mut ctx = PythonContext::new(None, unaccounted_log_ring());
+    ctx.prefetch_secrets([&uri], &provider).unwrap();
+    let response = host
+        .block_on_root(ctx.send_bearer(&transport, &allowlist, request(), &uri, &provider, &budget))
+        .unwrap();
+    assert_eq!(response.status, 200);
+    assert_eq!(provider.0.load(Ordering::SeqCst), 2);
+    assert_eq!(transport.0.load(Ordering::SeqCst), 2);
+    assert_eq!(
+        ctx.traces()
+            .iter()
+            .map(|trace| (trace.status, trace.error_kind.clone()))
+            .collect::<Vec<_>>(),
+        vec![(Some(401), Some(ErrorKind::Auth)), (Some(200), None)]
+    );
+    assert!(
+        ctx.traces()
+            .iter()
+            .all(|trace| trace.headers.get("authorization").unwrap() == "[REDACTED]")
+    );
+
+    // The refreshed token stays cached, so the next request reaches the provider no more.
+    host.block_on_root(ctx.send_bearer(
+        &transport,
+        &allowlist,
+        request(),
+        &uri,
+        &provider,
+        &budget,
+    ))
+    .unwrap();
+    assert_eq!(provider.0.load(Ordering::SeqCst), 2);
+    assert_eq!(transport.0.load(Ordering::SeqCst), 3);
+
+    // A credential the server still rejects after one refresh is returned, not retried again.
+    let transport = RotatedOnly::default();
+    let provider = Stale(AtomicUsize::new(0));
+    let mut ctx = PythonContext::new(None, unaccounted_log_ring());
+    let response = host
+        .block_on_root(ctx.send_bearer(&transport, &allowlist, request(), &uri, &provider, &budget))
+        .unwrap();
+    assert_eq!(response.status, 401);
+    assert_eq!(provider.0.load(Ordering::SeqCst), 2);
+    assert_eq!(transport.0.load(Ordering::SeqCst), 2);
+}
+
+#[test]
+fn context_log_ring_is_bounded_filtered_and_rate_limited() {
+    let (host, execution) = cdf_engine::StandaloneExecutionHost::default_services(1 << 20).unwrap();
+    let policy = ContextLogPolicy {
+        min_level: ContextLogLevel::Info,
+        messages_per_minute: Some(5),
+    };
+    let ring = host
+        .block_on_root(ContextLogRing::reserve(execution.memory(), 64, policy))
+        .unwrap();
+    assert_eq!(ring.reserved_bytes(), 64);
+    let mut ctx = PythonContext::new(None, ring);
+
+    ctx.log("debug", "noisy detail");
+    for page in 0..6 {
+        ctx.log("info", format!("fetched page {page:02} of 10"));
+    }
+
+    let evidence = ctx.log_evidence();
+    let messages = evidence
+        .events
+        .iter()
+        .map(|event| event.message.as_str())
+        .collect::<Vec<_>>();
+    assert_eq!(messages, ["fetched page 03 of 10", "fetched page 04 of 10"]);
+    assert_eq!(
+        evidence.counts,
+        ContextLogCounts {
+            kept: 5,
+            below_level: 1,
+            rate_limited: 1,
+            evicted: 3,
+        }
+    );
+    assert!(ContextLogRing::new(0, ContextLogPolicy::default()).is_err());
+}
+
+#[test]
+fn context_get_many_bounds_in_flight_requests_and_keeps_response_order() {
+    struct Pending(usize);
+
+    impl std::future::Future for Pending {
+        type Output = ();
+
+        fn poll(
+            mut self: std::pin::Pin<&mut Self>,
+            context: &mut std::task::Context<'_>,
+        ) -> std::task::Poll<()> {
+            if self.0 == 0 {
+                return std::task::Poll::Ready(());
+            }
+            self.0 -= 1;
+            context.waker().wake_by_ref();
+            std::task::Poll::Pending
+        }
+    }
+
+    #[derive(Default)]
+    struct PagesTransport {
+        active: AtomicUsize,
+        peak: AtomicUsize,
+    }
+
+    impl cdf_http::HttpTransport for PagesTransport {
+        fn send(
+            &self,
+            request: HttpRequest,
+            _budget: cdf_http::HttpResponseBudget,
+        ) -> cdf_kernel::BoxFuture<'_, Result<cdf_http::HttpResponse>> {
+            Box::pin(async move {
+                let current = self.active.fetch_add(1, Ordering::SeqCst) + 1;
+                self.peak.fetch_max(current, Ordering::SeqCst);
+                let page = request
+                    .url
+                    .rsplit('=')
+                    .next()
+                    .unwrap()
+                    .parse::<usize>()
+                    .unwrap();
+                if page == 4 {
+                    self.active.fetch_sub(1, Ordering::SeqCst);
+                    return Err(CdfError::transient("page 4 unavailable"));
+                }
+                Pending(8 - page).await;
+                self.active.fetch_sub(1, Ordering::SeqCst);
+                Ok(cdf_http::HttpResponse::new(200).with_header("x-page", page.to_string()))
+            })
+        }
+    }
+
+    let (host, execution) = cdf_engine::StandaloneExecutionHost::default_services(1 << 20).unwrap();
+    let budget =
+        cdf_http::HttpResponseBudget::new(1 << 16, execution.memory(), Arc::new(|| Ok(())))
+            .unwrap();
+    let transport = PagesTransport::default();
+    let allowlist = EgressAllowlist::from_hosts(["api.example.test"]);
+    let pages = |range: std::ops::Range<usize>| {
+        range
+            .map(|page| {
+                HttpRequest::new(
+                    HttpMethod::Get,
+                    format!("https://api.example.test/issues?token=super-secret-token&page={page}"),
+                )
+            })
+            .collect::<Vec<_>>()
+    };
+    let mut ctx = PythonContext::new(None, unaccounted_log_ring());
+
+    let responses = host
+        .block_on_root(ctx.get_many(&transport, &allowlist, pages(0..4), &budget, 2))
+        .unwrap();
+    let order = responses
+        .iter()
+        .map(|response| response.headers.get("x-page").unwrap().as_str())
+        .collect::<Vec<_>>();
+    assert_eq!(order, ["0", "1", "2", "3"]);
+    assert_eq!(transport.peak.load(Ordering::SeqCst), 2);
+    assert_eq!(ctx.traces().len(), 4);
+    assert!(
+        ctx.traces()
+            .iter()
+            .all(|trace| trace.status == Some(200) && !trace.url.contains("super-secret-token"))
+    );
+
+    let error = host
+        .block_on_root(ctx.get_many(&transport, &allowlist, pages(3..6), &budget, 3))
+        .unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Transient);
+    assert_eq!(ctx.traces().len(), 6);
+    assert_eq!(ctx.traces()[5].error_kind, Some(ErrorKind::Transient));
+
+    let error = host
+        .block_on_root(ctx.get_many(
+            &transport,
+            &allowlist,
+            vec![HttpRequest::new(
+                HttpMethod::Post,
+                "https://api.example.test/issues",
+            )],
+            &budget,
+            2,
+        ))
+        .unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Contract);
+}
+
 #[test]
 fn python_dict_rows_reject_non_json_values() {
     Python::attach(|py| {
@@ -1358,6 +3747,93 @@ fn python_dict_rows_reject_non_json_values() {
     });
 }
 
+#[test]
+fn sdk_column_batches_convert_in_one_bridge_call() {
+    Python::attach(|py| {
+        let sdk_root = PathBuf::from(env!("CARGO_MANIFEST_DIR"))
+            .parent()
+            .unwrap()
+            .parent()
+            .unwrap()
+            .join("python");
+        let source = format!(
+            r#"
+import array
+import sys
+sys.path.insert(0, {sdk_root:?})
+from cdf_sdk import ColumnBatch
+
+def rows():
+    yield {{"id": 0, "score": 0.0, "name": "first", "active": False}}
+    yield ColumnBatch(
+        {{
+            "id": array.array("q", [1, 2, 3]),
+            "score": [0.5, None, 2],
+            "name": ["ada", "grace", None],
+            "active": [True, False, True],
+        }},
+        schema={{"name": "utf8"}},
+    )
+    yield ColumnBatch({{"id": []}})
+
+def text_columns():
+    rejected = []
+    for values in ("ada", b"ada", bytearray(b"ada")):
+        try:
+            ColumnBatch({{"name": values}})
+        except TypeError:
+            rejected.append(type(values).__name__)
+    return rejected
+"#
+        );
+        let source = CString::new(source).unwrap();
+        let module =
+            PyModule::from_code(py, &source, c"column_batches.py", c"column_batches").unwrap();
+        let iterable = module.getattr("rows").unwrap().call0().unwrap();
+        let read = collect_python_iterable(&bridge(), &iterable).unwrap();
+
+        assert_eq!(read.summary.row_count, 4);
+        assert_eq!(read.summary.column_batch_outcomes, 1);
+        assert_eq!(
+            read.yield_kinds,
+            vec![PythonYieldKind::DictRows, PythonYieldKind::ColumnBatch]
+        );
+        let columns = read.batches[1].record_batch().unwrap();
+        let schema = columns.schema();
+        assert_eq!(schema.field(0).data_type(), &DataType::Int64);
+        assert_eq!(schema.field(1).data_type(), &DataType::Float64);
+        assert_eq!(schema.field(2).data_type(), &DataType::Utf8);
+        assert_eq!(schema.field(3).data_type(), &DataType::Boolean);
+        assert_eq!(columns.column(1).null_count(), 1);
+        assert_eq!(columns.column(2).null_count(), 1);
+
+        // A string is a sequence of characters, not a column of values.
+        let rejected = module
+            .getattr("text_columns")
+            .unwrap()
+            .call0()
+            .unwrap()
+            .extract::<Vec<String>>()
+            .unwrap();
+        assert_eq!(rejected, ["str", "bytes", "bytearray"]);
+
+        let module = PyModule::from_code(
+            py,
+            c"class Columns:\n    def __cdf_columns__(self):\n        return ((('id', 'int64', True),), (['secret://vault/token'],))\n\ndef rows():\n    yield Columns()\n",
+            c"column_mismatch.py",
+            c"column_mismatch",
+        )
+        .unwrap();
+        let iterable = module.getattr("rows").unwrap().call0().unwrap();
+        let error = bridge()
+            .visit_python_foreign_iterable(&iterable, |_outcome, _kind| Ok(()))
+            .unwrap_err();
+        assert_eq!(error.kind, ErrorKind::Data);
+        assert!(error.message.contains("column `id`"), "{}", error.message);
+        assert!(!error.message.contains("secret://"));
+    });
+}
+
 #[test]
 fn python_lists_are_not_silently_treated_as_rows() {
     Python::attach(|py| {
@@ -1422,15 +3898,201 @@ fn schema_variance_crosses_python_as_distinct_physical_observations() {
     )
     .unwrap();
 
-    assert_eq!(read.summary.outcome_count, 2);
-    assert_ne!(
-        read.batches[0].header.observed_schema_hash,
-        read.batches[1].header.observed_schema_hash
-    );
-    assert_eq!(
-        read.summary.first_schema_hash(),
-        Some(&read.batches[0].header.observed_schema_hash)
-    );
+    assert_eq!(read.summary.outcome_count, 2);
+    assert_ne!(
+        read.batches[0].header.observed_schema_hash,
+        read.batches[1].header.observed_schema_hash
+    );
+    assert_eq!(
+        read.summary.first_schema_hash(),
+        Some(&read.batches[0].header.observed_schema_hash)
+    );
+}
+
+#[test]
+fn inferred_dict_schema_is_cached_and_widened_across_windows() {
+    let bridge = PythonResourceBridge::new(
+        PythonBridgeOptions::new(
+            ResourceId::new("orders").unwrap(),
+            PartitionId::new("p0").unwrap(),
+        )
+        .with_dict_batch_rows(1)
+        .unwrap(),
+    );
+    let read = collect_json_rows(
+        &bridge,
+        [
+            serde_json::json!({"id": 1}),
+            serde_json::json!({"id": 2}),
+            serde_json::json!({"id": 3.5}),
+            serde_json::json!({"id": 4, "name": null}),
+            serde_json::json!({"id": 5, "name": "grace"}),
+            serde_json::json!({"id": 6}),
+        ],
+    )
+    .unwrap();
+
+    assert_eq!(read.summary.outcome_count, 6);
+    assert_eq!(read.summary.dict_schema_cache_hits, 2);
+    assert_eq!(read.summary.dict_schema_widenings, 3);
+    let hashes = read
+        .batches
+        .iter()
+        .map(|batch| batch.header.observed_schema_hash.clone())
+        .collect::<Vec<_>>();
+    assert_eq!(hashes[0], hashes[1]);
+    assert_ne!(hashes[1], hashes[2]);
+    assert_eq!(hashes[4], hashes[5]);
+    let widened = read.batches[5].record_batch().unwrap().schema();
+    assert_eq!(widened.field(0).name(), "id");
+    assert_eq!(widened.field(0).data_type(), &DataType::Float64);
+    assert_eq!(widened.field(1).data_type(), &DataType::Utf8);
+}
+
+#[test]
+fn inferred_dict_windows_fill_projected_columns_no_row_set_with_nulls() {
+    let bridge = PythonResourceBridge::new(
+        PythonBridgeOptions::new(
+            ResourceId::new("orders").unwrap(),
+            PartitionId::new("p0").unwrap(),
+        )
+        .with_dict_batch_rows(1)
+        .unwrap()
+        .with_projection(vec!["name".to_owned(), "id".to_owned()])
+        .unwrap(),
+    );
+    let read = collect_json_rows(
+        &bridge,
+        [
+            serde_json::json!({"id": 1, "note": "dropped"}),
+            serde_json::json!({"id": 2, "name": "grace"}),
+        ],
+    )
+    .unwrap();
+
+    let first = read.batches[0].record_batch().unwrap();
+    assert_eq!(
+        first
+            .schema()
+            .fields()
+            .iter()
+            .map(|field| (field.name().as_str(), field.data_type().clone()))
+            .collect::<Vec<_>>(),
+        vec![("name", DataType::Null), ("id", DataType::Int64)]
+    );
+    assert_eq!(first.column(0).len(), 1);
+    let second = read.batches[1].record_batch().unwrap();
+    assert_eq!(second.schema().field(0).data_type(), &DataType::Utf8);
+}
+
+#[test]
+fn inferred_dict_schema_keeps_cached_columns_when_a_window_changes_a_type() {
+    let bridge = PythonResourceBridge::new(
+        PythonBridgeOptions::new(
+            ResourceId::new("orders").unwrap(),
+            PartitionId::new("p0").unwrap(),
+        )
+        .with_dict_batch_rows(1)
+        .unwrap(),
+    );
+    let read = collect_json_rows(
+        &bridge,
+        [
+            serde_json::json!({"id": 1, "name": "ada"}),
+            serde_json::json!({"id": "b-2"}),
+            serde_json::json!({"id": "c-3", "name": "grace"}),
+        ],
+    )
+    .unwrap();
+
+    // The conflicting `id` takes the window's type, but `name` does not vanish with it, and
+    // the next window fits the cache without re-inference.
+    let changed = read.batches[1].record_batch().unwrap();
+    let schema = changed.schema();
+    assert_eq!(
+        schema
+            .fields()
+            .iter()
+            .map(|field| (field.name().as_str(), field.data_type().clone()))
+            .collect::<Vec<_>>(),
+        vec![("id", DataType::Utf8), ("name", DataType::Utf8)]
+    );
+    assert!(changed.column(1).is_null(0));
+    assert_eq!(
+        read.batches[1].header.observed_schema_hash,
+        read.batches[2].header.observed_schema_hash
+    );
+    assert_eq!(read.summary.dict_schema_widenings, 1);
+    assert_eq!(read.summary.dict_schema_cache_hits, 1);
+}
+
+fn declared_bridge() -> PythonResourceBridge {
+    let schema = Arc::new(Schema::new(vec![
+        Field::new("id", DataType::Int64, false),
+        Field::new("name", DataType::Utf8, true),
+    ]));
+    PythonResourceBridge::new(
+        PythonBridgeOptions::new(
+            ResourceId::new("orders").unwrap(),
+            PartitionId::new("p0").unwrap(),
+        )
+        .with_dict_batch_rows(1)
+        .unwrap()
+        .with_declared_schema(schema)
+        .unwrap(),
+    )
+}
+
+#[test]
+fn declared_schema_decodes_every_window_without_schema_drift() {
+    let bridge = declared_bridge();
+    let declared_hash = cdf_kernel::canonical_arrow_schema_hash(
+        bridge.options().declared_schema.as_deref().unwrap(),
+    )
+    .unwrap();
+    let read = collect_json_rows(
+        &bridge,
+        [
+            serde_json::json!({"id": 1}),
+            serde_json::json!({"id": 2, "name": "grace"}),
+            serde_json::json!({"id": 3, "name": null}),
+        ],
+    )
+    .unwrap();
+
+    assert_eq!(read.summary.outcome_count, 3);
+    for batch in &read.batches {
+        assert_eq!(batch.header.observed_schema_hash, declared_hash);
+    }
+}
+
+#[test]
+fn declared_schema_mismatches_name_the_field_but_not_the_value() {
+    let error = declared_bridge()
+        .visit_json_dict_rows(
+            [serde_json::json!({"id": "secret://vault/token"})],
+            |_outcome, _kind| Ok(()),
+        )
+        .unwrap_err();
+    assert_eq!(error.kind, ErrorKind::Data);
+    assert!(error.message.contains("field `id`"), "{}", error.message);
+    assert!(!error.message.contains("secret://"));
+
+    let error = declared_bridge()
+        .visit_json_dict_rows(
+            [serde_json::json!({"id": 1, "secret://vault/token": true})],
+            |_outcome, _kind| Ok(()),
+        )
+        .unwrap_err();
+    assert!(error.message.contains("declared schema does not name"));
+    assert!(!error.message.contains("secret://"));
+
+    let error = declared_bridge()
+        .visit_json_dict_rows([serde_json::json!({"name": "ada"})], |_outcome, _kind| {
+            Ok(())
+        })
+        .unwrap_err();
+    assert!(error.message.contains("non-nullable field `id`"));
 }
 
 #[test]
@@ -1656,6 +4318,274 @@ def crm():
     });
 }
 
+#[test]
+fn dlt_sources_fan_out_their_resources_across_threads() {
+    Python::attach(|py| {
+        let module = PyModule::from_code(
+            py,
+            c"
+import time
+
+def endpoint(name, ids):
+    def read():
+        time.sleep(0.2)
+        for id in ids:
+            yield {'id': id}
+    read.__cdf_dlt_metadata__ = {'kind': 'resource', 'name': name, 'selected': True}
+    return read
+
+def skipped():
+    raise RuntimeError('unselected resource executed')
+
+skipped.__cdf_dlt_metadata__ = {'kind': 'resource', 'name': 'skipped', 'selected': False}
+
+def crm():
+    return [endpoint('users', [1, 2]), skipped, endpoint('orders', [3]), endpoint('events', [4, 5, 6])]
+
+crm.__cdf_dlt_metadata__ = {'kind': 'source', 'name': 'crm'}
+",
+            c"dlt_fan_out_fixture.py",
+            c"dlt_fan_out_fixture",
+        )
+        .unwrap();
+        let source = module.getattr("crm").unwrap();
+        let members = expand_dlt_source(&source).unwrap();
+        assert_eq!(
+            members
+                .iter()
+                .map(|member| member.metadata.name.as_deref().unwrap())
+                .collect::<Vec<_>>(),
+            vec!["users", "orders", "events"]
+        );
+
+        let emitted = std::sync::Mutex::new(BTreeMap::<String, u64>::new());
+        let started = std::time::Instant::now();
+        let concurrent = bridge()
+            .visit_dlt_source_concurrently(
+                &source,
+                std::num::NonZeroUsize::new(3).unwrap(),
+                |metadata| {
+                    let name = metadata.name.clone().unwrap();
+                    let emitted = &emitted;
+                    move |outcome: cdf_foreign_stream::ForeignBatchOutcome,
+                          _kind: PythonYieldKind|
+                          -> Result<()> {
+                        *emitted.lock().unwrap().entry(name.clone()).or_default() +=
+                            outcome.batch.header.row_count;
+                        Ok(())
+                    }
+                },
+            )
+            .unwrap();
+        // Three 200 ms endpoints overlap instead of running back to back.
+        assert!(started.elapsed() < std::time::Duration::from_millis(500));
+        assert_eq!(
+            emitted.into_inner().unwrap(),
+            BTreeMap::from([
+                ("events".to_owned(), 3),
+                ("orders".to_owned(), 1),
+                ("users".to_owned(), 2),
+            ])
+        );
+
+        let sequential = bridge()
+            .visit_dlt_source(&source, |_metadata, _outcome, _kind| Ok(()))
+            .unwrap();
+        let shape = |reads: &[DltBridgeSummary]| {
+            reads
+                .iter()
+                .map(|read| {
+                    (
+                        read.stream
+                            .descriptor()
+                            .unwrap()
+                            .resource_id
+                            .as_str()
+                            .to_owned(),
+                        read.metadata.source_name.clone(),
+                        read.stream.row_count,
+                        read.stream.outcome_count,
+                    )
+                })
+                .collect::<Vec<_>>()
+        };
+        assert_eq!(shape(&concurrent), shape(&sequential));
+        assert_eq!(concurrent[0].metadata.source_name.as_deref(), Some("crm"));
+    });
+}
+
+#[test]
+fn dlt_incremental_windows_skip_rows_and_stop_ordered_resources() {
+    Python::attach(|py| {
+        let module = PyModule::from_code(
+            py,
+            c"
+def metadata(row_order):
+    return {
+        'kind': 'resource',
+        'name': 'events',
+        'incremental': {
+            'cursor_path': 'meta.seq',
+            'initial_value': 2,
+            'end_value': 5,
+            'row_order': row_order,
+        },
+        'selected': True,
+    }
+
+def ascending():
+    for seq in range(8):
+        yield {'id': seq, 'meta': {'seq': seq}}
+    raise RuntimeError('ascending resource pulled past end_value')
+
+def descending():
+    for seq in reversed(range(8)):
+        yield {'id': seq, 'meta': {'seq': seq}}
+    raise RuntimeError('descending resource pulled past start')
+
+def unordered():
+    for seq in (6, 1, 3, 9, 4):
+        yield {'id': seq, 'meta': {'seq': seq}}
+
+def mistyped():
+    yield {'id': 0, 'meta': {'seq': 'acct-7731-private'}}
+
+ascending.__cdf_dlt_metadata__ = metadata('asc')
+descending.__cdf_dlt_metadata__ = metadata('desc')
+unordered.__cdf_dlt_metadata__ = metadata(None)
+mistyped.__cdf_dlt_metadata__ = metadata(None)
+",
+            c"dlt_incremental_fixture.py",
+            c"dlt_incremental_fixture",
+        )
+        .unwrap();
+
+        let ascending = bridge()
+            .visit_dlt_resource(&module.getattr("ascending").unwrap(), |_outcome, _kind| {
+                Ok(())
+            })
+            .unwrap();
+        assert_eq!(ascending.stream.row_count, 3);
+        assert_eq!(ascending.stream.cursor_skipped_rows, 2);
+        assert!(ascending.stream.cursor_bound_reached);
+
+        let descending = bridge()
+            .visit_dlt_resource(&module.getattr("descending").unwrap(), |_outcome, _kind| {
+                Ok(())
+            })
+            .unwrap();
+        assert_eq!(descending.stream.row_count, 3);
+        assert_eq!(descending.stream.cursor_skipped_rows, 3);
+        assert!(descending.stream.cursor_bound_reached);
+
+        let unordered = bridge()
+            .visit_dlt_resource(&module.getattr("unordered").unwrap(), |_outcome, _kind| {
+                Ok(())
+            })
+            .unwrap();
+        assert_eq!(unordered.stream.row_count, 2);
+        assert_eq!(unordered.stream.cursor_skipped_rows, 3);
+        assert!(!unordered.stream.cursor_bound_reached);
+
+        // A committed cursor supersedes the hint's initial value.
+        let resumed = bridge()
+            .visit_dlt_resource_after(
+                &module.getattr("ascending").unwrap(),
+                Some(&serde_json::json!(4)),
+                |_outcome, _kind| Ok(()),
+            )
+            .unwrap();
+        assert_eq!(resumed.stream.row_count, 1);
+        assert_eq!(resumed.stream.cursor_skipped_rows, 4);
+        assert!(resumed.stream.cursor_bound_reached);
+
+        // A cursor of the wrong kind names the path and both kinds, never the row's value.
+        let mistyped = bridge()
+            .visit_dlt_resource(&module.getattr("mistyped").unwrap(), |_outcome, _kind| {
+                Ok(())
+            })
+            .unwrap_err();
+        assert_eq!(mistyped.kind, ErrorKind::Data);
+        assert!(
+            mistyped
+                .message
+                .contains("cursor `meta.seq` is a string and is not comparable with its number")
+        );
+        assert!(!mistyped.message.contains("acct-7731"));
+    });
+}
+
+#[test]
+fn dlt_incremental_windows_keep_late_rows_inside_the_lag_band() {
+    Python::attach(|py| {
+        let module = PyModule::from_code(
+            py,
+            c"
+def metadata(name, initial_value, lag_tolerance_ms):
+    return {
+        'kind': 'resource',
+        'name': name,
+        'incremental': {
+            'cursor_path': 'seq',
+            'initial_value': initial_value,
+            'lag_tolerance_ms': lag_tolerance_ms,
+        },
+        'selected': True,
+    }
+
+def rows():
+    for seq in (5, 6, 3, 0, 7):
+        yield {'id': seq, 'seq': seq}
+
+def lagged():
+    yield from rows()
+
+def strict():
+    yield from rows()
+
+lagged.__cdf_dlt_metadata__ = metadata('lagged', '1', 5000)
+strict.__cdf_dlt_metadata__ = metadata('strict', '4', 0)
+",
+            c"dlt_lag_fixture.py",
+            c"dlt_lag_fixture",
+        )
+        .unwrap();
+
+        // Row 3 arrives after the committed cursor 5 but inside the lag band, so it is kept;
+        // row 0 is still below the string `initial_value`, compared numerically.
+        let lagged = bridge()
+            .visit_dlt_resource_after(
+                &module.getattr("lagged").unwrap(),
+                Some(&serde_json::json!(5)),
+                |_outcome, _kind| Ok(()),
+            )
+            .unwrap();
+        assert_eq!(lagged.stream.row_count, 4);
+        assert_eq!(lagged.stream.cursor_skipped_rows, 1);
+
+        let strict = bridge()
+            .visit_dlt_resource_after(
+                &module.getattr("strict").unwrap(),
+                Some(&serde_json::json!(5)),
+                |_outcome, _kind| Ok(()),
+            )
+            .unwrap();
+        assert_eq!(strict.stream.row_count, 3);
+        assert_eq!(strict.stream.cursor_skipped_rows, 2);
+    });
+
+    let window = CursorWindow::new("seq", Some(serde_json::json!("soon")), None, None)
+        .unwrap()
+        .unwrap();
+    Python::attach(|py| {
+        let row = pyo3::types::PyDict::new(py);
+        row.set_item("seq", 3).unwrap();
+        let error = window.classify(row.as_any()).unwrap_err();
+        assert_eq!(error.kind, ErrorKind::Data);
+        assert!(error.message.contains("both be numbers or both be strings"));
+    });
+}
+
 #[test]
 fn dlt_current_state_view_reads_committed_checkpoint_heads() {
     let pipeline_id = PipelineId::new("pipeline").unwrap();
@@ -1714,6 +4644,318 @@ fn dlt_current_state_view_reads_committed_checkpoint_heads() {
     assert!(view.note.contains("committed CDF checkpoint heads"));
 }
 
+#[test]
+fn dlt_state_sessions_hydrate_from_heads_and_flush_keyed_deltas() {
+    Python::attach(|py| {
+        let sdk_root = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
+            .parent()
+            .unwrap()
+            .parent()
+            .unwrap()
+            .join("python");
+        let source = format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+from cdf_sdk import dlt
+
+@dlt.resource(name="events", incremental=dlt.incremental("seq", row_order="asc"))
+def events():
+    state = dlt.current.resource_state()
+    for seq in range(6):
+        yield {{"seq": seq}}
+        if seq > state["last_value"]:
+            state["last_value"] = seq
+    dlt.current.source_state()["finished"] = True
+
+dlt.bind_source(events, "crm")
+"#,
+            sdk_root = sdk_root.display()
+        );
+        let source = CString::new(source).unwrap();
+        let module =
+            PyModule::from_code(py, &source, c"dlt_state_fixture.py", c"dlt_state_fixture")
+                .unwrap();
+
+        let pipeline_id = PipelineId::new("pipeline").unwrap();
+        let resource_id = ResourceId::new("events").unwrap();
+        let head = fixture_dlt_foreign_state(&serde_json::json!({
+            "last_value": 2,
+            "history": {"page": 7},
+        }))
+        .unwrap();
+        let store = FixtureCheckpointStore {
+            checkpoints: vec![checkpoint_fixture(
+                "events-head",
+                pipeline_id.clone(),
+                resource_id.clone(),
+                ScopeKey::Resource,
+                head,
+            )],
+        };
+        let session = DltStateSession::new(py, &store, pipeline_id).unwrap();
+
+        let mut batched = Vec::new();
+        let summary = bridge()
+            .visit_dlt_resource_with_state(
+                &module.getattr("events").unwrap(),
+                &session,
+                |_outcome, _kind, deltas| {
+                    batched.push(deltas);
+                    Ok(())
+                },
+            )
+            .unwrap();
+
+        // The committed last_value starts the window, so rows 0 and 1 never convert.
+        assert_eq!(summary.stream.row_count, 4);
+        assert_eq!(summary.stream.cursor_skipped_rows, 2);
+        assert_eq!(batched.len(), 2);
+        let deltas = batched
+            .into_iter()
+            .flatten()
+            .chain(summary.state_deltas)
+            .collect::<Vec<_>>();
+        assert!(
+            deltas
+                .iter()
+                .all(|delta| !delta.written.contains_key("history"))
+        );
+        let resource = deltas
+            .iter()
+            .rev()
+            .find(|delta| delta.scope == ScopeKey::Resource)
+            .unwrap();
+        assert_eq!(resource.written["last_value"], serde_json::json!(5));
+        let state = crate::dlt::position_to_dlt_state(&resource.output_position).unwrap();
+        assert_eq!(
+            state,
+            serde_json::json!({"last_value": 5, "history": {"page": 7}})
+        );
+        let source = deltas
+            .iter()
+            .find(|delta| delta.scope != ScopeKey::Resource)
+            .unwrap();
+        assert_eq!(source.resource_id, resource_id);
+        assert_eq!(source.written["finished"], serde_json::json!(true));
+    });
+}
+
+#[test]
+fn dlt_state_drains_held_containers_again_after_every_mutation() {
+    Python::attach(|py| {
+        let sdk_root = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
+            .parent()
+            .unwrap()
+            .parent()
+            .unwrap()
+            .join("python");
+        let source = format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+from cdf_sdk import dlt
+
+@dlt.resource(name="pages")
+def pages():
+    seen = dlt.current.resource_state().setdefault("seen", {{}})
+    for page in range(4):
+        yield {{"page": page}}
+        seen[str(page)] = True
+"#,
+            sdk_root = sdk_root.display()
+        );
+        let source = CString::new(source).unwrap();
+        let module =
+            PyModule::from_code(py, &source, c"dlt_held_fixture.py", c"dlt_held_fixture").unwrap();
+        let pipeline_id = PipelineId::new("pipeline").unwrap();
+        let store = FixtureCheckpointStore {
+            checkpoints: Vec::new(),
+        };
+        let session = DltStateSession::new(py, &store, pipeline_id).unwrap();
+
+        let mut batched = Vec::new();
+        let summary = bridge()
+            .visit_dlt_resource_with_state(
+                &module.getattr("pages").unwrap(),
+                &session,
+                |_outcome, _kind, deltas| {
+                    batched.push(deltas);
+                    Ok(())
+                },
+            )
+            .unwrap();
+
+        // The resource mutates the dict it got from setdefault, never the state map itself.
+        let seen = |deltas: &[DltStateDelta]| {
+            deltas
+                .iter()
+                .map(|delta| delta.written["seen"].clone())
+                .collect::<Vec<_>>()
+        };
+        assert_eq!(batched.len(), 2);
+        assert_eq!(seen(&batched[0]), vec![serde_json::json!({"0": true})]);
+        assert_eq!(
+            seen(&batched[1]),
+            vec![serde_json::json!({"0": true, "1": true, "2": true})]
+        );
+        assert_eq!(
+            seen(&summary.state_deltas),
+            vec![serde_json::json!({"0": true, "1": true, "2": true, "3": true})]
+        );
+        let state =
+            crate::dlt::position_to_dlt_state(&summary.state_deltas[0].output_position).unwrap();
+        assert_eq!(
+            state,
+            serde_json::json!({"seen": {"0": true, "1": true, "2": true, "3": true}})
+        );
+        assert!(session.drain(py).unwrap().is_empty());
+    });
+}
+
+#[test]
+fn dlt_state_never_rides_a_batch_flushed_ahead_of_a_pending_yield() {
+    Python::attach(|py| {
+        let sdk_root = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
+            .parent()
+            .unwrap()
+            .parent()
+            .unwrap()
+            .join("python");
+        let source = format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+from cdf_sdk import ColumnBatch, dlt
+
+@dlt.resource(name="mixed")
+def mixed():
+    state = dlt.current.resource_state()
+    state["last_value"] = 0
+    yield {{"seq": 0}}
+    state["last_value"] = 2
+    yield ColumnBatch({{"seq": [1, 2]}})
+    state["last_value"] = 3
+    yield {{"seq": 3}}
+"#,
+            sdk_root = sdk_root.display()
+        );
+        let source = CString::new(source).unwrap();
+        let module = PyModule::from_code(
+            py,
+            &source,
+            c"dlt_pending_fixture.py",
+            c"dlt_pending_fixture",
+        )
+        .unwrap();
+        let pipeline_id = PipelineId::new("pipeline").unwrap();
+        let store = FixtureCheckpointStore {
+            checkpoints: Vec::new(),
+        };
+        let session = DltStateSession::new(py, &store, pipeline_id).unwrap();
+
+        let mut batched = Vec::new();
+        let summary = bridge()
+            .visit_dlt_resource_with_state(
+                &module.getattr("mixed").unwrap(),
+                &session,
+                |outcome, _kind, deltas| {
+                    let column = outcome.batch.record_batch().unwrap().column(0).clone();
+                    let column = column.as_any().downcast_ref::<Int64Array>().unwrap();
+                    let last_values = deltas
+                        .iter()
+                        .map(|delta| delta.written["last_value"].clone())
+                        .collect::<Vec<_>>();
+                    batched.push((column.values().to_vec(), last_values));
+                    Ok(())
+                },
+            )
+            .unwrap();
+
+        // The column batch flushes row 0 after Python already recorded last_value 2, so that
+        // write waits for the batch holding rows 1 and 2 instead of riding with row 0.
+        assert_eq!(
+            batched,
+            vec![
+                (vec![0], vec![]),
+                (vec![1, 2], vec![serde_json::json!(2)]),
+                (vec![3], vec![serde_json::json!(3)]),
+            ]
+        );
+        assert!(summary.state_deltas.is_empty());
+    });
+}
+
+#[test]
+fn dlt_state_sessions_never_see_state_an_earlier_session_left_uncommitted() {
+    Python::attach(|py| {
+        let sdk_root = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
+            .parent()
+            .unwrap()
+            .parent()
+            .unwrap()
+            .join("python");
+        let source = format!(
+            r#"
+import sys
+sys.path.insert(0, {sdk_root:?})
+from cdf_sdk import dlt
+
+@dlt.resource(name="counter")
+def counter():
+    state = dlt.current.resource_state()
+    yield {{"seen": state["last_value"]}}
+    state["last_value"] = 99
+"#,
+            sdk_root = sdk_root.display()
+        );
+        let source = CString::new(source).unwrap();
+        let module = PyModule::from_code(
+            py,
+            &source,
+            c"dlt_session_fixture.py",
+            c"dlt_session_fixture",
+        )
+        .unwrap();
+        let resource = module.getattr("counter").unwrap();
+
+        let pipeline_id = PipelineId::new("pipeline").unwrap();
+        let store = FixtureCheckpointStore {
+            checkpoints: vec![checkpoint_fixture(
+                "counter-head",
+                pipeline_id.clone(),
+                ResourceId::new("counter").unwrap(),
+                ScopeKey::Resource,
+                fixture_dlt_foreign_state(&serde_json::json!({"last_value": 1})).unwrap(),
+            )],
+        };
+        // Each run gets its own session; the first one's write of 99 is never committed.
+        let run = || {
+            let session = DltStateSession::new(py, &store, pipeline_id.clone()).unwrap();
+            let mut seen = Vec::new();
+            let mut batched = Vec::new();
+            let summary = bridge()
+                .visit_dlt_resource_with_state(&resource, &session, |outcome, _kind, deltas| {
+                    let column = outcome.batch.record_batch().unwrap().column(0).clone();
+                    let column = column.as_any().downcast_ref::<Int64Array>().unwrap();
+                    seen.extend(column.values().iter().copied());
+                    batched.extend(deltas);
+                    Ok(())
+                })
+                .unwrap();
+            batched.extend(summary.state_deltas);
+            (seen, batched)
+        };
+
+        for _ in 0..2 {
+            let (seen, deltas) = run();
+            assert_eq!(seen, vec![1]);
+            assert_eq!(deltas.len(), 1);
+            assert_eq!(deltas[0].written["last_value"], serde_json::json!(99));
+        }
+    });
+}
+
 struct FixtureCheckpointStore {
     checkpoints: Vec<Checkpoint>,
 }
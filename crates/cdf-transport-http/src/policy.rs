@@ -1,4 +1,4 @@
-//! Fixed HTTP byte-source chunk and progress-deadline policy.
+//! Fixed HTTP byte-source chunk, progress-deadline, and connection keepalive policy.
 
 use std::time::Duration;
 
@@ -6,3 +6,6 @@ pub(crate) const MINIMUM_CHUNK_BYTES: u64 = 8 * 1024;
 pub(crate) const MAXIMUM_CHUNK_BYTES: u64 = 32 * 1024 * 1024;
 pub(crate) const FILE_RESPONSE_TIMEOUT: Duration = Duration::from_secs(10);
 pub(crate) const FILE_READ_IDLE_TIMEOUT: Duration = Duration::from_secs(10);
+/// Probes idle pooled control-plane connections, so one a NAT or load balancer dropped
+/// silently fails fast instead of stalling the next request.
+pub(crate) const CONTROL_TCP_KEEPALIVE: Duration = Duration::from_secs(60);
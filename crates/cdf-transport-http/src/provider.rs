@@ -17,7 +17,7 @@ use cdf_runtime::ByteSource;
 
 use crate::byte_source::HttpByteSource;
 use crate::errors::sanitized_reqwest_error;
-use crate::policy::{FILE_READ_IDLE_TIMEOUT, FILE_RESPONSE_TIMEOUT};
+use crate::policy::{CONTROL_TCP_KEEPALIVE, FILE_READ_IDLE_TIMEOUT, FILE_RESPONSE_TIMEOUT};
 use crate::request::{RawHttpResponse, reqwest_method, response_headers};
 use crate::response_body::read_bounded_response_body;
 
@@ -38,8 +38,12 @@ impl ReqwestHttpProvider {
         file_response_timeout: Duration,
         file_read_idle_timeout: Duration,
     ) -> Result<Self> {
+        // Control-plane requests (REST pages, catalog calls, Python context fetches) share
+        // reqwest's keep-alive pool per provider; HTTPS origins that offer HTTP/2 multiplex
+        // concurrent requests over a single connection.
         let asynchronous = reqwest::Client::builder()
             .redirect(reqwest::redirect::Policy::none())
+            .tcp_keepalive(CONTROL_TCP_KEEPALIVE)
             .build()
             .map_err(|error| {
                 CdfError::environment(format!(
@@ -1,29 +1,56 @@
 """Typed authoring surface for cdf Python resources."""
 
 from . import dlt as dlt
-from .context import Context, CursorView, HttpClient, HttpResponse, Logger, SecretProvider
+from .context import (
+    AsyncHttpClient,
+    Context,
+    CursorView,
+    HttpClient,
+    HttpResponse,
+    Logger,
+    LogLevel,
+    SecretProvider,
+)
 from .resource import (
     ArrowArrayExport,
     ArrowStreamExport,
+    ColumnBatch,
+    ColumnValues,
+    CursorOrdering,
+    Estimate,
+    EstimateHook,
     JsonScalar,
     JsonValue,
     ResourceYield,
     Row,
     resource,
 )
+from .resume import Resume
+from .scan import Predicate, Pushdown, ScanRequest
 
 __all__ = [
     "ArrowArrayExport",
     "ArrowStreamExport",
+    "AsyncHttpClient",
+    "ColumnBatch",
+    "ColumnValues",
     "Context",
+    "CursorOrdering",
     "CursorView",
+    "Estimate",
+    "EstimateHook",
     "HttpClient",
     "HttpResponse",
     "JsonScalar",
     "JsonValue",
+    "LogLevel",
     "Logger",
+    "Predicate",
+    "Pushdown",
     "ResourceYield",
+    "Resume",
     "Row",
+    "ScanRequest",
     "SecretProvider",
     "dlt",
     "resource",
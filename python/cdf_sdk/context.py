@@ -1,9 +1,16 @@
-"""Protocols implemented by the cdf Python host context."""
+"""Protocols implemented by the cdf Python host context.
+
+``_HostLogger`` is the ``Logger`` meant for ``ctx.logger``. It applies the host's level
+threshold and message rate before a message is formatted, so suppressed calls build no string.
+It stays private until the host passes resources a context: then the logger is built from the
+Rust context's log policy with a sink feeding its log ring.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Protocol
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Literal, Protocol
 
 
 class HttpResponse(Protocol):
@@ -38,6 +45,34 @@ class HttpClient(Protocol):
         params: Mapping[str, object] | None = None,
     ) -> HttpResponse: ...
 
+    def get_many(
+        self,
+        urls: Sequence[str],
+        *,
+        headers: Mapping[str, str] | None = None,
+        max_in_flight: int = 4,
+    ) -> list[HttpResponse]: ...
+
+
+class AsyncHttpClient(Protocol):
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, object] | None = None,
+        json: object | None = None,
+    ) -> HttpResponse: ...
+
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, object] | None = None,
+    ) -> HttpResponse: ...
+
 
 class SecretProvider(Protocol):
     def get(self, uri: str, /) -> str: ...
@@ -47,20 +82,117 @@ class CursorView(Protocol):
     def get(self, field: str, default: object | None = None, /) -> object | None: ...
 
 
+LogLevel = Literal["debug", "info", "warning", "error"]
+
+_LEVEL_RANKS: dict[str, int] = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+
 class Logger(Protocol):
-    def debug(self, message: str, *, extra: Mapping[str, object] | None = None) -> None: ...
+    """Messages take ``%``-style ``args``, formatted only when the message is kept."""
+
+    def enabled(self, level: LogLevel, /) -> bool: ...
+
+    def debug(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None: ...
+
+    def info(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None: ...
+
+    def warning(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None: ...
 
-    def info(self, message: str, *, extra: Mapping[str, object] | None = None) -> None: ...
+    def error(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None: ...
 
-    def warning(self, message: str, *, extra: Mapping[str, object] | None = None) -> None: ...
 
-    def error(self, message: str, *, extra: Mapping[str, object] | None = None) -> None: ...
+LogSink = Callable[[LogLevel, str, Mapping[str, object] | None], None]
+
+
+class _HostLogger:
+    """Drops messages below ``level`` or over ``messages_per_minute``, counting the latter in
+    ``suppressed``, and forwards the rest to the host ``sink`` once formatted."""
+
+    __slots__ = ("_allowance", "_checked", "_per_minute", "_sink", "_threshold", "suppressed")
+
+    def __init__(
+        self,
+        sink: LogSink,
+        *,
+        level: LogLevel = "info",
+        messages_per_minute: int | None = None,
+    ) -> None:
+        if messages_per_minute is not None and messages_per_minute < 1:
+            raise ValueError("messages_per_minute must be at least 1")
+        self._sink = sink
+        self._threshold = _LEVEL_RANKS[level]
+        self._per_minute = messages_per_minute
+        self._allowance = float(messages_per_minute or 0)
+        self._checked = time.monotonic()
+        self.suppressed = 0
+
+    def enabled(self, level: LogLevel, /) -> bool:
+        return _LEVEL_RANKS[level] >= self._threshold
+
+    def debug(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None:
+        self._log("debug", message, args, extra)
+
+    def info(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None:
+        self._log("info", message, args, extra)
+
+    def warning(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None:
+        self._log("warning", message, args, extra)
+
+    def error(
+        self, message: str, *args: object, extra: Mapping[str, object] | None = None
+    ) -> None:
+        self._log("error", message, args, extra)
+
+    def _log(
+        self,
+        level: LogLevel,
+        message: str,
+        args: tuple[object, ...],
+        extra: Mapping[str, object] | None,
+    ) -> None:
+        if _LEVEL_RANKS[level] < self._threshold:
+            return
+        if not self._admit():
+            self.suppressed += 1
+            return
+        self._sink(level, message % args if args else message, extra)
+
+    def _admit(self) -> bool:
+        if self._per_minute is None:
+            return True
+        now = time.monotonic()
+        self._allowance = min(
+            float(self._per_minute),
+            self._allowance + (now - self._checked) * self._per_minute / 60.0,
+        )
+        self._checked = now
+        if self._allowance < 1.0:
+            return False
+        self._allowance -= 1.0
+        return True
 
 
 class Context(Protocol):
     @property
     def http(self) -> HttpClient: ...
 
+    @property
+    def async_http(self) -> AsyncHttpClient: ...
+
     @property
     def secrets(self) -> SecretProvider: ...
 
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from contextvars import ContextVar
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import Literal, TypeVar, overload
 
@@ -35,10 +44,98 @@ class Incremental:
         }
 
 
+class _StateMap(MutableMapping[str, JsonValue]):
+    """One resource's or source's state, loaded on first use.
+
+    The map records which top-level keys were written or deleted, so the host commits only those
+    keys. Reading a list or dict value counts as a write, because the caller may mutate it in
+    place. A caller may also hold on to such a value and keep mutating it across drains, so
+    every drained list or dict is kept as a snapshot and drained again whenever it differs.
+    """
+
+    __slots__ = ("_data", "_dirty", "_drained", "_loader", "_removed")
+
+    def __init__(self, loader: Callable[[], Mapping[str, JsonValue]] | None) -> None:
+        self._loader = loader
+        self._data: dict[str, JsonValue] | None = None
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self._drained: dict[str, JsonValue] = {}
+
+    def _state(self) -> dict[str, JsonValue]:
+        if self._data is None:
+            loader, self._loader = self._loader, None
+            self._data = {} if loader is None else dict(loader())
+        return self._data
+
+    def __getitem__(self, key: str) -> JsonValue:
+        value = self._state()[key]
+        if isinstance(value, (dict, list)):
+            self._dirty.add(key)
+        return value
+
+    def __setitem__(self, key: str, value: JsonValue) -> None:
+        self._state()[key] = value
+        self._dirty.add(key)
+        self._removed.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        del self._state()[key]
+        self._dirty.discard(key)
+        self._drained.pop(key, None)
+        self._removed.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._state())
+
+    def __len__(self) -> int:
+        return len(self._state())
+
+    def _drain(self) -> tuple[dict[str, JsonValue], list[str]] | None:
+        state = self._data
+        if state is None:
+            return None
+        changed = self._dirty | {
+            key
+            for key, snapshot in self._drained.items()
+            if key in state and state[key] != snapshot
+        }
+        if not changed and not self._removed:
+            return None
+        written = {key: state[key] for key in changed}
+        for key, value in written.items():
+            if isinstance(value, (dict, list)):
+                self._drained[key] = deepcopy(value)
+            else:
+                self._drained.pop(key, None)
+        removed = sorted(self._removed)
+        self._dirty.clear()
+        self._removed.clear()
+        return written, removed
+
+
+class _Session:
+    """The state maps bound by one host session.
+
+    Every session starts empty, so state an earlier session wrote but never
+    committed cannot leak into the next run.
+    """
+
+    __slots__ = ("resources", "sources")
+
+    def __init__(self) -> None:
+        self.resources: dict[str | None, _StateMap] = {}
+        self.sources: dict[str | None, _StateMap] = {}
+
+
 class _Current:
+    """Per-resource and per-source dlt state, bound by the host to the resource being read."""
+
     def __init__(self) -> None:
-        self._resource_state: dict[str, JsonValue] = {}
-        self._source_state: dict[str, JsonValue] = {}
+        self._unbound = _Session()
+        self._active: ContextVar[tuple[_Session | None, str | None, str | None]] = (
+            ContextVar("cdf_dlt_active_scope", default=(None, None, None))
+        )
 
     @property
     def state(self) -> MutableMapping[str, JsonValue]:
@@ -47,14 +144,54 @@ class _Current:
     def resource_state(
         self, resource_name: str | None = None
     ) -> MutableMapping[str, JsonValue]:
-        _ = resource_name
-        return self._resource_state
+        session, active_resource, _ = self._active.get()
+        if resource_name is None:
+            resource_name = active_resource
+        return (session or self._unbound).resources.setdefault(
+            resource_name, _StateMap(None)
+        )
 
     def source_state(
         self, source_state_key: str | None = None
     ) -> MutableMapping[str, JsonValue]:
-        _ = source_state_key
-        return self._source_state
+        session, _, active_source = self._active.get()
+        if source_state_key is None:
+            source_state_key = active_source
+        return (session or self._unbound).sources.setdefault(
+            source_state_key, _StateMap(None)
+        )
+
+    def _session(self) -> _Session:
+        return _Session()
+
+    def _bind(
+        self,
+        session: _Session,
+        resource_name: str,
+        source_name: str | None,
+        resource_loader: Callable[[], Mapping[str, JsonValue]] | None,
+        source_loader: Callable[[], Mapping[str, JsonValue]] | None,
+    ) -> None:
+        session.resources.setdefault(resource_name, _StateMap(resource_loader))
+        if source_name is not None:
+            session.sources.setdefault(source_name, _StateMap(source_loader))
+        self._active.set((session, resource_name, source_name))
+
+    def _drain(
+        self, session: _Session
+    ) -> list[tuple[str, str, dict[str, JsonValue], list[str]]]:
+        changes: list[tuple[str, str, dict[str, JsonValue], list[str]]] = []
+        for kind, maps in (
+            ("resource", session.resources),
+            ("source", session.sources),
+        ):
+            for key, state in maps.items():
+                if key is None:
+                    continue
+                drained = state._drain()
+                if drained is not None:
+                    changes.append((kind, key, *drained))
+        return changes
 
 
 current = _Current()
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Mapping, Sequence
-from typing import Protocol, TypeVar, overload, runtime_checkable
+import array
+from collections.abc import AsyncIterable, Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    Protocol,
+    TypeVar,
+    overload,
+    runtime_checkable,
+)
+
+if TYPE_CHECKING:
+    from .scan import Pushdown
 
 JsonScalar = str | int | float | bool | None
 JsonValue = JsonScalar | Mapping[str, "JsonValue"] | Sequence["JsonValue"]
 Row = Mapping[str, JsonValue]
+ColumnValues = Sequence[JsonScalar] | array.array
+SchemaDeclaration = Mapping[str, str | tuple[str, bool]]
 
 
 @runtime_checkable
@@ -22,9 +36,50 @@ class ArrowStreamExport(Protocol):
     def __arrow_c_stream__(self, requested_schema: object | None = None, /) -> object: ...
 
 
-ResourceYield = Row | ArrowArrayExport | ArrowStreamExport
+@dataclass(frozen=True, slots=True)
+class ColumnBatch:
+    columns: Mapping[str, ColumnValues]
+    schema: SchemaDeclaration | None = None
 
-R = TypeVar("R", bound=Callable[..., Iterable[ResourceYield]])
+    def __post_init__(self) -> None:
+        if not self.columns:
+            raise ValueError("ColumnBatch requires at least one column")
+        if any(isinstance(values, str | bytes | bytearray) for values in self.columns.values()):
+            raise TypeError("ColumnBatch columns must be sequences of values, not str or bytes")
+        if len({len(values) for values in self.columns.values()}) != 1:
+            raise ValueError("ColumnBatch columns must have equal lengths")
+        if self.schema is not None and not set(self.schema) <= set(self.columns):
+            raise ValueError("ColumnBatch schema names a column that is not present")
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __cdf_columns__(
+        self,
+    ) -> tuple[tuple[tuple[str, str | None, bool], ...], tuple[ColumnValues, ...]]:
+        declared = dict(_schema_fields(self.schema or {}))
+        fields = tuple((name, *declared.get(name, (None, True))) for name in self.columns)
+        return fields, tuple(self.columns.values())
+
+
+@dataclass(frozen=True, slots=True)
+class Estimate:
+    rows: int | None = None
+    bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if any(value is not None and value < 0 for value in (self.rows, self.bytes)):
+            raise ValueError("Estimate rows and bytes must be nonnegative")
+
+
+ResourceYield = Row | ColumnBatch | ArrowArrayExport | ArrowStreamExport
+PartitionEnumerator = Callable[[], Iterable[str]]
+EstimateHook = Callable[..., Estimate | None]
+CursorOrdering = Literal["exact", "inexact", "unordered"]
+
+R = TypeVar(
+    "R", bound=Callable[..., Iterable[ResourceYield] | AsyncIterable[ResourceYield]]
+)
 
 
 @overload
@@ -38,9 +93,15 @@ def resource(
     primary_key: Sequence[str] = (),
     merge_key: Sequence[str] = (),
     cursor: str | None = None,
+    cursor_ordering: CursorOrdering = "exact",
+    cursor_lag_ms: int = 0,
     bounded: bool = True,
-    schema: Mapping[str, str | tuple[str, bool]] | None = None,
+    schema: SchemaDeclaration | None = None,
     write_disposition: str = "append",
+    partitions: PartitionEnumerator | None = None,
+    pushdown: Pushdown | None = None,
+    estimate: EstimateHook | None = None,
+    resumable: bool = False,
 ) -> Callable[[R], R]: ...
 
 
@@ -52,9 +113,15 @@ def resource(
     primary_key: Sequence[str] = (),
     merge_key: Sequence[str] = (),
     cursor: str | None = None,
+    cursor_ordering: CursorOrdering = "exact",
+    cursor_lag_ms: int = 0,
     bounded: bool = True,
-    schema: Mapping[str, str | tuple[str, bool]] | None = None,
+    schema: SchemaDeclaration | None = None,
     write_disposition: str = "append",
+    partitions: PartitionEnumerator | None = None,
+    pushdown: Pushdown | None = None,
+    estimate: EstimateHook | None = None,
+    resumable: bool = False,
 ) -> R | Callable[[R], R]:
     def decorate(inner: R) -> R:
         setattr(inner, "__cdf_resource__", True)
@@ -62,20 +129,44 @@ def resource(
         setattr(inner, "__cdf_primary_key__", tuple(primary_key))
         setattr(inner, "__cdf_merge_key__", tuple(merge_key))
         setattr(inner, "__cdf_cursor__", cursor)
+        setattr(inner, "__cdf_cursor_ordering__", cursor_ordering)
+        setattr(inner, "__cdf_cursor_lag_ms__", cursor_lag_ms)
         setattr(inner, "__cdf_bounded__", bounded)
         setattr(
             inner,
             "__cdf_schema__",
             tuple(
-                (field, value, True)
-                if isinstance(value, str)
-                else (field, value[0], value[1])
-                for field, value in (schema or {}).items()
+                (field, field_type, nullable)
+                for field, (field_type, nullable) in _schema_fields(schema or {})
             ),
         )
         setattr(inner, "__cdf_write_disposition__", write_disposition)
+        setattr(inner, "__cdf_partitions__", partitions)
+        setattr(
+            inner,
+            "__cdf_pushdown__",
+            None
+            if pushdown is None
+            else (
+                pushdown.projection,
+                tuple(sorted(set(pushdown.operators))),
+                pushdown.exact,
+                pushdown.limit,
+            ),
+        )
+        setattr(inner, "__cdf_estimate__", estimate)
+        setattr(inner, "__cdf_resumable__", resumable)
         return inner
 
     if func is not None:
         return decorate(func)
     return decorate
+
+
+def _schema_fields(
+    schema: SchemaDeclaration,
+) -> tuple[tuple[str, tuple[str, bool]], ...]:
+    return tuple(
+        (field, (value, True) if isinstance(value, str) else (value[0], value[1]))
+        for field, value in schema.items()
+    )
@@ -0,0 +1,77 @@
+"""Durable page-token positions for resources declared ``resumable=True``.
+
+The host passes such a resource ``resume=Resume(token)``, where ``token`` is the position its
+partition last committed. ``mark_position`` records that every row yielded so far is covered by
+a token; the host stamps it on the next batch boundary.
+
+Marks are at-least-once. Rows that already left in a batch before the mark, such as a full
+dict window or an uncoalesced Arrow yield, carry the previous token, so the mark rides the next
+batch instead, and a mark after the last batch rides none. A run that resumes after such a
+mark re-reads the pages since the last token a committed batch carried; it never skips rows.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+
+from .resource import ResourceYield
+
+
+class Resume:
+    __slots__ = ("_marked", "token")
+
+    def __init__(self, token: str | None) -> None:
+        self.token = token
+        self._marked: str | None = None
+
+    def mark_position(self, token: str, /) -> None:
+        if not isinstance(token, str) or not token:
+            raise ValueError("mark_position requires a nonempty string token")
+        self._marked = token
+
+    def _take_marked(self) -> _PositionMark | None:
+        marked, self._marked = self._marked, None
+        return None if marked is None else _PositionMark(marked)
+
+
+@dataclass(frozen=True, slots=True)
+class _PositionMark:
+    token: str
+
+    def __cdf_position__(self) -> str:
+        return self.token
+
+
+def _resume_from_host(token: str | None, /) -> Resume:
+    return Resume(token)
+
+
+def _marked(
+    items: Iterable[ResourceYield] | AsyncIterable[ResourceYield], resume: Resume, /
+) -> Iterator[ResourceYield | _PositionMark] | AsyncIterator[ResourceYield | _PositionMark]:
+    if isinstance(items, AsyncIterable):
+        return _marked_async(items, resume)
+    return _marked_sync(items, resume)
+
+
+def _marked_sync(
+    items: Iterable[ResourceYield], resume: Resume
+) -> Iterator[ResourceYield | _PositionMark]:
+    for item in items:
+        if resume._marked is not None:
+            yield resume._take_marked()
+        yield item
+    if resume._marked is not None:
+        yield resume._take_marked()
+
+
+async def _marked_async(
+    items: AsyncIterable[ResourceYield], resume: Resume
+) -> AsyncIterator[ResourceYield | _PositionMark]:
+    async for item in items:
+        if resume._marked is not None:
+            yield resume._take_marked()
+        yield item
+    if resume._marked is not None:
+        yield resume._take_marked()
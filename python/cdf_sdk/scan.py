@@ -0,0 +1,50 @@
+"""Negotiated scan contracts for resources that push work into their upstream query."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from .resource import JsonScalar
+
+COMPARISON_OPERATORS = frozenset({"=", "!=", ">", ">=", "<", "<="})
+
+
+@dataclass(frozen=True, slots=True)
+class Pushdown:
+    projection: bool = False
+    operators: Sequence[str] = ()
+    exact: bool = False
+    limit: bool = False
+
+    def __post_init__(self) -> None:
+        unknown = set(self.operators) - COMPARISON_OPERATORS
+        if unknown:
+            raise ValueError(
+                "Pushdown operators must be drawn from " + ", ".join(sorted(COMPARISON_OPERATORS))
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class Predicate:
+    column: str
+    operator: str
+    value: JsonScalar
+
+
+@dataclass(frozen=True, slots=True)
+class ScanRequest:
+    columns: tuple[str, ...] | None = None
+    predicates: tuple[Predicate, ...] = ()
+    limit: int | None = None
+
+
+def _scan_from_host(payload: str, /) -> ScanRequest:
+    scan = json.loads(payload)
+    columns = scan["columns"]
+    return ScanRequest(
+        columns=None if columns is None else tuple(columns),
+        predicates=tuple(Predicate(*predicate) for predicate in scan["predicates"]),
+        limit=scan["limit"],
+    )